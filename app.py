@@ -79,6 +79,16 @@ except ImportError as e:
 except Exception as e:
     logger.error(f"Kurumsal AI route'ları kaydedilirken hata: {e}")
 
+# Full-text arama indeksleri deploy sırasında oluşturulur:
+#   python -m core.Database.fulltext
+
+# Arama önerileri için bellek içi önek indeksini oluştur
+try:
+    from core.Services.autocomplete_service import get_autocomplete_service
+    get_autocomplete_service().build()
+except Exception as e:
+    logger.error(f"Autocomplete indeksi oluşturulamadı: {e}")
+
 # Hata yönetimini aktifleştir
 app.register_error_handler(Exception, error_handler.handle_error)
 
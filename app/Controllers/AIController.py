@@ -19,6 +19,7 @@ from typing import Dict, List, Any, Optional
 from flask import request, jsonify, session, current_app
 
 from core.Services.logger import LoggerService
+from core.Services.queue_service import JobPriority, get_queue_service
 from core.AI.ai_core import ai_core
 from core.AI.image_recognition import ImageRecognitionService
 from core.AI.content_categorizer import ContentCategorizerService
@@ -148,6 +149,24 @@ class AIController:
                     'code': 'NO_VALID_FILES'
                 }
             
+            # Arka planda işleme: görseller queue işçilerine dağıtılır
+            if request_data.get('background') and analysis_type == 'basic':
+                queue_service = get_queue_service()
+                job_ids = []
+                for image_path in valid_paths:
+                    response = queue_service.add_job(
+                        'process_image', {'image_path': image_path, 'user_id': user_id}, JobPriority.HIGH
+                    )
+                    if response.get('status') == 'success':
+                        job_ids.append(response['data']['job_id'])
+
+                return {
+                    'success': True,
+                    'queued': True,
+                    'job_ids': job_ids,
+                    'total_queued': len(job_ids)
+                }
+            
             # Toplu işleme
             if analysis_type == 'basic':
                 results = await ai_core.batch_process_images(valid_paths, user_id)
@@ -468,8 +487,15 @@ class AIController:
         """
         try:
             image_path = request_data.get('image_path')
-            user_id = request_data.get('user_id', session.get('user_id', 1))
+            is_admin = session.get('is_admin', False)
+            # Başka bir satıcının indeksi yalnızca yöneticilere açıktır
+            if is_admin:
+                user_id = request_data.get('user_id', session.get('user_id'))
+            else:
+                user_id = session.get('user_id')
             similarity_threshold = request_data.get('similarity_threshold', 0.8)
+            limit = request_data.get('limit', 50)
+            scope = request_data.get('scope', 'user')
             
             if not image_path:
                 return {
@@ -478,9 +504,24 @@ class AIController:
                     'code': 'MISSING_PARAMETER'
                 }
             
+            if user_id is None:
+                return {
+                    'success': False,
+                    'error': 'Oturum açmanız gerekiyor',
+                    'code': 'UNAUTHORIZED'
+                }
+            
+            # Global indeks diğer kullanıcıların görsellerini içerir
+            if scope == 'global' and not is_admin:
+                return {
+                    'success': False,
+                    'error': 'Global benzerlik araması yalnızca yöneticilere açıktır',
+                    'code': 'FORBIDDEN'
+                }
+            
             # Benzer görselleri bul
             similar_images = await self.image_recognition.find_similar_images(
-                image_path, user_id, similarity_threshold
+                image_path, user_id, similarity_threshold, limit, scope
             )
             
             return {
@@ -488,7 +529,8 @@ class AIController:
                 'data': {
                     'similar_images': similar_images,
                     'query_image': image_path,
-                    'similarity_threshold': similarity_threshold
+                    'similarity_threshold': similarity_threshold,
+                    'scope': scope
                 }
             }
             
@@ -13,7 +13,8 @@ from core.Services.UIService import UIService
 from core.Services.ComponentService import ComponentService
 from core.Services.auth_page_service import AuthPageService
 from app.Models.User import User
-from core.Database.connection import get_connection
+from core.Database.connection import get_connection, get_db_connection
+from core.Services.cache_service import get_cache_service
 import json
 import datetime
 from flask import jsonify, request, session
@@ -126,12 +127,25 @@ class AdminController(BaseController):
             return error_handler.handle_error(e, self.request)
     
     def _get_admin_stats(self):
-        """Admin dashboard istatistikleri"""
+        """Admin dashboard istatistikleri (60 sn cache, süresi dolunca arka planda yenilenir)"""
         try:
-            conn = get_connection()
-            cursor = conn.cursor()
+            return get_cache_service().remember('admin_dashboard_stats', 60, self._query_admin_stats, stale_ttl=60)
             
-            stats = {}
+        except Exception as e:
+            print(f"Admin stats error: {str(e)}")
+            return {}
+    
+    def _query_admin_stats(self):
+        """
+        Admin dashboard istatistiklerini veritabanından hesapla
+        
+        remember() arka plan thread'inden de çağrılır; bu yüzden paylaşılan
+        ham bağlantı yerine havuzdan alınan bağlantı kullanılır.
+        """
+        stats = {}
+        
+        with get_db_connection().get_connection() as conn:
+            cursor = conn.cursor()
             
             # Toplam kullanıcı sayısı
             cursor.execute("SELECT COUNT(*) FROM users")
@@ -162,22 +176,18 @@ class AdminController(BaseController):
             result = cursor.fetchone()
             stats['pending_approvals'] = result[0] if result else 0
             
-            conn.close()
-            
-            # Ek istatistikler
-            stats.update({
-                'total_content': 156,
-                'published_content': 142,
-                'draft_content': 14,
-                'total_comments': 1247,
-                'pending_comments': 23
-            })
-            
-            return stats
-            
-        except Exception as e:
-            print(f"Admin stats error: {str(e)}")
-            return {}
+            cursor.close()
+        
+        # Ek istatistikler
+        stats.update({
+            'total_content': 156,
+            'published_content': 142,
+            'draft_content': 14,
+            'total_comments': 1247,
+            'pending_comments': 23
+        })
+        
+        return stats
     
     def _get_admin_activities(self):
         """Admin aktiviteleri"""
@@ -14,7 +14,7 @@ from core.Services.seo_service import SEOService
 from core.Services.security_service import SecurityService
 from core.Services.performance_optimizer import PerformanceOptimizer
 from core.Services.error_handler import error_handler
-from flask import jsonify, request, render_template, make_response
+from flask import jsonify, request, render_template, make_response, Response, stream_with_context
 from typing import Dict, Any, List
 import json
 from datetime import datetime, timedelta
@@ -106,13 +106,24 @@ class AdminReportController(BaseController):
                     report = self.reporting_service.generate_system_performance_report(config)
                 elif report_type == ReportType.CUSTOM_QUERY:
                     report = self.reporting_service.generate_custom_report(config)
+                elif report_type == ReportType.ORDER_HISTORY:
+                    report = self.reporting_service.generate_order_history_report(config)
                 else:
                     report = {'error': 'Desteklenmeyen rapor türü'}
                 
                 # Export format
                 export_format = form_data.get('export_format', 'json')
                 
-                if export_format == 'json':
+                if report_type == ReportType.ORDER_HISTORY and export_format in ('json', 'csv'):
+                    # Sipariş geçmişi satırları veritabanından akış halinde yazılır
+                    mimetype = 'text/csv' if export_format == 'csv' else 'application/json'
+                    response = Response(
+                        stream_with_context(self.reporting_service.stream_report(report, export_format)),
+                        mimetype=mimetype
+                    )
+                    response.headers['Content-Disposition'] = f'attachment; filename=orders_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{export_format}'
+                    return response
+                elif export_format == 'json':
                     return jsonify(report)
                 elif export_format == 'csv':
                     csv_data = self.reporting_service.export_report(report, 'csv')
@@ -255,13 +266,14 @@ class AdminReportController(BaseController):
     def dashboard_widgets(self):
         """Dashboard widget'ları"""
         try:
-            widgets = {
+            # Ağır toplamlar: TTL dolduğunda tek işçi yeniler, diğer istekler eski değeri alır
+            widgets = self.reporting_service.cache.remember('admin_dashboard_widgets', 300, lambda: {
                 'user_stats': self._get_user_widget_data(),
                 'sales_stats': self._get_sales_widget_data(),
                 'performance_stats': self._get_performance_widget_data(),
                 'security_stats': self._get_security_widget_data(),
                 'seo_stats': self._get_seo_widget_data()
-            }
+            }, stale_ttl=120)
             
             return jsonify(widgets)
             
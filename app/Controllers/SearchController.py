@@ -9,6 +9,9 @@ Arama işlemleri için controller
 from app.Controllers.BaseController import BaseController
 from core.Services.error_handler import error_handler
 from core.Database.connection import get_connection
+from core.Database.query_builder import QueryBuilder
+from core.Database.fulltext import find_fulltext_index
+from core.Services.autocomplete_service import get_autocomplete_service
 from flask import request, jsonify
 import datetime
 from typing import Dict, Any, List
@@ -75,18 +78,25 @@ class SearchController(BaseController):
                 })
             
             suggestions = []
-            
-            # Kullanıcı önerileri
-            user_suggestions = self._get_user_suggestions(query, limit // 3)
-            suggestions.extend([
-                {
-                    'type': 'user',
-                    'title': suggestion['name'],
-                    'subtitle': suggestion['email'],
-                    'url': f'/admin/users/{suggestion["id"]}'
-                }
-                for suggestion in user_suggestions
-            ])
+            autocomplete = get_autocomplete_service()
+            
+            if autocomplete.is_built():
+                # Bellek içi önek indeksi (ürün, kategori, etiket, kullanıcı)
+                suggestions.extend(autocomplete.suggest(query, limit // 3, types=['product']))
+                suggestions.extend(autocomplete.suggest(query, limit // 3, types=['category', 'tag']))
+                suggestions.extend(autocomplete.suggest(query, limit // 3, types=['user']))
+            else:
+                # Kullanıcı önerileri
+                user_suggestions = self._get_user_suggestions(query, limit // 3)
+                suggestions.extend([
+                    {
+                        'type': 'user',
+                        'title': suggestion['name'],
+                        'subtitle': suggestion['email'],
+                        'url': f'/admin/users/{suggestion["id"]}'
+                    }
+                    for suggestion in user_suggestions
+                ])
             
             # İçerik önerileri
             content_suggestions = self._get_content_suggestions(query, limit // 3)
@@ -115,9 +125,37 @@ class SearchController(BaseController):
                 'message': f'Öneriler alınırken hata oluştu: {str(e)}'
             }, 500)
     
+    def _fulltext_page(self, index, builder, query, page, per_page):
+        """Full-text indeksiyle ilgililik sıralı bir sayfa getir"""
+        index.apply(builder, query, rank=True, snippets=True)
+        
+        total_records = builder.count()
+        total_pages = (total_records + per_page - 1) // per_page
+        
+        builder.paginate(page, per_page)
+        rows = index.decorate(builder.get(), query)
+        
+        return rows, {
+            'current_page': page,
+            'total_pages': total_pages,
+            'total_records': total_records,
+            'per_page': per_page,
+            'has_prev': page > 1,
+            'has_next': page < total_pages
+        }
+    
     def _search_users(self, query, page, per_page):
         """Kullanıcı araması"""
         try:
+            index = find_fulltext_index('users')
+            if index:
+                builder = QueryBuilder('users').select(
+                    'users.id', 'users.name', 'users.email', 'users.username',
+                    'users.role', 'users.status', 'users.created_at'
+                )
+                users, pagination = self._fulltext_page(index, builder, query, page, per_page)
+                return {'users': users, 'pagination': pagination}
+            
             conn = get_connection()
             cursor = conn.cursor()
             
@@ -175,6 +213,15 @@ class SearchController(BaseController):
     def _search_content(self, query, page, per_page):
         """İçerik araması"""
         try:
+            index = find_fulltext_index('posts')
+            if index:
+                builder = QueryBuilder('posts').select(
+                    'posts.id', 'posts.title', 'posts.excerpt', 'posts.status', 'posts.views',
+                    'posts.likes', 'posts.created_at', 'users.name as author_name'
+                ).left_join('users', 'posts.author_id', '=', 'users.id')
+                content, pagination = self._fulltext_page(index, builder, query, page, per_page)
+                return {'content': content, 'pagination': pagination}
+            
             conn = get_connection()
             cursor = conn.cursor()
             
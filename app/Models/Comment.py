@@ -16,6 +16,13 @@ class Comment(BaseModel):
     ]
     __hidden__ = ['ip_address', 'user_agent']
     __timestamps__ = True
+    __relations__ = {
+        'user': {'type': 'belongs_to', 'model': 'app.Models.User.User', 'foreign_key': 'user_id'},
+        'post': {'type': 'belongs_to', 'model': 'app.Models.Post.Post', 'foreign_key': 'post_id'},
+        'parent': {'type': 'belongs_to', 'model': 'app.Models.Comment.Comment', 'foreign_key': 'parent_id'},
+        'replies': {'type': 'has_many', 'model': 'app.Models.Comment.Comment', 'foreign_key': 'parent_id',
+                    'conditions': {'status': 'approved'}}
+    }
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -46,21 +53,21 @@ class Comment(BaseModel):
     
     def user(self):
         """Yorumun yazarı"""
-        if self._user is None:
+        if self._user is None and 'user' not in self._loaded_relations:
             from .User import User
             self._user = User.find(self.user_id)
         return self._user
     
     def post(self):
         """Yorumun yapıldığı post"""
-        if self._post is None:
+        if self._post is None and 'post' not in self._loaded_relations:
             from .Post import Post
             self._post = Post.find(self.post_id)
         return self._post
     
     def parent(self):
         """Üst yorum"""
-        if self._parent is None and self.parent_id:
+        if self._parent is None and self.parent_id and 'parent' not in self._loaded_relations:
             self._parent = Comment.find(self.parent_id)
         return self._parent
     
@@ -101,20 +108,23 @@ class Comment(BaseModel):
         data['replies_count'] = self.replies_count()
         
         # İlişkili veriler
-        if self.user():
-            data['user'] = self.user().to_dict()
+        user = self.user()
+        if user:
+            data['user'] = user.to_dict()
         
-        if self.post():
+        post = self.post()
+        if post:
             data['post'] = {
-                'id': self.post().id,
-                'title': self.post().title,
-                'url': self.post().url
+                'id': post.id,
+                'title': post.title,
+                'url': post.url
             }
         
-        if self.parent():
+        parent = self.parent()
+        if parent:
             data['parent'] = {
-                'id': self.parent().id,
-                'content': self.parent().content[:100] + '...' if len(self.parent().content) > 100 else self.parent().content
+                'id': parent.id,
+                'content': parent.content[:100] + '...' if len(parent.content) > 100 else parent.content
             }
         
         return data
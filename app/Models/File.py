@@ -7,6 +7,7 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from core.Database.base_model import BaseModel
+from core.Services.file_hash_cache import hash_bytes
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 import json
@@ -386,7 +387,7 @@ class File(BaseModel):
     
     def _calculate_file_hash(self, content: bytes) -> str:
         """Dosya hash'i hesapla"""
-        return hashlib.sha256(content).hexdigest()
+        return hash_bytes(content, 'sha256')
     
     def _create_upload_directory(self, user_id: int, category: str) -> str:
         """Upload dizini oluştur"""
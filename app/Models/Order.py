@@ -2,7 +2,7 @@
 Order Model
 Sipariş modeli ve ilişkileri
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Dict, Any
 from datetime import datetime
 from core.Database.base_model import BaseModel
 
@@ -17,6 +17,10 @@ class Order(BaseModel):
     ]
     __hidden__ = []
     __timestamps__ = True
+    __relations__ = {
+        'user': {'type': 'belongs_to', 'model': 'app.Models.User.User', 'foreign_key': 'user_id'},
+        'items': {'type': 'has_many', 'model': 'app.Models.OrderItem.OrderItem', 'foreign_key': 'order_id'}
+    }
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -65,7 +69,7 @@ class Order(BaseModel):
     
     def user(self):
         """Siparişin sahibi"""
-        if self._user is None:
+        if self._user is None and 'user' not in self._loaded_relations:
             from .User import User
             self._user = User.find(self.user_id)
         return self._user
@@ -185,37 +189,47 @@ class Order(BaseModel):
         return cls.where({'payment_status': 'pending'})
     
     @classmethod
-    def create_order(cls, user_id: int, items: List[Dict[str, Any]], **kwargs) -> Optional['Order']:
-        """Yeni sipariş oluştur"""
-        try:
-            # Sipariş numarası oluştur
-            order_number = cls.generate_order_number()
-            
-            # Toplam tutarı hesapla
-            total_amount = sum(item.get('price', 0) * item.get('quantity', 1) for item in items)
-            
-            # Sipariş oluştur
-            order_data = {
-                'user_id': user_id,
-                'order_number': order_number,
-                'total_amount': total_amount,
-                'status': 'pending',
-                'payment_status': 'pending',
-                **kwargs
-            }
-            
+    def create_order(cls, user_id: int, items: List[Dict[str, Any]], **kwargs) -> 'Order':
+        """
+        Yeni sipariş oluştur
+        
+        Sipariş ve kalemleri tek transaction içinde yazılır; biri başarısız
+        olursa hiçbiri kalmaz ve hata yükseltilir. Kalemlerde birim fiyat
+        'unit_price' ya da 'price' olarak verilebilir.
+        """
+        from .OrderItem import OrderItem
+        
+        order_items = [cls._order_item_data(item) for item in items]
+        
+        # Sipariş verisi
+        order_data = {
+            'user_id': user_id,
+            'order_number': cls.generate_order_number(),
+            'total_amount': sum(item['total_price'] for item in order_items),
+            'status': 'pending',
+            'payment_status': 'pending',
+            **kwargs
+        }
+        
+        with cls._db_connection.transaction():
             order = cls(**order_data)
-            if order.save():
-                # Sipariş kalemlerini oluştur
-                from .OrderItem import OrderItem
-                for item_data in items:
-                    item_data['order_id'] = order.id
-                    OrderItem.create(item_data)
-                
-                return order
-            
-            return None
+            if not order.save():
+                raise RuntimeError("Sipariş kaydedilemedi")
             
-        except Exception as e:
-            print(f"Order creation error: {str(e)}")
-            return None 
\ No newline at end of file
+            # Sipariş kalemlerini oluştur
+            for item in order_items:
+                item['order_id'] = order.id
+            written = OrderItem.bulk_insert(order_items)
+            if written != len(order_items):
+                raise RuntimeError(f"Sipariş kalemleri kaydedilemedi ({written}/{len(order_items)})")
+        
+        return order
+    
+    @staticmethod
+    def _order_item_data(item: Dict[str, Any]) -> Dict[str, Any]:
+        """Kalem verisini OrderItem sütunlarına çevir"""
+        data = {key: value for key, value in item.items() if key != 'price'}
+        data['unit_price'] = item.get('unit_price', item.get('price', 0))
+        data['quantity'] = item.get('quantity', 1)
+        data['total_price'] = data['unit_price'] * data['quantity']
+        return data
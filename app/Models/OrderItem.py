@@ -16,6 +16,10 @@ class OrderItem(BaseModel):
     ]
     __hidden__ = []
     __timestamps__ = True
+    __relations__ = {
+        'order': {'type': 'belongs_to', 'model': 'app.Models.Order.Order', 'foreign_key': 'order_id'},
+        'product': {'type': 'belongs_to', 'model': 'app.Models.Product.Product', 'foreign_key': 'product_id'}
+    }
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -29,14 +33,14 @@ class OrderItem(BaseModel):
     
     def order(self):
         """Bağlı olduğu sipariş"""
-        if self._order is None:
+        if self._order is None and 'order' not in self._loaded_relations:
             from .Order import Order
             self._order = Order.find(self.order_id)
         return self._order
     
     def product(self):
         """Ürün bilgisi"""
-        if self._product is None:
+        if self._product is None and 'product' not in self._loaded_relations:
             from .Product import Product
             self._product = Product.find(self.product_id)
         return self._product
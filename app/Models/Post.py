@@ -17,6 +17,12 @@ class Post(BaseModel):
     ]
     __hidden__ = []
     __timestamps__ = True
+    __relations__ = {
+        'user': {'type': 'belongs_to', 'model': 'app.Models.User.User', 'foreign_key': 'user_id'},
+        'comments': {'type': 'has_many', 'model': 'app.Models.Comment.Comment', 'foreign_key': 'post_id',
+                     'conditions': {'status': 'approved'}},
+        'likes': {'type': 'has_many', 'model': 'app.Models.Like.Like', 'foreign_key': 'post_id'}
+    }
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -63,7 +69,7 @@ class Post(BaseModel):
     
     def user(self):
         """Post'un yazarı"""
-        if self._user is None:
+        if self._user is None and 'user' not in self._loaded_relations:
             from .User import User
             self._user = User.find(self.user_id)
         return self._user
@@ -200,8 +206,9 @@ class Post(BaseModel):
         data['likes_count'] = self.likes_count()
         
         # İlişkili veriler
-        if self.user():
-            data['user'] = self.user().to_dict()
+        user = self.user()
+        if user:
+            data['user'] = user.to_dict()
         
         return data
     
@@ -27,6 +27,11 @@ class Product(BaseModel):
     ]
     __hidden__ = ['cost_price']
     __timestamps__ = True
+    __relations__ = {
+        'category': {'type': 'belongs_to', 'model': 'app.Models.Category.Category', 'foreign_key': 'category_id'},
+        # Review bir BaseModel değil; yorumlar satır (dict) olarak yüklenir
+        'reviews': {'type': 'has_many', 'table': 'reviews', 'foreign_key': 'product_id'}
+    }
     
     # Ürün durumları
     STATUS_DRAFT = 'draft'
@@ -119,7 +124,7 @@ class Product(BaseModel):
     
     def category(self) -> Optional['Category']:
         """Kategoriyi getir"""
-        if self._category is None and self.category_id:
+        if self._category is None and self.category_id and 'category' not in self._loaded_relations:
             from app.Models.Category import Category
             self._category = Category.find(self.category_id)
         return self._category
@@ -131,12 +136,9 @@ class Product(BaseModel):
             self._brand = Brand.find(self.brand_id)
         return self._brand
     
-    def reviews(self) -> List['Review']:
-        """Yorumları getir"""
-        if self._reviews is None:
-            from app.Models.Review import Review
-            self._reviews = Review.where({'product_id': self.id})
-        return self._reviews
+    def reviews(self) -> List[Dict[str, Any]]:
+        """Yorumları satır (dict) olarak getir"""
+        return self.load_relation('reviews')
     
     def related_products(self, limit: int = 4) -> List['Product']:
         """İlgili ürünleri getir"""
@@ -358,38 +360,43 @@ class Product(BaseModel):
     
     @classmethod
     def search(cls, query: str, filters: Dict[str, Any] = None) -> List['Product']:
-        """Ürün ara"""
-        sql = """
-        SELECT * FROM products 
-        WHERE (name LIKE %s OR description LIKE %s OR tags LIKE %s)
-        AND status = %s
-        """
-        params = [f'%{query}%', f'%{query}%', f'%{query}%', cls.STATUS_ACTIVE]
+        """Ürün ara (full-text indeks varsa BM25 ilgililiğine göre)"""
+        from core.Database.query_builder import QueryBuilder
+        from core.Database.fulltext import find_fulltext_index
+        
+        builder = QueryBuilder(cls.__table__)
+        
+        index = find_fulltext_index(cls.__table__)
+        if not (index and index.apply(builder, query, rank=True)):
+            like = f'%{query}%'
+            placeholder = builder.param_placeholder
+            builder.where_conditions.append(
+                f"(name LIKE {placeholder} OR description LIKE {placeholder} OR tags LIKE {placeholder})"
+            )
+            builder.where_values.extend([like, like, like])
+        
+        builder.where(f'{cls.__table__}.status', '=', cls.STATUS_ACTIVE)
         
         # Filtreler
         if filters:
             if filters.get('category_id'):
-                sql += " AND category_id = %s"
-                params.append(filters['category_id'])
+                builder.where('category_id', '=', filters['category_id'])
             
             if filters.get('brand_id'):
-                sql += " AND brand_id = %s"
-                params.append(filters['brand_id'])
+                builder.where('brand_id', '=', filters['brand_id'])
             
             if filters.get('min_price'):
-                sql += " AND price >= %s"
-                params.append(filters['min_price'])
+                builder.where('price', '>=', filters['min_price'])
             
             if filters.get('max_price'):
-                sql += " AND price <= %s"
-                params.append(filters['max_price'])
+                builder.where('price', '<=', filters['max_price'])
             
             if filters.get('in_stock'):
-                sql += " AND quantity > 0"
+                builder.where('quantity', '>', 0)
         
-        sql += " ORDER BY rating DESC, sold_count DESC LIMIT 50"
+        builder.order_by('rating', 'DESC').order_by('sold_count', 'DESC').limit(50)
         
-        return cls.raw(sql, params)
+        return [cls(**row) for row in builder.get()]
     
     @classmethod
     def trending(cls, limit: int = 10) -> List['Product']:
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Autocomplete Benchmark Scripti
+SearchController'ın LIKE tabanlı öneri sorgusu ile bellek içi önek
+indeksini (PrefixIndex) aynı veri üzerinde karşılaştırır.
+
+Kullanım:
+    python benchmark_autocomplete.py [satır_sayısı] [sorgu_sayısı]
+"""
+
+import os
+import sys
+import random
+import sqlite3
+import tempfile
+import time
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Services.autocomplete_service import PrefixIndex, Suggestion
+
+WORDS = [
+    'kırmızı', 'mavi', 'yeşil', 'siyah', 'beyaz', 'elbise', 'gömlek', 'ayakkabı',
+    'çanta', 'şapka', 'pamuk', 'keten', 'ipek', 'yazlık', 'kışlık', 'çocuk',
+    'kadın', 'erkek', 'spor', 'klasik', 'ılık', 'İstanbul', 'deri', 'örgü'
+]
+
+
+def print_header(title: str):
+    """Başlık yazdırır"""
+    print("\n" + "=" * 60)
+    print(f" {title}")
+    print("=" * 60)
+
+
+def create_dataset(row_count: int) -> list:
+    """Rastgele ürün adları üretir"""
+    random.seed(42)
+    return [
+        (i + 1, ' '.join(random.sample(WORDS, 3)).title(), random.randint(0, 5000))
+        for i in range(row_count)
+    ]
+
+
+def build_sqlite(rows: list) -> sqlite3.Connection:
+    """Ürünleri geçici SQLite veritabanına yükler"""
+    path = os.path.join(tempfile.mkdtemp(), 'benchmark.db')
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE products (id INTEGER PRIMARY KEY, name TEXT, sold_count INTEGER)")
+    conn.execute("CREATE INDEX idx_products_name ON products (name)")
+    conn.executemany("INSERT INTO products (id, name, sold_count) VALUES (?, ?, ?)", rows)
+    conn.commit()
+    return conn
+
+
+def build_index(rows: list) -> PrefixIndex:
+    """Ürünleri önek indeksine yükler"""
+    index = PrefixIndex(top_k=10)
+    for product_id, name, sold_count in rows:
+        index.add(Suggestion('product', product_id, name, score=sold_count), [name])
+    return index
+
+
+def benchmark(label: str, func, queries: list) -> float:
+    """Sorgu başına ortalama süreyi (mikrosaniye) ölçer"""
+    started = time.perf_counter()
+    for query in queries:
+        func(query)
+    elapsed = (time.perf_counter() - started) / len(queries) * 1_000_000
+    print(f"{label:<32} {elapsed:>12.1f} µs/sorgu")
+    return elapsed
+
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    query_count = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+
+    print_header(f"AUTOCOMPLETE BENCHMARK ({row_count:,} ürün, {query_count:,} sorgu)")
+
+    rows = create_dataset(row_count)
+
+    started = time.perf_counter()
+    conn = build_sqlite(rows)
+    print(f"SQLite yükleme: {time.perf_counter() - started:.2f}s")
+
+    started = time.perf_counter()
+    index = build_index(rows)
+    print(f"Önek indeksi oluşturma: {time.perf_counter() - started:.2f}s ({len(index):,} kayıt)")
+
+    # Tuş vuruşlarını taklit et: her kelimenin 2..n harflik önekleri
+    random.seed(7)
+    queries = []
+    while len(queries) < query_count:
+        word = random.choice(WORDS)
+        for length in range(2, len(word) + 1):
+            queries.append(word[:length])
+    queries = queries[:query_count]
+
+    def sql_path(query: str):
+        # SearchController._get_user_suggestions ile aynı LIKE kalıbı
+        conn.execute(
+            "SELECT id, name FROM products WHERE name LIKE ? ORDER BY sold_count DESC LIMIT ?",
+            (f"%{query}%", 10)
+        ).fetchall()
+
+    def index_path(query: str):
+        index.search(query, 10)
+
+    print()
+    sql_time = benchmark("SQL LIKE '%q%'", sql_path, queries)
+    index_time = benchmark("PrefixIndex.search", index_path, queries)
+    print(f"\nHızlanma: {sql_time / index_time:.0f}x")
+
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -124,13 +124,14 @@ class AICore:
             self.logger.error(f"AI modelleri yüklenirken hata: {e}")
             raise
     
-    async def process_image(self, image_path: str, user_id: int) -> Dict[str, Any]:
+    async def process_image(self, image_path: str, user_id: int, image=None) -> Dict[str, Any]:
         """
         Görsel işleme ana fonksiyonu
         
         Args:
             image_path: İşlenecek görselin yolu
             user_id: Kullanıcı ID'si
+            image: Önceden çözülmüş ImageContext (verilirse dosya yeniden okunmaz)
             
         Returns:
             İşleme sonuçları
@@ -143,14 +144,14 @@ class AICore:
             
             # Görsel sınıflandırma
             if 'image_classifier' in self.pipelines:
-                tasks.append(self._classify_image(image_path))
+                tasks.append(self._classify_image(image_path, image))
             
             # Nesne algılama
             if 'yolo' in self.models:
-                tasks.append(self._detect_objects(image_path))
+                tasks.append(self._detect_objects(image_path, image))
             
             # Meta veri çıkarma
-            tasks.append(self._extract_metadata(image_path))
+            tasks.append(self._extract_metadata(image_path, image))
             
             # Tüm görevleri paralel çalıştır
             results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -191,13 +192,16 @@ class AICore:
             
             return error_result
     
-    async def _classify_image(self, image_path: str) -> Dict[str, Any]:
+    async def _classify_image(self, image_path: str, image=None) -> Dict[str, Any]:
         """Görsel sınıflandırma"""
         try:
-            from PIL import Image
+            if image is not None:
+                pil_image = image.image
+            else:
+                from PIL import Image
+                pil_image = Image.open(image_path)
             
-            image = Image.open(image_path)
-            results = self.pipelines['image_classifier'](image)
+            results = self.pipelines['image_classifier'](pil_image)
             
             return {
                 'categories': results[:5],  # İlk 5 kategori
@@ -208,13 +212,15 @@ class AICore:
             self.logger.error(f"Görsel sınıflandırma hatası: {e}")
             return {'error': str(e)}
     
-    async def _detect_objects(self, image_path: str) -> Dict[str, Any]:
+    async def _detect_objects(self, image_path: str, image=None) -> Dict[str, Any]:
         """Nesne algılama"""
         try:
             if 'yolo' not in self.models:
                 return {'error': 'YOLO modeli mevcut değil'}
             
-            results = self.models['yolo'](image_path)
+            # Çözülmüş görsel varsa BGR çalışma kopyası kullanılır
+            results = self.models['yolo'](image.bgr if image is not None else image_path)
+            scale = image.scale if image is not None else 1.0
             
             objects = []
             for result in results:
@@ -222,7 +228,7 @@ class AICore:
                     objects.append({
                         'class': result.names[int(box.cls)],
                         'confidence': float(box.conf),
-                        'bbox': box.xyxy.tolist()[0]
+                        'bbox': [value * scale for value in box.xyxy.tolist()[0]]
                     })
             
             return {
@@ -234,9 +240,20 @@ class AICore:
             self.logger.error(f"Nesne algılama hatası: {e}")
             return {'error': str(e)}
     
-    async def _extract_metadata(self, image_path: str) -> Dict[str, Any]:
+    async def _extract_metadata(self, image_path: str, image=None) -> Dict[str, Any]:
         """Meta veri çıkarma"""
         try:
+            if image is not None:
+                return {
+                    'file_size': image.stat.st_size,
+                    'creation_time': datetime.fromtimestamp(image.stat.st_ctime).isoformat(),
+                    'modification_time': datetime.fromtimestamp(image.stat.st_mtime).isoformat(),
+                    'dimensions': {'width': image.width, 'height': image.height},
+                    'format': image.format,
+                    'mode': image.mode,
+                    'exif': image.exif
+                }
+            
             from PIL import Image
             from PIL.ExifTags import TAGS
             import os
@@ -28,6 +28,8 @@ from sklearn.model_selection import train_test_split
 
 from core.Services.logger import LoggerService
 from core.Database.connection import DatabaseConnection
+from core.Config.config import get_config
+from . import similarity_index
 
 
 class ContentCategorizerService:
@@ -276,6 +278,16 @@ class ContentCategorizerService:
             # Veritabanına kaydet
             await self._save_categorization_result(final_categorization)
             
+            # Benzerlik indeksindeki kategorileri güncelle (sonraki yakın kopyalar için)
+            if analysis.get('similarity_hash'):
+                try:
+                    similarity_index.add_image(
+                        image_path, analysis['similarity_hash'], user_id,
+                        [c['category'] for c in hierarchical_categories[:5]]
+                    )
+                except Exception as e:
+                    self.logger.warning(f"Benzerlik indeksi güncellenemedi: {e}")
+            
             # İstatistikleri güncelle
             self._update_category_stats(hierarchical_categories)
             
@@ -353,15 +365,35 @@ class ContentCategorizerService:
         categories = []
         
         try:
-            # Benzer görselleri bul (bu kısım veritabanı implementasyonuna bağlı)
             similarity_hash = analysis.get('similarity_hash')
             if not similarity_hash:
                 return categories
             
-            # Placeholder - gerçek implementasyon veritabanı sorgusu gerektirir
-            # similar_images = await self._query_similar_images(similarity_hash, user_id)
+            # Kullanıcının benzerlik indeksinden yakın kopyaları bul
+            config = get_config('ai.similarity_index', {}) or {}
+            similar_images = similarity_index.find_similar(
+                similarity_hash,
+                user_id,
+                config.get('category_distance', 10),
+                config.get('category_neighbors', 20),
+                exclude=analysis.get('image_path')
+            )
+            
+            # Her kategori, onu taşıyan en benzer görselin benzerliği ile skorlanır
+            category_scores = {}
+            category_counts = Counter()
+            for similar in similar_images:
+                for category in similar['categories']:
+                    category_scores[category] = max(category_scores.get(category, 0.0), similar['similarity'])
+                    category_counts[category] += 1
             
-            # Şimdilik boş döndür, gerçek implementasyon eklenecek
+            for category, confidence in category_scores.items():
+                categories.append({
+                    'category': category,
+                    'confidence': confidence,
+                    'method': 'similarity_based',
+                    'similar_images': category_counts[category]
+                })
             
         except Exception as e:
             self.logger.warning(f"Benzerlik tabanlı kategorilendirme hatası: {e}")
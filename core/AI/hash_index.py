@@ -0,0 +1,498 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PofuAi Hash Index
+================
+
+64 bitlik perceptual hash'ler (pHash) için hamming mesafesi indeksi
+- Hash'ler NumPy uint64 dizisinde paketlenir, mesafe XOR + popcount ile hesaplanır
+- Eşik sorguları multi-index hashing ile alt-doğrusal çalışır
+- Toplu duplicate tespiti yalnızca aynı parçayı paylaşan adayları karşılaştırır
+- İndeks diske kaydedilir ve artımlı güncellenir; başka süreçlerin
+  kaydettiği değişiklikler dosya değişince yeniden yüklenir
+"""
+
+import atexit
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+
+HashValue = Union[int, str]
+
+if hasattr(np, 'bitwise_count'):
+    def popcount(values: np.ndarray) -> np.ndarray:
+        """uint64 dizisindeki her elemanın 1 bit sayısı"""
+        return np.bitwise_count(values)
+else:
+    _BYTE_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+    def popcount(values: np.ndarray) -> np.ndarray:
+        """uint64 dizisindeki her elemanın 1 bit sayısı"""
+        values = np.ascontiguousarray(values, dtype=np.uint64)
+        return _BYTE_POPCOUNT[values.view(np.uint8)].reshape(values.shape + (8,)).sum(axis=-1)
+
+
+def to_int(value: HashValue) -> int:
+    """Hex string (imagehash formatı) ya da int hash'i int'e çevir"""
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+def hamming_distance(first: HashValue, second: HashValue) -> int:
+    """İki hash arasındaki farklı bit sayısı"""
+    return bin(to_int(first) ^ to_int(second)).count('1')
+
+
+def _chunk_layout(chunks: int) -> List[Tuple[int, int]]:
+    """64 biti `chunks` parçaya böl: (shift, mask) listesi"""
+    layout = []
+    shift = 0
+    for index in range(chunks):
+        width = 64 // chunks + (1 if index < 64 % chunks else 0)
+        layout.append((shift, (1 << width) - 1))
+        shift += width
+    return layout
+
+
+@lru_cache(maxsize=None)
+def _neighbor_masks(width: int, radius: int) -> Tuple[int, ...]:
+    """`width` bitlik bir değerin en fazla `radius` bit farklı komşuları için XOR maskeleri"""
+    masks = []
+    for distance in range(radius + 1):
+        for bits in combinations(range(width), distance):
+            masks.append(sum(1 << bit for bit in bits))
+    return tuple(masks)
+
+
+def _file_version(path: str) -> Tuple[int, int]:
+    """Dosya sürümü; atomik değiştirme yeni inode ürettiği için aynı zaman damgasında da ayırt eder"""
+    stat = os.stat(path)
+    return stat.st_ino, stat.st_mtime_ns
+
+
+@contextmanager
+def _file_lock(path: str, timeout: float = 10.0):
+    """
+    Süreçler arası O_EXCL kilit dosyası
+
+    `timeout` saniyeden eski kilit, sahibi ölmüş sayılıp kaldırılır.
+    """
+    lock_path = f"{path}.lock"
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) > timeout:
+                    os.remove(lock_path)
+            except OSError:
+                pass
+            time.sleep(0.01)
+    os.close(fd)
+    try:
+        yield
+    finally:
+        try:
+            os.remove(lock_path)
+        except FileNotFoundError:
+            pass
+
+
+class HammingIndex:
+    """
+    Hamming mesafesi indeksi
+
+    Sorgular için hash'in 64 biti `chunks` parçaya bölünür ve her parça
+    değeri için ayrı kova tutulur. Aralarında en fazla k bit fark olan iki
+    hash'in en az bir parçası en fazla k // chunks bit farklı olacağından
+    (güvercin yuvası) yalnızca bu komşu kovalardaki adaylar karşılaştırılır.
+    Komşu kova sayısı kayıt sayısına göre büyüdüğünde vektörel tam tarama
+    daha ucuz olduğundan ona geçilir.
+
+    Alt-doğrusal arama pratikte yalnızca `max_distance < chunks` iken
+    (k // chunks == 0, tek kova araması) işe yarar: varsayılan 4 parça ile
+    0.95 eşiği (mesafe 3) kovalardan yanıtlanır, 12 gibi mesafelerde 16
+    bitlik parça başına yüzlerce komşu kova gerektiğinden çok büyük
+    indeksler dışında tam taramaya düşülür. Büyük mesafelerle sorgulanacak
+    indeksler için `chunks` beklenen mesafeden büyük seçilmelidir.
+    """
+
+    # Toplu karşılaştırmada bir seferde karşılaştırılan satır sayısı (bellek sınırı)
+    COMPARE_BLOCK = 512
+
+    def __init__(self, chunks: int = 4, path: str = None):
+        self.chunks = chunks
+        self.path = path
+        self.dirty = False
+        self._saved_at = time.monotonic()
+        self._layout = _chunk_layout(chunks)
+        # Son kayıt/yüklemeden beri yapılan değişiklikler: anahtar -> (hash, etiket) ya da None (silindi)
+        self._pending: Dict[str, Optional[Tuple[int, str]]] = {}
+        # Diskteki dosyanın bilinen son sürümü (inode, st_mtime_ns)
+        self._file_version: Optional[Tuple[int, int]] = None
+        self._lock = threading.RLock()
+        self._clear()
+
+    def _clear(self):
+        self._hashes = np.zeros(64, dtype=np.uint64)
+        self._alive = np.zeros(64, dtype=bool)
+        self._size = 0
+        self._keys: List[Optional[str]] = []
+        self._tags: List[str] = []
+        self._slots: Dict[str, int] = {}
+        self._buckets: List[Dict[int, Set[int]]] = [defaultdict(set) for _ in range(self.chunks)]
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._slots
+
+    def get(self, key: str) -> Optional[str]:
+        """Anahtarın hash'ini 16 haneli hex olarak getir"""
+        slot = self._slots.get(key)
+        return None if slot is None else format(int(self._hashes[slot]), '016x')
+
+    def tag(self, key: str) -> Optional[str]:
+        """Anahtarla birlikte saklanan etiket (örn. dosya imzası)"""
+        slot = self._slots.get(key)
+        return None if slot is None else self._tags[slot]
+
+    def keys(self) -> List[str]:
+        return list(self._slots)
+
+    def _chunk_values(self, value: int) -> List[int]:
+        return [(value >> shift) & mask for shift, mask in self._layout]
+
+    def add(self, key: str, value: HashValue, tag: str = ''):
+        """Hash ekle (anahtar varsa güncelle)"""
+        value = to_int(value)
+        with self._lock:
+            if self._add(key, value, tag):
+                self._pending[key] = (value, tag)
+                self.dirty = True
+
+    def _add(self, key: str, value: int, tag: str) -> bool:
+        slot = self._slots.get(key)
+        if slot is not None:
+            if int(self._hashes[slot]) == value:
+                if self._tags[slot] == tag:
+                    return False
+                self._tags[slot] = tag
+                return True
+            self._remove_slot(key, slot)
+
+        if self._size == len(self._hashes):
+            self._hashes = np.concatenate([self._hashes, np.zeros(len(self._hashes), dtype=np.uint64)])
+            self._alive = np.concatenate([self._alive, np.zeros(len(self._alive), dtype=bool)])
+
+        slot = self._size
+        self._size += 1
+        self._hashes[slot] = value
+        self._alive[slot] = True
+        self._keys.append(key)
+        self._tags.append(tag)
+        self._slots[key] = slot
+        for buckets, chunk in zip(self._buckets, self._chunk_values(value)):
+            buckets[chunk].add(slot)
+        return True
+
+    def add_many(self, items: Iterable[Tuple]):
+        """Çok sayıda (anahtar, hash[, etiket]) ekle"""
+        with self._lock:
+            for item in items:
+                self.add(*item)
+
+    def remove(self, key: str) -> bool:
+        """Hash'i kaldır"""
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                return False
+            self._remove_slot(key, slot)
+            self._pending[key] = None
+            self.dirty = True
+
+            # Silinenler çoğaldıysa dizileri sıkıştır
+            if self._size > 1024 and len(self._slots) < self._size // 2:
+                self._rebuild()
+            return True
+
+    def _remove_slot(self, key: str, slot: int):
+        del self._slots[key]
+        self._keys[slot] = None
+        self._tags[slot] = ''
+        self._alive[slot] = False
+        for buckets, chunk in zip(self._buckets, self._chunk_values(int(self._hashes[slot]))):
+            bucket = buckets.get(chunk)
+            if bucket is not None:
+                bucket.discard(slot)
+                if not bucket:
+                    del buckets[chunk]
+
+    def _rebuild(self, items: Iterable[Tuple[str, int, str]] = None):
+        if items is None:
+            items = [(key, int(self._hashes[slot]), self._tags[slot]) for key, slot in self._slots.items()]
+        self._clear()
+        for key, value, tag in items:
+            self._add(key, int(value), tag)
+
+    def _read_file(self) -> bool:
+        """Diskteki sürümü yükle ve bu süreçte henüz kaydedilmemiş değişiklikleri üzerine uygula"""
+        try:
+            version = _file_version(self.path)
+        except FileNotFoundError:
+            return False
+
+        with np.load(self.path, allow_pickle=False) as data:
+            self._rebuild(zip(data['keys'].tolist(), data['hashes'].tolist(), data['tags'].tolist()))
+        for key, change in self._pending.items():
+            if change is None:
+                slot = self._slots.get(key)
+                if slot is not None:
+                    self._remove_slot(key, slot)
+            else:
+                self._add(key, *change)
+        self._file_version = version
+        return True
+
+    def refresh(self) -> bool:
+        """Dosya başka bir süreç tarafından kaydedildiyse yeniden yükle"""
+        if not self.path:
+            return False
+        try:
+            version = _file_version(self.path)
+        except FileNotFoundError:
+            return False
+        if version == self._file_version:
+            return False
+        with self._lock:
+            return self._read_file()
+
+    def query(self, value: HashValue, max_distance: int, limit: int = None) -> List[Tuple[str, int]]:
+        """
+        Hash'e en fazla `max_distance` bit uzaklıktaki kayıtlar
+
+        Returns:
+            List[Tuple[str, int]]: (anahtar, mesafe), mesafeye göre sıralı
+        """
+        value = to_int(value)
+        with self._lock:
+            radius = max_distance // self.chunks
+            masks = [_neighbor_masks(mask.bit_length(), radius) for _, mask in self._layout]
+            # Bir kova araması kabaca 100 elemanlık vektörel taramaya denk
+            if sum(len(chunk_masks) for chunk_masks in masks) * 100 < len(self._slots):
+                candidates = set()
+                chunk_values = self._chunk_values(value)
+                for buckets, chunk, chunk_masks in zip(self._buckets, chunk_values, masks):
+                    for mask in chunk_masks:
+                        bucket = buckets.get(chunk ^ mask)
+                        if bucket:
+                            candidates.update(bucket)
+                slots = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+            else:
+                slots = np.flatnonzero(self._alive[:self._size])
+
+            if not len(slots):
+                return []
+
+            distances = popcount(self._hashes[slots] ^ np.uint64(value))
+            matched = distances <= max_distance
+            slots, distances = slots[matched], distances[matched]
+            order = np.lexsort((slots, distances))[:limit]
+            return [(self._keys[slots[i]], int(distances[i])) for i in order]
+
+    def _unique_pairs(self, max_distance: int) -> Tuple[List[Optional[str]], np.ndarray, List[Tuple[int, int, int]]]:
+        """
+        Farklı hash değerleri arasındaki yakın çiftler
+
+        Aynı hash'e sahip kayıtlar tek değerde toplanır; böylece çok sayıda
+        birebir kopya karesel sayıda karşılaştırma üretmez. Büyük aday
+        grupları satır blokları halinde karşılaştırılır.
+
+        Returns:
+            (anahtarlar, her anahtarın değer numarası, (değer, değer, mesafe) listesi)
+        """
+        with self._lock:
+            slots = np.flatnonzero(self._alive[:self._size])
+            keys = [self._keys[slot] for slot in slots]
+            values, inverse = np.unique(self._hashes[slots], return_inverse=True)
+
+        found: Dict[Tuple[int, int], int] = {}
+
+        def compare(group: np.ndarray):
+            group_hashes = values[group]
+            for start in range(0, len(group), self.COMPARE_BLOCK):
+                block = group_hashes[start:start + self.COMPARE_BLOCK]
+                distances = popcount(block[:, None] ^ group_hashes[None, :])
+                rows, columns = np.nonzero(distances <= max_distance)
+                for row, column in zip(rows, columns):
+                    first, second = int(group[start + row]), int(group[column])
+                    if first < second:
+                        found[(first, second)] = int(distances[row, column])
+
+        if max_distance >= 16:
+            # Parçalar çok daralınca kovalar işe yaramaz; bloklar halinde tam karşılaştırma
+            compare(np.arange(len(values)))
+        else:
+            for shift, mask in _chunk_layout(max_distance + 1):
+                chunk_values = (values >> np.uint64(shift)) & np.uint64(mask)
+                order = np.argsort(chunk_values, kind='stable')
+                boundaries = np.flatnonzero(np.diff(chunk_values[order])) + 1
+                for group in np.split(order, boundaries):
+                    if len(group) > 1:
+                        compare(group)
+
+        pairs = [(first, second, distance) for (first, second), distance in sorted(found.items())]
+        return keys, inverse, pairs
+
+    def pairs(self, max_distance: int) -> List[Tuple[str, str, int]]:
+        """
+        Birbirine en fazla `max_distance` bit uzaklıktaki tüm kayıt çiftleri
+
+        Hash'ler `max_distance + 1` parçaya bölünür; yalnızca en az bir
+        parçası aynı olan farklı hash değerleri (sıralama ile bulunan eşit
+        değer grupları) vektörel olarak karşılaştırılır. Aynı hash'e sahip
+        n kaydın n * (n - 1) / 2 çifti sonuçta yer alır; yalnızca grup
+        gerekiyorsa `groups` kullanılmalıdır.
+        """
+        keys, inverse, value_pairs = self._unique_pairs(max_distance)
+        members = defaultdict(list)
+        for position, value in enumerate(inverse.tolist()):
+            members[value].append(position)
+
+        found = []
+        for positions in members.values():
+            for first, second in combinations(positions, 2):
+                found.append((first, second, 0))
+        for first_value, second_value, distance in value_pairs:
+            for first in members[first_value]:
+                for second in members[second_value]:
+                    found.append((min(first, second), max(first, second), distance))
+
+        found.sort()
+        return [(keys[first], keys[second], distance) for first, second, distance in found]
+
+    def groups(self, max_distance: int) -> List[List[str]]:
+        """
+        Benzer kayıt grupları; tekil kayıtlar hariç
+
+        Gruplar zincirleme (geçişli) birleştirilmez: her grup bir temsilci
+        ile ona en fazla `max_distance` bit uzaklıktaki, henüz bir gruba
+        girmemiş kayıtlardan oluşur. Temsilci grubun ilk elemanıdır; böylece
+        grubun geri kalanı temsilciye her zaman benzerdir. Temsilciler ekleme
+        sırasıyla seçilir.
+        """
+        keys, inverse, value_pairs = self._unique_pairs(max_distance)
+        members = defaultdict(list)
+        for position, value in enumerate(inverse.tolist()):
+            members[value].append(keys[position])
+
+        neighbors = defaultdict(list)
+        for first_value, second_value, _ in value_pairs:
+            neighbors[first_value].append(second_value)
+            neighbors[second_value].append(first_value)
+
+        groups = []
+        assigned: Set[int] = set()
+        for value in dict.fromkeys(inverse.tolist()):
+            if value in assigned:
+                continue
+            assigned.add(value)
+            group = list(members[value])
+            for neighbor in neighbors[value]:
+                if neighbor not in assigned:
+                    assigned.add(neighbor)
+                    group.extend(members[neighbor])
+            if len(group) > 1:
+                groups.append(group)
+        return groups
+
+    def save(self, path: str = None) -> str:
+        """
+        İndeksi .npz dosyasına atomik olarak kaydet
+
+        Kendi dosyasına kaydederken kilit altında önce diskteki sürüm
+        okunur ve bu süreçteki değişiklikler onun üzerine uygulanır; böylece
+        aynı indeksi kullanan süreçler birbirinin kayıtlarını ezmez.
+        """
+        path = path or self.path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._lock, _file_lock(path):
+            if path == self.path:
+                self._read_file()
+
+            slots = np.flatnonzero(self._alive[:self._size])
+            keys = np.array([self._keys[slot] for slot in slots], dtype=str)
+            tags = np.array([self._tags[slot] for slot in slots], dtype=str)
+            hashes = self._hashes[slots]
+
+            temp_path = f"{path}.{os.getpid()}.tmp.npz"
+            np.savez(temp_path, keys=keys, tags=tags, hashes=hashes, chunks=np.array(self.chunks))
+            os.replace(temp_path, path)
+            if path == self.path:
+                self._file_version = _file_version(path)
+                self._pending.clear()
+                self.dirty = False
+            self._saved_at = time.monotonic()
+        return path
+
+    def save_if_due(self, interval: float = 30.0) -> bool:
+        """Değişiklik varsa ve son kayıttan bu yana `interval` saniye geçtiyse kaydet"""
+        if self.dirty and self.path and time.monotonic() - self._saved_at >= interval:
+            self.save()
+            return True
+        return False
+
+    @classmethod
+    def load(cls, path: str, chunks: int = 4) -> 'HammingIndex':
+        """Kaydedilmiş indeksi yükle; dosya yoksa boş indeks döner"""
+        if not os.path.exists(path):
+            return cls(chunks, path)
+
+        with np.load(path, allow_pickle=False) as data:
+            chunks = int(data['chunks'])
+        index = cls(chunks, path)
+        index._read_file()
+        return index
+
+
+_indexes: Dict[str, HammingIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def open_hash_index(path: str, chunks: int = 4) -> HammingIndex:
+    """
+    Süreç içinde paylaşılan (yol başına tek) indeksi getir
+
+    Dosya başka bir süreç tarafından kaydedildiyse indeks yeniden yüklenir.
+    """
+    path = os.path.abspath(path)
+    index = _indexes.get(path)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(path)
+            if index is None:
+                index = _indexes[path] = HammingIndex.load(path, chunks)
+                return index
+    index.refresh()
+    return index
+
+
+@atexit.register
+def flush_hash_indexes():
+    """Kaydedilmemiş değişikliği olan tüm paylaşılan indeksleri kaydet"""
+    for index in list(_indexes.values()):
+        if index.dirty:
+            try:
+                index.save()
+            except Exception as e:
+                print(f"Hash indeksi kaydedilemedi {index.path}: {e}")
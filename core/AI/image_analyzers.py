@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PofuAi Image Analyzers
+=====================
+
+Görsel analizörleri (saf fonksiyonlar)
+- Süreç havuzunda çalıştırılabilmeleri için modül seviyesindedir
+- Hepsi önceden çözülmüş bir ImageContext alır
+"""
+
+import pickle
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional
+
+import cv2
+import numpy as np
+import face_recognition
+from sklearn.cluster import KMeans
+
+from core.Services.logger import LoggerService
+from .image_context import ImageContext
+
+
+def analyze_basic_properties(image: ImageContext) -> Dict[str, Any]:
+    """Temel görsel özellikleri analizi"""
+    try:
+        width, height = image.size
+
+        # Aspect ratio
+        aspect_ratio = width / height
+
+        # Orientation
+        if width > height:
+            orientation = 'landscape'
+        elif height > width:
+            orientation = 'portrait'
+        else:
+            orientation = 'square'
+
+        # Resolution category
+        total_pixels = width * height
+        if total_pixels > 8000000:  # 8MP+
+            resolution_category = 'high'
+        elif total_pixels > 2000000:  # 2MP+
+            resolution_category = 'medium'
+        else:
+            resolution_category = 'low'
+
+        return {
+            'dimensions': {'width': width, 'height': height},
+            'format': image.format,
+            'mode': image.mode,
+            'aspect_ratio': round(aspect_ratio, 2),
+            'orientation': orientation,
+            'total_pixels': total_pixels,
+            'resolution_category': resolution_category,
+            'file_size': image.file_size
+        }
+
+    except Exception as e:
+        return {'error': str(e)}
+
+
+def analyze_colors(image: ImageContext, clusters: int = 5) -> Dict[str, Any]:
+    """Renk analizi"""
+    try:
+        # Performans için 200x200 RGB görünüm
+        pixels = image.resized_array((200, 200)).reshape(-1, 3)
+
+        # K-means ile dominant renkleri bul
+        kmeans = KMeans(n_clusters=clusters, random_state=42, n_init=10)
+        kmeans.fit(pixels)
+
+        colors = kmeans.cluster_centers_.astype(int)
+        labels = kmeans.labels_
+
+        # Renk yüzdelerini hesapla
+        color_percentages = []
+        for i in range(clusters):
+            percentage = np.sum(labels == i) / len(labels) * 100
+            color_percentages.append({
+                'color': colors[i].tolist(),
+                'hex': '#{:02x}{:02x}{:02x}'.format(colors[i][0], colors[i][1], colors[i][2]),
+                'percentage': round(percentage, 2)
+            })
+
+        # Renkleri yüzdeye göre sırala
+        color_percentages.sort(key=lambda x: x['percentage'], reverse=True)
+
+        # Renk çeşitliliği analizi
+        color_diversity = calculate_color_diversity(colors)
+
+        # Brightness analizi
+        brightness = np.mean(pixels)
+
+        # Contrast analizi
+        contrast = np.std(pixels)
+
+        return {
+            'dominant_colors': color_percentages,
+            'color_diversity': color_diversity,
+            'average_brightness': round(brightness, 2),
+            'contrast_level': round(contrast, 2),
+            'brightness_category': categorize_brightness(brightness),
+            'contrast_category': categorize_contrast(contrast)
+        }
+
+    except Exception as e:
+        return {'error': str(e)}
+
+
+def calculate_color_diversity(colors: np.ndarray) -> float:
+    """Renk çeşitliliğini hesapla"""
+    try:
+        # Renklerin birbirinden uzaklığını hesapla
+        distances = []
+        for i in range(len(colors)):
+            for j in range(i + 1, len(colors)):
+                distance = np.linalg.norm(colors[i] - colors[j])
+                distances.append(distance)
+
+        return round(np.mean(distances), 2) if distances else 0.0
+    except:
+        return 0.0
+
+
+def categorize_brightness(brightness: float) -> str:
+    """Parlaklık kategorisi"""
+    if brightness < 85:
+        return 'dark'
+    elif brightness < 170:
+        return 'medium'
+    else:
+        return 'bright'
+
+
+def categorize_contrast(contrast: float) -> str:
+    """Kontrast kategorisi"""
+    if contrast < 30:
+        return 'low'
+    elif contrast < 60:
+        return 'medium'
+    else:
+        return 'high'
+
+
+def detect_faces(image: ImageContext) -> Dict[str, Any]:
+    """Yüz algılama ve tanıma"""
+    try:
+        # Yüz konumlarını çalışma kopyası üzerinde bul
+        face_locations = face_recognition.face_locations(image.array)
+
+        if not face_locations:
+            return {
+                'face_count': 0,
+                'faces': [],
+                'has_faces': False
+            }
+
+        # Yüz encodings'lerini çıkar
+        face_encodings = face_recognition.face_encodings(image.array, face_locations)
+
+        faces_data = []
+        for i, (face_encoding, face_location) in enumerate(zip(face_encodings, face_locations)):
+            # Konumları orijinal görsel koordinatlarına çevir
+            top, right, bottom, left = (int(round(value * image.scale)) for value in face_location)
+
+            face_data = {
+                'face_id': f"face_{i}",
+                'location': {
+                    'top': top,
+                    'right': right,
+                    'bottom': bottom,
+                    'left': left
+                },
+                'size': {
+                    'width': right - left,
+                    'height': bottom - top
+                },
+                'encoding': face_encoding.tolist()  # Benzerlik karşılaştırması için
+            }
+
+            faces_data.append(face_data)
+
+        return {
+            'face_count': len(face_locations),
+            'faces': faces_data,
+            'has_faces': True,
+            'face_density': len(face_locations) / (image.width * image.height) * 1000000  # faces per megapixel
+        }
+
+    except Exception as e:
+        LoggerService.get_logger().warning(f"Yüz algılama hatası: {e}")
+        return {
+            'face_count': 0,
+            'faces': [],
+            'has_faces': False,
+            'error': str(e)
+        }
+
+
+def analyze_composition(image: ImageContext) -> Dict[str, Any]:
+    """Kompozisyon analizi"""
+    try:
+        gray = image.gray
+        height, width = gray.shape
+
+        # Edge detection
+        edges = cv2.Canny(gray, 50, 150)
+        edge_density = np.sum(edges > 0) / (height * width)
+
+        # Rule of thirds analizi
+        thirds_analysis = analyze_rule_of_thirds(gray)
+
+        # Symmetry analizi
+        symmetry_score = analyze_symmetry(gray)
+
+        # Texture analizi
+        texture_score = analyze_texture(gray)
+
+        return {
+            'edge_density': round(edge_density, 4),
+            'rule_of_thirds': thirds_analysis,
+            'symmetry_score': round(symmetry_score, 3),
+            'texture_score': round(texture_score, 3),
+            'composition_quality': rate_composition(edge_density, symmetry_score, texture_score)
+        }
+
+    except Exception as e:
+        return {'error': str(e)}
+
+
+def analyze_rule_of_thirds(gray_image: np.ndarray) -> Dict[str, Any]:
+    """Rule of thirds analizi"""
+    try:
+        height, width = gray_image.shape
+
+        # Üçte bir çizgileri
+        h_third1, h_third2 = height // 3, 2 * height // 3
+        w_third1, w_third2 = width // 3, 2 * width // 3
+
+        # Intersection points
+        intersections = [
+            (h_third1, w_third1), (h_third1, w_third2),
+            (h_third2, w_third1), (h_third2, w_third2)
+        ]
+
+        # Her intersection point etrafındaki aktiviteyi kontrol et
+        region_size = min(height, width) // 20
+        interest_scores = []
+
+        for y, x in intersections:
+            y_start = max(0, y - region_size)
+            y_end = min(height, y + region_size)
+            x_start = max(0, x - region_size)
+            x_end = min(width, x + region_size)
+
+            region = gray_image[y_start:y_end, x_start:x_end]
+            interest_score = np.std(region)  # Variance as interest measure
+            interest_scores.append(interest_score)
+
+        return {
+            'intersection_scores': [round(score, 2) for score in interest_scores],
+            'average_interest': round(np.mean(interest_scores), 2),
+            'follows_rule': np.max(interest_scores) > np.mean(gray_image) * 0.5
+        }
+
+    except Exception:
+        return {'error': 'Rule of thirds analizi başarısız'}
+
+
+def analyze_symmetry(gray_image: np.ndarray) -> float:
+    """Simetri analizi"""
+    try:
+        height, width = gray_image.shape
+
+        # Vertical symmetry
+        left_half = gray_image[:, :width//2]
+        right_half = gray_image[:, width//2:]
+        right_half_flipped = np.fliplr(right_half)
+
+        # Resize to match if needed
+        min_width = min(left_half.shape[1], right_half_flipped.shape[1])
+        left_half = left_half[:, :min_width]
+        right_half_flipped = right_half_flipped[:, :min_width]
+
+        # Calculate similarity
+        diff = np.abs(left_half.astype(float) - right_half_flipped.astype(float))
+        symmetry_score = 1.0 - (np.mean(diff) / 255.0)
+
+        return max(0.0, symmetry_score)
+
+    except Exception:
+        return 0.0
+
+
+def analyze_texture(gray_image: np.ndarray) -> float:
+    """Texture analizi"""
+    try:
+        # Local Binary Pattern benzeri basit texture measure
+        kernel = np.array([[-1, -1, -1], [-1, 8, -1], [-1, -1, -1]])
+        texture_response = cv2.filter2D(gray_image, -1, kernel)
+        texture_score = np.std(texture_response) / 255.0
+
+        return min(1.0, texture_score)
+
+    except Exception:
+        return 0.0
+
+
+def rate_composition(edge_density: float, symmetry: float, texture: float) -> str:
+    """Kompozisyon kalitesi değerlendirmesi"""
+    score = (edge_density * 0.3 + symmetry * 0.4 + texture * 0.3)
+
+    if score > 0.7:
+        return 'excellent'
+    elif score > 0.5:
+        return 'good'
+    elif score > 0.3:
+        return 'average'
+    else:
+        return 'poor'
+
+
+def extract_visual_features(image: ImageContext) -> Dict[str, Any]:
+    """Görsel özellik çıkarma (deep learning features)"""
+    try:
+        # Basit histogram tabanlı özellikler
+        img_array = image.resized_array((224, 224))  # Standard size
+
+        # Color histograms
+        hist_r = np.histogram(img_array[:,:,0], bins=32, range=(0, 256))[0]
+        hist_g = np.histogram(img_array[:,:,1], bins=32, range=(0, 256))[0]
+        hist_b = np.histogram(img_array[:,:,2], bins=32, range=(0, 256))[0]
+
+        # Normalize histograms
+        hist_r = hist_r / np.sum(hist_r)
+        hist_g = hist_g / np.sum(hist_g)
+        hist_b = hist_b / np.sum(hist_b)
+
+        return {
+            'color_histogram_r': hist_r.tolist(),
+            'color_histogram_g': hist_g.tolist(),
+            'color_histogram_b': hist_b.tolist(),
+            'feature_vector_size': len(hist_r) * 3
+        }
+
+    except Exception as e:
+        return {'error': str(e)}
+
+
+def analyze_quality(image: ImageContext) -> Dict[str, Any]:
+    """Görsel kalitesi analizi"""
+    try:
+        gray = image.gray
+
+        # Blur detection (Laplacian variance)
+        blur_score = cv2.Laplacian(gray, cv2.CV_64F).var()
+
+        # Noise estimation
+        noise_score = estimate_noise(gray)
+
+        # Dynamic range
+        dynamic_range = np.max(gray) - np.min(gray)
+
+        # Overall quality score
+        quality_score = calculate_quality_score(blur_score, noise_score, dynamic_range)
+
+        return {
+            'blur_score': round(blur_score, 2),
+            'noise_score': round(noise_score, 2),
+            'dynamic_range': int(dynamic_range),
+            'quality_score': round(quality_score, 2),
+            'quality_category': categorize_quality(quality_score),
+            'is_blurry': blur_score < 100,
+            'is_noisy': noise_score > 0.1
+        }
+
+    except Exception as e:
+        return {'error': str(e)}
+
+
+def estimate_noise(gray_image: np.ndarray) -> float:
+    """Gürültü tahmini"""
+    try:
+        # Wavelet denoising approach
+        H, W = gray_image.shape
+        M = [[1, -2, 1],
+             [-2, 4, -2],
+             [1, -2, 1]]
+
+        M = np.array(M)
+        sigma = np.sum(np.sum(np.absolute(cv2.filter2D(gray_image, -1, M))))
+        sigma = sigma * np.sqrt(0.5 * np.pi) / (6 * (W-2) * (H-2))
+
+        return sigma / 255.0  # Normalize
+
+    except Exception:
+        return 0.0
+
+
+def calculate_quality_score(blur: float, noise: float, dynamic_range: int) -> float:
+    """Genel kalite skoru hesaplama"""
+    # Normalize components
+    blur_norm = min(1.0, blur / 500.0)  # Higher is better
+    noise_norm = max(0.0, 1.0 - noise * 10)  # Lower is better
+    range_norm = dynamic_range / 255.0  # Higher is better
+
+    # Weighted average
+    quality = (blur_norm * 0.4 + noise_norm * 0.3 + range_norm * 0.3)
+
+    return quality
+
+
+def categorize_quality(quality_score: float) -> str:
+    """Kalite kategorisi"""
+    if quality_score > 0.8:
+        return 'excellent'
+    elif quality_score > 0.6:
+        return 'good'
+    elif quality_score > 0.4:
+        return 'average'
+    else:
+        return 'poor'
+
+
+def similarity_hash(image: ImageContext) -> str:
+    """Benzerlik karşılaştırması için perceptual hash"""
+    import imagehash
+
+    # Resize to standard size for consistent hashing
+    return str(imagehash.phash(image.resized((256, 256))))
+
+
+# Analiz adı -> analizör; sonuçlar detailed_analysis altında bu adlarla döner
+ANALYZERS = {
+    'basic': analyze_basic_properties,
+    'colors': analyze_colors,
+    'faces': detect_faces,
+    'composition': analyze_composition,
+    'features': extract_visual_features,
+    'quality': analyze_quality,
+}
+
+
+def run_analyzer(name: str, image: ImageContext, options: Dict[str, Any] = None,
+                 started: Optional[List[float]] = None, index: int = 0) -> Dict[str, Any]:
+    """Havuz işçisinde adı verilen analizörü çalıştır; başlangıç zamanı `started[index]`e yazılır"""
+    if started is not None:
+        started[index] = time.time()
+    return ANALYZERS[name](image, **(options or {}).get(name, {}))
+
+
+# Paylaşılan blok başlığı: (slot sayısı, bağlam boyutu), ardından slot başına float64 başlangıç zamanı
+_SHARED_HEADER = struct.Struct('II')
+
+# İşçi sürecinde paylaşılan bloktan çözülen son bağlam: blok adı -> ImageContext
+_shared_contexts: Dict[str, ImageContext] = {}
+
+
+def share_context(image: ImageContext, slots: int) -> shared_memory.SharedMemory:
+    """
+    Bağlamı bir kez pickle edip paylaşılan belleğe yaz
+
+    Blok analizör başına bir başlangıç zamanı slotu da taşır. Bloğu
+    oluşturan taraf işi bitince close() ve unlink() çağırmalıdır.
+    """
+    payload = pickle.dumps(image, protocol=pickle.HIGHEST_PROTOCOL)
+    offset = _SHARED_HEADER.size + slots * 8
+    block = shared_memory.SharedMemory(create=True, size=offset + len(payload))
+    _SHARED_HEADER.pack_into(block.buf, 0, slots, len(payload))
+    struct.pack_into(f'{slots}d', block.buf, _SHARED_HEADER.size, *([0.0] * slots))
+    block.buf[offset:offset + len(payload)] = payload
+    return block
+
+
+def shared_started_at(block: shared_memory.SharedMemory, index: int) -> float:
+    """Analizörün başlangıç zamanı (henüz başlamadıysa 0)"""
+    return struct.unpack_from('d', block.buf, _SHARED_HEADER.size + index * 8)[0]
+
+
+def run_shared_analyzer(name: str, block_name: str, index: int,
+                        options: Dict[str, Any] = None) -> Dict[str, Any]:
+    """
+    Havuz işçisinde paylaşılan bloktaki bağlam üzerinde analizörü çalıştır
+
+    Başlangıç zamanı bloktaki slota yazılır. Bağlam işçi başına bir kez
+    çözülür; aynı görselin sonraki analizörleri önbellekteki kopyayı kullanır.
+    """
+    block = shared_memory.SharedMemory(name=block_name)
+    try:
+        slots, size = _SHARED_HEADER.unpack_from(block.buf, 0)
+        struct.pack_into('d', block.buf, _SHARED_HEADER.size + index * 8, time.time())
+        
+        image = _shared_contexts.get(block_name)
+        if image is None:
+            offset = _SHARED_HEADER.size + slots * 8
+            image = pickle.loads(bytes(block.buf[offset:offset + size]))
+            _shared_contexts.clear()
+            _shared_contexts[block_name] = image
+    finally:
+        block.close()
+
+    return run_analyzer(name, image, options)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PofuAi Image Context
+===================
+
+Görseli bir kez çözüp (decode) tüm analizörlerle paylaşan bağlam nesnesi
+"""
+
+import hashlib
+import io
+import os
+from typing import Any, Dict, Tuple
+
+import numpy as np
+from PIL import Image
+from PIL.ExifTags import TAGS
+
+
+class ImageContext:
+    """
+    Bir kez çözülmüş görsel
+
+    Dosya tek seferde okunur; MD5, dosya boyutu, EXIF ve orijinal boyutlar bu
+    okumadan çıkarılır. Piksel verisi `max_size` ile sınırlanmış tek bir RGB
+    çalışma kopyası olarak çözülür (JPEG'lerde draft modu ile doğrudan
+    küçültülmüş çözülür). Analizörler bu kopyayı ve ondan türetilen NumPy,
+    BGR, gri ve yeniden boyutlandırılmış görünümleri paylaşır; görünümler ilk
+    erişimde oluşturulup önbelleğe alınır ve salt okunur kabul edilmelidir.
+    """
+
+    def __init__(self, image_path: str, max_size: Tuple[int, int] = (1024, 1024)):
+        self.path = image_path
+        self.stat = os.stat(image_path)
+
+        with open(image_path, 'rb') as handle:
+            data = handle.read()
+        self.file_size = len(data)
+        self.md5 = hashlib.md5(data).hexdigest()
+
+        image = Image.open(io.BytesIO(data))
+        self.format = image.format
+        self.mode = image.mode
+        self.width, self.height = image.size
+        self.exif = {TAGS.get(tag, tag): str(value) for tag, value in image.getexif().items()}
+
+        # Bozuk dosyalar burada hata verir (ayrı bir verify() okumasına gerek yok)
+        image.draft('RGB', max_size)
+        image.load()
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        if image.width > max_size[0] or image.height > max_size[1]:
+            image.thumbnail(max_size, Image.Resampling.LANCZOS)
+
+        self.image = image
+        # Çalışma kopyası koordinatlarını orijinal boyuta çevirme katsayısı
+        self.scale = self.width / image.width
+        self._views: Dict[Any, Any] = {}
+
+    def __getstate__(self):
+        # Süreç havuzuna gönderilirken türetilmiş görünümler taşınmaz
+        state = self.__dict__.copy()
+        state['_views'] = {}
+        return state
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """Orijinal (width, height)"""
+        return self.width, self.height
+
+    @property
+    def array(self) -> np.ndarray:
+        """Çalışma kopyasının RGB uint8 (H, W, 3) görünümü"""
+        if 'rgb' not in self._views:
+            self._views['rgb'] = np.asarray(self.image)
+        return self._views['rgb']
+
+    @property
+    def bgr(self) -> np.ndarray:
+        """OpenCV için BGR sıralı görünüm"""
+        if 'bgr' not in self._views:
+            self._views['bgr'] = np.ascontiguousarray(self.array[:, :, ::-1])
+        return self._views['bgr']
+
+    @property
+    def gray(self) -> np.ndarray:
+        """Gri tonlamalı uint8 (H, W) görünüm (cv2 BGR2GRAY ile aynı katsayılar)"""
+        if 'gray' not in self._views:
+            self._views['gray'] = np.asarray(self.image.convert('L'))
+        return self._views['gray']
+
+    def resized(self, size: Tuple[int, int]) -> Image.Image:
+        """Çalışma kopyasının tam `size` boyutuna getirilmiş hali"""
+        key = ('resized', size)
+        if key not in self._views:
+            self._views[key] = self.image.resize(size)
+        return self._views[key]
+
+    def resized_array(self, size: Tuple[int, int]) -> np.ndarray:
+        """`resized(size)` görünümünün RGB NumPy dizisi"""
+        key = ('resized_array', size)
+        if key not in self._views:
+            self._views[key] = np.asarray(self.resized(size))
+        return self._views[key]
@@ -14,21 +14,97 @@ Gelişmiş görsel tanıma ve analiz servisi
 """
 
 import os
-import cv2
-import numpy as np
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
-import hashlib
 import json
 from PIL import Image, ImageEnhance, ImageFilter
-import face_recognition
 import torch
 import torchvision.transforms as transforms
-from sklearn.cluster import KMeans
 from sklearn.metrics.pairwise import cosine_similarity
 
+from core.Config.config import get_config
 from core.Services.logger import LoggerService
+from core.Services.file_hash_cache import get_file_hash_cache
 from .ai_core import ai_core
+from .image_analyzers import (
+    ANALYZERS, run_analyzer, run_shared_analyzer, share_context, shared_started_at, similarity_hash
+)
+from .image_context import ImageContext
+from . import similarity_index
+
+
+# Süreç içinde paylaşılan analiz havuzları: (tür, işçi sayısı) -> executor
+_analysis_executors: Dict[Tuple[str, int], Executor] = {}
+# Havuzu kullanmakta olan analiz sayısı ve emekliye ayrılmış havuzlar
+_analysis_executor_users: Dict[Executor, int] = {}
+_retired_analysis_executors: set = set()
+_analysis_executors_lock = threading.Lock()
+
+
+def acquire_analysis_executor(kind: str = 'process', workers: int = 0) -> Executor:
+    """
+    Görsel analizörleri için paylaşılan havuzu getir ve kullanımını kaydet
+    
+    Her çağrı release_analysis_executor ile eşlenmelidir.
+    
+    Args:
+        kind: 'process' (GIL'i bırakmayan işler için) ya da 'thread'
+        workers: İşçi sayısı (0: CPU sayısı)
+    """
+    workers = workers or os.cpu_count() or 1
+    key = (kind, workers)
+    
+    with _analysis_executors_lock:
+        executor = _analysis_executors.get(key)
+        if executor is None:
+            if kind == 'thread':
+                executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='image-analysis')
+            else:
+                # Model ve thread barındıran süreçten fork edilmemesi için spawn
+                executor = ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context('spawn')
+                )
+            _analysis_executors[key] = executor
+        _analysis_executor_users[executor] = _analysis_executor_users.get(executor, 0) + 1
+    return executor
+
+
+def release_analysis_executor(executor: Executor):
+    """Havuz kullanımını bırak; emekli havuzun son kullanıcısıysa süreçlerini sonlandır"""
+    with _analysis_executors_lock:
+        users = _analysis_executor_users.get(executor, 1) - 1
+        if users > 0:
+            _analysis_executor_users[executor] = users
+            return
+        _analysis_executor_users.pop(executor, None)
+        if executor not in _retired_analysis_executors:
+            return
+        _retired_analysis_executors.discard(executor)
+    
+    processes = list((getattr(executor, '_processes', None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+
+def retire_analysis_executor(executor: Executor):
+    """
+    Havuzu emekliye ayır; sonraki acquire_analysis_executor yenisini kurar
+    
+    Çalışmaya başlamış bir analizör süreç sonlandırılmadan durdurulamaz.
+    Emekli havuza yeni iş gönderilmez; süreçleri, havuzu kullanan diğer
+    analizler bittikten sonra release_analysis_executor sonlandırır.
+    """
+    with _analysis_executors_lock:
+        for key, value in list(_analysis_executors.items()):
+            if value is executor:
+                del _analysis_executors[key]
+        _retired_analysis_executors.add(executor)
 
 
 class ImageRecognitionService:
@@ -45,9 +121,21 @@ class ImageRecognitionService:
         self.max_image_size = (2048, 2048)
         self.thumbnail_size = (256, 256)
         
+        # Analizörlerin paylaştığı çalışma kopyasının en büyük boyutu; similarity
+        # hash'i bu kopyadan hesaplanır (similarity_index.hash_image ile aynı boyut)
+        self.working_size = (1024, 1024)
+        
         # Renk analizi için K-means parametreleri
         self.color_clusters = 5
         
+        # Analizörlerin çalıştığı havuz ve analizör başına zaman aşımları (saniye)
+        analysis_config = get_config('ai.image_analysis', {}) or {}
+        self.analysis_executor = analysis_config.get('executor', 'process')
+        self.analysis_workers = analysis_config.get('workers', 0)
+        self.analysis_timeout = analysis_config.get('timeout', 30)
+        self.analysis_timeouts = analysis_config.get('timeouts', {})
+        self.analysis_total_timeout = analysis_config.get('total_timeout')
+        
         # Yüz tanıma modeli
         self.face_encodings_cache = {}
         
@@ -65,24 +153,26 @@ class ImageRecognitionService:
             Detaylı analiz sonuçları
         """
         try:
-            if not self._is_valid_image(image_path):
+            # Okuma, çözme ve hash/indeks işleri event loop'u bloklamasın
+            loop = asyncio.get_running_loop()
+            image = await loop.run_in_executor(None, self._load_image, image_path)
+            if image is None:
                 raise ValueError(f"Geçersiz görsel dosyası: {image_path}")
             
-            # Görsel hash'i oluştur (duplicate detection için)
-            image_hash = self._generate_image_hash(image_path)
+            # Görsel hash'i (duplicate detection için) okuma sırasında hesaplandı
+            image_hash = image.md5
+            remember_task = loop.run_in_executor(None, self._remember_image_hash, image)
+            similarity_task = loop.run_in_executor(None, self._generate_similarity_hash, image)
             
-            # Paralel analiz görevleri
-            analysis_tasks = [
-                self._analyze_basic_properties(image_path),
-                self._analyze_colors(image_path),
-                self._detect_faces(image_path),
-                self._analyze_composition(image_path),
-                self._extract_visual_features(image_path),
-                self._analyze_quality(image_path)
-            ]
+            # Analizörler havuzda hemen başlar; AI Core işlemesi onlarla eşzamanlı yürür
+            analysis_task = asyncio.ensure_future(self._run_analyzers(image))
             
             # AI Core ile temel işleme
-            ai_result = await self.ai_core.process_image(image_path, user_id)
+            try:
+                ai_result = await self.ai_core.process_image(image_path, user_id, image=image)
+            except BaseException:
+                analysis_task.cancel()
+                raise
             
             # Tüm analizleri birleştir
             comprehensive_analysis = {
@@ -94,22 +184,20 @@ class ImageRecognitionService:
                 'detailed_analysis': {}
             }
             
-            # Detaylı analizleri sırayla çalıştır
-            analysis_names = ['basic', 'colors', 'faces', 'composition', 'features', 'quality']
-            for i, task_name in enumerate(analysis_names):
-                try:
-                    if i < len(analysis_tasks):
-                        result = await analysis_tasks[i]
-                        comprehensive_analysis['detailed_analysis'][task_name] = result
-                except Exception as e:
-                    self.logger.warning(f"{task_name} analizi başarısız: {e}")
-                    comprehensive_analysis['detailed_analysis'][task_name] = {'error': str(e)}
+            # Detaylı analiz sonuçları
+            comprehensive_analysis['detailed_analysis'] = await analysis_task
             
             # Kategorilendirme önerisi
             comprehensive_analysis['suggested_categories'] = self._suggest_categories(comprehensive_analysis)
             
-            # Benzerlik hash'i (duplicate detection için)
-            comprehensive_analysis['similarity_hash'] = self._generate_similarity_hash(image_path)
+            # Benzerlik hash'i (duplicate detection için) benzerlik indeksine de eklenir
+            comprehensive_analysis['similarity_hash'] = await similarity_task
+            await loop.run_in_executor(
+                None, self._index_similarity_hash, image_path, user_id,
+                comprehensive_analysis['similarity_hash'], comprehensive_analysis['suggested_categories'],
+                similarity_index.file_signature(image.stat)
+            )
+            await remember_task
             
             self.logger.info(f"Kapsamlı görsel analizi tamamlandı: {image_path}")
             
@@ -124,463 +212,130 @@ class ImageRecognitionService:
                 'status': 'error'
             }
     
-    def _is_valid_image(self, image_path: str) -> bool:
-        """Görsel dosyasının geçerliliğini kontrol et"""
+    def _load_image(self, image_path: str) -> Optional[ImageContext]:
+        """Görseli bir kez okuyup çöz; geçersizse None döner"""
         if not os.path.exists(image_path):
-            return False
+            return None
         
         _, ext = os.path.splitext(image_path.lower())
         if ext not in self.supported_formats:
-            return False
+            return None
         
         try:
-            with Image.open(image_path) as img:
-                img.verify()
-            return True
+            return ImageContext(image_path, self.working_size)
         except Exception:
-            return False
+            return None
     
-    def _generate_image_hash(self, image_path: str) -> str:
-        """Görsel için MD5 hash oluştur"""
-        hash_md5 = hashlib.md5()
-        with open(image_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+    def _remember_image_hash(self, image: ImageContext):
+        """Okuma sırasında hesaplanan MD5'i paylaşılan hash önbelleğine yaz"""
+        try:
+            get_file_hash_cache().remember(image.path, 'md5', image.md5, image.stat)
+        except Exception as e:
+            self.logger.warning(f"Görsel hash'i önbelleğe yazılamadı: {e}")
     
-    def _generate_similarity_hash(self, image_path: str) -> str:
+    def _generate_similarity_hash(self, image: ImageContext) -> str:
         """Benzerlik karşılaştırması için perceptual hash"""
         try:
-            import imagehash
-            with Image.open(image_path) as img:
-                # Resize to standard size for consistent hashing
-                img = img.resize((256, 256))
-                phash = imagehash.phash(img)
-                return str(phash)
+            return similarity_hash(image)
         except Exception as e:
             self.logger.warning(f"Similarity hash oluşturulamadı: {e}")
             return ""
     
-    async def _analyze_basic_properties(self, image_path: str) -> Dict[str, Any]:
-        """Temel görsel özellikleri analizi"""
-        try:
-            with Image.open(image_path) as img:
-                width, height = img.size
-                format_info = img.format
-                mode = img.mode
-                
-                # Aspect ratio
-                aspect_ratio = width / height
-                
-                # Orientation
-                if width > height:
-                    orientation = 'landscape'
-                elif height > width:
-                    orientation = 'portrait'
-                else:
-                    orientation = 'square'
-                
-                # Resolution category
-                total_pixels = width * height
-                if total_pixels > 8000000:  # 8MP+
-                    resolution_category = 'high'
-                elif total_pixels > 2000000:  # 2MP+
-                    resolution_category = 'medium'
-                else:
-                    resolution_category = 'low'
-                
-                return {
-                    'dimensions': {'width': width, 'height': height},
-                    'format': format_info,
-                    'mode': mode,
-                    'aspect_ratio': round(aspect_ratio, 2),
-                    'orientation': orientation,
-                    'total_pixels': total_pixels,
-                    'resolution_category': resolution_category,
-                    'file_size': os.path.getsize(image_path)
-                }
-                
-        except Exception as e:
-            return {'error': str(e)}
-    
-    async def _analyze_colors(self, image_path: str) -> Dict[str, Any]:
-        """Renk analizi"""
-        try:
-            with Image.open(image_path) as img:
-                # RGB'ye çevir
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # Resize for performance
-                img = img.resize((200, 200))
-                
-                # Numpy array'e çevir
-                img_array = np.array(img)
-                pixels = img_array.reshape(-1, 3)
-                
-                # K-means ile dominant renkleri bul
-                kmeans = KMeans(n_clusters=self.color_clusters, random_state=42, n_init=10)
-                kmeans.fit(pixels)
-                
-                colors = kmeans.cluster_centers_.astype(int)
-                labels = kmeans.labels_
-                
-                # Renk yüzdelerini hesapla
-                color_percentages = []
-                for i in range(self.color_clusters):
-                    percentage = np.sum(labels == i) / len(labels) * 100
-                    color_percentages.append({
-                        'color': colors[i].tolist(),
-                        'hex': '#{:02x}{:02x}{:02x}'.format(colors[i][0], colors[i][1], colors[i][2]),
-                        'percentage': round(percentage, 2)
-                    })
-                
-                # Renkleri yüzdeye göre sırala
-                color_percentages.sort(key=lambda x: x['percentage'], reverse=True)
-                
-                # Renk çeşitliliği analizi
-                color_diversity = self._calculate_color_diversity(colors)
-                
-                # Brightness analizi
-                brightness = np.mean(pixels)
-                
-                # Contrast analizi
-                contrast = np.std(pixels)
-                
-                return {
-                    'dominant_colors': color_percentages,
-                    'color_diversity': color_diversity,
-                    'average_brightness': round(brightness, 2),
-                    'contrast_level': round(contrast, 2),
-                    'brightness_category': self._categorize_brightness(brightness),
-                    'contrast_category': self._categorize_contrast(contrast)
-                }
-                
-        except Exception as e:
-            return {'error': str(e)}
-    
-    def _calculate_color_diversity(self, colors: np.ndarray) -> float:
-        """Renk çeşitliliğini hesapla"""
+    def _index_similarity_hash(self, image_path: str, user_id: int, image_similarity_hash: str,
+                               categories: Optional[List[str]] = None, signature: Optional[str] = None):
+        """Similarity hash'i kullanıcı ve global benzerlik indekslerine ekle"""
         try:
-            # Renklerin birbirinden uzaklığını hesapla
-            distances = []
-            for i in range(len(colors)):
-                for j in range(i + 1, len(colors)):
-                    distance = np.linalg.norm(colors[i] - colors[j])
-                    distances.append(distance)
-            
-            return round(np.mean(distances), 2) if distances else 0.0
-        except:
-            return 0.0
-    
-    def _categorize_brightness(self, brightness: float) -> str:
-        """Parlaklık kategorisi"""
-        if brightness < 85:
-            return 'dark'
-        elif brightness < 170:
-            return 'medium'
-        else:
-            return 'bright'
-    
-    def _categorize_contrast(self, contrast: float) -> str:
-        """Kontrast kategorisi"""
-        if contrast < 30:
-            return 'low'
-        elif contrast < 60:
-            return 'medium'
-        else:
-            return 'high'
-    
-    async def _detect_faces(self, image_path: str) -> Dict[str, Any]:
-        """Yüz algılama ve tanıma"""
-        try:
-            # Görseli yükle
-            image = face_recognition.load_image_file(image_path)
-            
-            # Yüz konumlarını bul
-            face_locations = face_recognition.face_locations(image)
-            
-            if not face_locations:
-                return {
-                    'face_count': 0,
-                    'faces': [],
-                    'has_faces': False
-                }
-            
-            # Yüz encodings'lerini çıkar
-            face_encodings = face_recognition.face_encodings(image, face_locations)
-            
-            faces_data = []
-            for i, (face_encoding, face_location) in enumerate(zip(face_encodings, face_locations)):
-                top, right, bottom, left = face_location
-                
-                face_data = {
-                    'face_id': f"face_{i}",
-                    'location': {
-                        'top': top,
-                        'right': right,
-                        'bottom': bottom,
-                        'left': left
-                    },
-                    'size': {
-                        'width': right - left,
-                        'height': bottom - top
-                    },
-                    'encoding': face_encoding.tolist()  # Benzerlik karşılaştırması için
-                }
-                
-                faces_data.append(face_data)
-            
-            return {
-                'face_count': len(face_locations),
-                'faces': faces_data,
-                'has_faces': True,
-                'face_density': len(face_locations) / (image.shape[0] * image.shape[1]) * 1000000  # faces per megapixel
-            }
-            
+            similarity_index.add_image(image_path, image_similarity_hash, user_id, categories, signature)
         except Exception as e:
-            self.logger.warning(f"Yüz algılama hatası: {e}")
-            return {
-                'face_count': 0,
-                'faces': [],
-                'has_faces': False,
-                'error': str(e)
-            }
+            self.logger.warning(f"Benzerlik indeksi güncellenemedi: {e}")
     
-    async def _analyze_composition(self, image_path: str) -> Dict[str, Any]:
-        """Kompozisyon analizi"""
-        try:
-            # OpenCV ile görsel yükle
-            img = cv2.imread(image_path)
-            if img is None:
-                raise ValueError("Görsel yüklenemedi")
-            
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-            height, width = gray.shape
-            
-            # Edge detection
-            edges = cv2.Canny(gray, 50, 150)
-            edge_density = np.sum(edges > 0) / (height * width)
-            
-            # Rule of thirds analizi
-            thirds_analysis = self._analyze_rule_of_thirds(gray)
-            
-            # Symmetry analizi
-            symmetry_score = self._analyze_symmetry(gray)
-            
-            # Texture analizi
-            texture_score = self._analyze_texture(gray)
-            
-            return {
-                'edge_density': round(edge_density, 4),
-                'rule_of_thirds': thirds_analysis,
-                'symmetry_score': round(symmetry_score, 3),
-                'texture_score': round(texture_score, 3),
-                'composition_quality': self._rate_composition(edge_density, symmetry_score, texture_score)
-            }
-            
-        except Exception as e:
-            return {'error': str(e)}
-    
-    def _analyze_rule_of_thirds(self, gray_image: np.ndarray) -> Dict[str, Any]:
-        """Rule of thirds analizi"""
-        try:
-            height, width = gray_image.shape
-            
-            # Üçte bir çizgileri
-            h_third1, h_third2 = height // 3, 2 * height // 3
-            w_third1, w_third2 = width // 3, 2 * width // 3
-            
-            # Intersection points
-            intersections = [
-                (h_third1, w_third1), (h_third1, w_third2),
-                (h_third2, w_third1), (h_third2, w_third2)
-            ]
-            
-            # Her intersection point etrafındaki aktiviteyi kontrol et
-            region_size = min(height, width) // 20
-            interest_scores = []
-            
-            for y, x in intersections:
-                y_start = max(0, y - region_size)
-                y_end = min(height, y + region_size)
-                x_start = max(0, x - region_size)
-                x_end = min(width, x + region_size)
-                
-                region = gray_image[y_start:y_end, x_start:x_end]
-                interest_score = np.std(region)  # Variance as interest measure
-                interest_scores.append(interest_score)
-            
-            return {
-                'intersection_scores': [round(score, 2) for score in interest_scores],
-                'average_interest': round(np.mean(interest_scores), 2),
-                'follows_rule': np.max(interest_scores) > np.mean(gray_image) * 0.5
-            }
-            
-        except Exception:
-            return {'error': 'Rule of thirds analizi başarısız'}
-    
-    def _analyze_symmetry(self, gray_image: np.ndarray) -> float:
-        """Simetri analizi"""
-        try:
-            height, width = gray_image.shape
-            
-            # Vertical symmetry
-            left_half = gray_image[:, :width//2]
-            right_half = gray_image[:, width//2:]
-            right_half_flipped = np.fliplr(right_half)
-            
-            # Resize to match if needed
-            min_width = min(left_half.shape[1], right_half_flipped.shape[1])
-            left_half = left_half[:, :min_width]
-            right_half_flipped = right_half_flipped[:, :min_width]
-            
-            # Calculate similarity
-            diff = np.abs(left_half.astype(float) - right_half_flipped.astype(float))
-            symmetry_score = 1.0 - (np.mean(diff) / 255.0)
-            
-            return max(0.0, symmetry_score)
-            
-        except Exception:
-            return 0.0
-    
-    def _analyze_texture(self, gray_image: np.ndarray) -> float:
-        """Texture analizi"""
-        try:
-            # Local Binary Pattern benzeri basit texture measure
-            kernel = np.array([[-1, -1, -1], [-1, 8, -1], [-1, -1, -1]])
-            texture_response = cv2.filter2D(gray_image, -1, kernel)
-            texture_score = np.std(texture_response) / 255.0
-            
-            return min(1.0, texture_score)
-            
-        except Exception:
-            return 0.0
-    
-    def _rate_composition(self, edge_density: float, symmetry: float, texture: float) -> str:
-        """Kompozisyon kalitesi değerlendirmesi"""
-        score = (edge_density * 0.3 + symmetry * 0.4 + texture * 0.3)
+    async def _run_analyzers(self, image: ImageContext) -> Dict[str, Any]:
+        """
+        Tüm analizörleri havuzda eşzamanlı çalıştır
         
-        if score > 0.7:
-            return 'excellent'
-        elif score > 0.5:
-            return 'good'
-        elif score > 0.3:
-            return 'average'
-        else:
-            return 'poor'
-    
-    async def _extract_visual_features(self, image_path: str) -> Dict[str, Any]:
-        """Görsel özellik çıkarma (deep learning features)"""
+        Süreç havuzunda bağlam bir kez paylaşılan belleğe yazılır, analizörlere
+        yalnızca blok adı gönderilir. Her analizörün zaman aşımı havuzda
+        çalışmaya başladığı anda işlemeye başlar; kuyrukta beklenen süre
+        sayılmaz. Analizin tamamı `total_timeout` (verilmemişse analizör
+        zaman aşımlarının toplamı) ile sınırlıdır; süre dolunca başlamamış
+        analizörler de zaman aşımı sayılır. Süresi dolan ya da hata veren
+        analizör sonucu {'error': ...} olur. Süresi dolan analizör süreç
+        havuzunda durdurulamadığından havuz emekliye ayrılır: yeni analizler
+        yeni havuza gider, eski havuzun süreçleri onu kullanan diğer analizler
+        bitince sonlandırılır. İş parçacığı havuzunda süresi dolan analizör
+        yalnızca beklenir; toplam süre dolduğunda ise takılan iş parçacıkları
+        sonraki analizleri bekletmesin diye havuz yine emekliye ayrılır.
+        """
+        loop = asyncio.get_running_loop()
+        executor = acquire_analysis_executor(self.analysis_executor, self.analysis_workers)
+        options = {'colors': {'clusters': self.color_clusters}}
+        
+        names = list(ANALYZERS)
+        timeouts = [self.analysis_timeouts.get(name, self.analysis_timeout) for name in names]
+        
+        block = None
+        results: List[Any] = [None] * len(names)
+        pending: Dict[Any, int] = {}
+        retire = False
         try:
-            # Bu fonksiyon AI Core'daki embedding modelini kullanabilir
-            if 'embedder' in self.ai_core.models:
-                # Sentence transformer ile görsel embedding
-                # Not: Bu normalde görsel için değil ama örnek olarak
-                pass
-            
-            # Basit histogram tabanlı özellikler
-            with Image.open(image_path) as img:
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
+            if isinstance(executor, ProcessPoolExecutor):
+                block = share_context(image, len(names))
+                started_at = lambda index: shared_started_at(block, index)
+                futures = [
+                    loop.run_in_executor(executor, run_shared_analyzer, name, block.name, index, options)
+                    for index, name in enumerate(names)
+                ]
+            else:
+                started = [0.0] * len(names)
+                started_at = started.__getitem__
+                futures = [
+                    loop.run_in_executor(executor, run_analyzer, name, image, options, started, index)
+                    for index, name in enumerate(names)
+                ]
+            
+            pending = {future: index for index, future in enumerate(futures)}
+            deadline = time.time() + (self.analysis_total_timeout or sum(timeouts))
+            while pending:
+                # Bir sonraki olası zaman aşımına kadar bekle; başlamamış
+                # analizörün süresi en erken şimdi + kendi zaman aşımında dolar
+                now = time.time()
+                wake_at = deadline
+                for index in pending.values():
+                    wake_at = min(wake_at, (started_at(index) or now) + timeouts[index])
+                done, _ = await asyncio.wait(list(pending), timeout=max(0.0, wake_at - now))
+                for future in done:
+                    index = pending.pop(future)
+                    results[index] = future.exception() or future.result()
                 
-                img = img.resize((224, 224))  # Standard size
-                img_array = np.array(img)
-                
-                # Color histograms
-                hist_r = np.histogram(img_array[:,:,0], bins=32, range=(0, 256))[0]
-                hist_g = np.histogram(img_array[:,:,1], bins=32, range=(0, 256))[0]
-                hist_b = np.histogram(img_array[:,:,2], bins=32, range=(0, 256))[0]
-                
-                # Normalize histograms
-                hist_r = hist_r / np.sum(hist_r)
-                hist_g = hist_g / np.sum(hist_g)
-                hist_b = hist_b / np.sum(hist_b)
-                
-                return {
-                    'color_histogram_r': hist_r.tolist(),
-                    'color_histogram_g': hist_g.tolist(),
-                    'color_histogram_b': hist_b.tolist(),
-                    'feature_vector_size': len(hist_r) * 3
-                }
-                
-        except Exception as e:
-            return {'error': str(e)}
-    
-    async def _analyze_quality(self, image_path: str) -> Dict[str, Any]:
-        """Görsel kalitesi analizi"""
-        try:
-            img = cv2.imread(image_path)
-            if img is None:
-                raise ValueError("Görsel yüklenemedi")
-            
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-            
-            # Blur detection (Laplacian variance)
-            blur_score = cv2.Laplacian(gray, cv2.CV_64F).var()
-            
-            # Noise estimation
-            noise_score = self._estimate_noise(gray)
-            
-            # Dynamic range
-            dynamic_range = np.max(gray) - np.min(gray)
-            
-            # Overall quality score
-            quality_score = self._calculate_quality_score(blur_score, noise_score, dynamic_range)
-            
-            return {
-                'blur_score': round(blur_score, 2),
-                'noise_score': round(noise_score, 2),
-                'dynamic_range': int(dynamic_range),
-                'quality_score': round(quality_score, 2),
-                'quality_category': self._categorize_quality(quality_score),
-                'is_blurry': blur_score < 100,
-                'is_noisy': noise_score > 0.1
-            }
-            
-        except Exception as e:
-            return {'error': str(e)}
-    
-    def _estimate_noise(self, gray_image: np.ndarray) -> float:
-        """Gürültü tahmini"""
-        try:
-            # Wavelet denoising approach
-            H, W = gray_image.shape
-            M = [[1, -2, 1],
-                 [-2, 4, -2],
-                 [1, -2, 1]]
-            
-            M = np.array(M)
-            sigma = np.sum(np.sum(np.absolute(cv2.filter2D(gray_image, -1, M))))
-            sigma = sigma * np.sqrt(0.5 * np.pi) / (6 * (W-2) * (H-2))
-            
-            return sigma / 255.0  # Normalize
-            
-        except Exception:
-            return 0.0
-    
-    def _calculate_quality_score(self, blur: float, noise: float, dynamic_range: int) -> float:
-        """Genel kalite skoru hesaplama"""
-        # Normalize components
-        blur_norm = min(1.0, blur / 500.0)  # Higher is better
-        noise_norm = max(0.0, 1.0 - noise * 10)  # Lower is better
-        range_norm = dynamic_range / 255.0  # Higher is better
-        
-        # Weighted average
-        quality = (blur_norm * 0.4 + noise_norm * 0.3 + range_norm * 0.3)
+                now = time.time()
+                for future, index in list(pending.items()):
+                    start = started_at(index)
+                    if now >= deadline or (start and now - start >= timeouts[index]):
+                        del pending[future]
+                        future.cancel()
+                        results[index] = asyncio.TimeoutError()
+                        retire = retire or block is not None or now >= deadline
+        finally:
+            for future in pending:
+                future.cancel()
+            if retire:
+                self.logger.warning("Süresi dolan analizör nedeniyle analiz havuzu emekliye ayrılıyor")
+                retire_analysis_executor(executor)
+            release_analysis_executor(executor)
+            if block is not None:
+                block.close()
+                block.unlink()
         
-        return quality
-    
-    def _categorize_quality(self, quality_score: float) -> str:
-        """Kalite kategorisi"""
-        if quality_score > 0.8:
-            return 'excellent'
-        elif quality_score > 0.6:
-            return 'good'
-        elif quality_score > 0.4:
-            return 'average'
-        else:
-            return 'poor'
+        detailed_analysis = {}
+        for name, result in zip(names, results):
+            if isinstance(result, asyncio.TimeoutError):
+                self.logger.warning(f"{name} analizi zaman aşımına uğradı")
+                result = {'error': 'timeout'}
+            elif isinstance(result, BaseException):
+                self.logger.warning(f"{name} analizi başarısız: {result}")
+                result = {'error': str(result)}
+            detailed_analysis[name] = result
+        return detailed_analysis
     
     def _suggest_categories(self, analysis: Dict[str, Any]) -> List[str]:
         """Analiz sonuçlarına göre kategori önerisi"""
@@ -633,22 +388,42 @@ class ImageRecognitionService:
         
         return categories[:10]  # Maximum 10 kategori
     
-    async def find_similar_images(self, image_path: str, user_id: int, similarity_threshold: float = 0.8) -> List[Dict[str, Any]]:
-        """Benzer görselleri bul"""
+    async def find_similar_images(self, image_path: str, user_id: int, similarity_threshold: float = 0.8,
+                                  limit: int = 50, scope: str = 'user') -> List[Dict[str, Any]]:
+        """
+        Benzer görselleri bul
+        
+        Args:
+            image_path: Aranan görsel
+            user_id: Kullanıcı ID'si
+            similarity_threshold: En düşük benzerlik (0-1)
+            limit: En fazla sonuç sayısı
+            scope: 'user' (kullanıcının görselleri) ya da 'global'; global sonuçlar
+                diğer kullanıcıların yol ve kategorilerini içerdiğinden yalnızca
+                yöneticilere açılmalıdır
+            
+        Returns:
+            Benzerliğe göre sıralı görseller
+        
+        Salt okunur bir aramadır; aranan görsel indekslere eklenmez.
+        """
         try:
-            # Bu görsel için similarity hash
-            target_hash = self._generate_similarity_hash(image_path)
+            # Bu görsel için similarity hash; okuma ve indeks araması event loop dışında
+            loop = asyncio.get_running_loop()
+            image = await loop.run_in_executor(None, self._load_image, image_path)
+            target_hash = await loop.run_in_executor(None, self._generate_similarity_hash, image) if image else ""
             if not target_hash:
                 return []
             
-            # Veritabanından kullanıcının diğer görsellerini al
-            # Bu kısım veritabanı implementasyonuna bağlı
-            # Şimdilik placeholder
-            
-            similar_images = []
-            # Implementation needed based on database structure
-            
-            return similar_images
+            return await loop.run_in_executor(
+                None, lambda: similarity_index.find_similar(
+                    target_hash,
+                    user_id if scope == 'user' else None,
+                    similarity_index.threshold_to_distance(similarity_threshold),
+                    limit,
+                    exclude=image_path
+                )
+            )
             
         except Exception as e:
             self.logger.error(f"Benzer görsel arama hatası: {e}")
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PofuAi Similarity Index
+======================
+
+Analiz edilen görsellerin similarity hash'lerini (64 bit pHash) kullanıcı
+başına ve global kalıcı hamming indekslerinde tutar
+- Analiz sırasında ve akıllı depolamanın benzer görsel taramasında doldurulur;
+  ikisi de aynı indeksi ve aynı hash fonksiyonunu (similarity_hash) kullanır
+- Kayıt etiketinde görselin sahibi, kategorileri ve dosya imzası saklanır
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from core.Config.config import get_config
+from .hash_index import HammingIndex, open_hash_index
+
+HASH_BITS = 64
+
+
+def _config() -> Dict[str, Any]:
+    return get_config('ai.similarity_index', {}) or {}
+
+
+def threshold_to_distance(similarity_threshold: float) -> int:
+    """0-1 arası benzerlik eşiğini izin verilen en büyük hamming mesafesine çevir"""
+    return max(0, int(round((1.0 - similarity_threshold) * HASH_BITS, 6)))
+
+
+def file_signature(stat: os.stat_result) -> str:
+    """Değişmemiş dosyanın yeniden hash'lenmemesi için boyut ve mtime imzası"""
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def hash_image(image_path: str) -> str:
+    """
+    Görselin similarity hash'i
+
+    Analizdeki similarity_hash ile aynı çalışma kopyasından (ImageContext
+    varsayılan boyutu) hesaplanır; aynı görsel her yolda aynı hash'i alır.
+    """
+    from .image_analyzers import similarity_hash
+    from .image_context import ImageContext
+
+    return similarity_hash(ImageContext(image_path))
+
+
+def get_similarity_index(user_id: Optional[int] = None) -> HammingIndex:
+    """
+    Kullanıcının (user_id None ise global) benzerlik indeksini getir
+    """
+    config = _config()
+    directory = config.get('path', os.path.join(os.getcwd(), 'storage', 'indexes'))
+    name = f"similarity_user_{user_id}.npz" if user_id is not None else 'similarity_global.npz'
+    return open_hash_index(os.path.join(directory, name), config.get('chunks', 4))
+
+
+def _read_tag(index: HammingIndex, image_path: str) -> Dict[str, Any]:
+    tag = index.tag(image_path)
+    try:
+        return json.loads(tag) if tag else {}
+    except ValueError:
+        return {}
+
+
+def stored_signature(index: HammingIndex, image_path: str) -> Optional[str]:
+    """Görsel indekslendiğindeki dosya imzası"""
+    return _read_tag(index, image_path).get('signature')
+
+
+def add_image(image_path: str, similarity_hash: str, user_id: Optional[int] = None,
+              categories: Optional[List[str]] = None, signature: Optional[str] = None):
+    """
+    Görseli kullanıcı ve global indekslere ekle / güncelle
+
+    Args:
+        image_path: Görsel yolu (indeks anahtarı)
+        similarity_hash: 16 haneli hex pHash
+        user_id: Görselin sahibi
+        categories: Görselin kategorileri (None ise mevcut kategoriler korunur)
+        signature: Dosya imzası (file_signature); None ise mevcut imza korunur
+    """
+    if not similarity_hash:
+        return
+
+    config = _config()
+    indexes = [get_similarity_index()]
+    if user_id is not None:
+        indexes.insert(0, get_similarity_index(user_id))
+
+    for index in indexes:
+        stored = _read_tag(index, image_path)
+        tag = json.dumps({
+            'user_id': user_id,
+            'categories': stored.get('categories', []) if categories is None else categories,
+            'signature': stored.get('signature') if signature is None else signature
+        }, ensure_ascii=False)
+        index.add(image_path, similarity_hash, tag)
+        index.save_if_due(config.get('save_interval', 30))
+
+
+def remove_image(image_path: str, user_id: Optional[int] = None):
+    """Görseli indekslerden çıkar"""
+    indexes = [get_similarity_index()]
+    if user_id is not None:
+        indexes.insert(0, get_similarity_index(user_id))
+
+    for index in indexes:
+        if index.remove(image_path):
+            index.save_if_due(_config().get('save_interval', 30))
+
+
+def save(user_id: Optional[int] = None):
+    """Kullanıcı ve global indeksteki kaydedilmemiş değişiklikleri hemen kaydet"""
+    indexes = [get_similarity_index()]
+    if user_id is not None:
+        indexes.insert(0, get_similarity_index(user_id))
+
+    for index in indexes:
+        if index.dirty and index.path:
+            index.save()
+
+
+def find_similar(similarity_hash: str, user_id: Optional[int] = None, max_distance: int = 12,
+                 limit: int = 50, exclude: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Hash'e en fazla `max_distance` bit uzaklıktaki görseller
+
+    Args:
+        similarity_hash: Aranan görselin pHash'i
+        user_id: Kullanıcı indeksi (None ise global indeks)
+        max_distance: En büyük hamming mesafesi
+        limit: En fazla sonuç sayısı
+        exclude: Sonuçlardan çıkarılacak görsel yolu (aranan görselin kendisi)
+
+    Returns:
+        Mesafeye göre sıralı benzer görseller
+    """
+    if not similarity_hash:
+        return []
+
+    index = get_similarity_index(user_id)
+    matches = index.query(similarity_hash, max_distance, limit + 1 if exclude else limit)
+
+    results = []
+    for image_path, distance in matches:
+        if image_path == exclude:
+            continue
+        tag = _read_tag(index, image_path)
+        results.append({
+            'image_path': image_path,
+            'user_id': tag.get('user_id'),
+            'similarity_hash': index.get(image_path),
+            'distance': distance,
+            'similarity': 1.0 - distance / HASH_BITS,
+            'categories': tag.get('categories', [])
+        })
+    return results[:limit]
@@ -15,7 +15,6 @@ Akıllı depolama sistemi servisi
 
 import os
 import shutil
-import hashlib
 import json
 import asyncio
 from typing import Dict, List, Any, Optional, Tuple, Set
@@ -27,10 +26,12 @@ import time
 
 import numpy as np
 from PIL import Image
-import imagehash
 
 from core.Services.logger import LoggerService
 from core.Database.connection import DatabaseConnection
+from core.Services.file_hash_cache import DEDUP_ALGORITHM, get_file_hash_cache
+from .hash_index import HammingIndex
+from . import similarity_index
 
 
 class SmartStorageService:
@@ -45,8 +46,8 @@ class SmartStorageService:
         # Depolama konfigürasyonu
         self.storage_config = self._initialize_storage_config()
         
-        # Dosya hash'leri cache
-        self.file_hashes: Dict[str, str] = {}
+        # Dosya hash'leri cache (içerik hash'leri kalıcı önbellekte)
+        self.hash_cache = get_file_hash_cache()
         self.similarity_hashes: Dict[str, str] = {}
         
         # Duplicate detection
@@ -84,7 +85,7 @@ class SmartStorageService:
             'duplicate_detection': {
                 'enabled': True,
                 'similarity_threshold': 0.95,
-                'hash_algorithms': ['md5', 'phash'],
+                'hash_algorithms': [DEDUP_ALGORITHM, 'phash'],
                 'auto_remove': False
             },
             'compression': {
@@ -129,7 +130,7 @@ class SmartStorageService:
             organization_plan = await self._create_organization_plan(user_id, user_files, organization_method)
             
             # Duplicate detection
-            duplicates = await self._detect_duplicates(user_files)
+            duplicates = await self._detect_duplicates(user_files, user_id)
             
             # Dosyaları organize et
             organization_results = await self._execute_organization_plan(organization_plan)
@@ -483,7 +484,7 @@ class SmartStorageService:
             self.logger.error(f"Organizasyon planı uygulama hatası: {e}")
             return {'folders_created': 0, 'files_moved': 0, 'errors': [str(e)]}
     
-    async def _detect_duplicates(self, files: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    async def _detect_duplicates(self, files: List[Dict[str, Any]], user_id: int = None) -> Dict[str, List[str]]:
         """Duplicate dosyaları tespit et"""
         try:
             if not self.storage_config['duplicate_detection']['enabled']:
@@ -491,16 +492,17 @@ class SmartStorageService:
             
             duplicates = defaultdict(list)
             
-            # MD5 hash'leri hesapla
-            hash_to_files = defaultdict(list)
+            # İçerik hash'leri: değişmemiş dosyalar kalıcı önbellekten gelir, diğerleri paralel hesaplanır
+            algorithm = self._content_hash_algorithm()
+            loop = asyncio.get_running_loop()
+            file_hashes = await loop.run_in_executor(
+                None, self.hash_cache.hash_files, [file_info['path'] for file_info in files], algorithm
+            )
             
-            for file_info in files:
-                file_path = file_info['path']
-                
-                # MD5 hash hesapla
-                md5_hash = await self._calculate_file_hash(file_path, 'md5')
-                if md5_hash:
-                    hash_to_files[md5_hash].append(file_path)
+            hash_to_files = defaultdict(list)
+            for file_path, file_hash in file_hashes.items():
+                if file_hash:
+                    hash_to_files[file_hash].append(file_path)
             
             # Duplicate grupları oluştur
             for hash_value, file_list in hash_to_files.items():
@@ -509,7 +511,7 @@ class SmartStorageService:
             
             # Perceptual hash ile benzer görselleri bul
             if 'phash' in self.storage_config['duplicate_detection']['hash_algorithms']:
-                similar_groups = await self._find_similar_images(files)
+                similar_groups = await self._find_similar_images(files, user_id)
                 duplicates.update(similar_groups)
             
             return dict(duplicates)
@@ -518,87 +520,91 @@ class SmartStorageService:
             self.logger.error(f"Duplicate detection hatası: {e}")
             return {}
     
+    def _content_hash_algorithm(self) -> str:
+        """Duplicate tespitinde kullanılacak içerik hash algoritması"""
+        for algorithm in self.storage_config['duplicate_detection']['hash_algorithms']:
+            if algorithm != 'phash':
+                return algorithm
+        return DEDUP_ALGORITHM
+    
     async def _calculate_file_hash(self, file_path: str, algorithm: str = 'md5') -> Optional[str]:
-        """Dosya hash'i hesapla"""
+        """Dosya hash'i hesapla (kalıcı hash önbelleği üzerinden)"""
         try:
-            with self._hash_lock:
-                cache_key = f"{file_path}_{algorithm}"
-                if cache_key in self.file_hashes:
-                    return self.file_hashes[cache_key]
-            
-            if algorithm == 'md5':
-                hash_obj = hashlib.md5()
-                with open(file_path, 'rb') as f:
-                    for chunk in iter(lambda: f.read(4096), b""):
-                        hash_obj.update(chunk)
-                file_hash = hash_obj.hexdigest()
-            else:
-                return None
-            
-            with self._hash_lock:
-                self.file_hashes[cache_key] = file_hash
-            
-            return file_hash
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.hash_cache.hash_file, file_path, algorithm)
             
         except Exception as e:
             self.logger.error(f"Dosya hash hesaplama hatası: {e}")
             return None
     
-    async def _find_similar_images(self, files: List[Dict[str, Any]]) -> Dict[str, List[str]]:
-        """Benzer görselleri bul (perceptual hashing)"""
+    async def _find_similar_images(self, files: List[Dict[str, Any]], user_id: int = None) -> Dict[str, List[str]]:
+        """
+        Benzer görselleri bul (perceptual hashing)
+        
+        pHash'ler görsel analiziyle paylaşılan kullanıcı başına benzerlik
+        indeksinde (similarity_index) tutulur; yalnızca yeni ya da değişmiş
+        dosyaların hash'i hesaplanır, silinen dosyalar indeksten çıkarılır.
+        Gruplar verilen dosyaların hash'lerinden multi-index araması ile bulunur.
+        """
         try:
-            similar_groups = defaultdict(list)
-            hash_to_files = defaultdict(list)
+            # Görsel çözme ve pHash CPU'ya bağlı; event loop'u bloklamasın
+            loop = asyncio.get_running_loop()
+            index = await loop.run_in_executor(None, self._update_similarity_index, files, user_id)
             
-            for file_info in files:
-                file_path = file_info['path']
-                
-                try:
-                    with Image.open(file_path) as img:
-                        # Perceptual hash hesapla
-                        phash = imagehash.phash(img)
-                        hash_to_files[str(phash)].append(file_path)
-                except Exception as e:
-                    self.logger.warning(f"Perceptual hash hesaplanamadı {file_path}: {e}")
-                    continue
-            
-            # Benzer hash'leri grupla
             threshold = self.storage_config['duplicate_detection']['similarity_threshold']
-            processed_hashes = set()
+            max_distance = similarity_index.threshold_to_distance(threshold)
             
-            for hash1, files1 in hash_to_files.items():
-                if hash1 in processed_hashes:
-                    continue
-                
-                similar_files = files1.copy()
-                
-                for hash2, files2 in hash_to_files.items():
-                    if hash1 == hash2 or hash2 in processed_hashes:
-                        continue
-                    
-                    # Hash benzerliğini hesapla
-                    try:
-                        h1 = imagehash.hex_to_hash(hash1)
-                        h2 = imagehash.hex_to_hash(hash2)
-                        similarity = 1.0 - (h1 - h2) / len(h1.hash) ** 2
-                        
-                        if similarity >= threshold:
-                            similar_files.extend(files2)
-                            processed_hashes.add(hash2)
-                    except Exception:
-                        continue
-                
-                if len(similar_files) > 1:
-                    similar_groups[f"similar_{hash1}"] = similar_files
-                
-                processed_hashes.add(hash1)
+            # Paylaşılan indeks analiz edilmiş başka görselleri de tutar;
+            # gruplar yalnızca verilen dosyaların hash'lerinden kurulur
+            file_index = HammingIndex()
+            for file_info in files:
+                phash = index.get(file_info['path'])
+                if phash:
+                    file_index.add(file_info['path'], phash)
+            
+            similar_groups = {}
+            for group in file_index.groups(max_distance):
+                with self._hash_lock:
+                    for file_path in group:
+                        self.similarity_hashes[file_path] = index.get(file_path)
+                similar_groups[f"similar_{index.get(group[0])}"] = group
             
-            return dict(similar_groups)
+            return similar_groups
             
         except Exception as e:
             self.logger.error(f"Benzer görsel bulma hatası: {e}")
             return {}
     
+    def _update_similarity_index(self, files: List[Dict[str, Any]], user_id: int = None) -> HammingIndex:
+        """Kullanıcının (user_id None ise global) benzerlik indeksini dosya listesiyle senkronla (bloklayan)"""
+        index = similarity_index.get_similarity_index(user_id)
+        
+        current_paths = set()
+        for file_info in files:
+            file_path = file_info['path']
+            current_paths.add(file_path)
+            
+            try:
+                signature = similarity_index.file_signature(os.stat(file_path))
+                if similarity_index.stored_signature(index, file_path) == signature:
+                    continue
+                
+                similarity_index.add_image(
+                    file_path, similarity_index.hash_image(file_path), user_id, signature=signature
+                )
+            except Exception as e:
+                self.logger.warning(f"Perceptual hash hesaplanamadı {file_path}: {e}")
+                continue
+        
+        # Diskten silinmiş dosyaları indeksten çıkar; indeks analiz edilen
+        # başka görselleri de tuttuğundan listede olmamak tek başına yetmez
+        for file_path in index.keys():
+            if file_path not in current_paths and not os.path.exists(file_path):
+                similarity_index.remove_image(file_path, user_id)
+        
+        similarity_index.save(user_id)
+        return index
+    
     async def _generate_thumbnails(self, files: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Thumbnail'ları oluştur"""
         try:
@@ -843,7 +849,7 @@ class SmartStorageService:
             user_files = await self._get_user_files(user_id)
             
             # Duplicate'leri tespit et
-            duplicates = await self._detect_duplicates(user_files)
+            duplicates = await self._detect_duplicates(user_files, user_id)
             
             cleanup_results = {
                 'user_id': user_id,
@@ -874,6 +880,8 @@ class SmartStorageService:
                                 
                                 # Veritabanından da kaldır
                                 await self._remove_file_from_db(remove_file)
+                                self.hash_cache.forget(remove_file)
+                                similarity_index.remove_image(remove_file, user_id)
                                 
                                 cleanup_results['files_removed'] += 1
                                 cleanup_results['space_freed'] += file_size
@@ -103,6 +103,28 @@ class Config:
                 },
                 'prefix': 'pofuai_cache'
             },
+            'ai': {
+                'image_analysis': {
+                    'executor': 'process',
+                    'workers': 0,
+                    'timeout': 30,
+                    'timeouts': {'faces': 60, 'colors': 20},
+                    'total_timeout': 120
+                },
+                'similarity_index': {
+                    'path': os.path.join(self.root_dir, 'storage', 'indexes'),
+                    'chunks': 4,
+                    'save_interval': 30,
+                    'category_distance': 10,
+                    'category_neighbors': 20
+                }
+            },
+            'autocomplete': {
+                'refresh_interval': 60,
+                'rebuild_interval': 3600,
+                'max_key_length': 40,
+                'chunk_size': 5000
+            },
             'logger': {
                 'driver': 'file',
                 'path': os.path.join(self.root_dir, 'storage', 'logs'),
@@ -112,8 +134,20 @@ class Config:
                 'format': '[%(asctime)s] %(levelname)s: %(message)s'
             },
             'queue': {
-                'driver': 'sync',
+                'driver': 'sqlite',
                 'default': 'default',
+                'path': os.path.join(self.root_dir, 'storage', 'Queue'),
+                'visibility_timeout': 300,
+                'workers': {
+                    'processes': 0,
+                    'async_workers': 1,
+                    'async_concurrency': 20,
+                    'async_job_types': ['send_email', 'send_notification'],
+                    'limits': {'generate_report': 2},
+                    'retry': {'base_delay': 5, 'factor': 2, 'max_delay': 3600},
+                    'heartbeat_interval': 30,
+                    'shutdown_timeout': 30
+                },
                 'connections': {
                     'sync': {
                         'driver': 'sync',
@@ -141,6 +175,53 @@ class Config:
                 'public': os.path.join(self.root_dir, 'public', 'uploads'),
                 'url': '/uploads',
                 'visibility': 'public',
+                'hash_cache': {
+                    'path': os.path.join(self.root_dir, 'storage', 'cache', 'file_hashes.db'),
+                    'buffer_size': 1024 * 1024,
+                    'workers': 0
+                },
+            },
+            'http': {
+                'backend': None,
+                'http2': True,
+                'timeout': 30,
+                'connect_timeout': 10,
+                'pool_size': 100,
+                'pool_size_per_host': 20,
+                'keepalive_timeout': 60,
+                'retry': {
+                    'max_retries': 2,
+                    'base_delay': 0.5,
+                    'max_delay': 30,
+                    'status_forcelist': [429, 500, 502, 503, 504],
+                    'respect_retry_after': True,
+                    'max_retry_after': 120,
+                    'deadline': 60,
+                    'sync_deadline': 10,
+                    'sync_max_retry_after': 5,
+                    'budget': {'ratio': 0.2, 'min_per_second': 1, 'window': 10}
+                },
+                'integrations': {
+                    'trendyol': {'retry': {'base_delay': 1}},
+                    'n11': {'timeout': 60},
+                    'amazon': {'timeout': 60},
+                    'ebay': {'timeout': 45},
+                    'mng_cargo': {'timeout': 20, 'connect_timeout': 5}
+                }
+            },
+            'marketplace_sync': {
+                'default_concurrency': 4,
+                'default_deadline': 60,
+                'concurrency': {'trendyol': 4, 'n11': 8, 'hepsiburada': 4},
+                'deadlines': {'trendyol': 60, 'n11': 90, 'hepsiburada': 60},
+                'state_path': os.path.join(self.root_dir, 'storage', 'cache', 'sync_state.db'),
+                'overlap': 300,
+                'initial_lookback_days': 30,
+                'page_size': 100,
+                'default_batch_size': 100,
+                'batch_size': {'trendyol': 1000, 'hepsiburada': 500},
+                'batch_confirm_timeout': 30,
+                'batch_poll_interval': 2
             },
             'view': {
                 'path': os.path.join(self.root_dir, 'public', 'Views'),
@@ -9,6 +9,8 @@ from .base_model import BaseModel
 from .query_builder import QueryBuilder
 from .pagination import Pagination
 from .search import SearchEngine
+from .statement_cache import get_statement_cache
+from .row import Row
 
 # Helper fonksiyonlar
 def table(table_name: str) -> QueryBuilder:
@@ -38,5 +40,7 @@ __all__ = [
     'table',
     'search', 
     'paginate',
-    'get_db_connection'
+    'get_db_connection',
+    'get_statement_cache',
+    'Row'
 ] 
\ No newline at end of file
@@ -5,8 +5,11 @@ Tüm modellerin temel sınıfı
 
 from typing import Dict, List, Optional, Any, Union, Set
 from datetime import datetime
+import importlib
 import json
 from .connection import get_db_connection
+from .statement_cache import get_statement_cache
+from .row import Row
 
 class BaseModel:
     """Temel model sınıfı"""
@@ -18,6 +21,15 @@ class BaseModel:
     __timestamps__ = True
     __dates__ = ['created_at', 'updated_at']
     
+    # Eager loading ilişki tanımları, örn:
+    # 'items': {'type': 'has_many', 'model': 'app.Models.OrderItem.OrderItem', 'foreign_key': 'order_id'}
+    # 'user': {'type': 'belongs_to', 'model': 'app.Models.User.User', 'foreign_key': 'user_id'}
+    # Sonuçlar model üzerinde '_<ilişki>' özelliğine yazılır.
+    __relations__ = {}
+    
+    # Tek IN sorgusundaki maksimum anahtar sayısı (SQLite değişken limiti)
+    _eager_chunk_size = 500
+    
     # Veritabanı bağlantısı ve parametre işareti
     _db_connection = get_db_connection()
     _is_sqlite = _db_connection._driver == 'sqlite'
@@ -29,6 +41,8 @@ class BaseModel:
         self._original = {}
         self._exists = False
         self._dirty = set()
+        # Yüklenmiş ilişkiler (None sonuçlu belongs_to tekrar sorgulanmaz)
+        self._loaded_relations = set()
         
         # Verileri doldur
         for key, value in kwargs.items():
@@ -91,8 +105,71 @@ class BaseModel:
     def save(self) -> bool:
         """Kaydet (insert veya update)"""
         if self._exists:
-            return self._update()
-        return self._insert()
+            saved = self._update()
+        else:
+            saved = self._insert()
+        
+        if saved:
+            from core.Services.events import SystemEvents
+            self._fire_model_event(SystemEvents.MODEL_SAVED)
+        return saved
+    
+    @staticmethod
+    def _listening_dispatcher(event_name: str):
+        """Event'i dinleyen varsa global dispatcher'ı getir"""
+        try:
+            from core.Services.events import get_dispatcher
+        except ImportError:
+            return None
+        
+        dispatcher = get_dispatcher()
+        return dispatcher if dispatcher.has_listeners(event_name) else None
+    
+    def _fire_model_event(self, event_name: str):
+        """Global dispatcher'a model event'i gönder (dinleyici varsa)"""
+        dispatcher = self._listening_dispatcher(event_name)
+        if dispatcher is None:
+            return
+        
+        from core.Services.events import Event
+        
+        # Gizli alanlar (parola, token) event geçmişinde tutulmamalı
+        attributes = {key: value for key, value in self._data.items() if key not in self.__hidden__}
+        dispatcher.dispatch(Event(
+            name=event_name,
+            data={
+                'table': self.__table__,
+                'model': self.__class__.__name__,
+                'id': self._data.get(self.__primary_key__),
+                'attributes': attributes
+            },
+            source=self.__class__.__name__
+        ))
+    
+    @classmethod
+    def _fire_bulk_event(cls, ids: List[Any], count: int):
+        """
+        Toplu yazım için tek model.bulk_saved event'i gönder (dinleyici varsa)
+        
+        Satır içerikleri taşınmaz; dinleyiciler gerekirse kayıtları id ile okur.
+        Birincil anahtarı verilmemiş (yeni eklenen) satırlar yalnızca sayıya yansır.
+        """
+        from core.Services.events import Event, SystemEvents
+        
+        dispatcher = cls._listening_dispatcher(SystemEvents.MODEL_BULK_SAVED)
+        if dispatcher is None or not count:
+            return
+        
+        dispatcher.dispatch(Event(
+            name=SystemEvents.MODEL_BULK_SAVED,
+            data={
+                'table': cls.__table__,
+                'model': cls.__name__,
+                'ids': [value for value in ids if value is not None],
+                'count': count
+            },
+            source=cls.__name__
+        ))
     
     def _insert(self) -> bool:
         """Yeni kayıt ekle"""
@@ -119,10 +196,9 @@ class BaseModel:
         
         # SQL sorgusu oluştur
         fields = list(data.keys())
-        placeholders = [self._param_placeholder] * len(fields)
         values = list(data.values())
         
-        query = f"INSERT INTO {self.__table__} ({', '.join(fields)}) VALUES ({', '.join(placeholders)})"
+        query = self._statement('insert', fields)
         
         try:
             with self._db_connection.get_connection() as conn:
@@ -173,11 +249,10 @@ class BaseModel:
             return True
             
         # SQL sorgusu oluştur
-        set_clauses = [f"{field} = {self._param_placeholder}" for field in data.keys()]
         values = list(data.values())
         values.append(self._data[self.__primary_key__])
         
-        query = f"UPDATE {self.__table__} SET {', '.join(set_clauses)} WHERE {self.__primary_key__} = {self._param_placeholder}"
+        query = self._statement('update', data.keys())
         
         try:
             with self._db_connection.get_connection() as conn:
@@ -203,7 +278,7 @@ class BaseModel:
         if not self.__table__:
             raise ValueError("Tablo adı belirtilmemiş")
         
-        query = f"DELETE FROM {self.__table__} WHERE {self.__primary_key__} = {self._param_placeholder}"
+        query = self._statement('delete')
         
         try:
             with self._db_connection.get_connection() as conn:
@@ -213,18 +288,88 @@ class BaseModel:
                 
                 self._exists = False
                 cursor.close()
-                return cursor.rowcount > 0
+                deleted = cursor.rowcount > 0
+            
+            if deleted:
+                from core.Services.events import SystemEvents
+                self._fire_model_event(SystemEvents.MODEL_DELETED)
+            return deleted
         except Exception as e:
             print(f"Silme hatası: {e}")
             return False
     
+    @classmethod
+    def _statement(cls, kind: str, columns=(), keys=()) -> str:
+        """
+        Model sorgusunun derlenmiş SQL metnini getir
+        
+        Args:
+            kind: Sorgu türü (find, all, where, count, insert, upsert, update,
+                bulk_update, delete)
+            columns: Sorguda kullanılan sütunlar (sıra önemlidir)
+            keys: upsert için çakışma, bulk_update için eşleşme sütunları
+            
+        Returns:
+            str: Önbellekten ya da yeni derlenmiş SQL
+        """
+        columns = tuple(columns)
+        keys = tuple(keys)
+        shape = (kind, cls.__table__, cls.__primary_key__, cls._param_placeholder, columns, keys)
+        return get_statement_cache().get_or_build(shape, lambda: cls._compile_statement(kind, columns, keys))
+    
+    @classmethod
+    def _compile_statement(cls, kind: str, columns: tuple, keys: tuple = ()) -> str:
+        """Sorgu türüne göre SQL metnini oluştur"""
+        table = cls.__table__
+        pk = cls.__primary_key__
+        ph = cls._param_placeholder
+        conditions = ' AND '.join([f"{column} = {ph}" for column in columns])
+        
+        if kind == 'find':
+            return f"SELECT * FROM {table} WHERE {pk} = {ph}"
+        if kind == 'all':
+            return f"SELECT * FROM {table}"
+        if kind == 'where':
+            return f"SELECT * FROM {table} WHERE {conditions}"
+        if kind == 'count':
+            query = f"SELECT COUNT(*) as count FROM {table}"
+            return f"{query} WHERE {conditions}" if columns else query
+        if kind == 'insert':
+            placeholders = ', '.join([ph] * len(columns))
+            return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+        if kind == 'upsert':
+            placeholders = ', '.join([ph] * len(columns))
+            insert = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+            # created_at ve çakışma anahtarları mevcut kayıtta korunur
+            updates = [column for column in columns if column not in keys and column != 'created_at']
+            if cls._is_sqlite:
+                if not updates:
+                    return f"{insert} ON CONFLICT ({', '.join(keys)}) DO NOTHING"
+                set_clauses = ', '.join([f"{column} = excluded.{column}" for column in updates])
+                return f"{insert} ON CONFLICT ({', '.join(keys)}) DO UPDATE SET {set_clauses}"
+            # MySQL çakışmayı tablodaki PRIMARY/UNIQUE indekslerden belirler
+            updates = updates or [keys[0]]
+            set_clauses = ', '.join([f"{column} = VALUES({column})" for column in updates])
+            return f"{insert} ON DUPLICATE KEY UPDATE {set_clauses}"
+        if kind == 'bulk_update':
+            set_clauses = ', '.join([f"{column} = {ph}" for column in columns])
+            key_conditions = ' AND '.join([f"{key} = {ph}" for key in keys])
+            return f"UPDATE {table} SET {set_clauses} WHERE {key_conditions}"
+        if kind == 'update':
+            set_clauses = ', '.join([f"{column} = {ph}" for column in columns])
+            return f"UPDATE {table} SET {set_clauses} WHERE {pk} = {ph}"
+        if kind == 'delete':
+            return f"DELETE FROM {table} WHERE {pk} = {ph}"
+        
+        raise ValueError(f"Bilinmeyen sorgu türü: {kind}")
+    
     @classmethod
     def find(cls, id_value: Any) -> Optional['BaseModel']:
         """ID ile bul"""
         if not cls.__table__:
             raise ValueError("Tablo adı belirtilmemiş")
         
-        query = f"SELECT * FROM {cls.__table__} WHERE {cls.__primary_key__} = {cls._param_placeholder}"
+        query = cls._statement('find')
         result = cls._db_connection.execute_query(query, (id_value,))
         
         if result:
@@ -237,7 +382,7 @@ class BaseModel:
         if not cls.__table__:
             raise ValueError("Tablo adı belirtilmemiş")
         
-        query = f"SELECT * FROM {cls.__table__}"
+        query = cls._statement('all')
         result = cls._db_connection.execute_query(query)
         
         return [cls(**row) for row in result] if result else []
@@ -251,8 +396,7 @@ class BaseModel:
         if not conditions:
             return cls.all()
         
-        where_clause = ' AND '.join([f"{k} = {cls._param_placeholder}" for k in conditions.keys()])
-        query = f"SELECT * FROM {cls.__table__} WHERE {where_clause}"
+        query = cls._statement('where', conditions.keys())
         values = tuple(conditions.values())
         
         result = cls._db_connection.execute_query(query, values)
@@ -282,17 +426,299 @@ class BaseModel:
         if not cls.__table__:
             raise ValueError("Tablo adı belirtilmemiş")
         
-        query = f"SELECT COUNT(*) as count FROM {cls.__table__}"
-        values = None
-        
-        if conditions:
-            where_clause = ' AND '.join([f"{k} = {cls._param_placeholder}" for k in conditions.keys()])
-            query += f" WHERE {where_clause}"
-            values = tuple(conditions.values())
+        query = cls._statement('count', conditions.keys() if conditions else ())
+        values = tuple(conditions.values()) if conditions else None
         
         result = cls._db_connection.execute_query(query, values)
         return result[0]['count'] if result else 0
     
+    @classmethod
+    def _bulk_data(cls, row: Union[Dict[str, Any], 'BaseModel'], now: datetime,
+                   creating: bool = True) -> Dict[str, Any]:
+        """Toplu işlem satırını _insert ile aynı kurallarla hazırla"""
+        if isinstance(row, BaseModel):
+            row = row._data
+        
+        # Doldurulabilir alanları filtrele
+        data = {key: value for key, value in row.items()
+                if not cls.__fillable__ or key in cls.__fillable__}
+        
+        # Timestamp ekle
+        if cls.__timestamps__:
+            if creating and 'created_at' not in data:
+                data['created_at'] = now
+            if 'updated_at' not in data:
+                data['updated_at'] = now
+        
+        return data
+    
+    @classmethod
+    def _execute_bulk(cls, groups: Dict[tuple, List[tuple]], statement, batch_size: int) -> int:
+        """
+        Gruplanmış satırları executemany ile parti parti yaz
+        
+        Her parti tek transaction içinde çalışır; hata olursa o parti geri
+        alınır ve hata çağırana iletilir (önceki partiler yazılmış kalır,
+        hepsi-ya-da-hiçbiri için çağrıyı transaction() içine alın).
+        """
+        written = 0
+        with cls._db_connection.get_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                for columns, params in groups.items():
+                    query = statement(columns)
+                    for start in range(0, len(params), batch_size):
+                        batch = params[start:start + batch_size]
+                        try:
+                            cursor.executemany(query, batch)
+                            conn.commit()
+                        except Exception as e:
+                            conn.rollback()
+                            print(f"Toplu yazma hatası ({cls.__table__}, {written} satır yazıldı): {e}")
+                            raise
+                        written += len(batch)
+            finally:
+                cursor.close()
+        
+        return written
+    
+    @classmethod
+    def bulk_insert(cls, rows: List[Union[Dict[str, Any], 'BaseModel']], batch_size: int = 1000) -> int:
+        """
+        Satırları parti parti toplu ekle
+        
+        Fillable ve timestamp kuralları _insert ile aynıdır. Aynı sütun
+        kümesine sahip satırlar tek INSERT metniyle executemany'ye verilir.
+        Satır başına model.saved yerine tek model.bulk_saved event'i gönderilir.
+        
+        Args:
+            rows: Dictionary ya da model listesi
+            batch_size: Transaction başına satır sayısı
+            
+        Returns:
+            int: Eklenen satır sayısı
+        """
+        if not cls.__table__:
+            raise ValueError("Tablo adı belirtilmemiş")
+        
+        now = datetime.now()
+        groups: Dict[tuple, List[tuple]] = {}
+        ids = []
+        for row in rows:
+            data = cls._bulk_data(row, now)
+            if data:
+                groups.setdefault(tuple(data.keys()), []).append(tuple(data.values()))
+                ids.append(data.get(cls.__primary_key__))
+        
+        written = cls._execute_bulk(groups, lambda columns: cls._statement('insert', columns), batch_size)
+        cls._fire_bulk_event(ids, written)
+        return written
+    
+    @classmethod
+    def bulk_upsert(cls, rows: List[Union[Dict[str, Any], 'BaseModel']], conflict_keys: List[str] = None,
+                    batch_size: int = 1000) -> int:
+        """
+        Satırları toplu ekle, çakışanları güncelle
+        
+        SQLite'ta INSERT ... ON CONFLICT (conflict_keys) DO UPDATE, MySQL'de
+        INSERT ... ON DUPLICATE KEY UPDATE kullanılır. conflict_keys üzerinde
+        UNIQUE indeks olmalıdır; güncellemede created_at korunur.
+        
+        Args:
+            rows: Dictionary ya da model listesi
+            conflict_keys: Çakışma sütunları (varsayılan: birincil anahtar)
+            batch_size: Transaction başına satır sayısı
+            
+        Returns:
+            int: İşlenen satır sayısı
+        """
+        if not cls.__table__:
+            raise ValueError("Tablo adı belirtilmemiş")
+        
+        keys = tuple(conflict_keys or [cls.__primary_key__])
+        now = datetime.now()
+        groups: Dict[tuple, List[tuple]] = {}
+        ids = []
+        for row in rows:
+            source = row._data if isinstance(row, BaseModel) else row
+            data = cls._bulk_data(source, now)
+            # Çakışma anahtarları fillable dışında olsa da gerekli
+            for key in keys:
+                if key in source and key not in data:
+                    data[key] = source[key]
+            if data:
+                groups.setdefault(tuple(data.keys()), []).append(tuple(data.values()))
+                ids.append(data.get(cls.__primary_key__))
+        
+        written = cls._execute_bulk(groups, lambda columns: cls._statement('upsert', columns, keys), batch_size)
+        cls._fire_bulk_event(ids, written)
+        return written
+    
+    @classmethod
+    def bulk_update(cls, rows: List[Union[Dict[str, Any], 'BaseModel']], key: str = None,
+                    batch_size: int = 1000) -> int:
+        """
+        Satırları anahtar sütuna göre toplu güncelle
+        
+        Her satır eşleşme anahtarını içermelidir; diğer fillable alanları
+        güncellenir ve timestamp açıksa updated_at yenilenir.
+        
+        Args:
+            rows: Dictionary ya da model listesi
+            key: Eşleşme sütunu (varsayılan: birincil anahtar)
+            batch_size: Transaction başına satır sayısı
+            
+        Returns:
+            int: İşlenen satır sayısı
+        """
+        if not cls.__table__:
+            raise ValueError("Tablo adı belirtilmemiş")
+        
+        key = key or cls.__primary_key__
+        now = datetime.now()
+        groups: Dict[tuple, List[tuple]] = {}
+        ids = []
+        for row in rows:
+            source = row._data if isinstance(row, BaseModel) else row
+            if source.get(key) is None:
+                raise ValueError(f"Toplu güncelleme satırında '{key}' eksik")
+            data = cls._bulk_data(source, now, creating=False)
+            data.pop(key, None)
+            if data:
+                groups.setdefault(tuple(data.keys()), []).append(tuple(data.values()) + (source[key],))
+                ids.append(source.get(cls.__primary_key__))
+        
+        written = cls._execute_bulk(groups, lambda columns: cls._statement('bulk_update', columns, (key,)), batch_size)
+        cls._fire_bulk_event(ids, written)
+        return written
+    
+    @classmethod
+    def find_many_by(cls, column: str, values: List[Any],
+                     conditions: Dict[str, Any] = None) -> List['BaseModel']:
+        """
+        Birden çok değer için kayıtları IN sorgusuyla getir
+        
+        Args:
+            column: Eşleştirilecek sütun
+            values: Aranan değerler (tekrarlar ve None atlanır)
+            conditions: Ek eşitlik koşulları
+            
+        Returns:
+            List[BaseModel]: Bulunan modeller
+        """
+        return [cls(**row) for row in cls._fetch_in(cls.__table__, column, values, conditions)]
+    
+    @classmethod
+    def _fetch_in(cls, table: str, column: str, values: List[Any],
+                  conditions: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """IN sorgusunu parçalar halinde çalıştır"""
+        from .query_builder import QueryBuilder
+        
+        keys = list(dict.fromkeys(value for value in values if value is not None))
+        rows = []
+        for start in range(0, len(keys), cls._eager_chunk_size):
+            builder = QueryBuilder(table).where_in(column, keys[start:start + cls._eager_chunk_size])
+            for key, value in (conditions or {}).items():
+                builder.where(key, '=', value)
+            rows.extend(builder.get())
+        return rows
+    
+    @staticmethod
+    def _resolve_model(path: str):
+        """'paket.modul.Sinif' yolundan model sınıfını getir"""
+        module_name, _, class_name = path.rpartition('.')
+        return getattr(importlib.import_module(module_name), class_name)
+    
+    @classmethod
+    def eager_load(cls, models: List['BaseModel'], *relations: str) -> List['BaseModel']:
+        """
+        İlişkileri ilişki başına tek sorguyla yükle (N+1 önleme)
+        
+        Ebeveyn anahtarları toplanır, her ilişki tek bir WHERE ... IN (...)
+        sorgusuyla getirilir ve sonuçlar modellerin '_<ilişki>' önbelleğine
+        yazılır; böylece order.items() gibi mevcut erişimciler yeniden sorgu
+        atmaz. 'items.product' gibi noktalı yollar iç içe yüklenir.
+        
+        Args:
+            models: Ebeveyn modeller
+            relations: İlişki adları
+            
+        Returns:
+            List[BaseModel]: Aynı model listesi
+        """
+        if not models:
+            return models
+        
+        # Aynı ilişkinin iç içe yollarını grupla: items, items.product -> items: [product]
+        grouped: Dict[str, List[str]] = {}
+        for relation in relations:
+            name, _, nested = relation.partition('.')
+            grouped.setdefault(name, [])
+            if nested:
+                grouped[name].append(nested)
+        
+        for name, nested in grouped.items():
+            spec = cls.__relations__.get(name)
+            if spec is None:
+                raise ValueError(f"'{cls.__name__}' modelinde '{name}' ilişkisi tanımlı değil")
+            
+            related = cls._load_relation(models, name, spec)
+            
+            if nested and related and 'model' in spec:
+                cls._resolve_model(spec['model']).eager_load(related, *nested)
+        
+        return models
+    
+    @classmethod
+    def _load_relation(cls, models: List['BaseModel'], name: str, spec: Dict[str, Any]) -> List[Any]:
+        """Tek ilişkiyi yükle ve modellere dağıt; yüklenen kayıtları döndür"""
+        related_class = cls._resolve_model(spec['model']) if 'model' in spec else None
+        table = related_class.__table__ if related_class else spec['table']
+        foreign_key = spec['foreign_key']
+        conditions = spec.get('conditions')
+        attribute = f"_{name}"
+        
+        if spec['type'] == 'belongs_to':
+            owner_key = spec.get('owner_key', 'id')
+            rows = cls._fetch_in(table, owner_key, [model._data.get(foreign_key) for model in models], conditions)
+            items = [related_class(**row) for row in rows] if related_class else rows
+            by_key = {item[owner_key]: item for item in items}
+            
+            for model in models:
+                setattr(model, attribute, by_key.get(model._data.get(foreign_key)))
+                model._loaded_relations.add(name)
+            return items
+        
+        if spec['type'] == 'has_many':
+            local_key = spec.get('local_key', cls.__primary_key__)
+            rows = cls._fetch_in(table, foreign_key, [model._data.get(local_key) for model in models], conditions)
+            items = [related_class(**row) for row in rows] if related_class else rows
+            by_key: Dict[Any, List[Any]] = {}
+            for item in items:
+                by_key.setdefault(item[foreign_key], []).append(item)
+            
+            for model in models:
+                setattr(model, attribute, by_key.get(model._data.get(local_key), []))
+                model._loaded_relations.add(name)
+            return items
+        
+        raise ValueError(f"Bilinmeyen ilişki türü: {spec['type']}")
+    
+    def load_relation(self, name: str) -> Any:
+        """Tek model için tanımlı ilişkiyi yükle (önbellekliyse tekrar sorgulamaz)"""
+        if name not in self._loaded_relations:
+            self.__class__.eager_load([self], name)
+        return getattr(self, f"_{name}")
+    
+    @classmethod
+    def with_(cls, *relations: str) -> 'QueryResult':
+        """
+        Eager loading ile sorgu başlat
+        
+        Örnek: Order.with_('items', 'user').limit(100).get()
+        """
+        return cls.query().with_(*relations)
+    
     @classmethod
     def order_by(cls, column: str, direction: str = 'desc') -> 'QueryResult':
         """
@@ -375,6 +801,36 @@ class QueryResult:
     def __init__(self, model_class, query_builder):
         self.model_class = model_class
         self.query_builder = query_builder
+        self.eager_relations = []
+        self.readonly_rows = False
+    
+    def readonly(self) -> 'QueryResult':
+        """
+        Sonuçları salt okunur Row nesneleri olarak döndür
+        
+        Büyük rapor/export sorguları için; satırlar model yerine tuple
+        tabanlı Row olarak gelir, gerekirse row.to_model() ile modele çevrilir.
+        """
+        self.readonly_rows = True
+        return self
+    
+    def rows(self) -> List[Row]:
+        """Sorguyu çalıştır ve salt okunur Row listesi döndür"""
+        if self.eager_relations:
+            raise ValueError("Salt okunur satırlarla eager loading kullanılamaz")
+        return self.query_builder.get_rows(self.model_class)
+    
+    def with_(self, *relations: str) -> 'QueryResult':
+        """Sonuçlarla birlikte yüklenecek ilişkileri ekle"""
+        self.eager_relations.extend(relations)
+        return self
+    
+    def _hydrate(self, rows: List[Dict[str, Any]]) -> List[BaseModel]:
+        """Satırları modele çevir ve istenen ilişkileri toplu yükle"""
+        models = [self.model_class(**row) for row in rows] if rows else []
+        if models and self.eager_relations:
+            self.model_class.eager_load(models, *self.eager_relations)
+        return models
     
     def order_by(self, column: str, direction: str = 'desc') -> 'QueryResult':
         """ORDER BY ekle"""
@@ -406,10 +862,16 @@ class QueryResult:
         self.query_builder.where_like(column, pattern)
         return self
     
-    def get(self) -> List[BaseModel]:
-        """Sorguyu çalıştır ve model listesi döndür"""
-        results = self.query_builder.get()
-        return [self.model_class(**row) for row in results] if results else []
+    def where_in(self, column: str, values: List[Any]) -> 'QueryResult':
+        """WHERE IN koşulu ekle"""
+        self.query_builder.where_in(column, values)
+        return self
+    
+    def get(self) -> List[Union[BaseModel, Row]]:
+        """Sorguyu çalıştır ve model (readonly modda Row) listesi döndür"""
+        if self.readonly_rows:
+            return self.rows()
+        return self._hydrate(self.query_builder.get())
     
     def first(self) -> Optional[BaseModel]:
         """İlk sonucu model olarak döndür"""
@@ -438,4 +900,33 @@ class QueryResult:
                 'from': (page - 1) * per_page + 1 if results else 0,
                 'to': min(page * per_page, total) if results else 0
             }
+        }
+    
+    def cursor_paginate(self, per_page: int, cursor: Optional[str] = None,
+                        with_total: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Keyset (cursor) sayfalama yap
+        
+        COUNT(*) ve OFFSET kullanmadığı için derin sayfalar da sabit maliyetlidir.
+        Sıralama mevcut order_by koşullarından alınır, sona birincil anahtar eklenir.
+        """
+        from .pagination import KeysetPaginator
+        
+        paginator = KeysetPaginator(
+            self.query_builder, per_page,
+            unique_key=self.model_class.__primary_key__,
+            with_total=with_total
+        )
+        page = paginator.paginate(cursor)
+        
+        return {
+            'data': self._hydrate(page.items),
+            'pagination': {
+                'total': page.total,
+                'per_page': per_page,
+                'next_cursor': page.next_cursor,
+                'prev_cursor': page.prev_cursor,
+                'has_next': page.has_next,
+                'has_previous': page.has_previous
+            }
         } 
\ No newline at end of file
@@ -12,8 +12,331 @@ except ImportError:
 
 import logging
 import os
+import queue
+import shutil
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict
+
+
+class PooledSQLiteConnection(sqlite3.Connection):
+    """
+    Havuz bağlantısı
+    
+    Aynı thread içinde iç içe açılan context'ler bağlantıyı paylaşır; dış
+    transaction sürerken açılan iç context bir SAVEPOINT ile başlar. İç
+    context'teki commit() dış transaction'ı erken commit etmez, rollback()
+    yalnızca iç context'in değişikliklerini geri alır.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.depth = 0
+        self.owner = None
+        self.closed = False
+        self._savepoints = []
+    
+    def begin_nested(self):
+        """İç context başlat"""
+        if self.in_transaction:
+            name = f"pool_nested_{len(self._savepoints)}"
+            self.execute(f"SAVEPOINT {name}")
+            self._savepoints.append(name)
+        else:
+            self._savepoints.append(None)
+    
+    def end_nested(self):
+        """İç context'i bitir; savepoint dış transaction'a katılır"""
+        name = self._savepoints.pop()
+        if name and self.in_transaction:
+            try:
+                self.execute(f"RELEASE SAVEPOINT {name}")
+            except sqlite3.OperationalError:
+                pass
+    
+    def _current_savepoint(self):
+        return self._savepoints[-1] if self._savepoints else None
+    
+    def commit(self):
+        # Dış transaction sürüyorsa commit'i dış context yapar
+        if self._current_savepoint() and self.in_transaction:
+            return
+        super().commit()
+    
+    def rollback(self):
+        name = self._current_savepoint()
+        if name and self.in_transaction:
+            self.execute(f"ROLLBACK TO SAVEPOINT {name}")
+            return
+        super().rollback()
+    
+    def close(self):
+        self.closed = True
+        super().close()
+
+
+class NestedMySQLConnection:
+    """
+    Dış transaction'ın MySQL bağlantısı
+    
+    DatabaseConnection.transaction() içinde açılan iç context'ler aynı
+    bağlantıyı bir SAVEPOINT ile paylaşır; commit() dış transaction'ı erken
+    commit etmez, rollback() yalnızca iç context'i geri alır, close() bağlantıyı
+    havuza bırakmaz.
+    """
+    
+    def __init__(self, conn, name: str):
+        self._conn = conn
+        self._name = name
+        self._run(f"SAVEPOINT {name}")
+    
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+    
+    def _run(self, statement: str):
+        cursor = self._conn.cursor()
+        try:
+            cursor.execute(statement)
+        finally:
+            cursor.close()
+    
+    def commit(self):
+        # Commit'i dış transaction yapar
+        pass
+    
+    def rollback(self):
+        self._run(f"ROLLBACK TO SAVEPOINT {self._name}")
+    
+    def close(self):
+        pass
+    
+    def release(self):
+        """İç context'i bitir; savepoint dış transaction'a katılır"""
+        try:
+            self._run(f"RELEASE SAVEPOINT {self._name}")
+        except Exception:
+            pass
+
+
+class SQLiteConnectionPool:
+    """
+    Thread-safe SQLite bağlantı havuzu
+    
+    Her thread checkout/checkin ile kendi bağlantısını kullanır; aynı thread
+    içinde iç içe açılan context'ler aynı bağlantıyı savepoint'lerle
+    paylaşır. Bağlantı başka bir thread'de de geri verilebilir (örn. başka
+    thread'de kapatılan generator). Varsayılan olarak WAL açılır; okuyucular
+    yazıcıyı beklemez. WAL dosyada kalıcıdır; `journal_mode=None` dosyanın
+    mevcut modunu korur.
+    """
+    
+    def __init__(self, database: str, pool_size: int = 5, timeout: float = 30.0,
+                 journal_mode: str = 'WAL', busy_timeout: int = 5000,
+                 synchronous: str = 'NORMAL', mmap_size: int = 268435456,
+                 cache_size: int = -16000, foreign_keys: bool = False,
+                 cached_statements: int = 256):
+        self.database = database
+        self.timeout = timeout
+        self.journal_mode = journal_mode
+        self.busy_timeout = busy_timeout
+        self.synchronous = synchronous
+        self.mmap_size = mmap_size
+        self.cache_size = cache_size
+        self.foreign_keys = foreign_keys
+        self.cached_statements = cached_statements
+        
+        # In-memory veritabanı bağlantılar arasında paylaşılamaz
+        self.is_memory = database == ':memory:'
+        self.pool_size = 1 if self.is_memory else max(1, pool_size)
+        
+        self._idle = queue.LifoQueue()
+        self._by_thread: Dict[int, PooledSQLiteConnection] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._memory_conn = None
+        self.created_at = datetime.now()
+        
+        self._created = 0
+        self._in_use = 0
+        self._stats = {
+            'checkouts': 0,
+            'waits': 0,
+            'timeouts': 0,
+            'total_wait_time': 0.0,
+        }
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Pragma'ları uygulanmış yeni bağlantı oluştur"""
+        if self.is_memory and self._memory_conn is not None:
+            return self._memory_conn
+        
+        conn = sqlite3.connect(
+            self.database,
+            timeout=self.busy_timeout / 1000.0,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+            factory=PooledSQLiteConnection
+        )
+        conn.row_factory = sqlite3.Row
+        
+        if not self.is_memory and self.journal_mode:
+            conn.execute(f"PRAGMA journal_mode={self.journal_mode}")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout)}")
+        if self.synchronous:
+            conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        if self.mmap_size is not None:
+            conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        if self.cache_size is not None:
+            conn.execute(f"PRAGMA cache_size={int(self.cache_size)}")
+        if self.foreign_keys:
+            conn.execute("PRAGMA foreign_keys=ON")
+        
+        if self.is_memory:
+            self._memory_conn = conn
+        return conn
+    
+    def create_connection(self) -> sqlite3.Connection:
+        """Havuz dışında kullanılacak bağımsız bağlantı oluştur"""
+        return self._connect()
+    
+    def _check_fork(self):
+        """Fork sonrası ebeveyn sürecin bağlantılarını bırak"""
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._idle = queue.LifoQueue()
+                    self._by_thread = {}
+                    self._created = 0
+                    self._in_use = 0
+                    self._pid = os.getpid()
+    
+    def checkout(self) -> sqlite3.Connection:
+        """Havuzdan bağlantı al"""
+        self._check_fork()
+        
+        # Aynı thread'de iç içe kullanım: mevcut bağlantıyı savepoint ile paylaş
+        thread_id = threading.get_ident()
+        conn = self._by_thread.get(thread_id)
+        if conn is not None:
+            conn.begin_nested()
+            conn.depth += 1
+            return conn
+        
+        conn = None
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if self._created < self.pool_size:
+                    self._created += 1
+                    create = True
+                else:
+                    create = False
+            
+            if create:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                started = time.time()
+                with self._lock:
+                    self._stats['waits'] += 1
+                try:
+                    conn = self._idle.get(timeout=self.timeout)
+                except queue.Empty:
+                    with self._lock:
+                        self._stats['timeouts'] += 1
+                    raise TimeoutError(
+                        f"SQLite bağlantı havuzu tükendi ({self.pool_size} bağlantı, {self.timeout}s)"
+                    )
+                finally:
+                    with self._lock:
+                        self._stats['total_wait_time'] += time.time() - started
+        
+        conn.depth = 1
+        conn.owner = thread_id
+        with self._lock:
+            self._in_use += 1
+            self._stats['checkouts'] += 1
+            self._by_thread[thread_id] = conn
+        return conn
+    
+    def checkin(self, conn: sqlite3.Connection):
+        """Bağlantıyı havuza geri ver (checkout yapan thread dışından da olabilir)"""
+        if getattr(conn, 'owner', None) is None or conn.depth <= 0:
+            return
+        
+        conn.depth -= 1
+        if conn.depth > 0:
+            conn.end_nested()
+            return
+        
+        with self._lock:
+            if self._by_thread.get(conn.owner) is conn:
+                del self._by_thread[conn.owner]
+            conn.owner = None
+            self._in_use -= 1
+        
+        if conn.closed:
+            with self._lock:
+                self._created -= 1
+            return
+        
+        # Yarım kalmış transaction'ı bir sonraki kullanıcıya devretme
+        if conn.in_transaction:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                pass
+        self._idle.put(conn)
+    
+    @contextmanager
+    def connection(self):
+        """Checkout/checkin context manager"""
+        conn = self.checkout()
+        try:
+            yield conn
+        finally:
+            self.checkin(conn)
+    
+    def close_all(self):
+        """Boştaki tüm bağlantıları kapat"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+            with self._lock:
+                self._created -= 1
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Havuz istatistikleri"""
+        with self._lock:
+            checkouts = self._stats['checkouts']
+            return {
+                'driver': 'sqlite',
+                'total_connections': self._created,
+                'active_connections': self._in_use,
+                'idle_connections': self._idle.qsize(),
+                'max_connections': self.pool_size,
+                'checkouts': checkouts,
+                'waits': self._stats['waits'],
+                'timeouts': self._stats['timeouts'],
+                'avg_wait_time': self._stats['total_wait_time'] / self._stats['waits'] if self._stats['waits'] else 0.0,
+                'journal_mode': self.journal_mode if not self.is_memory else 'memory',
+                'pool_age': (datetime.now() - self.created_at).seconds
+            }
+
 
 class DatabaseConnection:
     """Veritabanı bağlantı yöneticisi"""
@@ -21,8 +344,10 @@ class DatabaseConnection:
     _instance = None
     _pool = None
     _config = None
-    _conn = None
     _driver = None
+    _sqlite_pool = None
+    _raw_local = threading.local()
+    _tx_local = threading.local()
     
     def __new__(cls):
         if cls._instance is None:
@@ -67,6 +392,13 @@ class DatabaseConnection:
                 
                 self._config = {
                     'database': db_path,
+                    'pool_size': config.get('database.pool_size', 8),
+                    'pool_timeout': config.get('database.pool_timeout', 30),
+                    'journal_mode': config.get('database.journal_mode', 'WAL'),
+                    'busy_timeout': config.get('database.busy_timeout', 5000),
+                    'synchronous': config.get('database.synchronous', 'NORMAL'),
+                    'mmap_size': config.get('database.mmap_size', 268435456),
+                    'cache_size': config.get('database.cache_size', -16000),
                 }
                 
         except Exception as e:
@@ -89,9 +421,20 @@ class DatabaseConnection:
                 # Dizin yoksa oluştur
                 os.makedirs(os.path.dirname(db_path), exist_ok=True)
                 
-                # SQLite bağlantısı oluştur
-                self._conn = sqlite3.connect(db_path, check_same_thread=False)
-                self._conn.row_factory = sqlite3.Row
+                # Çalışma veritabanı yoksa izlenen seed kopyasından oluştur
+                self._copy_sqlite_seed(db_path)
+                
+                # SQLite bağlantı havuzu oluştur
+                self._sqlite_pool = SQLiteConnectionPool(
+                    db_path,
+                    pool_size=self._config.get('pool_size', 8),
+                    timeout=self._config.get('pool_timeout', 30),
+                    journal_mode=self._config.get('journal_mode', 'WAL'),
+                    busy_timeout=self._config.get('busy_timeout', 5000),
+                    synchronous=self._config.get('synchronous', 'NORMAL'),
+                    mmap_size=self._config.get('mmap_size', 268435456),
+                    cache_size=self._config.get('cache_size', -16000)
+                )
                 
                 # SQLite'ı başlat - basit şema kontrol et
                 self._init_sqlite_schema()
@@ -102,41 +445,59 @@ class DatabaseConnection:
             logging.error(f"Veritabanı bağlantı hatası: {e}")
             # Demo modunda çalış - dummy bağlantı
             self._driver = 'memory'
-            self._conn = None
+            self._sqlite_pool = None
+    
+    @staticmethod
+    def _copy_sqlite_seed(db_path: str):
+        """
+        <ad>.seed.db varsa ve veritabanı dosyası yoksa seed'i kopyala
+        
+        Depoda yalnızca seed izlenir; uygulamanın açtığı (WAL'a geçirdiği,
+        -wal/-shm dosyaları oluşan) kopya git dışında kalır.
+        """
+        seed_path = f"{os.path.splitext(db_path)[0]}.seed.db"
+        if os.path.exists(db_path) or not os.path.exists(seed_path):
+            return
+        try:
+            shutil.copyfile(seed_path, db_path)
+            logging.info(f"SQLite veritabanı seed'den oluşturuldu: {db_path}")
+        except OSError as e:
+            logging.warning(f"SQLite seed kopyalanamadı ({seed_path}): {e}")
     
     def _init_sqlite_schema(self):
         """SQLite şemasını başlat"""
         try:
-            cursor = self._conn.cursor()
-            
-            # SQLite versiyonunu kontrol et
-            cursor.execute("SELECT sqlite_version();")
-            version = cursor.fetchone()[0]
-            logging.info(f"SQLite versiyonu: {version}")
-            
-            # Tablo var mı kontrol et
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='users';")
-            if not cursor.fetchone():
-                logging.info("Users tablosu bulunamadı, oluşturuluyor...")
+            with self._sqlite_pool.connection() as conn:
+                cursor = conn.cursor()
                 
-                # Örnek tablo oluştur
-                cursor.execute('''
-                CREATE TABLE IF NOT EXISTS users (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    email TEXT NOT NULL UNIQUE,
-                    username TEXT NOT NULL UNIQUE,
-                    password TEXT NOT NULL,
-                    is_active BOOLEAN DEFAULT 1,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                );
-                ''')
-                self._conn.commit()
+                # SQLite versiyonunu kontrol et
+                cursor.execute("SELECT sqlite_version();")
+                version = cursor.fetchone()[0]
+                logging.info(f"SQLite versiyonu: {version}")
                 
-                logging.info("Users tablosu oluşturuldu.")
-            
-            cursor.close()
+                # Tablo var mı kontrol et
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='users';")
+                if not cursor.fetchone():
+                    logging.info("Users tablosu bulunamadı, oluşturuluyor...")
+                    
+                    # Örnek tablo oluştur
+                    cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS users (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        name TEXT NOT NULL,
+                        email TEXT NOT NULL UNIQUE,
+                        username TEXT NOT NULL UNIQUE,
+                        password TEXT NOT NULL,
+                        is_active BOOLEAN DEFAULT 1,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    );
+                    ''')
+                    conn.commit()
+                    
+                    logging.info("Users tablosu oluşturuldu.")
+                
+                cursor.close()
             
         except Exception as e:
             logging.error(f"SQLite şema başlatma hatası: {e}")
@@ -158,16 +519,27 @@ class DatabaseConnection:
             self._pool = None
     
     def get_raw_connection(self):
-        """Ham bağlantı döndür"""
-        if self._driver == 'sqlite' and self._conn:
-            return self._conn
-        return None
+        """
+        Ham bağlantı döndür
+        
+        Havuz dışı bağlantı thread başına açılır; eski kodların bağlantıyı
+        kapatması diğer thread'leri etkilemez, kapatılan bağlantı bir
+        sonraki çağrıda yeniden açılır.
+        """
+        if self._driver != 'sqlite' or not self._sqlite_pool:
+            return None
+        
+        local = self._raw_local
+        conn = getattr(local, 'conn', None)
+        if conn is None or conn.closed or getattr(local, 'pid', None) != os.getpid():
+            conn = local.conn = self._sqlite_pool.create_connection()
+            local.pid = os.getpid()
+        return conn
 
     def get_cursor(self):
         """Basit cursor döndür (SQLite için)"""
-        if self._driver == 'sqlite' and self._conn:
-            return self._conn.cursor()
-        return None
+        conn = self.get_raw_connection()
+        return conn.cursor() if conn else None
 
     @contextmanager
     def get_connection(self):
@@ -175,23 +547,66 @@ class DatabaseConnection:
         connection = None
         try:
             if self._driver == 'mysql' and self._pool:
-                connection = self._pool.get_connection()
+                outer = getattr(self._tx_local, 'conn', None)
+                if outer is not None:
+                    # transaction() içinde: aynı bağlantıyı savepoint ile paylaş
+                    self._tx_local.depth += 1
+                    connection = NestedMySQLConnection(outer, f"tx_nested_{self._tx_local.depth}")
+                else:
+                    connection = self._pool.get_connection()
+                yield connection
+            elif self._driver == 'sqlite' and self._sqlite_pool:
+                connection = self._sqlite_pool.checkout()
                 yield connection
-            elif self._driver == 'sqlite' and self._conn:
-                yield self._conn
             else:
                 # Demo mod - dummy bağlantı
                 yield None
         except Exception as e:
-            if connection and self._driver == 'mysql':
-                connection.rollback()
-            elif self._conn and self._driver == 'sqlite':
-                self._conn.rollback()
+            if connection:
+                try:
+                    connection.rollback()
+                except Exception:
+                    pass
             logging.error(f"Veritabanı işlem hatası: {e}")
             raise
         finally:
-            if connection and self._driver == 'mysql':
+            if isinstance(connection, NestedMySQLConnection):
+                connection.release()
+                self._tx_local.depth -= 1
+            elif connection and self._driver == 'mysql':
                 connection.close()
+            elif connection and self._driver == 'sqlite':
+                self._sqlite_pool.checkin(connection)
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Tek transaction context'i
+        
+        Blok içinde açılan get_connection() context'leri (model save, bulk
+        işlemler) aynı bağlantıyı savepoint'lerle paylaşır. Blok hatasız
+        biterse hepsi birlikte commit edilir, hata olursa hepsi geri alınır.
+        """
+        with self.get_connection() as conn:
+            owner = False
+            if self._driver == 'sqlite':
+                if not conn.in_transaction:
+                    conn.execute("BEGIN")
+            elif self._driver == 'mysql' and not isinstance(conn, NestedMySQLConnection):
+                if not conn.in_transaction:
+                    conn.start_transaction()
+                self._tx_local.conn = conn
+                self._tx_local.depth = 0
+                owner = True
+            
+            try:
+                yield conn
+            finally:
+                if owner:
+                    self._tx_local.conn = None
+            
+            if conn is not None:
+                conn.commit()
     
     def execute_query(self, query: str, params: tuple = None):
         """Tek sorgu çalıştır"""
@@ -219,6 +634,99 @@ class DatabaseConnection:
             logging.error(f"Sorgu hatası: {query} - {e}")
             return []
     
+    def iter_query(self, query: str, params: tuple = None, batch_size: int = 1000, batches: bool = False,
+                   model_class=None):
+        """
+        Sorgu sonuçlarını fetchmany ile salt okunur Row nesneleri olarak akıt
+        
+        Sonuçlar belleğe toplu alınmaz; MySQL'de buffered olmayan (server-side)
+        cursor, SQLite'ta adım adım okunan cursor kullanılır. Satırlar dict'e
+        çevrilmez, tümü tek bir RowSchema'yı paylaşır. Bağlantı akış bitene
+        (ya da generator kapatılana) kadar havuzdan ayrılmış kalır.
+        
+        Args:
+            query: SQL sorgusu
+            params: Sorgu parametreleri
+            batch_size: fetchmany başına satır sayısı
+            batches: True ise satır yerine satır listeleri (parti) üretir
+            model_class: Row.to_model() için model sınıfı
+            
+        Yields:
+            Row ya da List[Row]
+        """
+        from .row import Row, RowSchema
+        
+        if self._driver == 'memory':
+            return
+        
+        try:
+            with self.get_connection() as conn:
+                if self._driver == 'mysql':
+                    cursor = conn.cursor(buffered=False)
+                else:
+                    cursor = conn.cursor()
+                    cursor.row_factory = None
+                cursor.execute(query, params or ())
+                
+                try:
+                    schema = RowSchema([column[0] for column in cursor.description or ()], model_class)
+                    while True:
+                        rows = cursor.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        rows = [Row(schema, tuple(row)) for row in rows]
+                        if batches:
+                            yield rows
+                        else:
+                            yield from rows
+                finally:
+                    if self._driver == 'mysql':
+                        # Okunmamış sonuçlar bağlantıyı kilitlememeli
+                        try:
+                            cursor.fetchall()
+                        except Exception:
+                            pass
+                    cursor.close()
+                    
+        except GeneratorExit:
+            raise
+        except Exception as e:
+            logging.error(f"Akış sorgusu hatası: {query} - {e}")
+            raise
+    
+    def execute_query_rows(self, query: str, params: tuple = None):
+        """
+        Sorguyu çalıştır ve sonuçları dict'e çevirmeden döndür
+        
+        Returns:
+            Tuple[List[str], List[tuple]]: Sütun adları ve satır değerleri
+        """
+        try:
+            if self._driver == 'memory':
+                return [], []
+                
+            with self.get_connection() as conn:
+                if self._driver == 'mysql':
+                    cursor = conn.cursor()
+                    cursor.execute(query, params or ())
+                    result = cursor.fetchall()
+                    columns = [column[0] for column in cursor.description or ()]
+                    cursor.close()
+                    return columns, result
+                elif self._driver == 'sqlite':
+                    # sqlite3.Row yerine doğrudan tuple üret; ikinci kopya oluşmaz
+                    cursor = conn.cursor()
+                    cursor.row_factory = None
+                    cursor.execute(query, params or ())
+                    columns = [column[0] for column in cursor.description or ()]
+                    result = cursor.fetchall()
+                    cursor.close()
+                    return columns, result
+                    
+        except Exception as e:
+            logging.error(f"Sorgu hatası: {query} - {e}")
+            return [], []
+    
     def execute_many(self, query: str, params_list: list) -> int:
         """Çoklu sorgu çalıştır"""
         try:
@@ -291,15 +799,30 @@ class DatabaseConnection:
             logging.error(f"Bağlantı testi başarısız: {e}")
             return False
     
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Bağlantı havuzu istatistikleri"""
+        if self._driver == 'sqlite' and self._sqlite_pool:
+            return self._sqlite_pool.get_pool_stats()
+        if self._driver == 'mysql' and self._pool:
+            return {
+                'driver': 'mysql',
+                'pool_name': self._pool.pool_name,
+                'max_connections': self._pool.pool_size,
+            }
+        return {'driver': self._driver}
+    
     def close_connection(self):
         """Bağlantıyı kapat"""
         try:
             if self._driver == 'mysql' and self._pool:
                 self._pool.close()
                 logging.info("MySQL connection pool kapatıldı")
-            elif self._driver == 'sqlite' and self._conn:
-                self._conn.close()
-                logging.info("SQLite bağlantısı kapatıldı")
+            elif self._driver == 'sqlite' and self._sqlite_pool:
+                self._sqlite_pool.close_all()
+                conn = getattr(self._raw_local, 'conn', None)
+                if conn is not None and not conn.closed:
+                    conn.close()
+                logging.info("SQLite bağlantı havuzu kapatıldı")
         except Exception as e:
             logging.error(f"Bağlantı kapatma hatası: {e}")
 
@@ -0,0 +1,410 @@
+"""
+Full-Text Arama İndeksleri
+SQLite FTS5 ve MySQL FULLTEXT destekli, BM25 sıralamalı arama
+"""
+
+import argparse
+import html
+import logging
+import re
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Any, Tuple
+from .connection import get_db_connection
+
+_TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+def tokenize(query: str) -> List[str]:
+    """Arama metnini kelimelere ayır (operatör karakterleri atılır)"""
+    return _TOKEN_PATTERN.findall(query or '')
+
+
+def turkish_lower(text: str) -> str:
+    """Türkçe kurallarıyla küçük harfe çevir (I -> ı, İ -> i)"""
+    return text.replace('I', 'ı').replace('İ', 'i').lower()
+
+
+def term_variants(token: str) -> List[str]:
+    """
+    Kelimenin i/ı varyantları
+
+    Tokenizer ı ile i'yi ayrı harf sayar; büyük harfle ya da Türkçe karakter
+    kullanmadan yazılan aramaların da eşleşmesi için varyantlar üretilir.
+    """
+    lowered = turkish_lower(token)
+    variants = [lowered]
+    for variant in (lowered.replace('ı', 'i'), lowered.replace('i', 'ı')):
+        if variant not in variants:
+            variants.append(variant)
+    return variants
+
+
+def highlight(text: Any, terms: List[str], before: str = '<mark>', after: str = '</mark>',
+              width: int = 160) -> str:
+    """
+    Metinde terimleri işaretleyen kısa bir özet üret
+
+    FTS5'in snippet() fonksiyonu olmayan MySQL için Python tarafında kullanılır.
+    """
+    if text is None:
+        return ''
+    text = html.escape(str(text))
+    if not terms:
+        return text[:width]
+
+    variants = [variant for term in terms for variant in term_variants(term)]
+    pattern = re.compile('|'.join(re.escape(html.escape(variant)) for variant in variants), re.IGNORECASE)
+    match = pattern.search(text)
+    start = max(0, match.start() - width // 3) if match else 0
+    fragment = text[start:start + width]
+
+    fragment = pattern.sub(lambda m: f"{before}{m.group(0)}{after}", fragment)
+    prefix = '…' if start > 0 else ''
+    suffix = '…' if start + width < len(text) else ''
+    return f"{prefix}{fragment}{suffix}"
+
+
+class FullTextIndex(ABC):
+    """Full-text indeks temel sınıfı"""
+
+    def __init__(self, table: str, fields: List[str], key: str = 'id'):
+        self.table = table
+        self.fields = list(fields)
+        self.key = key
+        self.db_connection = get_db_connection()
+        self._ready = None
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        """İndeks adı (alanlar dahil; farklı sütunlardaki indeksler karışmaz)"""
+        return f"{self.table}_{'_'.join(self.fields)}_fts"
+
+    def is_ready(self) -> bool:
+        """İndeks veritabanında mevcut mu (sonuç önbelleğe alınır)"""
+        if self._ready is None:
+            with self._lock:
+                if self._ready is None:
+                    self._ready = self._exists()
+        return self._ready
+
+    def ensure(self) -> bool:
+        """İndeksi (yoksa) oluştur"""
+        if self.is_ready():
+            return True
+        if not self._table_exists():
+            return False
+        try:
+            self._create()
+            self._ready = True
+        except Exception as e:
+            logging.error(f"Full-text indeks oluşturma hatası ({self.table}): {e}")
+            self._ready = False
+        return self._ready
+
+    @abstractmethod
+    def _exists(self) -> bool:
+        """İndeks veritabanında var mı"""
+
+    @abstractmethod
+    def _table_exists(self) -> bool:
+        """İndekslenecek tablo var mı"""
+
+    @abstractmethod
+    def _create(self):
+        """İndeksi oluştur"""
+
+    @abstractmethod
+    def rebuild(self) -> bool:
+        """İndeksi tablodan yeniden oluştur"""
+
+    @abstractmethod
+    def match_query(self, query: str) -> Optional[str]:
+        """Kullanıcı sorgusunu motorun sorgu diline çevir"""
+
+    @abstractmethod
+    def apply(self, query_builder, query: str, rank: bool = False, snippets: bool = False) -> bool:
+        """
+        QueryBuilder'a full-text koşulu ekle
+
+        Args:
+            query_builder: Hedef sorgu oluşturucu
+            query: Kullanıcının arama metni
+            rank: BM25/relevance sıralaması ekle
+            snippets: Vurgulanmış özet sütunu ekle (destekleniyorsa)
+
+        Returns:
+            bool: Koşul eklendiyse True
+        """
+
+    def search(self, query: str, limit: int = 20, offset: int = 0,
+               columns: List[str] = None) -> List[Dict[str, Any]]:
+        """İlgililiğe göre sıralı sonuçları, özetleriyle birlikte getir"""
+        from .query_builder import QueryBuilder
+
+        builder = QueryBuilder(self.table)
+        if columns:
+            builder.select(*columns)
+        if not self.apply(builder, query, rank=True, snippets=True):
+            return []
+        builder.limit(limit).offset(offset)
+        return self.decorate(builder.get(), query)
+
+    def decorate(self, rows: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
+        """Sonuçlara eksikse özet ekle"""
+        return rows
+
+
+class SQLiteFTS5Index(FullTextIndex):
+    """
+    SQLite FTS5 indeksi
+
+    Harici içerik tablosu (content=...) kullanır; insert/update/delete
+    tetikleyicileri indeksi tabloyla senkron tutar.
+    """
+
+    tokenizer = "unicode61 remove_diacritics 2"
+
+    # snippet() işaretleri; metin HTML-escape edildikten sonra <mark> olur
+    mark_start = '\x02'
+    mark_end = '\x03'
+
+    def _exists(self) -> bool:
+        result = self.db_connection.execute_query(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (self.name,)
+        )
+        return bool(result)
+
+    def _table_exists(self) -> bool:
+        result = self.db_connection.execute_query(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (self.table,)
+        )
+        return bool(result)
+
+    def _create(self):
+        fts = self.name
+        columns = ', '.join(self.fields)
+        new_values = ', '.join(f"new.{field}" for field in self.fields)
+        old_values = ', '.join(f"old.{field}" for field in self.fields)
+
+        statements = [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+            f"{columns}, content='{self.table}', content_rowid='{self.key}', "
+            f"tokenize='{self.tokenizer}')",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {self.table} BEGIN "
+            f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.{self.key}, {new_values}); END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {self.table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.{self.key}, {old_values}); END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {self.table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.{self.key}, {old_values}); "
+            f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.{self.key}, {new_values}); END",
+            f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+        ]
+        with self.db_connection.get_connection() as conn:
+            for statement in statements:
+                conn.execute(statement)
+            conn.commit()
+
+    def rebuild(self) -> bool:
+        return self.db_connection.execute_transaction([
+            (f"INSERT INTO {self.name}({self.name}) VALUES ('rebuild')", None)
+        ])
+
+    def match_query(self, query: str) -> Optional[str]:
+        """Her kelime zorunlu, son kelime önek araması ("foo" AND ("bar"* OR "bär"*))"""
+        tokens = tokenize(query)
+        if not tokens:
+            return None
+        groups = []
+        for i, token in enumerate(tokens):
+            suffix = '*' if i == len(tokens) - 1 else ''
+            terms = [f'"{variant}"{suffix}' for variant in term_variants(token)]
+            groups.append(terms[0] if len(terms) == 1 else f"({' OR '.join(terms)})")
+        return ' AND '.join(groups)
+
+    def apply(self, query_builder, query: str, rank: bool = False, snippets: bool = False) -> bool:
+        match = self.match_query(query)
+        if match is None or not self.is_ready():
+            return False
+
+        fts = self.name
+        if query_builder.select_fields == ['*']:
+            query_builder.select_fields = [f"{self.table}.*"]
+
+        query_builder.join(fts, f"{fts}.rowid", '=', f"{self.table}.{self.key}")
+        query_builder.where(fts, 'MATCH', match)
+
+        if rank:
+            # bm25() küçük değer = daha ilgili
+            query_builder.select_fields.append(f"bm25({fts}) AS relevance")
+            query_builder.order_clauses.insert(0, f"bm25({fts}) ASC")
+        if snippets:
+            query_builder.select_fields.append(
+                f"snippet({fts}, -1, char(2), char(3), '…', 16) AS snippet"
+            )
+        return True
+
+    def decorate(self, rows: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
+        """snippet() çıktısını HTML-escape edip işaretleri <mark> yap"""
+        for row in rows:
+            snippet = row.get('snippet')
+            if isinstance(snippet, str):
+                row['snippet'] = (html.escape(snippet)
+                                  .replace(self.mark_start, '<mark>')
+                                  .replace(self.mark_end, '</mark>'))
+        return rows
+
+
+class MySQLFullTextIndex(FullTextIndex):
+    """MySQL FULLTEXT indeksi (InnoDB, BOOLEAN MODE)"""
+
+    @property
+    def name(self) -> str:
+        return f"ft_{self.table}_{'_'.join(self.fields)}"[:64]
+
+    def _exists(self) -> bool:
+        result = self.db_connection.execute_query(
+            "SELECT INDEX_NAME FROM information_schema.STATISTICS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s LIMIT 1",
+            (self.table, self.name)
+        )
+        return bool(result)
+
+    def _table_exists(self) -> bool:
+        result = self.db_connection.execute_query(
+            "SELECT TABLE_NAME FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+            (self.table,)
+        )
+        return bool(result)
+
+    def _create(self):
+        with self.db_connection.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"ALTER TABLE {self.table} ADD FULLTEXT INDEX {self.name} ({', '.join(self.fields)})")
+            conn.commit()
+            cursor.close()
+
+    def rebuild(self) -> bool:
+        # InnoDB FULLTEXT indeksleri işlem anında güncellenir
+        return self.db_connection.execute_transaction([(f"OPTIMIZE TABLE {self.table}", None)])
+
+    def match_query(self, query: str) -> Optional[str]:
+        """Her kelime zorunlu, son kelime önek araması (+foo +(bar* bär*))"""
+        tokens = tokenize(query)
+        if not tokens:
+            return None
+        groups = []
+        for i, token in enumerate(tokens):
+            suffix = '*' if i == len(tokens) - 1 else ''
+            terms = [f"{variant}{suffix}" for variant in term_variants(token)]
+            groups.append(f"+{terms[0]}" if len(terms) == 1 else f"+({' '.join(terms)})")
+        return ' '.join(groups)
+
+    def apply(self, query_builder, query: str, rank: bool = False, snippets: bool = False) -> bool:
+        match = self.match_query(query)
+        if match is None or not self.is_ready():
+            return False
+
+        columns = ', '.join(f"{self.table}.{field}" for field in self.fields)
+        query_builder.where_conditions.append(
+            f"MATCH({columns}) AGAINST({query_builder.param_placeholder} IN BOOLEAN MODE)"
+        )
+        query_builder.where_values.append(match)
+
+        if rank:
+            # match_query yalnızca \w karakterleri ve +* operatörlerini içerir
+            literal = f"MATCH({columns}) AGAINST('{match}' IN BOOLEAN MODE)"
+            if query_builder.select_fields == ['*']:
+                query_builder.select_fields = [f"{self.table}.*"]
+            query_builder.select_fields.append(f"{literal} AS relevance")
+            query_builder.order_clauses.insert(0, f"{literal} DESC")
+        return True
+
+    def decorate(self, rows: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
+        terms = tokenize(query)
+        for row in rows:
+            if 'snippet' not in row:
+                text = next((row.get(field) for field in self.fields if row.get(field)), '')
+                row['snippet'] = highlight(text, terms)
+        return rows
+
+
+# Uygulamanın aradığı tablolar için varsayılan indeks tanımları
+DEFAULT_FULLTEXT_INDEXES = {
+    'products': ['name', 'description', 'tags'],
+    'users': ['name', 'email', 'username'],
+    'posts': ['title', 'content', 'excerpt'],
+    'comments': ['content'],
+}
+
+_indexes: Dict[Tuple[str, Tuple[str, ...]], FullTextIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_fulltext_index(table: str, fields: List[str] = None, key: str = 'id') -> Optional[FullTextIndex]:
+    """
+    Tablo için full-text indeks nesnesi getir
+
+    Args:
+        table: Tablo adı
+        fields: İndekslenen alanlar (varsayılan: DEFAULT_FULLTEXT_INDEXES)
+        key: Tablonun birincil anahtarı
+
+    Returns:
+        FullTextIndex: Sürücüye uygun indeks, destek yoksa None
+    """
+    fields = list(fields or DEFAULT_FULLTEXT_INDEXES.get(table, []))
+    if not fields:
+        return None
+
+    cache_key = (table, tuple(fields))
+    index = _indexes.get(cache_key)
+    if index is None:
+        driver = get_db_connection()._driver
+        if driver == 'sqlite':
+            index_class = SQLiteFTS5Index
+        elif driver == 'mysql':
+            index_class = MySQLFullTextIndex
+        else:
+            return None
+
+        with _indexes_lock:
+            index = _indexes.setdefault(cache_key, index_class(table, fields, key))
+    return index
+
+
+def find_fulltext_index(table: str, fields: List[str] = None) -> Optional[FullTextIndex]:
+    """Hazır (oluşturulmuş) full-text indeksi getir; yoksa None"""
+    index = get_fulltext_index(table, fields)
+    if index is not None and index.is_ready():
+        return index
+    return None
+
+
+def ensure_fulltext_indexes(definitions: Dict[str, List[str]] = None) -> Dict[str, bool]:
+    """Varsayılan (ya da verilen) full-text indeksleri oluştur"""
+    results = {}
+    for table, fields in (definitions or DEFAULT_FULLTEXT_INDEXES).items():
+        index = get_fulltext_index(table, fields)
+        results[table] = index.ensure() if index else False
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PofuAi full-text arama indeksleri")
+    parser.add_argument('--rebuild', action='store_true', help="Mevcut indeksleri tablodan yeniden oluştur")
+    args = parser.parse_args()
+
+    results = ensure_fulltext_indexes()
+    for table, ready in results.items():
+        if ready and args.rebuild:
+            ready = get_fulltext_index(table).rebuild()
+        print(f"{table}: {'hazır' if ready else 'oluşturulamadı'}")
+
+
+if __name__ == "__main__":
+    main()
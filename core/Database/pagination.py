@@ -3,9 +3,13 @@ Sayfalama Sistemi
 Sayfa bilgileri, navigasyon ve URL yönetimi
 """
 
-from typing import List, Dict, Any, Optional
+import base64
+import json
+import re
+from typing import List, Dict, Any, Optional, Tuple
 from math import ceil
 from .query_builder import QueryBuilder
+from .row import make_rows
 
 class Pagination:
     """Sayfalama sınıfı"""
@@ -212,6 +216,278 @@ class Paginator:
             'previous_page': page - 1 if page > 1 else None,
             'next_page': page + 1 if page * self.per_page < total else None
         }
+    
+    def cursor_paginate(self, cursor: Optional[str] = None, order_by: List[Tuple[str, str]] = None,
+                        unique_key: str = 'id', with_total: Optional[str] = None,
+                        base_url: str = "", query_params: Dict[str, Any] = None) -> 'CursorPagination':
+        """Keyset (cursor) sayfalama uygula"""
+        paginator = KeysetPaginator(self.query_builder, self.per_page, order_by, unique_key, with_total)
+        return paginator.paginate(cursor, base_url, query_params)
+
+class CursorPagination:
+    """Keyset (cursor) sayfalama sonucu"""
+    
+    def __init__(self, items: List[Any], per_page: int, next_cursor: Optional[str] = None,
+                 prev_cursor: Optional[str] = None, total: Optional[int] = None,
+                 base_url: str = "", query_params: Dict[str, Any] = None):
+        self.items = items
+        self.per_page = per_page
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+        self.total = total
+        self.base_url = base_url
+        self.query_params = query_params or {}
+        
+        self.has_next = next_cursor is not None
+        self.has_previous = prev_cursor is not None
+    
+    def get_cursor_url(self, cursor: Optional[str]) -> Optional[str]:
+        """Cursor için URL oluştur"""
+        if not self.base_url or cursor is None:
+            return None
+        
+        params = self.query_params.copy()
+        params.pop('page', None)
+        params['cursor'] = cursor
+        
+        param_strings = [f"{key}={value}" for key, value in params.items() if value is not None]
+        return f"{self.base_url}?{'&'.join(param_strings)}"
+    
+    def get_next_url(self) -> Optional[str]:
+        """Sonraki sayfa URL'i"""
+        return self.get_cursor_url(self.next_cursor)
+    
+    def get_previous_url(self) -> Optional[str]:
+        """Önceki sayfa URL'i"""
+        return self.get_cursor_url(self.prev_cursor)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Sayfalama bilgilerini dictionary'e çevir"""
+        return {
+            'items': self.items,
+            'per_page': self.per_page,
+            'total': self.total,
+            'has_previous': self.has_previous,
+            'has_next': self.has_next,
+            'next_cursor': self.next_cursor,
+            'prev_cursor': self.prev_cursor,
+            'next_url': self.get_next_url(),
+            'previous_url': self.get_previous_url()
+        }
+    
+    def __len__(self) -> int:
+        """Mevcut sayfadaki öğe sayısı"""
+        return len(self.items)
+    
+    def __iter__(self):
+        """Öğeleri iterate et"""
+        return iter(self.items)
+    
+    def __getitem__(self, index):
+        """Öğelere erişim"""
+        return self.items[index]
+
+_IDENTIFIER = re.compile(r'^[A-Za-z_][\w.]*$')
+_SELECT_ALIAS = re.compile(r'^(.*?)\s+AS\s+(\w+)$', re.IGNORECASE | re.DOTALL)
+
+
+class KeysetPaginator:
+    """
+    Keyset (seek) sayfalama
+    
+    COUNT(*) ve OFFSET kullanmaz; sayfa sınırı ORDER BY sütunlarının son
+    görülen değerlerinden oluşan opak bir cursor ile taşınır, böylece 5000.
+    sayfa da ilk sayfa kadar ucuzdur. Sıralama sütunları NULL içermemeli ve
+    benzersizliği garanti etmek için sona `unique_key` eklenir. readonly=True
+    ise sayfa öğeleri execute_query_rows ile okunan salt okunur Row'lardır.
+    """
+    
+    def __init__(self, query_builder: QueryBuilder, per_page: int = 20,
+                 order_by: List[Tuple[str, str]] = None, unique_key: str = 'id',
+                 with_total: Optional[str] = None, readonly: bool = False):
+        self.query_builder = query_builder
+        self.per_page = per_page
+        self.unique_key = unique_key
+        self.with_total = with_total  # None, 'approximate' veya 'exact'
+        self.readonly = readonly
+        
+        if order_by is None:
+            order_by = [self._parse_order_clause(clause) for clause in query_builder.order_clauses]
+        self.order_by = [(column, direction.upper()) for column, direction in order_by]
+        
+        if not any(self._row_key(column) == self._row_key(unique_key) for column, _ in self.order_by):
+            self.order_by.append((unique_key, 'ASC'))
+    
+    @staticmethod
+    def _parse_order_clause(clause: str) -> Tuple[str, str]:
+        """'column DIR' biçimindeki ORDER BY parçasını ayrıştır"""
+        parts = clause.rsplit(' ', 1)
+        if len(parts) == 2 and parts[1].upper() in ('ASC', 'DESC'):
+            return parts[0], parts[1].upper()
+        return clause, 'ASC'
+    
+    @staticmethod
+    def _row_key(column: str) -> str:
+        """Sonuç satırındaki anahtar (tablo öneki olmadan)"""
+        return column.split('.')[-1]
+    
+    @staticmethod
+    def encode_cursor(values: List[Any], direction: str) -> str:
+        """Sıralama değerlerinden opak cursor üret"""
+        payload = json.dumps({'v': values, 'd': direction}, default=str, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+    
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[List[Any], str]:
+        """Cursor'ı sıralama değerlerine çöz"""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+            return list(payload['v']), payload.get('d', 'next')
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Geçersiz cursor: {e}")
+    
+    def _seek_keys(self, builder: QueryBuilder) -> Tuple[List[str], List[str]]:
+        """
+        Sıralama değerlerinin sonuç satırındaki anahtarlarını belirle
+        
+        Seçilmemiş sütunlar ve ifadeler (örn. bm25(...)) takma adla SELECT'e
+        eklenir; eklenen anahtarlar sonuçtan sonra çıkarılır.
+        
+        Returns:
+            Tuple[List[str], List[str]]: (satır anahtarları, eklenen anahtarlar)
+        """
+        aliases = {}
+        selected = set()
+        select_all = False
+        for field in builder.select_fields:
+            match = _SELECT_ALIAS.match(field.strip())
+            if match:
+                aliases[match.group(1).strip()] = match.group(2)
+                selected.add(match.group(2))
+            elif field == '*' or field.endswith('.*'):
+                select_all = True
+            else:
+                selected.add(self._row_key(field))
+        
+        keys = []
+        added = []
+        for i, (column, _) in enumerate(self.order_by):
+            if column in aliases:
+                keys.append(aliases[column])
+            elif _IDENTIFIER.match(column) and (select_all or self._row_key(column) in selected):
+                keys.append(self._row_key(column))
+            else:
+                alias = f"_seek_{i}"
+                builder.select_fields.append(f"{column} AS {alias}")
+                keys.append(alias)
+                added.append(alias)
+        return keys, added
+    
+    def _cursor_for(self, row: Dict[str, Any], keys: List[str], direction: str) -> str:
+        """Satırın sıralama değerlerinden cursor oluştur"""
+        return self.encode_cursor([row[key] for key in keys], direction)
+    
+    def _apply_seek(self, builder: QueryBuilder, values: List[Any], backwards: bool):
+        """(a > ?) OR (a = ? AND b > ?) ... biçiminde seek koşulu ekle"""
+        if len(values) != len(self.order_by):
+            raise ValueError("Cursor sıralama sütunlarıyla uyuşmuyor")
+        
+        placeholder = builder.param_placeholder
+        branches = []
+        branch_values = []
+        
+        for i, (column, direction) in enumerate(self.order_by):
+            ascending = (direction == 'ASC') != backwards
+            operator = '>' if ascending else '<'
+            
+            parts = [f"{prev_column} = {placeholder}" for prev_column, _ in self.order_by[:i]]
+            parts.append(f"{column} {operator} {placeholder}")
+            branches.append(f"({' AND '.join(parts)})")
+            branch_values.extend(values[:i + 1])
+        
+        builder.where_conditions.append(f"({' OR '.join(branches)})")
+        builder.where_values.extend(branch_values)
+    
+    def paginate(self, cursor: Optional[str] = None, base_url: str = "",
+                 query_params: Dict[str, Any] = None) -> CursorPagination:
+        """Cursor'dan başlayarak bir sayfa getir"""
+        values, direction = self.decode_cursor(cursor) if cursor else (None, 'next')
+        backwards = direction == 'prev'
+        
+        builder = self.query_builder.clone()
+        builder.order_clauses = []
+        builder.limit_value = None
+        builder.offset_value = None
+        keys, added = self._seek_keys(builder)
+        
+        if values is not None:
+            self._apply_seek(builder, values, backwards)
+        
+        for column, order in self.order_by:
+            if backwards:
+                order = 'DESC' if order == 'ASC' else 'ASC'
+            builder.order_by(column, order)
+        
+        # Bir fazla kayıt çekerek sonraki sayfa olup olmadığını anla
+        builder.limit(self.per_page + 1)
+        rows = builder.get_rows() if self.readonly else builder.get()
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        
+        if backwards:
+            rows.reverse()
+            has_next = True
+            has_previous = has_more
+        else:
+            has_next = has_more
+            has_previous = values is not None
+        
+        next_cursor = self._cursor_for(rows[-1], keys, 'next') if rows and has_next else None
+        prev_cursor = self._cursor_for(rows[0], keys, 'prev') if rows and has_previous else None
+        if added and self.readonly and rows:
+            # Eklenen seek sütunları SELECT'in sonundadır
+            width = len(rows[0]) - len(added)
+            rows = make_rows(rows[0].keys()[:width], [row.values()[:width] for row in rows])
+        for row in rows if added and not self.readonly else ():
+            for key in added:
+                row.pop(key, None)
+        
+        total = None
+        if self.with_total == 'exact':
+            total = self.query_builder.clone().count()
+        elif self.with_total == 'approximate':
+            total = approximate_total(self.query_builder)
+        
+        return CursorPagination(rows, self.per_page, next_cursor, prev_cursor, total,
+                                base_url, query_params)
+
+def approximate_total(query_builder: QueryBuilder) -> int:
+    """
+    Toplam kayıt sayısı için ucuz tahmin
+    
+    Filtresiz sorgularda MySQL'in tablo istatistiklerini ya da SQLite'ın
+    rowid aralığını kullanır; filtreli sorgularda kesin sayıma düşer.
+    """
+    db = query_builder.db_connection
+    
+    if not query_builder.where_conditions and not query_builder.join_clauses:
+        if db._driver == 'mysql':
+            result = db.execute_query(
+                "SELECT TABLE_ROWS AS total FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+                (query_builder.table,)
+            )
+        else:
+            # MIN ve MAX ayrı alt sorgularda tek rowid aramasına iner; aynı SELECT'te tablo taranır
+            table = query_builder.table
+            result = db.execute_query(
+                f"SELECT COALESCE((SELECT MAX(rowid) FROM {table}) - (SELECT MIN(rowid) FROM {table}) + 1, 0) AS total"
+            )
+        if result and result[0].get('total') is not None:
+            return int(result[0]['total'])
+    
+    return query_builder.clone().count()
 
 # Kullanım kolaylığı için fonksiyonlar
 def paginate(query_builder: QueryBuilder, page: int, per_page: int = 20,
@@ -222,4 +498,11 @@ def paginate(query_builder: QueryBuilder, page: int, per_page: int = 20,
 def simple_paginate(query_builder: QueryBuilder, page: int, per_page: int = 20) -> Dict[str, Any]:
     """Basit sayfalama oluştur"""
     paginator = Paginator(query_builder, per_page)
-    return paginator.simple_paginate(page) 
\ No newline at end of file
+    return paginator.simple_paginate(page)
+
+def cursor_paginate(query_builder: QueryBuilder, cursor: Optional[str] = None, per_page: int = 20,
+                    order_by: List[Tuple[str, str]] = None, unique_key: str = 'id',
+                    with_total: Optional[str] = None) -> CursorPagination:
+    """Keyset (cursor) sayfalama oluştur"""
+    paginator = KeysetPaginator(query_builder, per_page, order_by, unique_key, with_total)
+    return paginator.paginate(cursor)
@@ -3,9 +3,13 @@ Dinamik SQL Sorgu Oluşturucu
 WHERE, JOIN, ORDER BY, GROUP BY gibi yapıları destekler
 """
 
-from typing import Dict, List, Optional, Any, Union, Tuple
+import copy
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Union, Tuple
 from .connection import get_db_connection
 
+if TYPE_CHECKING:
+    from .row import Row
+
 class QueryBuilder:
     """Dinamik SQL sorgu oluşturucu"""
     
@@ -136,7 +140,21 @@ class QueryBuilder:
         return self
     
     def _build_select_query(self) -> Tuple[str, List[Any]]:
-        """SELECT sorgusu oluştur"""
+        """
+        SELECT sorgusu oluştur
+        
+        LIMIT/OFFSET parametre olarak bağlanır; sayfalar aynı SQL metnini
+        kullandığı için SQLite'ın bağlantı başına statement cache'i isabet eder.
+        """
+        values = self.where_values.copy()
+        if self.limit_value is not None:
+            values.append(int(self.limit_value))
+            if self.offset_value is not None:
+                values.append(int(self.offset_value))
+        return self._compile_select_query(), values
+    
+    def _compile_select_query(self) -> str:
+        """SELECT sorgusunu derle"""
         # SELECT kısmı
         distinct_clause = "DISTINCT " if self.distinct else ""
         select_clause = f"SELECT {distinct_clause}{', '.join(self.select_fields)}"
@@ -167,20 +185,39 @@ class QueryBuilder:
         # LIMIT ve OFFSET kısmı
         limit_clause = ""
         if self.limit_value is not None:
-            limit_clause = f" LIMIT {self.limit_value}"
+            limit_clause = f" LIMIT {self.param_placeholder}"
             if self.offset_value is not None:
-                limit_clause += f" OFFSET {self.offset_value}"
+                limit_clause += f" OFFSET {self.param_placeholder}"
         
         # Sorguyu birleştir
-        query = f"{select_clause} {from_clause}{join_clause}{where_clause}{group_clause}{order_clause}{limit_clause}"
-        
-        return query, self.where_values.copy()
+        return f"{select_clause} {from_clause}{join_clause}{where_clause}{group_clause}{order_clause}{limit_clause}"
     
     def get(self) -> List[Dict[str, Any]]:
         """Sorguyu çalıştır ve sonuçları getir"""
         query, values = self._build_select_query()
         return self.db_connection.execute_query(query, tuple(values)) or []
     
+    def stream(self, batch_size: int = 1000, batches: bool = False, model_class=None):
+        """
+        Sonuçları tek sorguyla salt okunur Row nesneleri olarak akıt (sabit bellek)
+        
+        Args:
+            batch_size: Veritabanından parti başına okunacak satır sayısı
+            batches: True ise satır listeleri üretir
+            model_class: Row.to_model() için model sınıfı
+        """
+        query, values = self._build_select_query()
+        return self.db_connection.iter_query(query, tuple(values), batch_size=batch_size, batches=batches,
+                                             model_class=model_class)
+    
+    def get_rows(self, model_class=None) -> List['Row']:
+        """Sorguyu çalıştır ve salt okunur Row listesi getir"""
+        from .row import make_rows
+        
+        query, values = self._build_select_query()
+        columns, rows = self.db_connection.execute_query_rows(query, tuple(values))
+        return make_rows(columns, rows, model_class)
+    
     def first(self) -> Optional[Dict[str, Any]]:
         """İlk sonucu getir"""
         self.limit(1)
@@ -189,16 +226,19 @@ class QueryBuilder:
     
     def count(self) -> int:
         """Kayıt sayısını getir"""
-        # Mevcut select alanlarını sakla
+        # Mevcut select ve sıralama alanlarını sakla
         original_select = self.select_fields.copy()
+        original_order = self.order_clauses.copy()
         
-        # COUNT için select'i değiştir
+        # COUNT için select'i değiştir, sıralama sayımı etkilemez
         self.select_fields = ['COUNT(*) as count']
+        self.order_clauses = []
         
         result = self.first()
         
         # Orijinal select'i geri yükle
         self.select_fields = original_select
+        self.order_clauses = original_order
         
         return result['count'] if result else 0
     
@@ -230,18 +270,42 @@ class QueryBuilder:
         
         return {row[key_column]: row[value_column] for row in results}
     
-    def chunk(self, chunk_size: int):
-        """Büyük sonuçları parçalara böl"""
-        offset = 0
+    def chunk(self, chunk_size: int, column: str = 'id', readonly: bool = False):
+        """
+        Büyük sonuçları parçalara böl
+        
+        OFFSET yerine keyset (seek) kullanır; her parça son görülen sıralama
+        değerlerinden devam ettiği için ilerleyen parçalar yavaşlamaz. Mevcut
+        order_by sırası korunur, benzersizlik için sona `column` eklenir;
+        `column` benzersiz ve indeksli olmalıdır. readonly=True ise parçalar
+        dict yerine salt okunur Row listeleridir.
+        """
+        from .pagination import KeysetPaginator
+        
+        paginator = KeysetPaginator(self, chunk_size, unique_key=column, readonly=readonly)
+        cursor = None
         while True:
-            self.offset(offset).limit(chunk_size)
-            results = self.get()
+            page = paginator.paginate(cursor)
             
-            if not results:
+            if not page.items:
                 break
             
-            yield results
-            offset += chunk_size
+            yield page.items
+            
+            if not page.has_next:
+                break
+            cursor = page.next_cursor
+    
+    def clone(self) -> 'QueryBuilder':
+        """Sorgu oluşturucunun bağımsız kopyasını oluştur"""
+        cloned = copy.copy(self)
+        cloned.select_fields = self.select_fields.copy()
+        cloned.where_conditions = self.where_conditions.copy()
+        cloned.where_values = self.where_values.copy()
+        cloned.join_clauses = self.join_clauses.copy()
+        cloned.order_clauses = self.order_clauses.copy()
+        cloned.group_clauses = self.group_clauses.copy()
+        return cloned
     
     def to_sql(self) -> str:
         """SQL sorgusunu string olarak döndür"""
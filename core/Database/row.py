@@ -0,0 +1,123 @@
+"""
+Read-only Row
+Büyük sonuç kümeleri için tuple tabanlı, salt okunur satır nesneleri
+"""
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+
+class RowSchema:
+    """Bir sorgunun tüm satırlarınca paylaşılan sütun haritası"""
+
+    __slots__ = ('columns', 'index', 'model_class', 'hidden')
+
+    def __init__(self, columns: Sequence[str], model_class=None):
+        self.columns = tuple(columns)
+        self.index = {column: position for position, column in enumerate(self.columns)}
+        self.model_class = model_class
+        self.hidden = frozenset(getattr(model_class, '__hidden__', None) or ())
+
+
+class Row:
+    """
+    Salt okunur satır
+
+    Değerleri tek bir tuple içinde tutar; sütun adları sorgu başına bir kez
+    oluşturulan RowSchema üzerinden çözülür. Satır başına dict, _original
+    kopyası ve _dirty kümesi oluşmadığı için rapor/export gibi yüz binlerce
+    satır yükleyen işlerde bellek kullanımı belirgin şekilde düşer. Tam model
+    gerektiğinde `to_model()` ile talep üzerine oluşturulur.
+
+    Dict gibi davranır: iterasyon, `in` ve len() sütun adları üzerindendir;
+    değerler için values(), sıra numarasıyla erişim için row[0] kullanılır.
+    """
+
+    __slots__ = ('_schema', '_values')
+
+    def __init__(self, schema: RowSchema, values: Tuple[Any, ...]):
+        object.__setattr__(self, '_schema', schema)
+        object.__setattr__(self, '_values', values)
+
+    def __getattr__(self, name):
+        """Sütun değerine özellik olarak eriş"""
+        position = self._schema.index.get(name)
+        if position is None:
+            raise AttributeError(f"Satırda '{name}' sütunu yok")
+        return self._values[position]
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Row salt okunurdur; değişiklik için to_model() kullanın")
+
+    def __delattr__(self, name):
+        raise AttributeError("Row salt okunurdur")
+
+    def __getitem__(self, key):
+        """Sütun adı veya sıra numarası ile eriş"""
+        if isinstance(key, (int, slice)):
+            return self._values[key]
+        return self._values[self._schema.index[key]]
+
+    def __contains__(self, key) -> bool:
+        return key in self._schema.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._schema.columns)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Row):
+            return self._schema.columns == other._schema.columns and self._values == other._values
+        if isinstance(other, dict):
+            return dict(self.items()) == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._values)
+
+    def __repr__(self) -> str:
+        return f"Row({', '.join(f'{k}={v!r}' for k, v in zip(self._schema.columns, self._values))})"
+
+    def __getstate__(self):
+        return (self._schema.columns, self._schema.model_class, self._values)
+
+    def __setstate__(self, state):
+        columns, model_class, values = state
+        object.__setattr__(self, '_schema', RowSchema(columns, model_class))
+        object.__setattr__(self, '_values', values)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Sütun değerini getir, yoksa varsayılanı döndür"""
+        position = self._schema.index.get(key)
+        return default if position is None else self._values[position]
+
+    def keys(self) -> Tuple[str, ...]:
+        return self._schema.columns
+
+    def values(self) -> Tuple[Any, ...]:
+        return self._values
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return zip(self._schema.columns, self._values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Satırı dictionary'e çevir (modelin gizli alanları hariç)"""
+        hidden = self._schema.hidden
+        return {key: value for key, value in zip(self._schema.columns, self._values) if key not in hidden}
+
+    def to_model(self):
+        """Satırdan tam model oluştur"""
+        model_class = self._schema.model_class
+        if model_class is None:
+            raise TypeError("Bu satır bir modele bağlı değil")
+        return model_class(**dict(zip(self._schema.columns, self._values)))
+
+
+Mapping.register(Row)
+
+
+def make_rows(columns: Sequence[str], values: List[Tuple[Any, ...]], model_class=None) -> List[Row]:
+    """Sütun listesi ve tuple değerlerden satır listesi oluştur"""
+    schema = RowSchema(columns, model_class)
+    return [Row(schema, tuple(row)) for row in values]
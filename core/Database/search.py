@@ -5,6 +5,7 @@ Full-text search, çoklu filtre ve sıralama desteği
 
 from typing import Dict, List, Any, Optional, Union, Tuple
 from .query_builder import QueryBuilder
+from .fulltext import find_fulltext_index
 import re
 
 class SearchEngine:
@@ -16,6 +17,9 @@ class SearchEngine:
         self.filter_conditions = {}
         self.sort_conditions = []
         self.search_query = ""
+        self.relevance_sort = False
+        self.with_snippets = False
+        self._fulltext_index = None
     
     def search(self, query: str, fields: List[str] = None) -> 'SearchEngine':
         """Arama sorgusu ekle"""
@@ -66,18 +70,17 @@ class SearchEngine:
         return self
     
     def sort_by_relevance(self, search_fields: List[str] = None) -> 'SearchEngine':
-        """Arama sonuçlarını ilgililik sırasına göre sırala"""
+        """Arama sonuçlarını ilgililik (BM25) sırasına göre sırala"""
         if search_fields:
             self.search_fields = search_fields
         
-        if self.search_query and self.search_fields:
-            # MySQL'de MATCH AGAINST kullanarak relevance sıralama
-            match_fields = ', '.join(self.search_fields)
-            self.query_builder.order_by(
-                f"MATCH({match_fields}) AGAINST(%s IN BOOLEAN MODE)",
-                'DESC'
-            )
-        
+        # Sıralama, full-text koşuluyla birlikte _apply_search içinde eklenir
+        self.relevance_sort = True
+        return self
+    
+    def highlight(self, enabled: bool = True) -> 'SearchEngine':
+        """Sonuçlara vurgulanmış 'snippet' alanı ekle"""
+        self.with_snippets = enabled
         return self
     
     def _apply_search(self):
@@ -85,12 +88,19 @@ class SearchEngine:
         if not self.search_query or not self.search_fields:
             return
         
+        # Full-text indeks varsa kullan (FTS5 / MySQL FULLTEXT)
+        index = find_fulltext_index(self.query_builder.table, self.search_fields)
+        if index and index.apply(self.query_builder, self.search_query,
+                                 rank=self.relevance_sort, snippets=self.with_snippets):
+            self._fulltext_index = index
+            return
+        
         # Basit LIKE araması (full-text search yoksa)
         search_conditions = []
         search_values = []
         
         for field in self.search_fields:
-            search_conditions.append(f"{field} LIKE %s")
+            search_conditions.append(f"{field} LIKE {self.query_builder.param_placeholder}")
             search_values.append(f"%{self.search_query}%")
         
         if search_conditions:
@@ -98,6 +108,12 @@ class SearchEngine:
             self.query_builder.where_conditions.append(f"({' OR '.join(search_conditions)})")
             self.query_builder.where_values.extend(search_values)
     
+    def _decorate(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Full-text sonuçlarına özet ekle"""
+        if self._fulltext_index and self.with_snippets:
+            return self._fulltext_index.decorate(items, self.search_query)
+        return items
+    
     def _apply_filters(self):
         """Filtre koşullarını uygula"""
         for field, value in self.filter_conditions.items():
@@ -147,7 +163,7 @@ class SearchEngine:
         self._apply_sorting()
         
         # Sorguyu çalıştır
-        return self.query_builder.get()
+        return self._decorate(self.query_builder.get())
     
     def count(self) -> int:
         """Filtrelenmiş sonuç sayısını getir"""
@@ -168,7 +184,7 @@ class SearchEngine:
         # Sayfalama uygula
         total = self.query_builder.count()
         self.query_builder.paginate(page, per_page)
-        items = self.query_builder.get()
+        items = self._decorate(self.query_builder.get())
         
         return {
             'items': items,
@@ -179,6 +195,22 @@ class SearchEngine:
             'has_previous': page > 1,
             'has_next': page * per_page < total
         }
+    
+    def cursor_paginate(self, per_page: int, cursor: Optional[str] = None,
+                        unique_key: str = 'id', with_total: Optional[str] = None) -> Dict[str, Any]:
+        """Keyset (cursor) sayfalama ile arama yap"""
+        from .pagination import KeysetPaginator
+        
+        # Koşulları uygula
+        self._apply_search()
+        self._apply_filters()
+        self._apply_sorting()
+        
+        paginator = KeysetPaginator(self.query_builder, per_page, unique_key=unique_key,
+                                    with_total=with_total)
+        page = paginator.paginate(cursor)
+        page.items = self._decorate(page.items)
+        return page.to_dict()
 
 class AdvancedSearch:
     """Gelişmiş arama sınıfı"""
@@ -218,6 +250,11 @@ class AdvancedSearch:
         self.search_engine.sort_by_relevance(search_fields)
         return self
     
+    def highlight(self, enabled: bool = True) -> 'AdvancedSearch':
+        """Vurgulanmış özetleri ekle"""
+        self.search_engine.highlight(enabled)
+        return self
+    
     def get(self) -> List[Dict[str, Any]]:
         """Sonuçları getir"""
         return self.search_engine.execute()
@@ -229,6 +266,11 @@ class AdvancedSearch:
     def paginate(self, page: int, per_page: int) -> Dict[str, Any]:
         """Sayfalama ile getir"""
         return self.search_engine.paginate(page, per_page)
+    
+    def cursor_paginate(self, per_page: int, cursor: Optional[str] = None,
+                        with_total: Optional[str] = None) -> Dict[str, Any]:
+        """Keyset (cursor) sayfalama ile getir"""
+        return self.search_engine.cursor_paginate(per_page, cursor, with_total=with_total)
 
 class SearchFilter:
     """Arama filtresi yardımcı sınıfı"""
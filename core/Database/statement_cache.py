@@ -0,0 +1,77 @@
+"""
+Derlenmiş SQL Önbelleği
+Aynı şekle sahip sorguların SQL metnini yeniden üretmeden kullanır
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+class StatementCache:
+    """
+    Sorgu şekline göre anahtarlanan LRU SQL önbelleği
+    
+    BaseModel sorguları için kullanılır. Anahtar; sorgu türü, tablo ve
+    sütunlardan oluşan küçük bir tuple'dır, değer ise hazır SQL metnidir.
+    Aynı metnin tekrar kullanılması SQLite'ın bağlantı başına statement
+    cache'inin de isabet etmesini sağlar.
+    """
+    
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._statements: 'OrderedDict[Hashable, str]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get_or_build(self, shape: Hashable, builder: Callable[[], str]) -> str:
+        """Şekle ait SQL'i döndür, yoksa derleyip sakla"""
+        with self._lock:
+            query = self._statements.get(shape)
+            if query is not None:
+                self._statements.move_to_end(shape)
+                self.hits += 1
+                return query
+            self.misses += 1
+        
+        query = builder()
+        
+        with self._lock:
+            self._statements[shape] = query
+            self._statements.move_to_end(shape)
+            while len(self._statements) > self.max_size:
+                self._statements.popitem(last=False)
+                self.evictions += 1
+        
+        return query
+    
+    def clear(self):
+        """Önbelleği ve sayaçları temizle"""
+        with self._lock:
+            self._statements.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """İsabet/kaçırma istatistikleri"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._statements),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': self.hits / total if total else 0.0
+            }
+
+
+_statement_cache = StatementCache()
+
+
+def get_statement_cache() -> StatementCache:
+    """Global derlenmiş SQL önbelleğini getir"""
+    return _statement_cache
@@ -2,6 +2,9 @@
 Advanced Reporting Service
 İleri seviye dinamik raporlama sistemi
 """
+import csv
+import hashlib
+import io
 import json
 import pandas as pd
 import numpy as np
@@ -9,6 +12,7 @@ from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Union
 from core.Services.base_service import BaseService
 from core.Database.connection import get_connection
+from core.Database.query_builder import QueryBuilder
 from core.Services.cache_service import CacheService
 from core.Services.logger import LoggerService
 import sqlite3
@@ -23,6 +27,7 @@ class ReportType(Enum):
     SEO_METRICS = "seo_metrics"
     SECURITY_AUDIT = "security_audit"
     CUSTOM_QUERY = "custom_query"
+    ORDER_HISTORY = "order_history"
 
 @dataclass
 class ReportFilter:
@@ -52,7 +57,21 @@ class AdvancedReportingService(BaseService):
         self.connection = get_connection()
         
     def generate_user_behavior_report(self, config: ReportConfig) -> Dict[str, Any]:
-        """Kullanıcı davranış raporu"""
+        """
+        Kullanıcı davranış raporu
+        
+        1 saat cache'lenir; süre dolunca 10 dakika boyunca eski rapor sunulurken
+        tek bir işçi raporu arka planda yeniden üretir.
+        """
+        cache_key = f"report_user_behavior_{self._config_hash(config)}"
+        return self.cache.remember(cache_key, 3600, lambda: self._build_user_behavior_report(config), stale_ttl=600)
+    
+    def _config_hash(self, config: ReportConfig) -> str:
+        """Süreçler arasında sabit rapor anahtarı (hash() her süreçte farklıdır)"""
+        return hashlib.md5(json.dumps(config.__dict__, sort_keys=True, default=str).encode()).hexdigest()
+    
+    def _build_user_behavior_report(self, config: ReportConfig) -> Dict[str, Any]:
+        """Kullanıcı davranış raporunu oluştur"""
         try:
             query = """
             SELECT 
@@ -138,10 +157,6 @@ class AdvancedReportingService(BaseService):
                 }
             }
             
-            # Cache'e kaydet
-            cache_key = f"report_user_behavior_{hash(str(config.__dict__))}"
-            self.cache.set(cache_key, report, 3600)  # 1 saat
-            
             return report
             
         except Exception as e:
@@ -302,9 +317,102 @@ class AdvancedReportingService(BaseService):
             self.logger.error(f"Custom report error: {str(e)}")
             raise
     
-    def export_report(self, report: Dict[str, Any], format: str = 'json') -> str:
-        """Raporu dışa aktar"""
+    # Sipariş geçmişi raporunda filtrelenebilir/sıralanabilir alanlar
+    ORDER_HISTORY_COLUMNS = {
+        'id': 'o.id', 'order_number': 'o.order_number', 'user_id': 'o.user_id',
+        'status': 'o.status', 'payment_status': 'o.payment_status',
+        'payment_method': 'o.payment_method', 'total_amount': 'o.total_amount',
+        'created_at': 'o.created_at', 'customer_name': 'u.name', 'customer_email': 'u.email'
+    }
+    
+    # Sıralamada NULL yerine kullanılacak değerler (keyset chunk() NULL ile çalışmaz)
+    ORDER_HISTORY_NULL_SORT = {'o.user_id': 0, 'o.total_amount': 0}
+    
+    def _order_history_column(self, field: str) -> str:
+        """Formdan gelen alan adını izin verilen sütuna çevir"""
+        field = str(field or '').strip()
+        if field in self.ORDER_HISTORY_COLUMNS:
+            return self.ORDER_HISTORY_COLUMNS[field]
+        if field in self.ORDER_HISTORY_COLUMNS.values():
+            return field
+        raise ValueError(f"Geçersiz rapor alanı: {field}")
+    
+    def generate_order_history_report(self, config: ReportConfig) -> Dict[str, Any]:
+        """
+        Sipariş geçmişi raporu
+        
+        Satırlar belleğe alınmaz; 'data' alanı export/stream sırasında
+        parça parça okunan bir QueryBuilder'dır. Filtre ve sıralama alanları
+        ORDER_HISTORY_COLUMNS ile sınırlıdır.
+        """
+        query = QueryBuilder('orders o').select(
+            'o.id', 'o.order_number', 'o.user_id', 'u.name as customer_name', 'u.email as customer_email',
+            'o.status', 'o.payment_status', 'o.payment_method', 'o.total_amount', 'o.created_at'
+        ).left_join('users u', 'o.user_id', '=', 'u.id')
+        
+        operators = {'eq': '=', 'ne': '!=', 'gt': '>', 'lt': '<', 'gte': '>=', 'lte': '<='}
+        for filter in config.filters or []:
+            column = self._order_history_column(filter.field)
+            if filter.operator in operators:
+                query.where(column, operators[filter.operator], filter.value)
+            elif filter.operator == 'like':
+                query.where_like(column, f"%{filter.value}%")
+            elif filter.operator == 'in':
+                query.where_in(column, list(filter.value))
+            elif filter.operator == 'between':
+                query.where_between(column, filter.value[0], filter.value[1])
+            else:
+                raise ValueError(f"Geçersiz filtre operatörü: {filter.operator}")
+        
+        if config.date_range:
+            if config.date_range.get('start'):
+                query.where('o.created_at', '>=', config.date_range['start'])
+            if config.date_range.get('end'):
+                query.where('o.created_at', '<=', config.date_range['end'])
+        
+        for order in config.orderby or []:
+            column = self._order_history_column(order.get('field', 'id'))
+            direction = str(order.get('direction', 'ASC')).upper()
+            if direction not in ('ASC', 'DESC'):
+                raise ValueError(f"Geçersiz sıralama yönü: {direction}")
+            if column != 'o.id':
+                null_value = self.ORDER_HISTORY_NULL_SORT.get(column, "''")
+                column = f"COALESCE({column}, {null_value})"
+            query.order_by(column, direction)
+        
+        if not any(clause.startswith('o.id ') for clause in query.order_clauses):
+            query.order_by('o.id', 'ASC')
+        
+        if config.limit:
+            query.limit(int(config.limit))
+        
+        return {
+            'type': 'order_history',
+            'name': config.name,
+            'generated_at': datetime.now().isoformat(),
+            'data': query
+        }
+    
+    def export_report(self, report: Dict[str, Any], format: str = 'json', output: Any = None,
+                      batch_size: int = 1000) -> Any:
+        """
+        Raporu dışa aktar
+        
+        `output` (dosya yolu ya da yazılabilir nesne) verilmişse JSON/CSV
+        satırları parça parça oraya yazılır ve output döner; verilmemişse
+        metin döner. QueryBuilder verisi tek sorguyla salt okunur Row olarak
+        akar (stream()). HTTP yanıtına akış için stream_report() kullanılır.
+        """
         try:
+            data = report.get('data') if isinstance(report, dict) else None
+            streaming = data is not None and not isinstance(data, list)
+            
+            if format.lower() in ('json', 'csv') and (streaming or output is not None):
+                chunks = self._iter_export(report, format.lower(), batch_size)
+                if output is None:
+                    return ''.join(chunks)
+                return self._write_export(chunks, output)
+            
             if format.lower() == 'json':
                 return json.dumps(report, indent=2, default=str)
             
@@ -314,9 +422,10 @@ class AdvancedReportingService(BaseService):
                     return df.to_csv(index=False)
                 
             elif format.lower() == 'excel':
-                if 'data' in report and isinstance(report['data'], list):
-                    df = pd.DataFrame(report['data'])
-                    filename = f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+                if 'data' in report and report['data'] is not None:
+                    df = pd.DataFrame([dict(row) for row in self._iter_report_rows(report['data'], batch_size)])
+                    filename = output if isinstance(output, str) else \
+                        f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
                     df.to_excel(filename, index=False)
                     return filename
             
@@ -327,6 +436,73 @@ class AdvancedReportingService(BaseService):
             self.logger.error(f"Export report error: {str(e)}")
             raise
     
+    def stream_report(self, report: Dict[str, Any], format: str = 'json', batch_size: int = 1000):
+        """
+        Raporu HTTP yanıtına verilebilecek JSON/CSV metin parçaları olarak üret
+        
+        QueryBuilder verisi export_report ile aynı şekilde stream() ile okunur;
+        bağlantı yanıt tamamlanana (ya da generator kapatılana) kadar tutulur.
+        """
+        if format.lower() not in ('json', 'csv'):
+            raise ValueError(f"Unsupported stream format: {format}")
+        return self._iter_export(report, format.lower(), batch_size)
+    
+    def _iter_report_rows(self, data: Any, batch_size: int):
+        """
+        Rapor verisini satır satır getir
+        
+        QueryBuilder verisi tek sorguyla fetchmany üzerinden salt okunur Row
+        olarak akar (stream()).
+        """
+        if isinstance(data, QueryBuilder):
+            return data.stream(batch_size)
+        return iter(data or [])
+    
+    def _iter_export(self, report: Dict[str, Any], format: str, batch_size: int):
+        """Raporu JSON/CSV metin parçaları olarak üret (sabit bellek)"""
+        rows = self._iter_report_rows(report.get('data'), batch_size)
+        
+        if format == 'csv':
+            buffer = io.StringIO()
+            writer = None
+            for count, row in enumerate(rows, 1):
+                if writer is None:
+                    writer = csv.DictWriter(buffer, fieldnames=list(row.keys()), extrasaction='ignore')
+                    writer.writeheader()
+                writer.writerow(row)
+                if count % batch_size == 0:
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+            if buffer.tell():
+                yield buffer.getvalue()
+            return
+        
+        # JSON: üst bilgiler, ardından data dizisi satır satır
+        header = {key: value for key, value in report.items() if key != 'data'}
+        prefix = json.dumps(header, default=str)[:-1]
+        yield (prefix + ', ' if header else '{') + '"data": ['
+        
+        parts = []
+        for count, row in enumerate(rows):
+            parts.append((',' if count else '') + json.dumps(dict(row), default=str))
+            if len(parts) >= batch_size:
+                yield ''.join(parts)
+                parts = []
+        yield ''.join(parts) + ']}'
+    
+    def _write_export(self, chunks, output: Any) -> Any:
+        """Metin parçalarını dosyaya ya da yazılabilir nesneye yaz"""
+        if hasattr(output, 'write'):
+            for chunk in chunks:
+                output.write(chunk)
+            return output
+        
+        with open(output, 'w', encoding='utf-8', newline='') as handle:
+            for chunk in chunks:
+                handle.write(chunk)
+        return output
+    
     def _apply_filters(self, query: str, filters: List[ReportFilter]) -> tuple:
         """Filtreleri sorguya uygula"""
         if not filters:
@@ -6,7 +6,6 @@ API Dokümantasyonları:
 - Cimri: https://www.cimri.com/api/
 """
 
-import requests
 import json
 import hashlib
 import hmac
@@ -16,6 +15,8 @@ from typing import Dict, List, Optional, Any
 import logging
 from urllib.parse import urlencode, quote
 
+from .http_transport import TransportError, get_http_transport
+
 class AkakceAPI:
     """Akakçe Fiyat Karşılaştırma API Client"""
     
@@ -30,6 +31,7 @@ class AkakceAPI:
         else:
             self.base_url = "https://api.akakce.com/v1"
         
+        self.session = get_http_transport().session('akakce')
         self.logger = logging.getLogger(__name__)
     
     def _generate_signature(self, params: Dict[str, Any], timestamp: str) -> str:
@@ -76,16 +78,16 @@ class AkakceAPI:
         
         try:
             if method.upper() == 'GET':
-                response = requests.get(url, params=params, headers=headers, timeout=30)
+                response = self.session.get(url, params=params, headers=headers)
             elif method.upper() == 'POST':
-                response = requests.post(url, json=params, headers=headers, timeout=30)
+                response = self.session.post(url, json=params, headers=headers)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
             response.raise_for_status()
             return response.json()
             
-        except requests.exceptions.RequestException as e:
+        except TransportError as e:
             self.logger.error(f"Request failed: {str(e)}")
             raise Exception(f"Request failed: {str(e)}")
     
@@ -206,6 +208,7 @@ class CimriAPI:
         else:
             self.base_url = "https://api.cimri.com/v2"
         
+        self.session = get_http_transport().session('cimri')
         self.logger = logging.getLogger(__name__)
     
     def _generate_signature(self, params: Dict[str, Any], timestamp: str) -> str:
@@ -253,20 +256,20 @@ class CimriAPI:
         
         try:
             if method.upper() == 'GET':
-                response = requests.get(url, params=params, headers=headers, timeout=30)
+                response = self.session.get(url, params=params, headers=headers)
             elif method.upper() == 'POST':
-                response = requests.post(url, json=params, headers=headers, timeout=30)
+                response = self.session.post(url, json=params, headers=headers)
             elif method.upper() == 'PUT':
-                response = requests.put(url, json=params, headers=headers, timeout=30)
+                response = self.session.put(url, json=params, headers=headers)
             elif method.upper() == 'DELETE':
-                response = requests.delete(url, params=params, headers=headers, timeout=30)
+                response = self.session.delete(url, params=params, headers=headers)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
             response.raise_for_status()
             return response.json()
             
-        except requests.exceptions.RequestException as e:
+        except TransportError as e:
             self.logger.error(f"Request failed: {str(e)}")
             raise Exception(f"Request failed: {str(e)}")
     
@@ -4,7 +4,6 @@ Bu modül AliExpress'in resmi Open Platform API'sini kullanır.
 API Dokümantasyonu: https://openservice.aliexpress.com/doc/doc.htm
 """
 
-import requests
 import json
 import hashlib
 import hmac
@@ -15,6 +14,8 @@ from typing import Dict, List, Optional, Any
 import logging
 from urllib.parse import urlencode, quote
 
+from .http_transport import TransportError, get_http_transport
+
 class AliExpressMarketplaceAPI:
     """AliExpress Open Platform API Client"""
     
@@ -33,6 +34,7 @@ class AliExpressMarketplaceAPI:
             self.base_url = "https://gw.api.alibaba.com/openapi"
             self.auth_url = "https://oauth.alibaba.com/token"
         
+        self.session = get_http_transport().session('aliexpress')
         self.logger = logging.getLogger(__name__)
         
     def _generate_signature(self, params: Dict[str, Any], method: str = "POST") -> str:
@@ -76,7 +78,7 @@ class AliExpressMarketplaceAPI:
         all_params['sign'] = signature
         
         try:
-            response = requests.post(self.base_url, data=all_params, timeout=30)
+            response = self.session.post(self.base_url, data=all_params)
             response.raise_for_status()
             
             result = response.json()
@@ -87,7 +89,7 @@ class AliExpressMarketplaceAPI:
             
             return result
             
-        except requests.exceptions.RequestException as e:
+        except TransportError as e:
             self.logger.error(f"Request failed: {str(e)}")
             raise Exception(f"Request failed: {str(e)}")
     
@@ -101,7 +103,7 @@ class AliExpressMarketplaceAPI:
         }
         
         try:
-            response = requests.post(self.auth_url, data=params, timeout=30)
+            response = self.session.post(self.auth_url, data=params)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -118,7 +120,7 @@ class AliExpressMarketplaceAPI:
         }
         
         try:
-            response = requests.post(self.auth_url, data=params, timeout=30)
+            response = self.session.post(self.auth_url, data=params)
             response.raise_for_status()
             return response.json()
         except Exception as e:
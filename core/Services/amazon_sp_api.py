@@ -4,7 +4,6 @@ Bu modül Amazon'un resmi Selling Partner API'sini kullanır.
 API Dokümantasyonu: https://developer-docs.amazon.com/sp-api/
 """
 
-import requests
 import json
 import hashlib
 import hmac
@@ -16,6 +15,8 @@ import logging
 from urllib.parse import urlencode, quote
 import uuid
 
+from .http_transport import TransportError, get_http_transport
+
 class AmazonSPAPI:
     """Amazon Selling Partner API Client"""
     
@@ -53,7 +54,7 @@ class AmazonSPAPI:
             "SG": "A19VAU5U5O7RUS"
         }
         
-        self.session = requests.Session()
+        self.session = get_http_transport().session('amazon')
         self.access_token = None
         self.token_expires_at = None
         
@@ -74,7 +75,7 @@ class AmazonSPAPI:
                 "client_secret": self.client_secret
             }
             
-            response = requests.post(token_url, data=data)
+            response = self.session.post(token_url, data=data)
             response.raise_for_status()
             
             token_data = response.json()
@@ -133,7 +134,7 @@ class AmazonSPAPI:
             response.raise_for_status()
             return response.json()
             
-        except requests.exceptions.RequestException as e:
+        except TransportError as e:
             self.logger.error(f"Amazon SP-API request failed: {e}")
             if hasattr(e, 'response') and e.response:
                 self.logger.error(f"Response: {e.response.text}")
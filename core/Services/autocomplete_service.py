@@ -0,0 +1,451 @@
+"""
+Autocomplete Service
+Bellek içi önek (trie) indeksi ile anlık arama önerileri
+"""
+import heapq
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from core.Config.config import get_config
+from core.Services.base_service import BaseService
+from core.Services.events import Event, SystemEvents, get_dispatcher
+from core.Database.fulltext import tokenize, turkish_lower
+
+# Türkçe karakterleri ASCII karşılıklarına indir (kirmizi == Kırmızı)
+_FOLD_TABLE = str.maketrans('çğıöşüâîû', 'cgiosuaiu')
+
+
+def fold(text: Any) -> str:
+    """Arama anahtarını Türkçe kurallarıyla normalize et"""
+    if text is None:
+        return ''
+    return ' '.join(tokenize(turkish_lower(str(text)).translate(_FOLD_TABLE)))
+
+
+class Suggestion:
+    """İndekslenen öneri kaydı"""
+
+    __slots__ = ('type', 'id', 'title', 'subtitle', 'url', 'score', 'rank')
+
+    def __init__(self, type: str, id: Any, title: str, subtitle: str = '',
+                 url: str = '', score: float = 0.0):
+        self.type = type
+        self.id = id
+        self.title = title
+        self.subtitle = subtitle
+        self.url = url
+        self.score = score
+        # Yüksek skor önce, eşitlikte kısa başlık önce
+        self.rank = (-score, len(title), title)
+
+    @property
+    def key(self) -> Tuple[str, Any]:
+        return (self.type, self.id)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'type': self.type,
+            'title': self.title,
+            'subtitle': self.subtitle,
+            'url': self.url
+        }
+
+
+class _TrieNode:
+    """Trie düğümü; alt ağaçtaki en iyi k öneriyi önbellekte tutar"""
+
+    __slots__ = ('children', 'entries', 'top')
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.entries: Dict[Tuple[str, Any], Suggestion] = {}
+        self.top: List[Suggestion] = []
+
+
+class PrefixIndex:
+    """
+    Top-k önbellekli önek ağacı
+
+    Her düğüm kendi alt ağacındaki en iyi `top_k` öneriyi sıralı tutar; bu
+    sayede sorgu maliyeti yalnızca önek uzunluğuna bağlıdır. Öneriler tam
+    başlıkla birlikte her kelimenin başından da indekslenir ("elb" ->
+    "Kırmızı Elbise"). Anahtarlar `max_key_length` karakterde kesilir; uzun
+    başlıklarda indeks boyutu başlık uzunluğuyla doğrusal kalır.
+    """
+
+    def __init__(self, top_k: int = 10, max_key_length: int = 40):
+        self.top_k = top_k
+        self.max_key_length = max_key_length
+        self._root = _TrieNode()
+        self._keys: Dict[Tuple[str, Any], List[str]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _index_keys(self, terms: Iterable[str]) -> List[str]:
+        """Terimlerin tamamı ve her kelime başlangıcı için (kesilmiş) anahtarlar"""
+        keys = []
+        for term in terms:
+            folded = fold(term)
+            start = 0
+            while start < len(folded):
+                key = folded[start:start + self.max_key_length].strip()
+                if key and key not in keys:
+                    keys.append(key)
+                space = folded.find(' ', start)
+                if space < 0:
+                    break
+                start = space + 1
+        return keys
+
+    def add(self, suggestion: Suggestion, terms: Iterable[str] = None):
+        """Öneri ekle (aynı anahtar varsa güncelle)"""
+        keys = self._index_keys(terms or [suggestion.title])
+
+        with self._lock:
+            if suggestion.key in self._keys:
+                self._remove(suggestion.key)
+            if not keys:
+                return
+
+            self._keys[suggestion.key] = keys
+            for key in keys:
+                node = self._root
+                self._offer(node, suggestion)
+                for char in key:
+                    child = node.children.get(char)
+                    if child is None:
+                        child = node.children[char] = _TrieNode()
+                    node = child
+                    self._offer(node, suggestion)
+                node.entries[suggestion.key] = suggestion
+
+    def remove(self, key: Tuple[str, Any]) -> bool:
+        """Öneriyi kaldır"""
+        with self._lock:
+            if key not in self._keys:
+                return False
+            self._remove(key)
+            return True
+
+    def _remove(self, key: Tuple[str, Any]):
+        for index_key in self._keys.pop(key):
+            path = [self._root]
+            for char in index_key:
+                node = path[-1].children.get(char)
+                if node is None:
+                    break
+                path.append(node)
+            else:
+                path[-1].entries.pop(key, None)
+
+            # Yoldaki top listelerini aşağıdan yukarı yeniden hesapla
+            for depth in range(len(path) - 1, -1, -1):
+                node = path[depth]
+                if any(item.key == key for item in node.top):
+                    node.top = self._collect_top(node)
+                if depth > 0 and not node.entries and not node.children:
+                    del path[depth - 1].children[index_key[depth - 1]]
+
+    def _offer(self, node: _TrieNode, suggestion: Suggestion):
+        """Öneriyi düğümün top listesine uygunsa yerleştir"""
+        top = node.top
+        rank = suggestion.rank
+        if len(top) >= self.top_k and rank >= top[-1].rank:
+            return
+
+        position = len(top)
+        for i, item in enumerate(top):
+            if item.key == suggestion.key:
+                return
+            if position == len(top) and rank < item.rank:
+                position = i
+
+        # Okuyucular kilitsiz okuduğu için liste yerinde değiştirilmez
+        node.top = (top[:position] + [suggestion] + top[position:])[:self.top_k]
+
+    def _collect_top(self, node: _TrieNode) -> List[Suggestion]:
+        """Düğümün top listesini kendi kayıtları ve çocuklarından oluştur"""
+        candidates = {}
+        for suggestion in node.entries.values():
+            candidates[suggestion.key] = suggestion
+        for child in node.children.values():
+            for suggestion in child.top:
+                candidates[suggestion.key] = suggestion
+        return heapq.nsmallest(self.top_k, candidates.values(), key=lambda item: item.rank)
+
+    def _find(self, prefix: str) -> Optional[_TrieNode]:
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def search(self, prefix: str, limit: int = 10) -> List[Suggestion]:
+        """Önek ile başlayan en iyi `limit` öneriyi getir"""
+        folded = fold(prefix)[:self.max_key_length].strip()
+        if not folded:
+            return []
+
+        node = self._find(folded)
+        if node is None:
+            return []
+        if limit <= self.top_k:
+            return node.top[:limit]
+
+        # top_k üzerindeki istekler için alt ağacı tara
+        found = {}
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            found.update(current.entries)
+            stack.extend(current.children.values())
+        return heapq.nsmallest(limit, found.values(), key=lambda item: item.rank)
+
+    def clear(self):
+        with self._lock:
+            self._root = _TrieNode()
+            self._keys.clear()
+
+
+class AutocompleteService(BaseService):
+    """
+    Ürün, kullanıcı, etiket ve kategori önerileri için bellek içi indeks
+
+    İndeks süreç başınadır; diğer süreçlerdeki değişiklikler periyodik
+    olarak çekilir: `refresh_interval` saniyede bir updated_at'e göre
+    artımlı güncelleme, `rebuild_interval` saniyede bir (silinenleri de
+    düşürmek için) tam yeniden oluşturma. Yenileme arka planda yapılır,
+    öneri istekleri beklemez.
+    """
+
+    def __init__(self, top_k: int = 10, config: Dict[str, Any] = None):
+        super().__init__(event_dispatcher=get_dispatcher())
+        self.logger = self.get_logger()
+        config = config or get_config('autocomplete', {}) or {}
+        self.top_k = top_k
+        self.max_key_length = config.get('max_key_length', 40)
+        self.refresh_interval = config.get('refresh_interval', 60)
+        self.rebuild_interval = config.get('rebuild_interval', 3600)
+        self.chunk_size = config.get('chunk_size', 5000)
+        self.indexes: Dict[str, PrefixIndex] = {}
+        self._built = False
+        self._built_at = 0.0
+        self._checked_at = 0.0
+        self._watermarks: Dict[str, datetime] = {}
+        self._refresh_lock = threading.Lock()
+
+        # Tablo -> (öneri tipi, seçilecek sütunlar, satır dönüştürücü)
+        self.sources: Dict[str, Tuple[str, List[str], Callable[[Dict[str, Any]], Optional[Tuple[Suggestion, List[str]]]]]] = {
+            'products': ('product', ['id', 'name', 'slug', 'sku', 'status', 'sold_count'], self._product_suggestion),
+            'users': ('user', ['id', 'name', 'username', 'email'], self._user_suggestion),
+            'tags': ('tag', ['id', 'name', 'slug'], self._tag_suggestion),
+            'categories': ('category', ['id', 'name', 'slug', 'sort_order'], self._category_suggestion),
+        }
+
+        for suggestion_type, _, _ in self.sources.values():
+            self.indexes[suggestion_type] = PrefixIndex(top_k, self.max_key_length)
+
+        self.listen_event(SystemEvents.MODEL_SAVED, self._on_model_saved)
+        self.listen_event(SystemEvents.MODEL_BULK_SAVED, self._on_model_bulk_saved)
+        self.listen_event(SystemEvents.MODEL_DELETED, self._on_model_deleted)
+
+    # Satır dönüştürücüler
+    def _product_suggestion(self, row: Dict[str, Any]):
+        if row.get('status') not in (None, 'active'):
+            return None
+        suggestion = Suggestion(
+            'product', row['id'], row.get('name') or '',
+            subtitle=row.get('sku') or '',
+            url=f"/products/{row.get('slug') or row['id']}",
+            score=float(row.get('sold_count') or 0)
+        )
+        return suggestion, [row.get('name')]
+
+    def _user_suggestion(self, row: Dict[str, Any]):
+        suggestion = Suggestion(
+            'user', row['id'], row.get('name') or row.get('username') or '',
+            subtitle=row.get('email') or '',
+            url=f"/admin/users/{row['id']}"
+        )
+        return suggestion, [row.get('name'), row.get('username')]
+
+    def _tag_suggestion(self, row: Dict[str, Any]):
+        suggestion = Suggestion(
+            'tag', row['id'], row.get('name') or '',
+            subtitle='Etiket',
+            url=f"/tags/{row.get('slug') or row['id']}"
+        )
+        return suggestion, [row.get('name')]
+
+    def _category_suggestion(self, row: Dict[str, Any]):
+        suggestion = Suggestion(
+            'category', row['id'], row.get('name') or '',
+            subtitle='Kategori',
+            url=f"/categories/{row.get('slug') or row['id']}",
+            score=-float(row.get('sort_order') or 0)
+        )
+        return suggestion, [row.get('name')]
+
+    def _index_row(self, table: str, row: Dict[str, Any], index: PrefixIndex = None):
+        suggestion_type, _, converter = self.sources[table]
+        index = index or self.indexes[suggestion_type]
+
+        converted = converter(row)
+        if converted is None:
+            index.remove((suggestion_type, row.get('id')))
+            return
+
+        suggestion, terms = converted
+        index.add(suggestion, [term for term in terms if term])
+
+    def build(self, chunk_size: int = None) -> Dict[str, int]:
+        """
+        İndeksleri veritabanından oluştur
+
+        Yeni indeks ayrı oluşturulup hazır olunca eskisinin yerine konur;
+        oluşturma sırasında öneriler eski indeksten verilmeye devam eder.
+        """
+        from core.Database.query_builder import QueryBuilder
+
+        counts = {}
+        for table, (suggestion_type, columns, _) in self.sources.items():
+            started = datetime.now()
+            index = PrefixIndex(self.top_k, self.max_key_length)
+            try:
+                for rows in QueryBuilder(table).select(*columns).chunk(chunk_size or self.chunk_size):
+                    for row in rows:
+                        self._index_row(table, row, index)
+            except Exception as e:
+                self.logger.warning(f"Autocomplete index build skipped for {table}: {str(e)}")
+            else:
+                self.indexes[suggestion_type] = index
+                self._watermarks[table] = started
+            counts[suggestion_type] = len(self.indexes[suggestion_type])
+
+        self._built = True
+        self._built_at = self._checked_at = time.monotonic()
+        self.logger.info(f"Autocomplete indexes built: {counts}")
+        return counts
+
+    def refresh(self) -> Dict[str, int]:
+        """Son güncellemeden beri değişen (updated_at) kayıtları indekse ekle"""
+        from core.Database.query_builder import QueryBuilder
+
+        counts = {}
+        for table, (suggestion_type, columns, _) in self.sources.items():
+            since = self._watermarks.get(table)
+            if since is None:
+                continue
+            started = datetime.now()
+            changed = 0
+            try:
+                builder = QueryBuilder(table).select(*columns).where(
+                    'updated_at', '>=', since.strftime('%Y-%m-%d %H:%M:%S')
+                )
+                for rows in builder.chunk(self.chunk_size):
+                    for row in rows:
+                        self._index_row(table, row)
+                    changed += len(rows)
+            except Exception as e:
+                # updated_at olmayan tablolar yalnızca tam yeniden oluşturmada güncellenir
+                self.logger.debug(f"Autocomplete refresh skipped for {table}: {str(e)}")
+                continue
+            self._watermarks[table] = started
+            counts[suggestion_type] = changed
+        return counts
+
+    def _maybe_refresh(self):
+        """Süresi geldiyse arka planda artımlı yenileme ya da tam yeniden oluşturma başlat"""
+        now = time.monotonic()
+        if not self._built or now - self._checked_at < self.refresh_interval:
+            return
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        self._checked_at = now
+        rebuild = now - self._built_at >= self.rebuild_interval
+
+        def run():
+            try:
+                self.build() if rebuild else self.refresh()
+            except Exception as e:
+                self.logger.warning(f"Autocomplete refresh failed: {str(e)}")
+            finally:
+                self._refresh_lock.release()
+
+        threading.Thread(target=run, name='autocomplete-refresh', daemon=True).start()
+
+    def is_built(self) -> bool:
+        return self._built
+
+    def suggest(self, query: str, limit: int = 10, types: List[str] = None) -> List[Dict[str, Any]]:
+        """
+        Önek için sıralı öneriler getir
+
+        Args:
+            query: Kullanıcının yazdığı önek
+            limit: Maksimum öneri sayısı
+            types: Sadece bu tiplerden öner (varsayılan: hepsi)
+        """
+        self._maybe_refresh()
+
+        candidates = []
+        for suggestion_type in (types or list(self.indexes.keys())):
+            index = self.indexes.get(suggestion_type)
+            if index is not None:
+                candidates.extend(index.search(query, limit))
+
+        best = heapq.nsmallest(limit, candidates, key=lambda item: item.rank)
+        return [suggestion.to_dict() for suggestion in best]
+
+    # Event dinleyicileri
+    def _on_model_saved(self, event: Event):
+        table = event.data.get('table')
+        attributes = event.data.get('attributes') or {}
+        if table in self.sources and attributes.get('id') is not None:
+            self._index_row(table, attributes)
+
+    def _on_model_bulk_saved(self, event: Event):
+        from core.Database.query_builder import QueryBuilder
+
+        table = event.data.get('table')
+        if table not in self.sources:
+            return
+        columns = self.sources[table][1]
+        ids = event.data.get('ids') or []
+        for start in range(0, len(ids), 500):
+            for row in QueryBuilder(table).select(*columns).where_in('id', ids[start:start + 500]).get():
+                self._index_row(table, row)
+        if event.data.get('count', 0) > len(ids):
+            # id'si bilinmeyen yeni satırlar bir sonraki artımlı yenilemede gelir
+            self._checked_at = 0.0
+
+    def _on_model_deleted(self, event: Event):
+        table = event.data.get('table')
+        if table in self.sources:
+            suggestion_type = self.sources[table][0]
+            self.indexes[suggestion_type].remove((suggestion_type, event.data.get('id')))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'built': self._built,
+            'entries': {name: len(index) for name, index in self.indexes.items()},
+            'watermarks': {table: since.isoformat() for table, since in self._watermarks.items()}
+        }
+
+
+_autocomplete_service: Optional[AutocompleteService] = None
+_autocomplete_lock = threading.Lock()
+
+
+def get_autocomplete_service() -> AutocompleteService:
+    """Global autocomplete servisini getir"""
+    global _autocomplete_service
+    if _autocomplete_service is None:
+        with _autocomplete_lock:
+            if _autocomplete_service is None:
+                _autocomplete_service = AutocompleteService()
+    return _autocomplete_service
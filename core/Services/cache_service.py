@@ -2,15 +2,92 @@
 Cache Service
 Önbellek yönetimi servisi
 """
+import math
 import os
-import json
-import pickle
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional, Dict, List
-from datetime import datetime, timedelta
 from core.Services.base_service import BaseService
+from core.Services.cache_stores import (
+    MISS, CacheStore, LRUCacheStore, FileCacheStore, SQLiteCacheStore, RedisCacheStore
+)
+
+# Katmanlar süreç içinde paylaşılır; CacheService() her çağrıldığında L1 boşalmaz
+_shared_stores: Dict[tuple, CacheStore] = {}
+_shared_stores_lock = threading.Lock()
+# Bağlanılamayan arka uçlar her CacheService() çağrısında yeniden denenmez
+_unavailable_stores: set = set()
+
+
+def _shared_store(key: tuple, factory) -> CacheStore:
+    """Aynı yapılandırma için tek store örneği döndür"""
+    store = _shared_stores.get(key)
+    if store is None:
+        with _shared_stores_lock:
+            store = _shared_stores.get(key)
+            if store is None:
+                store = _shared_stores[key] = factory()
+    return store
+
+
+# remember() için anahtar başına süreç içi tek uçuş (single-flight) kilitleri
+_flight_locks: Dict[str, threading.Lock] = {}
+_flight_locks_lock = threading.Lock()
+
+# Stale-while-revalidate yenilemeleri için arka plan işçileri
+_refresh_executor: Optional[ThreadPoolExecutor] = None
+# Kuyrukta ya da çalışmakta olan yenilemeler (anahtar başına tek iş)
+_pending_refreshes: set = set()
+
+
+def _flight_lock(key: str) -> threading.Lock:
+    """Anahtar için süreç içi kilidi getir"""
+    with _flight_locks_lock:
+        lock = _flight_locks.get(key)
+        if lock is None:
+            lock = _flight_locks[key] = threading.Lock()
+        return lock
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    global _refresh_executor
+    if _refresh_executor is None:
+        with _flight_locks_lock:
+            if _refresh_executor is None:
+                _refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='cache-refresh')
+    return _refresh_executor
+
+
+class _CachedValue:
+    """remember() kaydı: değer, hesaplama süresi ve tazelik sınırı"""
+
+    __slots__ = ('value', 'delta', 'fresh_until')
+
+    def __init__(self, value: Any, delta: float, fresh_until: float):
+        self.value = value
+        self.delta = delta
+        self.fresh_until = fresh_until
+
+    def __getstate__(self):
+        return (self.value, self.delta, self.fresh_until)
+
+    def __setstate__(self, state):
+        self.value, self.delta, self.fresh_until = state
+
 
 class CacheService(BaseService):
-    """Önbellek yönetimi servisi"""
+    """
+    Önbellek yönetimi servisi
+    
+    İki katmanlıdır: L1 süreç içi, sınırlı ve TTL destekli LRU; L2 ise
+    paylaşılan arka uç (file, sqlite, redis). 'array' sürücüsü yalnızca L1
+    kullanır. Okumalar önce L1'e bakar, L2 isabetleri kalan TTL ile L1'e
+    alınır. L1 diğer süreçlerdeki silmeleri görmediği için ömrü `l1_ttl`
+    ile sınırlanır.
+    """
     
     def __init__(self):
         super().__init__()
@@ -20,24 +97,80 @@ class CacheService(BaseService):
         self.driver = self.cache_config.get('driver', 'file')
         self.prefix = self.cache_config.get('prefix', 'pofuai_')
         self.default_ttl = self.cache_config.get('ttl', 3600)
+        self.l1_ttl = self.cache_config.get('l1_ttl', 60)
+        self.cache_dir = self.cache_config.get('path', 'storage/Cache')
+        
+        l1_enabled = self.cache_config.get('l1_enabled', True) or self.driver == 'array'
+        l1_max_items = self.cache_config.get('l1_max_items', 1000)
+        self.l1: Optional[LRUCacheStore] = _shared_store(
+            ('lru', l1_max_items), lambda: LRUCacheStore(l1_max_items)
+        ) if l1_enabled else None
+        
+        self.l2: Optional[CacheStore] = self._create_l2_store()
+        if self.driver == 'array':
+            # Array sürücüsü L1'in kendisidir, TTL kısaltılmaz
+            self.l1_ttl = None
+    
+    def _create_l2_store(self) -> Optional[CacheStore]:
+        """Yapılandırılan paylaşılan arka ucu oluştur"""
+        try:
+            if self.driver == 'array':
+                return None
+            if self.driver == 'redis':
+                url = self.cache_config.get('redis_url') or os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+                
+                def create_redis():
+                    store = RedisCacheStore(url)
+                    store.client.ping()
+                    return store
+                
+                if ('redis', url) not in _unavailable_stores:
+                    try:
+                        return _shared_store(('redis', url), create_redis)
+                    except Exception:
+                        _unavailable_stores.add(('redis', url))
+                        raise
+            elif self.driver == 'sqlite':
+                path = self.cache_config.get('sqlite_path', os.path.join(self.cache_dir, 'cache.db'))
+                return _shared_store(('sqlite', path), lambda: SQLiteCacheStore(path))
+            elif self.driver != 'file':
+                self.logger.error(f"Unsupported cache driver: {self.driver}, falling back to file")
+        except Exception as e:
+            self.logger.warning(f"Cache driver '{self.driver}' unavailable, falling back to file: {str(e)}")
         
-        # Cache dizinini oluştur
-        if self.driver == 'file':
-            self.cache_dir = 'storage/Cache'
-            os.makedirs(self.cache_dir, exist_ok=True)
+        self.driver = 'file'
+        return _shared_store(('file', self.cache_dir), lambda: FileCacheStore(self.cache_dir))
+    
+    def _lookup(self, full_key: str, shared: bool = False) -> Any:
+        """Katmanlarda sırayla ara; bulunamazsa MISS döndür (shared: L1'i atla)"""
+        if self.l1 is not None and (not shared or self.l2 is None):
+            value, _ = self.l1.get(full_key)
+            if value is not MISS:
+                return value
+        
+        if self.l2 is None:
+            return MISS
+        
+        value, expires_at = self.l2.get(full_key)
+        if value is not MISS and self.l1 is not None:
+            self._fill_l1(full_key, value, expires_at)
+        return value
+    
+    def _fill_l1(self, full_key: str, value: Any, expires_at: Optional[float]):
+        """L2'den gelen değeri L1'e en fazla l1_ttl süreyle yerleştir"""
+        limit = time.time() + self.l1_ttl if self.l1_ttl else None
+        if expires_at is None or (limit and limit < expires_at):
+            expires_at = limit
+        if expires_at:
+            self.l1.set(full_key, value, 0, expires_at=expires_at)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Cache'den değer al"""
         try:
-            full_key = self._get_full_key(key)
-            
-            if self.driver == 'file':
-                return self._get_file(full_key, default)
-            elif self.driver == 'array':
-                return self._get_array(full_key, default)
-            else:
-                self.logger.error(f"Unsupported cache driver: {self.driver}")
+            value = self._lookup(self._get_full_key(key))
+            if value is MISS:
                 return default
+            return value.value if isinstance(value, _CachedValue) else value
                 
         except Exception as e:
             self.logger.error(f"Cache get error: {str(e)}")
@@ -49,13 +182,11 @@ class CacheService(BaseService):
             full_key = self._get_full_key(key)
             ttl = ttl or self.default_ttl
             
-            if self.driver == 'file':
-                return self._set_file(full_key, value, ttl)
-            elif self.driver == 'array':
-                return self._set_array(full_key, value, ttl)
-            else:
-                self.logger.error(f"Unsupported cache driver: {self.driver}")
-                return False
+            if self.l2 is not None:
+                self.l2.set(full_key, value, ttl)
+            if self.l1 is not None:
+                self._fill_l1(full_key, value, time.time() + ttl)
+            return True
                 
         except Exception as e:
             self.logger.error(f"Cache set error: {str(e)}")
@@ -66,32 +197,103 @@ class CacheService(BaseService):
         try:
             full_key = self._get_full_key(key)
             
-            if self.driver == 'file':
-                return self._delete_file(full_key)
-            elif self.driver == 'array':
-                return self._delete_array(full_key)
-            else:
-                self.logger.error(f"Unsupported cache driver: {self.driver}")
-                return False
+            if self.l1 is not None:
+                self.l1.delete(full_key)
+            if self.l2 is not None:
+                self.l2.delete(full_key)
+            return True
                 
         except Exception as e:
             self.logger.error(f"Cache delete error: {str(e)}")
             return False
     
+    def get_many(self, keys: List[str], default: Any = None, shared: bool = False) -> Dict[str, Any]:
+        """
+        Birden çok anahtarı tek seferde al
+        
+        L1'de bulunmayanlar L2'den tek istekte (SQLite IN, Redis MGET) okunur.
+        
+        Returns:
+            Dict[str, Any]: Her anahtar için değer ya da default
+        """
+        result = {key: default for key in keys}
+        try:
+            pending = {self._get_full_key(key): key for key in keys}
+            
+            if self.l1 is not None and (not shared or self.l2 is None):
+                for full_key in list(pending):
+                    value, _ = self.l1.get(full_key)
+                    if value is not MISS:
+                        result[pending.pop(full_key)] = value
+            
+            if pending and self.l2 is not None:
+                for full_key, (value, expires_at) in self.l2.get_many(list(pending)).items():
+                    result[pending[full_key]] = value
+                    if self.l1 is not None:
+                        self._fill_l1(full_key, value, expires_at)
+            
+            return {key: value.value if isinstance(value, _CachedValue) else value
+                    for key, value in result.items()}
+            
+        except Exception as e:
+            self.logger.error(f"Cache get_many error: {str(e)}")
+            return result
+    
+    def set_many(self, items: Dict[str, Any], ttl: int = None) -> bool:
+        """Birden çok anahtarı tek seferde kaydet"""
+        try:
+            ttl = ttl or self.default_ttl
+            full_items = {self._get_full_key(key): value for key, value in items.items()}
+            
+            if self.l2 is not None:
+                self.l2.set_many(full_items, ttl)
+            if self.l1 is not None:
+                expires_at = time.time() + ttl
+                for full_key, value in full_items.items():
+                    self._fill_l1(full_key, value, expires_at)
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Cache set_many error: {str(e)}")
+            return False
+    
+    def delete_many(self, keys: List[str]) -> bool:
+        """Birden çok anahtarı tek seferde sil"""
+        try:
+            full_keys = [self._get_full_key(key) for key in keys]
+            
+            if self.l1 is not None:
+                self.l1.delete_many(full_keys)
+            if self.l2 is not None:
+                self.l2.delete_many(full_keys)
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Cache delete_many error: {str(e)}")
+            return False
+    
+    def delete_prefix(self, prefix: str) -> int:
+        """Önekle başlayan tüm anahtarları sil (katmanlarda silinen kayıtların toplamı)"""
+        try:
+            full_prefix = self._get_full_key(prefix)
+            removed = self.l1.delete_prefix(full_prefix) if self.l1 is not None else 0
+            if self.l2 is not None:
+                removed += self.l2.delete_prefix(full_prefix)
+            return removed
+            
+        except Exception as e:
+            self.logger.error(f"Cache delete prefix error: {str(e)}")
+            return 0
+    
     def has(self, key: str) -> bool:
         """Cache'de key var mı kontrol et"""
         return self.get(key) is not None
     
     def clear(self) -> bool:
-        """Tüm cache'i temizle"""
+        """Tüm cache'i temizle (yalnızca bu önekteki anahtarlar)"""
         try:
-            if self.driver == 'file':
-                return self._clear_file()
-            elif self.driver == 'array':
-                return self._clear_array()
-            else:
-                self.logger.error(f"Unsupported cache driver: {self.driver}")
-                return False
+            self.delete_prefix('')
+            return True
                 
         except Exception as e:
             self.logger.error(f"Cache clear error: {str(e)}")
@@ -114,197 +316,260 @@ class CacheService(BaseService):
         """Sayısal değeri azalt"""
         return self.increment(key, -value)
     
-    def remember(self, key: str, ttl: int, callback) -> Any:
-        """Değeri cache'den al veya callback ile oluştur"""
-        value = self.get(key)
-        if value is not None:
-            return value
-        
-        value = callback()
-        self.set(key, value, ttl)
-        return value
+    def add(self, key: str, value: Any, ttl: int = None) -> bool:
+        """Anahtar yoksa kaydet (atomik); kaydedildiyse True"""
+        try:
+            full_key = self._get_full_key(key)
+            store = self.l2 if self.l2 is not None else self.l1
+            return store.add(full_key, value, ttl or self.default_ttl)
+            
+        except Exception as e:
+            self.logger.error(f"Cache add error: {str(e)}")
+            return False
     
-    def tags(self, *tags: str) -> 'TaggedCache':
-        """Tag'li cache oluştur"""
-        return TaggedCache(self, tags)
+    def acquire_lock(self, name: str, ttl: int = 30) -> Optional[str]:
+        """
+        Paylaşılan arka uç üzerinden kilit al
+        
+        Returns:
+            Optional[str]: Kilit alındıysa release_lock için token, yoksa None
+        """
+        token = uuid.uuid4().hex
+        return token if self.add(f"lock:{name}", token, ttl) else None
     
-    def flush(self) -> bool:
-        """Cache'i temizle (clear alias)"""
-        return self.clear()
+    def release_lock(self, name: str, token: str) -> bool:
+        """Kilidi yalnızca sahibi ise bırak"""
+        if self._lookup(self._get_full_key(f"lock:{name}"), shared=True) == token:
+            return self.delete(f"lock:{name}")
+        return False
     
-    def _get_full_key(self, key: str) -> str:
-        """Tam key oluştur"""
-        return f"{self.prefix}{key}"
+    def remember(self, key: str, ttl: int, callback, stale_ttl: int = 0,
+                 beta: float = 1.0, lock_timeout: int = 30) -> Any:
+        """
+        Değeri cache'den al veya callback ile oluştur
+        
+        - Tek uçuş: süresi dolan anahtarı süreç içinde ve süreçler arasında
+          (paylaşılan arka uçtaki kilit ile) yalnızca bir çağıran hesaplar;
+          diğerleri sonucu bekler.
+        - Olasılıksal erken yenileme (XFetch): hesaplama süresi ve `beta`
+          ile orantılı olarak, TTL dolmadan bir çağıran değeri yeniler.
+        - stale_ttl > 0 ise TTL dolduktan sonra bu süre boyunca eski değer
+          döner ve yenileme arka planda tek işçi tarafından yapılır.
+        
+        Args:
+            key: Cache anahtarı
+            ttl: Değerin taze kalacağı süre (saniye)
+            callback: Değeri üreten fonksiyon
+            stale_ttl: TTL sonrası eski değerin sunulabileceği süre
+            beta: Erken yenileme eğilimi (0 kapatır, >1 daha erken)
+            lock_timeout: Hesaplayanı bekleme ve kilit süresi (saniye)
+        """
+        entry = self._lookup(self._get_full_key(key))
+        
+        if entry is not MISS and entry is not None:
+            if not isinstance(entry, _CachedValue):
+                # set() ile yazılmış düz değer
+                return entry
+            
+            now = time.time()
+            early = entry.delta * beta * -math.log(1.0 - random.random())
+            if now + early < entry.fresh_until:
+                return entry.value
+            
+            if now < entry.fresh_until:
+                # Erken yenileme: kilidi alan yeniler, diğerleri mevcut değeri kullanır
+                refreshed = self._refresh(key, ttl, callback, stale_ttl, lock_timeout)
+                return entry.value if refreshed is MISS else refreshed
+            
+            if stale_ttl:
+                # Eski değeri sun, arka planda yenile
+                self._schedule_refresh(key, ttl, callback, stale_ttl, lock_timeout)
+                return entry.value
+        
+        return self._compute(key, ttl, callback, stale_ttl, lock_timeout)
     
-    def _get_file(self, key: str, default: Any) -> Any:
-        """File cache'den değer al"""
+    def _schedule_refresh(self, key: str, ttl: int, callback, stale_ttl: int, lock_timeout: int):
+        """Arka plan yenilemesini kuyruğa al; anahtar zaten kuyruktaysa tekrar ekleme"""
+        full_key = self._get_full_key(key)
+        with _flight_locks_lock:
+            if full_key in _pending_refreshes:
+                return
+            _pending_refreshes.add(full_key)
+        
+        def run():
+            try:
+                self._refresh(key, ttl, callback, stale_ttl, lock_timeout)
+            finally:
+                with _flight_locks_lock:
+                    _pending_refreshes.discard(full_key)
+        
         try:
-            file_path = os.path.join(self.cache_dir, f"{key}.cache")
-            
-            if not os.path.exists(file_path):
-                return default
-            
-            with open(file_path, 'rb') as f:
-                cache_data = pickle.load(f)
-            
-            # TTL kontrolü
-            if datetime.now() > cache_data['expires_at']:
-                os.remove(file_path)
-                return default
-            
-            return cache_data['value']
-            
-        except Exception as e:
-            self.logger.error(f"File cache get error: {str(e)}")
-            return default
+            _get_refresh_executor().submit(run)
+        except Exception:
+            with _flight_locks_lock:
+                _pending_refreshes.discard(full_key)
+            raise
     
-    def _set_file(self, key: str, value: Any, ttl: int) -> bool:
-        """File cache'e değer kaydet"""
-        try:
-            file_path = os.path.join(self.cache_dir, f"{key}.cache")
-            
-            cache_data = {
-                'value': value,
-                'expires_at': datetime.now() + timedelta(seconds=ttl),
-                'created_at': datetime.now()
-            }
-            
-            with open(file_path, 'wb') as f:
-                pickle.dump(cache_data, f)
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"File cache set error: {str(e)}")
-            return False
+    def _store_computed(self, key: str, ttl: int, callback, stale_ttl: int) -> Any:
+        """Callback'i çalıştır ve süresini de kaydederek yaz"""
+        started = time.time()
+        value = callback()
+        finished = time.time()
+        self.set(key, _CachedValue(value, finished - started, finished + ttl), ttl + stale_ttl)
+        return value
     
-    def _delete_file(self, key: str) -> bool:
-        """File cache'den değer sil"""
-        try:
-            file_path = os.path.join(self.cache_dir, f"{key}.cache")
-            
-            if os.path.exists(file_path):
-                os.remove(file_path)
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"File cache delete error: {str(e)}")
-            return False
+    def _fresh_entry(self, key: str) -> Any:
+        # L1 eski kaydı tutuyor olabilir; yeni değer paylaşılan katmandadır
+        entry = self._lookup(self._get_full_key(key), shared=True)
+        if isinstance(entry, _CachedValue) and entry.fresh_until > time.time():
+            return entry
+        return MISS
     
-    def _clear_file(self) -> bool:
-        """File cache'i temizle"""
+    def _refresh(self, key: str, ttl: int, callback, stale_ttl: int, lock_timeout: int) -> Any:
+        """Kilit boştaysa değeri yenile; kilit başkasındaysa MISS döndür"""
+        local_lock = _flight_lock(key)
+        if not local_lock.acquire(blocking=False):
+            return MISS
         try:
-            for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.cache'):
-                    file_path = os.path.join(self.cache_dir, filename)
-                    os.remove(file_path)
-            
-            return True
-            
+            token = self.acquire_lock(key, lock_timeout)
+            if token is None:
+                return MISS
+            try:
+                return self._store_computed(key, ttl, callback, stale_ttl)
+            finally:
+                self.release_lock(key, token)
         except Exception as e:
-            self.logger.error(f"File cache clear error: {str(e)}")
-            return False
+            self.logger.error(f"Cache refresh error ({key}): {str(e)}")
+            return MISS
+        finally:
+            local_lock.release()
     
-    def _get_array(self, key: str, default: Any) -> Any:
-        """Array cache'den değer al"""
+    def _compute(self, key: str, ttl: int, callback, stale_ttl: int, lock_timeout: int) -> Any:
+        """Değer yokken tek uçuş ile hesapla"""
+        local_lock = _flight_lock(key)
+        if not local_lock.acquire(timeout=lock_timeout):
+            return self._store_computed(key, ttl, callback, stale_ttl)
         try:
-            # Basit in-memory cache (test için)
-            if not hasattr(self, '_array_cache'):
-                self._array_cache = {}
-            
-            if key not in self._array_cache:
-                return default
-            
-            cache_data = self._array_cache[key]
-            
-            # TTL kontrolü
-            if datetime.now() > cache_data['expires_at']:
-                del self._array_cache[key]
-                return default
-            
-            return cache_data['value']
-            
-        except Exception as e:
-            self.logger.error(f"Array cache get error: {str(e)}")
-            return default
+            # Beklerken başka bir thread hesaplamış olabilir
+            entry = self._fresh_entry(key)
+            if entry is not MISS:
+                return entry.value
+            
+            token = self.acquire_lock(key, lock_timeout)
+            if token is None:
+                # Başka süreç hesaplıyor: sonucunu bekle
+                deadline = time.time() + lock_timeout
+                while time.time() < deadline:
+                    time.sleep(0.05)
+                    entry = self._fresh_entry(key)
+                    if entry is not MISS:
+                        return entry.value
+                    if self._lookup(self._get_full_key(f"lock:{key}"), shared=True) is MISS:
+                        break
+                return self._store_computed(key, ttl, callback, stale_ttl)
+            
+            try:
+                return self._store_computed(key, ttl, callback, stale_ttl)
+            finally:
+                self.release_lock(key, token)
+        finally:
+            local_lock.release()
     
-    def _set_array(self, key: str, value: Any, ttl: int) -> bool:
-        """Array cache'e değer kaydet"""
-        try:
-            if not hasattr(self, '_array_cache'):
-                self._array_cache = {}
-            
-            self._array_cache[key] = {
-                'value': value,
-                'expires_at': datetime.now() + timedelta(seconds=ttl),
-                'created_at': datetime.now()
-            }
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Array cache set error: {str(e)}")
-            return False
+    def tags(self, *tags: str) -> 'TaggedCache':
+        """Tag'li cache oluştur"""
+        return TaggedCache(self, tags)
     
-    def _delete_array(self, key: str) -> bool:
-        """Array cache'den değer sil"""
-        try:
-            if hasattr(self, '_array_cache') and key in self._array_cache:
-                del self._array_cache[key]
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Array cache delete error: {str(e)}")
-            return False
+    def flush(self) -> bool:
+        """Cache'i temizle (clear alias)"""
+        return self.clear()
     
-    def _clear_array(self) -> bool:
-        """Array cache'i temizle"""
-        try:
-            if hasattr(self, '_array_cache'):
-                self._array_cache.clear()
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Array cache clear error: {str(e)}")
-            return False
+    def _get_full_key(self, key: str) -> str:
+        """Tam key oluştur"""
+        return f"{self.prefix}{key}"
     
     def get_pattern(self, pattern: str) -> List[str]:
         """Pattern'e uyan cache key'lerini al"""
         try:
-            if self.driver == 'redis':
-                return [key.decode() for key in self.redis_client.keys(pattern)]
-            elif self.driver == 'file':
-                import glob
-                # File cache için pattern matching
-                pattern_path = os.path.join(self.cache_dir, pattern.replace(':', '_').replace('*', '*') + '.cache')
-                matches = glob.glob(pattern_path)
-                return [os.path.basename(match).replace('_', ':').replace('.cache', '') for match in matches]
-            
-            return []
+            store = self.l2 if self.l2 is not None else self.l1
+            if store is None:
+                return []
+            # Önek eklenerek aranır, çağırana öneksiz anahtarlar döner
+            return [key[len(self.prefix):] for key in store.keys(self._get_full_key(pattern))]
             
         except Exception as e:
             self.logger.error(f"Pattern arama hatası: {str(e)}")
             return []
     
     def get_hit_ratio(self) -> float:
-        """Cache hit ratio hesapla"""
+        """
+        Cache hit ratio hesapla (L1 + L2 isabetleri / toplam okuma)
+        
+        Her okuma ya L1'de biter ya da L2'ye ulaşır; L1'i atlayan okumalar
+        (tag sürümleri, kilitler) da L2'de sayıldığı için paydaya girer.
+        """
         try:
-            # Basit hit ratio hesaplama (gerçek implementasyon için metrics gerekli)
-            return 0.85  # Placeholder
+            if self.l2 is None:
+                if self.l1 is None:
+                    return 0.0
+                hits, lookups = self.l1.hits, self.l1.hits + self.l1.misses
+            else:
+                hits = (self.l1.hits if self.l1 is not None else 0) + self.l2.hits
+                lookups = hits + self.l2.misses
+            return round(hits / lookups, 4) if lookups else 0.0
         except Exception as e:
             self.logger.error(f"Hit ratio hesaplama hatası: {str(e)}")
             return 0.0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Katman bazında isabet/ıska/çıkarma sayaçları"""
+        return {
+            'driver': self.driver,
+            'hit_ratio': self.get_hit_ratio(),
+            'l1': self.l1.get_stats() if self.l1 is not None else None,
+            'l2': self.l2.get_stats() if self.l2 is not None else None
+        }
 
 class TaggedCache:
-    """Tag'li cache sınıfı"""
+    """
+    Tag'li cache sınıfı
+    
+    Her tag'in paylaşılan katmanda rastgele bir sürüm belirteci vardır ve
+    anahtarlar tüm tag sürümlerini içeren isim alanına yazılır. flush() ilgili
+    tag'lerin sürümünü değiştirir: eski kayıtlara artık ulaşılamaz ve TTL /
+    LRU ile kendiliğinden düşer. Böylece temizleme, cache'teki kayıt
+    sayısından bağımsız olarak tek yazmadır.
+    """
+    
+    # Sürüm anahtarlarının ömrü; kaybolursa yeni sürüm üretilir (güvenli tarafta kalır)
+    VERSION_TTL = 30 * 24 * 3600
     
     def __init__(self, cache_service: CacheService, tags: List[str]):
         self.cache_service = cache_service
-        self.tags = tags
-        self.namespace = f"tags:{':'.join(tags)}"
+        self.tags = list(tags)
+    
+    @staticmethod
+    def _version_key(tag: str) -> str:
+        return f"tag_version:{tag}"
+    
+    def _versions(self) -> List[str]:
+        """Tag sürümlerini tek okumada getir, eksikleri atomik olarak oluştur"""
+        # Başka süreçlerdeki flush'ları görmek için L1 atlanır
+        found = self.cache_service.get_many([self._version_key(tag) for tag in self.tags], shared=True)
+        versions = []
+        for tag in self.tags:
+            version = found.get(self._version_key(tag))
+            if version is None:
+                candidate = uuid.uuid4().hex[:12]
+                if not self.cache_service.add(self._version_key(tag), candidate, self.VERSION_TTL):
+                    candidate = self.cache_service.get_many([self._version_key(tag)], shared=True)[self._version_key(tag)] or candidate
+                version = candidate
+            versions.append(version)
+        return versions
+    
+    @property
+    def namespace(self) -> str:
+        """Güncel tag sürümlerini içeren isim alanı"""
+        return "tags:" + ':'.join(f"{tag}@{version}" for tag, version in zip(self.tags, self._versions()))
     
     def get(self, key: str, default: Any = None) -> Any:
         """Tag'li cache'den değer al"""
@@ -318,78 +583,40 @@ class TaggedCache:
         """Tag'li cache'den değer sil"""
         return self.cache_service.delete(f"{self.namespace}:{key}")
     
-    def flush(self) -> bool:
-        """Tag'li cache'i temizle"""
-        # Tag'li tüm cache'leri temizle
-        if self.cache_service.driver == 'file':
-            return self._flush_file()
-        elif self.cache_service.driver == 'array':
-            return self._flush_array()
-        return False
+    def get_many(self, keys: List[str], default: Any = None) -> Dict[str, Any]:
+        """Tag'li cache'den birden çok değer al"""
+        namespace = self.namespace
+        found = self.cache_service.get_many([f"{namespace}:{key}" for key in keys], default)
+        return {key: found[f"{namespace}:{key}"] for key in keys}
     
-    def _flush_file(self) -> bool:
-        """File tag'li cache'i temizle"""
-        try:
-            cache_dir = self.cache_service.cache_dir
-            namespace_prefix = f"{self.cache_service.prefix}{self.namespace}"
-            
-            for filename in os.listdir(cache_dir):
-                if filename.startswith(namespace_prefix) and filename.endswith('.cache'):
-                    file_path = os.path.join(cache_dir, filename)
-                    os.remove(file_path)
-            
-            return True
-            
-        except Exception as e:
-            self.cache_service.logger.error(f"Tagged cache flush error: {str(e)}")
-            return False
+    def set_many(self, items: Dict[str, Any], ttl: int = None) -> bool:
+        """Tag'li cache'e birden çok değer kaydet"""
+        namespace = self.namespace
+        return self.cache_service.set_many({f"{namespace}:{key}": value for key, value in items.items()}, ttl)
+    
+    def delete_many(self, keys: List[str]) -> bool:
+        """Tag'li cache'den birden çok değer sil"""
+        namespace = self.namespace
+        return self.cache_service.delete_many([f"{namespace}:{key}" for key in keys])
+    
+    def remember(self, key: str, ttl: int, callback, **options) -> Any:
+        """Tag'li remember (bkz. CacheService.remember)"""
+        return self.cache_service.remember(f"{self.namespace}:{key}", ttl, callback, **options)
+    
+    def flush(self) -> bool:
+        """Tag'li cache'i temizle (tag sürümlerini yenile)"""
+        return self.cache_service.set_many(
+            {self._version_key(tag): uuid.uuid4().hex[:12] for tag in self.tags}, self.VERSION_TTL
+        )
     
-    def _flush_array(self) -> bool:
-        """Array tag'li cache'i temizle"""
-        try:
-            if hasattr(self.cache_service, '_array_cache'):
-                namespace_prefix = f"{self.cache_service.prefix}{self.namespace}"
-                keys_to_delete = []
-                
-                for key in self.cache_service._array_cache.keys():
-                    if key.startswith(namespace_prefix):
-                        keys_to_delete.append(key)
-                
-                for key in keys_to_delete:
-                    del self.cache_service._array_cache[key]
-            
-            return True
-            
-        except Exception as e:
-            self.cache_service.logger.error(f"Tagged cache flush error: {str(e)}")
-            return False
-
     def get_pattern(self, pattern: str) -> List[str]:
-        """Pattern'e uyan cache key'lerini al"""
-        try:
-            if self.driver == 'redis':
-                return [key.decode() for key in self.redis_client.keys(pattern)]
-            elif self.driver == 'file':
-                import glob
-                # File cache için pattern matching
-                pattern_path = os.path.join(self.cache_dir, pattern.replace(':', '_').replace('*', '*'))
-                matches = glob.glob(pattern_path)
-                return [os.path.basename(match).replace('_', ':') for match in matches]
-            
-            return []
-            
-        except Exception as e:
-            self.logger.error(f"Pattern arama hatası: {str(e)}")
-            return []
+        """Pattern'e uyan tag'li cache key'lerini al"""
+        prefix = f"{self.namespace}:"
+        return [key[len(prefix):] for key in self.cache_service.get_pattern(f"{prefix}{pattern}")]
     
     def get_hit_ratio(self) -> float:
         """Cache hit ratio hesapla"""
-        try:
-            # Basit hit ratio hesaplama (gerçek implementasyon için metrics gerekli)
-            return 0.85  # Placeholder
-        except Exception as e:
-            self.logger.error(f"Hit ratio hesaplama hatası: {str(e)}")
-            return 0.0
+        return self.cache_service.get_hit_ratio()
 
 # Global cache service instance
 _cache_service = None
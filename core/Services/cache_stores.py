@@ -0,0 +1,566 @@
+"""
+Cache Stores
+CacheService katmanları: süreç içi LRU (L1) ve paylaşılan arka uçlar (L2)
+"""
+import fnmatch
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# get() sonucunda "bulunamadı" işareti (None geçerli bir değer olabilir)
+MISS = object()
+
+
+class CacheStore(ABC):
+    """Cache katmanı arayüzü ve sayaçları"""
+
+    name = 'store'
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @abstractmethod
+    def get(self, key: str) -> Tuple[Any, Optional[float]]:
+        """(değer, bitiş zamanı) döndür; yoksa (MISS, None)"""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: int) -> bool:
+        """Değeri `ttl` saniyeliğine yaz"""
+
+    @abstractmethod
+    def add(self, key: str, value: Any, ttl: int) -> bool:
+        """Anahtar yoksa (ya da süresi dolmuşsa) yaz; yazıldıysa True (kilitler için)"""
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """Anahtarı sil"""
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> int:
+        """Öneki eşleşen anahtarları sil; silinen sayısını döndür"""
+
+    @abstractmethod
+    def clear(self) -> bool:
+        """Tüm anahtarları sil"""
+
+    @abstractmethod
+    def keys(self, pattern: str = '*') -> List[str]:
+        """Kalıba uyan anahtarlar"""
+
+    def get_many(self, keys: List[str]) -> Dict[str, Tuple[Any, Optional[float]]]:
+        """Bulunan anahtarlar için {anahtar: (değer, bitiş zamanı)}"""
+        found = {}
+        for key in keys:
+            value, expires_at = self.get(key)
+            if value is not MISS:
+                found[key] = (value, expires_at)
+        return found
+
+    def set_many(self, items: Dict[str, Any], ttl: int) -> bool:
+        for key, value in items.items():
+            self.set(key, value, ttl)
+        return True
+
+    def delete_many(self, keys: List[str]) -> bool:
+        for key in keys:
+            self.delete(key)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'driver': self.name,
+            'hits': self.hits,
+            'misses': self.misses,
+            'sets': self.sets,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+
+class LRUCacheStore(CacheStore):
+    """
+    Sınırlı, TTL destekli süreç içi LRU
+
+    OrderedDict üzerinde erişimde move_to_end, taşmada popitem(last=False)
+    ile O(1) çıkarma yapılır. Süresi dolan kayıtlar okunurken temizlenir.
+    """
+
+    name = 'lru'
+
+    def __init__(self, max_items: int = 1000):
+        super().__init__()
+        self.max_items = max_items
+        self._data: 'OrderedDict[str, Tuple[Any, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Tuple[Any, Optional[float]]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISS, None
+
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return MISS, None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value, expires_at
+
+    def set(self, key: str, value: Any, ttl: int, expires_at: float = None) -> bool:
+        with self._lock:
+            self._data[key] = (value, expires_at or time.time() + ttl)
+            self._data.move_to_end(key)
+            self.sets += 1
+            while len(self._data) > self.max_items:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return True
+
+    def add(self, key: str, value: Any, ttl: int) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[1] > time.time():
+                return False
+        return self.set(key, value, ttl)
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            self._data.pop(key, None)
+        return True
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            matched = [key for key in self._data if key.startswith(prefix)]
+            for key in matched:
+                del self._data[key]
+        return len(matched)
+
+    def clear(self) -> bool:
+        with self._lock:
+            self._data.clear()
+        return True
+
+    def keys(self, pattern: str = '*') -> List[str]:
+        now = time.time()
+        with self._lock:
+            return [key for key, (_, expires_at) in self._data.items()
+                    if expires_at > now and fnmatch.fnmatchcase(key, pattern)]
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = super().get_stats()
+        stats.update({'items': len(self._data), 'max_items': self.max_items})
+        return stats
+
+
+class FileCacheStore(CacheStore):
+    """Anahtar başına bir pickle dosyası (eski 'file' sürücüsü ile aynı format)"""
+
+    name = 'file'
+
+    # Temizleme işareti bu süreden eskiyse (temizleyen süreç çökmüş) kaldırılır
+    REAP_TIMEOUT = 30
+
+    def __init__(self, cache_dir: str = 'storage/Cache'):
+        super().__init__()
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.cache")
+
+    @staticmethod
+    def _read(path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def _remove_expired(self, key: str) -> bool:
+        """
+        Süresi dolmuş kaydı sil
+
+        Temizleyenler '.reap' işaret dosyasıyla (O_EXCL) sıraya girer ve
+        dosya işaret alındıktan sonra yeniden okunur; böylece başka sürecin
+        arada oluşturduğu taze kayıt (örn. kilit) silinmez.
+        """
+        path = self._path(key)
+        marker = f"{path}.reap"
+        try:
+            fd = os.open(marker, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(marker) > self.REAP_TIMEOUT:
+                    os.remove(marker)
+            except OSError:
+                pass
+            return False
+        os.close(fd)
+
+        try:
+            cache_data = self._read(path)
+            if cache_data is not None and cache_data['expires_at'].timestamp() > time.time():
+                return False
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            return True
+        finally:
+            try:
+                os.remove(marker)
+            except FileNotFoundError:
+                pass
+
+    def get(self, key: str) -> Tuple[Any, Optional[float]]:
+        cache_data = self._read(self._path(key))
+        if cache_data is None:
+            self.misses += 1
+            return MISS, None
+
+        expires_at = cache_data['expires_at'].timestamp()
+        if expires_at <= time.time():
+            self._remove_expired(key)
+            self.expirations += 1
+            self.misses += 1
+            return MISS, None
+
+        self.hits += 1
+        return cache_data['value'], expires_at
+
+    def set(self, key: str, value: Any, ttl: int) -> bool:
+        now = time.time()
+        cache_data = {
+            'value': value,
+            'expires_at': datetime.fromtimestamp(now + ttl),
+            'created_at': datetime.fromtimestamp(now)
+        }
+        # Yarım yazılmış dosya okunmasın diye geçici dosya + rename
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'wb') as f:
+            pickle.dump(cache_data, f)
+        os.replace(temp_path, path)
+        self.sets += 1
+        return True
+
+    def add(self, key: str, value: Any, ttl: int) -> bool:
+        path = self._path(key)
+        for _ in range(2):
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                # Süresi dolmuş kayıt kilidi bloklamasın; taze kayda dokunulmaz
+                if self.get(key)[0] is not MISS:
+                    return False
+                continue
+            now = time.time()
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump({
+                    'value': value,
+                    'expires_at': datetime.fromtimestamp(now + ttl),
+                    'created_at': datetime.fromtimestamp(now)
+                }, f)
+            self.sets += 1
+            return True
+        return False
+
+    def delete(self, key: str) -> bool:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+        return True
+
+    def delete_prefix(self, prefix: str) -> int:
+        removed = 0
+        for filename in os.listdir(self.cache_dir):
+            if filename.startswith(prefix) and filename.endswith('.cache'):
+                try:
+                    os.remove(os.path.join(self.cache_dir, filename))
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+        return removed
+
+    def clear(self) -> bool:
+        self.delete_prefix('')
+        return True
+
+    def keys(self, pattern: str = '*') -> List[str]:
+        return [filename[:-len('.cache')] for filename in os.listdir(self.cache_dir)
+                if filename.endswith('.cache') and fnmatch.fnmatchcase(filename[:-len('.cache')], pattern)]
+
+
+class SQLiteCacheStore(CacheStore):
+    """
+    Tek sunuculu kurulumlar için SQLite tabanlı paylaşılan cache
+
+    Aynı dosyayı kullanan tüm süreçler (gunicorn worker'ları) aynı cache'i
+    görür. WAL modunda okumalar yazmaları beklemez; süresi dolan kayıtlar
+    okunurken ve `purge_expired()` ile temizlenir.
+    """
+
+    name = 'sqlite'
+
+    def __init__(self, path: str = 'storage/Cache/cache.db', busy_timeout: int = 5000):
+        super().__init__()
+        self.path = path
+        self.busy_timeout = busy_timeout
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        self._pid = os.getpid()
+
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_entries_expires ON cache_entries (expires_at)")
+        conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Thread (ve süreç) başına bağlantı"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout / 1000, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout)}")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Tuple[Any, Optional[float]]:
+        row = self._connection().execute(
+            "SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return MISS, None
+
+        if row[1] <= time.time():
+            self.delete(key)
+            self.expirations += 1
+            self.misses += 1
+            return MISS, None
+
+        self.hits += 1
+        return pickle.loads(row[0]), row[1]
+
+    def set(self, key: str, value: Any, ttl: int) -> bool:
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, sqlite3.Binary(pickle.dumps(value, pickle.HIGHEST_PROTOCOL)), time.time() + ttl)
+        )
+        conn.commit()
+        self.sets += 1
+        return True
+
+    def add(self, key: str, value: Any, ttl: int) -> bool:
+        conn = self._connection()
+        now = time.time()
+        cursor = conn.execute(
+            "INSERT INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at "
+            "WHERE cache_entries.expires_at <= ?",
+            (key, sqlite3.Binary(pickle.dumps(value, pickle.HIGHEST_PROTOCOL)), now + ttl, now)
+        )
+        conn.commit()
+        if cursor.rowcount:
+            self.sets += 1
+        return cursor.rowcount > 0
+
+    def delete(self, key: str) -> bool:
+        conn = self._connection()
+        conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+        conn.commit()
+        return True
+
+    def delete_prefix(self, prefix: str) -> int:
+        conn = self._connection()
+        escaped = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        cursor = conn.execute("DELETE FROM cache_entries WHERE key LIKE ? ESCAPE '\\'", (f"{escaped}%",))
+        conn.commit()
+        return cursor.rowcount
+
+    def get_many(self, keys: List[str]) -> Dict[str, Tuple[Any, Optional[float]]]:
+        found = {}
+        now = time.time()
+        conn = self._connection()
+        keys = list(keys)
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            rows = conn.execute(
+                f"SELECT key, value, expires_at FROM cache_entries WHERE key IN ({', '.join('?' * len(chunk))})",
+                chunk
+            ).fetchall()
+            for key, raw, expires_at in rows:
+                if expires_at > now:
+                    found[key] = (pickle.loads(raw), expires_at)
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def set_many(self, items: Dict[str, Any], ttl: int) -> bool:
+        expires_at = time.time() + ttl
+        conn = self._connection()
+        conn.executemany(
+            "INSERT OR REPLACE INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?)",
+            [(key, sqlite3.Binary(pickle.dumps(value, pickle.HIGHEST_PROTOCOL)), expires_at)
+             for key, value in items.items()]
+        )
+        conn.commit()
+        self.sets += len(items)
+        return True
+
+    def delete_many(self, keys: List[str]) -> bool:
+        conn = self._connection()
+        conn.executemany("DELETE FROM cache_entries WHERE key = ?", [(key,) for key in keys])
+        conn.commit()
+        return True
+
+    def purge_expired(self) -> int:
+        """Süresi dolmuş kayıtları sil"""
+        conn = self._connection()
+        cursor = conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),))
+        conn.commit()
+        self.expirations += cursor.rowcount
+        return cursor.rowcount
+
+    def clear(self) -> bool:
+        conn = self._connection()
+        conn.execute("DELETE FROM cache_entries")
+        conn.commit()
+        return True
+
+    def keys(self, pattern: str = '*') -> List[str]:
+        rows = self._connection().execute(
+            "SELECT key FROM cache_entries WHERE key GLOB ? AND expires_at > ?", (pattern, time.time())
+        ).fetchall()
+        return [row[0] for row in rows]
+
+
+class RedisCacheStore(CacheStore):
+    """Redis (ve Redis protokolü konuşan sunucular: KeyDB, Dragonfly) arka ucu"""
+
+    name = 'redis'
+
+    def __init__(self, url: str = 'redis://localhost:6379/0', client=None):
+        super().__init__()
+        if client is None:
+            if not REDIS_AVAILABLE:
+                raise RuntimeError("redis paketi yüklü değil")
+            client = redis.from_url(url)
+        self.client = client
+
+    def get(self, key: str) -> Tuple[Any, Optional[float]]:
+        pipe = self.client.pipeline()
+        pipe.get(key)
+        pipe.pttl(key)
+        raw, pttl = pipe.execute()
+        if raw is None:
+            self.misses += 1
+            return MISS, None
+
+        self.hits += 1
+        expires_at = time.time() + pttl / 1000 if pttl and pttl > 0 else None
+        return pickle.loads(raw), expires_at
+
+    def set(self, key: str, value: Any, ttl: int) -> bool:
+        self.client.set(key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), ex=max(int(ttl), 1))
+        self.sets += 1
+        return True
+
+    def add(self, key: str, value: Any, ttl: int) -> bool:
+        added = self.client.set(key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), ex=max(int(ttl), 1), nx=True)
+        if added:
+            self.sets += 1
+        return bool(added)
+
+    def delete(self, key: str) -> bool:
+        self.client.delete(key)
+        return True
+
+    def delete_prefix(self, prefix: str) -> int:
+        removed = 0
+        batch = []
+        for key in self.client.scan_iter(match=f"{prefix}*", count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                removed += self.client.delete(*batch)
+                batch = []
+        if batch:
+            removed += self.client.delete(*batch)
+        return removed
+
+    def clear(self) -> bool:
+        """Seçili Redis veritabanını tamamen boşalt (CacheService önek bazlı siler)"""
+        self.client.flushdb()
+        return True
+
+    def keys(self, pattern: str = '*') -> List[str]:
+        return [key.decode() if isinstance(key, bytes) else key
+                for key in self.client.scan_iter(match=pattern, count=500)]
+
+    def get_many(self, keys: List[str]) -> Dict[str, Tuple[Any, Optional[float]]]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        pipe = self.client.pipeline()
+        pipe.mget(keys)
+        for key in keys:
+            pipe.pttl(key)
+        results = pipe.execute()
+        now = time.time()
+
+        found = {}
+        for key, raw, pttl in zip(keys, results[0], results[1:]):
+            if raw is not None:
+                found[key] = (pickle.loads(raw), now + pttl / 1000 if pttl and pttl > 0 else None)
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def set_many(self, items: Dict[str, Any], ttl: int) -> bool:
+        pipe = self.client.pipeline()
+        for key, value in items.items():
+            pipe.set(key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), ex=max(int(ttl), 1))
+        pipe.execute()
+        self.sets += len(items)
+        return True
+
+    def delete_many(self, keys: List[str]) -> bool:
+        keys = list(keys)
+        if keys:
+            self.client.delete(*keys)
+        return True
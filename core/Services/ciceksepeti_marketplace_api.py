@@ -4,7 +4,6 @@ Bu modül Çiçeksepeti'nin resmi API'sini kullanır.
 API Dokümantasyonu: https://api.ciceksepeti.com/
 """
 
-import requests
 import json
 import hashlib
 import hmac
@@ -14,6 +13,8 @@ from typing import Dict, List, Optional, Any
 import logging
 from urllib.parse import urlencode
 
+from .http_transport import TransportError, get_http_transport
+
 class CiceksepetiMarketplaceAPI:
     """Çiçeksepeti Marketplace API Client"""
     
@@ -35,7 +36,7 @@ class CiceksepetiMarketplaceAPI:
         else:
             self.base_url = "https://api.ciceksepeti.com/v1"
             
-        self.session = requests.Session()
+        self.session = get_http_transport().session('ciceksepeti')
         self.session.headers.update({
             'Content-Type': 'application/json',
             'User-Agent': 'Ciceksepeti-Python-Client/1.0'
@@ -100,7 +101,7 @@ class CiceksepetiMarketplaceAPI:
             else:
                 return {"success": True}
             
-        except requests.exceptions.RequestException as e:
+        except TransportError as e:
             self.logger.error(f"Çiçeksepeti API request failed: {e}")
             if hasattr(e, 'response') and e.response:
                 self.logger.error(f"Response: {e.response.text}")
@@ -0,0 +1,623 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PofuAi Delta Sync
+================
+
+Pazaryerleri ile artımlı (delta) senkronizasyon
+- Platform başına kalıcı watermark: yalnızca son senkrondan sonra değişen siparişler çekilir
+- Örtüşme penceresindeki siparişler daha önce işlendiyse tekrar verilmez
+- Stok/fiyat yerel snapshot ile karşılaştırılır; yalnızca değişen SKU'lar toplu endpoint'lere gönderilir
+- Snapshot'a yalnızca platforma gerçekten gönderilen ve platformca onaylanan alanlar yazılır
+- Marketplace client'ları (iter_orders / update_stock_price) ve BaseEnterpriseIntegration desteklenir
+"""
+
+import asyncio
+import inspect
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.Config.config import get_config
+
+from .marketplace_results import is_success, status_text
+
+ORDER_TIMESTAMP_KEYS = ('updated_at', 'order_date', 'lastModifiedDate', 'lastStatusUpdateDate',
+                        'updatedAt', 'orderDate', 'createDate')
+ORDER_KEY_KEYS = ('order_number', 'orderNumber', 'id')
+STOCK_FIELDS = ('quantity', 'price', 'list_price')
+# STOCK_PRICE_FIELDS bildirmeyen hedeflerin (BaseEnterpriseIntegration) gönderdiği alanlar
+DEFAULT_SENT_FIELDS = ('quantity', 'price')
+
+DATE_FORMATS = ('%d/%m/%Y %H:%M:%S', '%d/%m/%Y %H:%M', '%d/%m/%Y', '%d.%m.%Y %H:%M:%S', '%d.%m.%Y')
+
+
+def to_timestamp(value: Any) -> Optional[float]:
+    """Epoch (saniye/milisaniye), ISO ya da gg/aa/yyyy tarihini epoch saniyeye çevir"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, dict):
+        return to_timestamp(value.get('text'))
+    if isinstance(value, (int, float)) or (isinstance(value, str) and value.strip().isdigit()):
+        number = float(value)
+        return number / 1000.0 if number > 1e11 else number
+
+    text = str(value).strip()
+    try:
+        return datetime.fromisoformat(text.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        pass
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, date_format).timestamp()
+        except ValueError:
+            continue
+    return None
+
+
+def _first(record: Dict, keys: Iterable[str]) -> Any:
+    for key in keys:
+        value = record.get(key)
+        if value not in (None, ''):
+            return value
+    return None
+
+
+def order_key(order: Dict) -> Optional[str]:
+    """Siparişin (paket bazında) tekil anahtarı"""
+    number = _first(order, ORDER_KEY_KEYS)
+    if isinstance(number, dict):
+        number = number.get('text')
+    package = order.get('package_id')
+    if number is None:
+        return None
+    return f"{number}:{package}" if package not in (None, '') and package != number else str(number)
+
+
+def canonical_stock(item: Dict) -> Optional[Dict]:
+    """Farklı formatlardaki stok/fiyat kaydını {sku, barcode, quantity, price, list_price} yap"""
+    sku = _first(item, ('sku', 'stockCode', 'stock_code', 'merchantSku', 'barcode'))
+    if sku is None:
+        return None
+    price = _first(item, ('price', 'salePrice', 'sale_price'))
+    list_price = _first(item, ('list_price', 'listPrice'))
+    quantity = _first(item, ('quantity', 'stock', 'availableStock'))
+    return {
+        'sku': str(sku),
+        'barcode': item.get('barcode') or str(sku),
+        'quantity': int(quantity) if quantity is not None else None,
+        'price': float(price) if price is not None else None,
+        'list_price': float(list_price) if list_price is not None else None
+    }
+
+
+class SyncStateStore:
+    """
+    Watermark, işlenmiş sipariş ve stok/fiyat snapshot'larının kalıcı deposu
+
+    SQLite (WAL) dosyası; thread başına bağlantı kullanılır.
+    """
+
+    def __init__(self, path: str = None, busy_timeout: int = 5000):
+        path = path or os.path.join('storage', 'cache', 'sync_state.db')
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.database = path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._pid = os.getpid()
+
+        self._connection().executescript("""
+            CREATE TABLE IF NOT EXISTS sync_watermarks (
+                platform TEXT NOT NULL,
+                stream TEXT NOT NULL,
+                value REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (platform, stream)
+            );
+            CREATE TABLE IF NOT EXISTS sync_seen_orders (
+                platform TEXT NOT NULL,
+                order_key TEXT NOT NULL,
+                changed_at REAL NOT NULL,
+                PRIMARY KEY (platform, order_key)
+            );
+            CREATE INDEX IF NOT EXISTS idx_sync_seen_orders_changed
+                ON sync_seen_orders (platform, changed_at);
+            CREATE TABLE IF NOT EXISTS sync_stock_snapshots (
+                platform TEXT NOT NULL,
+                sku TEXT NOT NULL,
+                quantity INTEGER,
+                price REAL,
+                list_price REAL,
+                synced_at REAL NOT NULL,
+                PRIMARY KEY (platform, sku)
+            );
+        """)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            conn = sqlite3.connect(self.database, timeout=self.busy_timeout / 1000,
+                                   isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _write(self, sql: str, rows: List[tuple]):
+        if not rows:
+            return
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(sql, rows)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    # Watermark
+
+    def get_watermark(self, platform: str, stream: str) -> Optional[float]:
+        row = self._connection().execute(
+            "SELECT value FROM sync_watermarks WHERE platform = ? AND stream = ?", (platform, stream)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_watermark(self, platform: str, stream: str, value: float):
+        self._write(
+            "INSERT OR REPLACE INTO sync_watermarks (platform, stream, value, updated_at) VALUES (?, ?, ?, ?)",
+            [(platform, stream, value, time.time())]
+        )
+
+    # İşlenmiş siparişler
+
+    def seen_orders(self, platform: str, keys: List[str]) -> Dict[str, float]:
+        seen = {}
+        conn = self._connection()
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            for key, changed_at in conn.execute(
+                f"SELECT order_key, changed_at FROM sync_seen_orders "
+                f"WHERE platform = ? AND order_key IN ({placeholders})", [platform, *chunk]
+            ):
+                seen[key] = changed_at
+        return seen
+
+    def mark_orders(self, platform: str, orders: List[Tuple[str, float]]):
+        self._write(
+            "INSERT OR REPLACE INTO sync_seen_orders (platform, order_key, changed_at) VALUES (?, ?, ?)",
+            [(platform, key, changed_at) for key, changed_at in orders]
+        )
+
+    def prune_orders(self, platform: str, before: float) -> int:
+        cursor = self._connection().execute(
+            "DELETE FROM sync_seen_orders WHERE platform = ? AND changed_at < ?", (platform, before)
+        )
+        return cursor.rowcount
+
+    # Stok / fiyat snapshot
+
+    def get_snapshot(self, platform: str, skus: List[str]) -> Dict[str, Tuple]:
+        snapshot = {}
+        conn = self._connection()
+        for start in range(0, len(skus), 500):
+            chunk = skus[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            for sku, quantity, price, list_price in conn.execute(
+                f"SELECT sku, quantity, price, list_price FROM sync_stock_snapshots "
+                f"WHERE platform = ? AND sku IN ({placeholders})", [platform, *chunk]
+            ):
+                snapshot[sku] = (quantity, price, list_price)
+        return snapshot
+
+    def update_snapshot(self, platform: str, records: List[Dict]):
+        now = time.time()
+        self._write(
+            "INSERT OR REPLACE INTO sync_stock_snapshots (platform, sku, quantity, price, list_price, synced_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(platform, record['sku'], record['quantity'], record['price'], record['list_price'], now)
+             for record in records]
+        )
+
+    def reset(self, platform: str):
+        """Platformun tüm senkron durumunu sil (sonraki senkron tam yapılır)"""
+        conn = self._connection()
+        for table in ('sync_watermarks', 'sync_seen_orders', 'sync_stock_snapshots'):
+            conn.execute(f"DELETE FROM {table} WHERE platform = ?", (platform,))
+
+
+class DeltaSyncEngine:
+    """
+    Watermark ve snapshot tabanlı artımlı senkronizasyon
+
+    Siparişler: [watermark - overlap, şimdi] aralığı çekilir; aralık tamamen
+    işlendiğinde watermark "şimdi"ye ilerler. Hata olursa watermark
+    değişmez ve sonraki senkron aynı aralığı yeniden dener.
+
+    Stok/fiyat: istenen durum son gönderilen (ya da platformdan okunan)
+    snapshot ile karşılaştırılır; yalnızca farklı SKU'lar platformun toplu
+    endpoint'ine parçalar halinde gönderilir ve başarılı parçalar snapshot'a yazılır.
+    Yalnızca hedefin gönderdiği alanlar (STOCK_PRICE_FIELDS) karşılaştırılır
+    ve snapshot'a yazılır. Asenkron toplu işlemlerde (Trendyol batchRequestId)
+    SKU'lar işlem sonucu onaylanana kadar senkronlanmış sayılmaz.
+    """
+
+    ORDERS = 'orders'
+    LISTINGS = 'listings'
+
+    def __init__(self, config: Dict[str, Any] = None, store: SyncStateStore = None):
+        config = config or {}
+        self.overlap = config.get('overlap', 300)
+        self.initial_lookback = config.get('initial_lookback_days', 30) * 86400
+        self.page_size = config.get('page_size', 100)
+        self.default_batch_size = config.get('default_batch_size', 100)
+        self.batch_sizes: Dict[str, int] = config.get('batch_size', {})
+        self.concurrency: Dict[str, int] = config.get('concurrency', {})
+        self.default_concurrency = config.get('default_concurrency', 4)
+        self.batch_confirm_timeout = config.get('batch_confirm_timeout', 30)
+        self.batch_poll_interval = config.get('batch_poll_interval', 2)
+        self.store = store or SyncStateStore(config.get('state_path'))
+
+    @staticmethod
+    def _format_date(source: Any, timestamp: float) -> Any:
+        formatter = getattr(source, 'format_date', None)
+        # Enterprise entegrasyonlar Trendyol gibi milisaniye epoch kabul eder
+        return formatter(timestamp) if formatter else int(timestamp * 1000)
+
+    # Siparişler
+
+    async def _fetch_orders(self, source: Any, start_date: Any, end_date: Any) -> AsyncIterator[Dict]:
+        if hasattr(source, 'iter_orders'):
+            async for order in source.iter_orders(start_date=start_date, end_date=end_date):
+                yield order
+            return
+
+        # BaseEnterpriseIntegration: sayfa başına get_orders
+        page = 0
+        while True:
+            orders = await source.get_orders(start_date=start_date, end_date=end_date, page=page,
+                                             size=self.page_size, offset=page * self.page_size,
+                                             limit=self.page_size)
+            for order in orders or []:
+                yield order
+            if not orders or len(orders) < self.page_size:
+                return
+            page += 1
+
+    async def iter_order_changes(self, platform: str, source: Any) -> AsyncIterator[Dict]:
+        """
+        Son senkrondan bu yana değişen siparişler
+
+        Tüketici kaydı işleyip bir sonrakini istediğinde kayıt "işlendi"
+        sayılır. Watermark yalnızca iterator sonuna kadar tüketilirse ilerler.
+        """
+        now = time.time()
+        watermark = self.store.get_watermark(platform, self.ORDERS)
+        since = (watermark - self.overlap) if watermark is not None else now - self.initial_lookback
+
+        processed: List[Tuple[str, float]] = []
+        page: List[Tuple[Dict, Optional[str], Optional[float]]] = []
+
+        async def flush_page():
+            keys = [key for _, key, _ in page if key is not None]
+            seen = self.store.seen_orders(platform, keys) if keys else {}
+            try:
+                for order, key, changed_at in page:
+                    # Değişiklik zamanı bilinmeyen sipariş daha önce işlendiyse değişmemiş sayılır
+                    if key is not None and key in seen and (changed_at is None or changed_at <= seen[key]):
+                        continue
+                    yield order
+                    if key is not None:
+                        processed.append((key, changed_at if changed_at is not None else now))
+            finally:
+                page.clear()
+                # Tüketici yarıda bıraksa da işlenenler bir sonraki senkronda tekrar verilmez
+                self.store.mark_orders(platform, processed)
+                processed.clear()
+
+        async for order in self._fetch_orders(source, self._format_date(source, since),
+                                              self._format_date(source, now)):
+            changed_at = to_timestamp(_first(order, ORDER_TIMESTAMP_KEYS))
+            page.append((order, order_key(order), changed_at))
+            if len(page) >= self.page_size:
+                async for changed in flush_page():
+                    yield changed
+        async for changed in flush_page():
+            yield changed
+
+        self.store.set_watermark(platform, self.ORDERS, now)
+        # Gün hassasiyetli tarih filtreleri (örn. N11) pencereyi gün başına genişletir
+        self.store.prune_orders(platform, since - max(self.overlap, 86400))
+
+    async def pull_orders(self, platform: str, source: Any,
+                          handler: Callable[[Dict], Any] = None) -> Dict[str, Any]:
+        """
+        Değişen siparişleri çekip `handler` ile işle
+
+        Returns:
+            {'success', 'platform', 'changed', 'since', 'watermark'} ya da hata
+        """
+        since = self.store.get_watermark(platform, self.ORDERS)
+        changed = 0
+        try:
+            async for order in self.iter_order_changes(platform, source):
+                if handler is not None:
+                    result = handler(order)
+                    if inspect.isawaitable(result):
+                        await result
+                changed += 1
+        except Exception as e:
+            return {'success': False, 'platform': platform, 'changed': changed, 'error': str(e)}
+        return {
+            'success': True,
+            'platform': platform,
+            'changed': changed,
+            'since': since,
+            'watermark': self.store.get_watermark(platform, self.ORDERS)
+        }
+
+    # Listeler
+
+    async def iter_listing_changes(self, platform: str, source: Any) -> AsyncIterator[Dict]:
+        """
+        Platformdaki stok/fiyatı snapshot'tan farklı olan listeler (marketplace client'ları)
+
+        Snapshot platformun gerçek durumuyla güncellenir; böylece panelden
+        yapılan değişiklikler bir sonraki push'ta yeniden gönderilmez ya da
+        gerektiğinde düzeltilir. Yalnızca platforma gönderilen alanlar
+        karşılaştırılır. Client değişiklik tarihi filtresini destekliyorsa
+        (start_date) yalnızca son senkrondan sonra değişenler çekilir.
+        """
+        now = time.time()
+        fields = self.sent_fields(source)
+        watermark = self.store.get_watermark(platform, self.LISTINGS)
+        kwargs = {}
+        if watermark is not None and 'start_date' in inspect.signature(source.iter_products).parameters:
+            kwargs['start_date'] = self._format_date(source, watermark - self.overlap)
+
+        batch: List[Tuple[Dict, Dict]] = []
+
+        def changed_records():
+            snapshot = self.store.get_snapshot(platform, [record['sku'] for _, record in batch])
+            changed = [
+                (product, record) for product, record in batch
+                if snapshot.get(record['sku']) != (record['quantity'], record['price'], record['list_price'])
+            ]
+            self.store.update_snapshot(platform, [record for _, record in changed])
+            batch.clear()
+            return changed
+
+        async for product in source.iter_products(**kwargs):
+            record = canonical_stock({
+                'sku': product.get('sku'),
+                'barcode': product.get('barcode'),
+                'quantity': product.get('quantity'),
+                'price': product.get('sale_price'),
+                'list_price': product.get('list_price')
+            })
+            if record is None:
+                continue
+            for field in STOCK_FIELDS:
+                if field not in fields:
+                    record[field] = None
+            batch.append((product, record))
+            if len(batch) >= self.page_size:
+                for changed, _ in changed_records():
+                    yield changed
+        for changed, _ in changed_records():
+            yield changed
+
+        self.store.set_watermark(platform, self.LISTINGS, now)
+
+    async def pull_listings(self, platform: str, source: Any,
+                            handler: Callable[[Dict], Any] = None) -> Dict[str, Any]:
+        """
+        Platformda değişen listeleri çekip `handler` ile işle
+
+        Returns:
+            {'success', 'platform', 'changed', 'since', 'watermark'} ya da hata
+        """
+        since = self.store.get_watermark(platform, self.LISTINGS)
+        changed = 0
+        try:
+            async for product in self.iter_listing_changes(platform, source):
+                if handler is not None:
+                    result = handler(product)
+                    if inspect.isawaitable(result):
+                        await result
+                changed += 1
+        except Exception as e:
+            return {'success': False, 'platform': platform, 'changed': changed, 'error': str(e)}
+        return {
+            'success': True,
+            'platform': platform,
+            'changed': changed,
+            'since': since,
+            'watermark': self.store.get_watermark(platform, self.LISTINGS)
+        }
+
+    # Stok / fiyat
+
+    @staticmethod
+    def sent_fields(target: Any) -> Tuple[str, ...]:
+        """Hedefin platforma gönderdiği stok/fiyat alanları"""
+        return tuple(getattr(target, 'STOCK_PRICE_FIELDS', DEFAULT_SENT_FIELDS))
+
+    def diff_stock(self, platform: str, items: Iterable[Dict],
+                   fields: Iterable[str] = STOCK_FIELDS) -> List[Dict]:
+        """
+        Snapshot'tan farklı (ya da hiç gönderilmemiş) stok/fiyat kayıtları
+
+        `fields` dışındaki alanlar gönderilmediği için karşılaştırılmaz;
+        kayıtta snapshot'taki değerleriyle (yoksa None) yer alır.
+        """
+        fields = tuple(fields)
+        records = {}
+        for item in items:
+            record = canonical_stock(item)
+            if record is None:
+                continue
+            for field in STOCK_FIELDS:
+                if field not in fields:
+                    record[field] = None
+            if any(record[field] is not None for field in fields):
+                records[record['sku']] = record
+        snapshot = self.store.get_snapshot(platform, list(records))
+
+        changed = []
+        for sku, record in records.items():
+            previous = snapshot.get(sku)
+            if previous is None:
+                changed.append(record)
+                continue
+            # Gönderilmeyen alan (None) önceki değeri korur
+            merged = {
+                'quantity': record['quantity'] if record['quantity'] is not None else previous[0],
+                'price': record['price'] if record['price'] is not None else previous[1],
+                'list_price': record['list_price'] if record['list_price'] is not None else previous[2]
+            }
+            if (merged['quantity'], merged['price'], merged['list_price']) != previous:
+                changed.append({**record, **merged})
+        return changed
+
+    async def _send_batch(self, target: Any, records: List[Dict], semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """Bir parçayı toplu endpoint'e gönder; SKU -> sonuç"""
+        loop = asyncio.get_running_loop()
+        formatter = getattr(target, 'stock_price_item', None)
+        payload = [formatter(record) for record in records] if formatter else records
+        async with semaphore:
+            result = await loop.run_in_executor(None, target.update_stock_price, payload)
+        batch_id = result.get('batchRequestId') if isinstance(result, dict) else None
+        if batch_id and is_success(result) and hasattr(target, 'check_batch_request_result'):
+            return await self._confirm_batch(target, batch_id, records)
+        return {record['sku']: result for record in records}
+
+    async def _confirm_batch(self, target: Any, batch_id: str, records: List[Dict]) -> Dict[str, Any]:
+        """
+        Asenkron toplu işlemin (Trendyol batchRequestId) sonucunu bekle; SKU -> sonuç
+
+        İşlem `batch_confirm_timeout` içinde tamamlanmazsa SKU'lar
+        {'success': False, 'pending': True} döner ve snapshot'a yazılmaz;
+        bir sonraki push aynı değerleri yeniden gönderir.
+        """
+        loop = asyncio.get_running_loop()
+        expires_at = time.monotonic() + self.batch_confirm_timeout
+        while True:
+            status = await loop.run_in_executor(None, target.check_batch_request_result, batch_id)
+            if isinstance(status, dict) and status.get('success') is not False \
+                    and status_text(status.get('status')) not in (None, 'IN_PROGRESS', 'PENDING'):
+                break
+            if time.monotonic() >= expires_at:
+                pending = {'success': False, 'pending': True, 'batchRequestId': batch_id,
+                           'error': 'batch result not confirmed'}
+                return {record['sku']: pending for record in records}
+            await asyncio.sleep(self.batch_poll_interval)
+
+        items = {}
+        for item in status.get('items') or []:
+            barcode = (item.get('requestItem') or {}).get('barcode')
+            if barcode is not None:
+                items[str(barcode)] = item
+
+        results = {}
+        for record in records:
+            item = items.get(record['barcode'])
+            if item is None:
+                results[record['sku']] = {'success': False, 'batchRequestId': batch_id,
+                                          'error': 'missing from batch result'}
+            elif status_text(item.get('status')) == 'SUCCESS':
+                results[record['sku']] = {'success': True, 'batchRequestId': batch_id}
+            else:
+                reasons = item.get('failureReasons') or [item.get('status')]
+                results[record['sku']] = {'success': False, 'batchRequestId': batch_id,
+                                          'error': '; '.join(str(reason) for reason in reasons)}
+        return results
+
+    async def _send_each(self, target: Any, records: List[Dict], concurrency: int) -> Dict[str, Any]:
+        """Toplu endpoint'i olmayan platformlara SKU başına sınırlı eşzamanlı gönderim"""
+        semaphore = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_running_loop()
+
+        async def send(record: Dict):
+            async with semaphore:
+                try:
+                    if hasattr(target, 'update_stock_by_stock_code'):
+                        return await loop.run_in_executor(
+                            None, target.update_stock_by_stock_code, record['sku'], record['quantity']
+                        )
+                    # BaseEnterpriseIntegration
+                    results = []
+                    if record['quantity'] is not None:
+                        results.append(await target.update_stock(record['sku'], record['quantity']))
+                    if record['price'] is not None:
+                        results.append(await target.update_price(record['sku'], record['price']))
+                    return all(is_success(result) for result in results)
+                except Exception as e:
+                    return {'success': False, 'error': str(e)}
+
+        results = await asyncio.gather(*(send(record) for record in records))
+        return {record['sku']: result for record, result in zip(records, results)}
+
+    async def push_stock(self, platform: str, target: Any, items: Iterable[Dict]) -> Dict[str, Any]:
+        """
+        Yalnızca değişen stok/fiyatları platforma gönder
+
+        Returns:
+            {'success', 'platform', 'total', 'changed', 'sent', 'failed': [sku], 'results': {sku: sonuç}}
+        """
+        items = list(items)
+        changed = self.diff_stock(platform, items, self.sent_fields(target))
+        results: Dict[str, Any] = {}
+        concurrency = self.concurrency.get(platform, self.default_concurrency)
+
+        if changed:
+            if hasattr(target, 'update_stock_price'):
+                batch_size = self.batch_sizes.get(platform, self.default_batch_size)
+                batches = [changed[start:start + batch_size] for start in range(0, len(changed), batch_size)]
+                semaphore = asyncio.Semaphore(concurrency)
+                for batch_results in await asyncio.gather(
+                    *(self._send_batch(target, batch, semaphore) for batch in batches), return_exceptions=True
+                ):
+                    if isinstance(batch_results, Exception):
+                        continue
+                    results.update(batch_results)
+                for record in changed:
+                    results.setdefault(record['sku'], {'success': False, 'error': 'batch failed'})
+            else:
+                results = await self._send_each(target, changed, concurrency)
+
+            self.store.update_snapshot(
+                platform, [record for record in changed if is_success(results.get(record['sku']))]
+            )
+
+        failed = [sku for sku, result in results.items() if not is_success(result)]
+        return {
+            'success': not failed,
+            'platform': platform,
+            'total': len(items),
+            'changed': len(changed),
+            'sent': len(changed) - len(failed),
+            'failed': failed,
+            'results': results
+        }
+
+
+_delta_sync_engine = None
+_delta_sync_engine_lock = threading.Lock()
+
+
+def get_delta_sync_engine() -> DeltaSyncEngine:
+    """Global delta sync motorunu al"""
+    global _delta_sync_engine
+    if _delta_sync_engine is None:
+        with _delta_sync_engine_lock:
+            if _delta_sync_engine is None:
+                _delta_sync_engine = DeltaSyncEngine(get_config('marketplace_sync', {}) or {})
+    return _delta_sync_engine
@@ -4,7 +4,6 @@ Bu modül eBay'in resmi Trading ve Inventory API'lerini kullanır.
 API Dokümantasyonu: https://developer.ebay.com/
 """
 
-import requests
 import json
 import base64
 import hashlib
@@ -16,6 +15,8 @@ from urllib.parse import urlencode, quote
 import xml.etree.ElementTree as ET
 from xml.dom import minidom
 
+from .http_transport import TransportError, get_http_transport
+
 class EbayMarketplaceAPI:
     """eBay Marketplace API Client"""
     
@@ -64,7 +65,7 @@ class EbayMarketplaceAPI:
             "CA": 2
         }
         
-        self.session = requests.Session()
+        self.session = get_http_transport().session('ebay')
         self.access_token = None
         self.token_expires_at = None
         
@@ -90,7 +91,7 @@ class EbayMarketplaceAPI:
                 "scope": "https://api.ebay.com/oauth/api_scope https://api.ebay.com/oauth/api_scope/sell.marketing.readonly https://api.ebay.com/oauth/api_scope/sell.marketing https://api.ebay.com/oauth/api_scope/sell.inventory.readonly https://api.ebay.com/oauth/api_scope/sell.inventory https://api.ebay.com/oauth/api_scope/sell.account.readonly https://api.ebay.com/oauth/api_scope/sell.account https://api.ebay.com/oauth/api_scope/sell.fulfillment.readonly https://api.ebay.com/oauth/api_scope/sell.fulfillment https://api.ebay.com/oauth/api_scope/sell.analytics.readonly"
             }
             
-            response = requests.post(self.oauth_url, headers=headers, data=data)
+            response = self.session.post(self.oauth_url, headers=headers, data=data)
             response.raise_for_status()
             
             token_data = response.json()
@@ -140,7 +141,7 @@ class EbayMarketplaceAPI:
             else:
                 return {"success": True}
             
-        except requests.exceptions.RequestException as e:
+        except TransportError as e:
             self.logger.error(f"eBay REST API request failed: {e}")
             if hasattr(e, 'response') and e.response:
                 self.logger.error(f"Response: {e.response.text}")
@@ -172,7 +173,7 @@ class EbayMarketplaceAPI:
                 "Content-Type": "text/xml"
             }
             
-            response = requests.post(self.trading_base_url, data=xml_request, headers=headers)
+            response = self.session.post(self.trading_base_url, data=xml_request, headers=headers)
             response.raise_for_status()
             
             # XML response'u parse et
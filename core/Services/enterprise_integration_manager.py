@@ -30,14 +30,13 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 import jwt
 from cryptography.fernet import Fernet
 import redis
 from contextlib import asynccontextmanager
 
+from .http_transport import TransportSession, get_http_transport
+
 
 class IntegrationStatus(Enum):
     """Entegrasyon durumları"""
@@ -336,32 +335,25 @@ class BaseEnterpriseIntegration(ABC):
         self.last_health_check = None
         self.is_healthy = True
 
-    def _create_session(self) -> requests.Session:
-        """HTTP session oluştur"""
-        session = requests.Session()
-        
-        # Retry strategy
-        retry_strategy = Retry(
-            total=self.config.retry_count,
-            backoff_factor=self.config.retry_delay,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        # Default headers
-        session.headers.update({
+    def _create_session(self) -> TransportSession:
+        """HTTP session oluştur (paylaşılan bağlantı havuzu üzerinde)"""
+        headers = {
             'User-Agent': 'PraPazar-Enterprise-Integration/1.0',
             'Accept': 'application/json',
             'Content-Type': 'application/json'
-        })
+        }
         
         if self.config.custom_headers:
-            session.headers.update(self.config.custom_headers)
-            
-        return session
+            headers.update(self.config.custom_headers)
+        
+        # Retry strategy transport seviyesinde, event loop bloklanmadan uygulanır
+        return get_http_transport().session(
+            self.config.name,
+            headers=headers,
+            retries=self.config.retry_count,
+            backoff_factor=self.config.retry_delay,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
 
     async def execute_with_circuit_breaker(self, func: Callable, *args, **kwargs) -> Any:
         """Circuit breaker ile işlem yürüt"""
@@ -403,7 +395,7 @@ class BaseEnterpriseIntegration(ABC):
         """Sağlık kontrolü"""
         try:
             # Basit ping isteği
-            response = self.session.get(f"{self.config.api_endpoint}/health", timeout=5)
+            response = await self.session.aget(f"{self.config.api_endpoint}/health", timeout=5)
             self.is_healthy = response.status_code == 200
             self.last_health_check = datetime.now()
             return self.is_healthy
@@ -459,7 +451,7 @@ class TrendyolEnterpriseIntegration(BaseEnterpriseIntegration):
                 'User-Agent': 'PraPazar-Trendyol-Integration/1.0'
             }
             
-            response = self.session.get(
+            response = await self.session.aget(
                 f"{self.config.api_endpoint}/suppliers/check-status",
                 headers=headers,
                 timeout=self.config.timeout
@@ -493,7 +485,7 @@ class TrendyolEnterpriseIntegration(BaseEnterpriseIntegration):
                 'size': kwargs.get('size', 50)
             }
             
-            response = self.session.get(
+            response = await self.session.aget(
                 f"{self.config.api_endpoint}/suppliers/products",
                 headers=headers,
                 params=params,
@@ -530,7 +522,7 @@ class TrendyolEnterpriseIntegration(BaseEnterpriseIntegration):
                 }]
             }
             
-            response = self.session.post(
+            response = await self.session.apost(
                 f"{self.config.api_endpoint}/suppliers/stock-updates",
                 headers=headers,
                 json=payload,
@@ -561,7 +553,7 @@ class TrendyolEnterpriseIntegration(BaseEnterpriseIntegration):
                 }]
             }
             
-            response = self.session.post(
+            response = await self.session.apost(
                 f"{self.config.api_endpoint}/suppliers/price-updates",
                 headers=headers,
                 json=payload,
@@ -604,7 +596,7 @@ class TrendyolEnterpriseIntegration(BaseEnterpriseIntegration):
             if 'end_date' in kwargs:
                 params['endDate'] = kwargs['end_date']
             
-            response = self.session.get(
+            response = await self.session.aget(
                 f"{self.config.api_endpoint}/suppliers/orders",
                 headers=headers,
                 params=params,
@@ -641,7 +633,7 @@ class HepsiburadaEnterpriseIntegration(BaseEnterpriseIntegration):
                 'User-Agent': 'PraPazar-Hepsiburada-Integration/1.0'
             }
             
-            response = self.session.get(
+            response = await self.session.aget(
                 f"{self.config.api_endpoint}/merchants/me",
                 headers=headers,
                 timeout=self.config.timeout
@@ -674,7 +666,7 @@ class HepsiburadaEnterpriseIntegration(BaseEnterpriseIntegration):
                 'limit': kwargs.get('limit', 50)
             }
             
-            response = self.session.get(
+            response = await self.session.aget(
                 f"{self.config.api_endpoint}/products",
                 headers=headers,
                 params=params,
@@ -708,7 +700,7 @@ class HepsiburadaEnterpriseIntegration(BaseEnterpriseIntegration):
                 'availableStock': stock
             }
             
-            response = self.session.put(
+            response = await self.session.aput(
                 f"{self.config.api_endpoint}/products/{product_id}/price-inventory",
                 headers=headers,
                 json=payload,
@@ -736,7 +728,7 @@ class HepsiburadaEnterpriseIntegration(BaseEnterpriseIntegration):
                 'price': price
             }
             
-            response = self.session.put(
+            response = await self.session.aput(
                 f"{self.config.api_endpoint}/products/{product_id}/price-inventory",
                 headers=headers,
                 json=payload,
@@ -774,7 +766,7 @@ class HepsiburadaEnterpriseIntegration(BaseEnterpriseIntegration):
             if 'status' in kwargs:
                 params['status'] = kwargs['status']
             
-            response = self.session.get(
+            response = await self.session.aget(
                 f"{self.config.api_endpoint}/orders",
                 headers=headers,
                 params=params,
@@ -4,7 +4,6 @@ Bu modül Etsy'nin resmi Open API v3'ünü kullanır.
 API Dokümantasyonu: https://www.etsy.com/developers/documentation
 """
 
-import requests
 import json
 import base64
 import hashlib
@@ -16,6 +15,8 @@ from typing import Dict, List, Optional, Any
 import logging
 from urllib.parse import urlencode, quote
 
+from .http_transport import TransportError, get_http_transport
+
 class EtsyMarketplaceAPI:
     """Etsy Open API v3 Client"""
     
@@ -36,6 +37,7 @@ class EtsyMarketplaceAPI:
         self.auth_url = "https://www.etsy.com/oauth/connect"
         self.token_url = "https://api.etsy.com/v3/public/oauth/token"
         
+        self.session = get_http_transport().session('etsy')
         self.logger = logging.getLogger(__name__)
         
         # OAuth 2.0 PKCE parameters
@@ -83,7 +85,7 @@ class EtsyMarketplaceAPI:
         }
         
         try:
-            response = requests.post(self.token_url, data=data, timeout=30)
+            response = self.session.post(self.token_url, data=data)
             response.raise_for_status()
             
             token_data = response.json()
@@ -105,7 +107,7 @@ class EtsyMarketplaceAPI:
         }
         
         try:
-            response = requests.post(self.token_url, data=data, timeout=30)
+            response = self.session.post(self.token_url, data=data)
             response.raise_for_status()
             
             token_data = response.json()
@@ -135,16 +137,16 @@ class EtsyMarketplaceAPI:
         
         try:
             if method.upper() == 'GET':
-                response = requests.get(url, headers=headers, params=params, timeout=30)
+                response = self.session.get(url, headers=headers, params=params)
             elif method.upper() == 'POST':
                 if files:
-                    response = requests.post(url, headers=headers, data=data, files=files, timeout=30)
+                    response = self.session.post(url, headers=headers, data=data, files=files)
                 else:
-                    response = requests.post(url, headers=headers, json=data, timeout=30)
+                    response = self.session.post(url, headers=headers, json=data)
             elif method.upper() == 'PUT':
-                response = requests.put(url, headers=headers, json=data, timeout=30)
+                response = self.session.put(url, headers=headers, json=data)
             elif method.upper() == 'DELETE':
-                response = requests.delete(url, headers=headers, timeout=30)
+                response = self.session.delete(url, headers=headers)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
@@ -156,7 +158,7 @@ class EtsyMarketplaceAPI:
             
             return response.json()
             
-        except requests.exceptions.RequestException as e:
+        except TransportError as e:
             self.logger.error(f"Request failed: {str(e)}")
             if hasattr(e, 'response') and e.response is not None:
                 try:
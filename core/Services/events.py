@@ -209,6 +209,10 @@ class EventDispatcher(IEventDispatcher):
             print(f"Listener getirme hatası: {e}")
             return []
     
+    def has_listeners(self, event_name: str) -> bool:
+        """Event için (wildcard dahil) dinleyici var mı"""
+        return bool(self._wildcard_listeners or self._listeners.get(event_name))
+    
     def get_event_history(self, event_name: str = None, limit: int = None) -> List[Event]:
         """Event geçmişini getir"""
         try:
@@ -289,10 +293,15 @@ class SystemEvents:
     JOB_STARTED = "job.started"
     JOB_COMPLETED = "job.completed"
     JOB_FAILED = "job.failed"
+    BATCH_COMPLETED = "batch.completed"
     
     NOTIFICATION_SENT = "notification.sent"
     NOTIFICATION_FAILED = "notification.failed"
     
     USER_REGISTERED = "user.registered"
     USER_LOGIN = "user.login"
-    USER_LOGOUT = "user.logout" 
\ No newline at end of file
+    USER_LOGOUT = "user.logout"
+    
+    MODEL_SAVED = "model.saved"
+    MODEL_BULK_SAVED = "model.bulk_saved"
+    MODEL_DELETED = "model.deleted"
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PofuAi Platform Fan-Out
+======================
+
+Aynı işlemi birden çok pazaryerine paralel gönderen yürütücü
+- Platform başına ayrı thread havuzu: eşzamanlılık sınırı tüm çağıranlar arasında geçerli
+- Platform başına süre sınırı; süresi dolan platform beklenmez, kısmi sonuç döner
+- Başlamış ama süresi dolmuş çağrının sonucu bilinmez olarak işaretlenir
+- Tek platformdaki çok sayıda çağrı (örn. SKU başına istek) anahtar bazında toplanır
+- Toplam süre platformların toplamına değil en yavaşına yakın olur
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from core.Config.config import get_config
+
+from .marketplace_results import is_success
+
+# (platform, anahtar, çağrı); anahtar None ise platformun sonucu doğrudan çağrının sonucudur.
+# Bir platformun çağrıları ya hep anahtarlı ya hep anahtarsızdır, anahtarlar tekildir.
+FanOutCall = Tuple[str, Optional[Hashable], Callable[[], Any]]
+
+
+class FanOutTimeout(Exception):
+    """Platform süre sınırı içinde yanıt vermedi"""
+
+
+def timeout_result(platform: str, deadline: float, started: bool = False) -> Dict[str, Any]:
+    """
+    Süresi dolan çağrı için sonuç
+
+    Başlamamış çağrı hiç yapılmamıştır (outcome 'not_started') ve güvenle
+    tekrarlanabilir. Başlamış çağrı arka planda sürer; yazma işlemi
+    (örn. ürün oluşturma) uygulanmış olabileceğinden outcome 'unknown' olur
+    ve körlemesine tekrarlanmamalıdır.
+    """
+    if started:
+        return {
+            'success': False,
+            'error': f'{platform} deadline exceeded ({deadline:g}s); call still running, outcome unknown',
+            'timed_out': True,
+            'outcome': 'unknown'
+        }
+    return {
+        'success': False,
+        'error': f'{platform} deadline exceeded ({deadline:g}s)',
+        'timed_out': True,
+        'outcome': 'not_started'
+    }
+
+
+def error_result(error: BaseException) -> Dict[str, Any]:
+    """Hata fırlatan çağrı için sonuç"""
+    return {'success': False, 'error': str(error)}
+
+
+class FanOutExecutor:
+    """
+    Platform başına sınırlı, süre kontrollü paralel çağrı yürütücü
+
+    Her platformun kendi havuzu (en fazla `concurrency` thread) vardır;
+    böylece bir platforma giden yüzlerce SKU isteği diğer platformların
+    çağrılarını sıraya sokmaz. Süresi dolan çağrılar iptal edilir (henüz
+    başlamadıysa) ya da sonucu beklenmez.
+    """
+
+    def __init__(self, config: Dict[str, Any] = None):
+        config = config or {}
+        self.default_concurrency = config.get('default_concurrency', 4)
+        self.default_deadline = config.get('default_deadline', 60)
+        self.concurrency: Dict[str, int] = config.get('concurrency', {})
+        self.deadlines: Dict[str, float] = config.get('deadlines', {})
+        self._pools: Dict[str, ThreadPoolExecutor] = {}
+        self._lock = threading.Lock()
+
+    def deadline_for(self, platform: str, deadline: float = None) -> float:
+        if deadline is not None:
+            return deadline
+        return self.deadlines.get(platform, self.default_deadline)
+
+    def _pool(self, platform: str) -> ThreadPoolExecutor:
+        pool = self._pools.get(platform)
+        if pool is None:
+            with self._lock:
+                pool = self._pools.get(platform)
+                if pool is None:
+                    pool = self._pools[platform] = ThreadPoolExecutor(
+                        max_workers=self.concurrency.get(platform, self.default_concurrency),
+                        thread_name_prefix=f'fan-out-{platform}'
+                    )
+        return pool
+
+    @staticmethod
+    def _guarded(func: Callable[[], Any], expires_at: float) -> Callable[[], Any]:
+        def call():
+            # Sırada beklerken süresi dolan çağrı hiç başlatılmaz
+            if time.monotonic() >= expires_at:
+                raise FanOutTimeout()
+            return func()
+        return call
+
+    def execute(self, calls: Iterable[FanOutCall], deadlines: Dict[str, float] = None) -> Dict[str, Any]:
+        """
+        Çağrıları paralel yürüt
+
+        Args:
+            calls: (platform, anahtar, çağrı) listesi
+            deadlines: Platform başına süre sınırı override'ları (saniye)
+
+        Returns:
+            Dict[str, Any]: platform -> sonuç; anahtarlı çağrılarda
+            platform -> {anahtar: sonuç}. Hata veren ya da süresi dolan
+            çağrıların sonucu {'success': False, 'error': ...} olur.
+
+        Raises:
+            ValueError: Bir platformda anahtarlı ve anahtarsız çağrılar
+                karışıksa ya da aynı anahtar tekrarlanıyorsa
+        """
+        calls = list(calls)
+        keys: Dict[str, Optional[set]] = {}
+        for platform, key, _ in calls:
+            platform_keys = keys.setdefault(platform, None if key is None else set())
+            if (key is None) != (platform_keys is None):
+                raise ValueError(f"{platform}: anahtarlı ve anahtarsız çağrılar karıştırılamaz")
+            if key is not None:
+                if key in platform_keys:
+                    raise ValueError(f"{platform}: tekrarlanan anahtar {key!r}")
+                platform_keys.add(key)
+
+        deadlines = deadlines or {}
+        started = time.monotonic()
+        futures: Dict[Future, Tuple[str, Optional[Hashable]]] = {}
+        expiry: Dict[str, float] = {}
+        results: Dict[str, Any] = {}
+
+        for platform, key, func in calls:
+            if platform not in expiry:
+                expiry[platform] = started + self.deadline_for(platform, deadlines.get(platform))
+                if key is not None:
+                    results[platform] = {}
+            if key is not None:
+                # Sonuçlar çağrı sırasıyla döner
+                results[platform][key] = None
+            future = self._pool(platform).submit(self._guarded(func, expiry[platform]))
+            futures[future] = (platform, key)
+
+        def store(future: Future, value: Any):
+            platform, key = futures[future]
+            if key is None:
+                results[platform] = value
+            else:
+                results[platform][key] = value
+
+        def settle(future: Future):
+            platform = futures[future][0]
+            try:
+                store(future, future.result())
+            except FanOutTimeout:
+                store(future, timeout_result(platform, expiry[platform] - started))
+            except Exception as e:
+                store(future, error_result(e))
+
+        pending = set(futures)
+        while pending:
+            now = time.monotonic()
+            expired = {
+                future for future in pending
+                if expiry[futures[future][0]] <= now and not future.done()
+            }
+            for future in expired:
+                if future.cancel():
+                    platform = futures[future][0]
+                    store(future, timeout_result(platform, expiry[platform] - started))
+                elif future.done():
+                    # done() kontrolü ile cancel() arasında bitti
+                    settle(future)
+                else:
+                    platform = futures[future][0]
+                    store(future, timeout_result(platform, expiry[platform] - started, True))
+            pending -= expired
+            if not pending:
+                break
+
+            next_expiry = min(expiry[futures[future][0]] for future in pending)
+            done, pending = wait(pending, timeout=max(0.0, next_expiry - time.monotonic()),
+                                 return_when=FIRST_COMPLETED)
+            for future in done:
+                settle(future)
+
+        return results
+
+    def run(self, calls: Dict[str, Callable[[], Any]], deadlines: Dict[str, float] = None) -> Dict[str, Any]:
+        """Platform başına tek çağrı: {platform: çağrı} -> {platform: sonuç}"""
+        return self.execute([(platform, None, func) for platform, func in calls.items()], deadlines)
+
+    def shutdown(self, wait_for: bool = False):
+        with self._lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.shutdown(wait=wait_for)
+
+
+def summarize(results: Dict[Hashable, Any]) -> Dict[str, Any]:
+    """Anahtar bazlı sonuçları tek platform sonucunda topla"""
+    failed: List[Hashable] = [
+        key for key, result in results.items()
+        if not is_success(result)
+    ]
+    return {
+        'success': not failed,
+        'total': len(results),
+        'failed': failed,
+        'results': results
+    }
+
+
+_fan_out_executor = None
+_fan_out_executor_lock = threading.Lock()
+
+
+def get_fan_out_executor() -> FanOutExecutor:
+    """Global fan-out yürütücüsünü al"""
+    global _fan_out_executor
+    if _fan_out_executor is None:
+        with _fan_out_executor_lock:
+            if _fan_out_executor is None:
+                _fan_out_executor = FanOutExecutor(get_config('marketplace_sync', {}) or {})
+    return _fan_out_executor
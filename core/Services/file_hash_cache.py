@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PofuAi File Hash Cache
+=====================
+
+Kalıcı, içerik adresli dosya hash önbelleği
+- Kayıtlar (device, inode, boyut, mtime) ile doğrulanır; değişmeyen ya da taşınan dosyalar yeniden okunmaz
+- Dosyalar büyük tamponlarla (readinto) okunur, hashlib GIL'i bıraktığı için paralel hesaplanır
+- Duplicate tespiti için hızlı BLAKE2 (kuruluysa xxHash) özetleri
+- Aynı içeriğe sahip dosyalar özet üzerinden bulunabilir
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from core.Config.config import get_config
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+
+# Duplicate tespiti için varsayılan (kriptografik olmayan kullanım) özet
+DEDUP_ALGORITHM = 'xxh3_128' if XXHASH_AVAILABLE else 'blake2b'
+
+
+def new_hasher(algorithm: str):
+    """Algoritma adına göre hash nesnesi oluştur"""
+    if algorithm == 'blake2b':
+        return hashlib.blake2b(digest_size=32)
+    if algorithm == 'xxh3_128':
+        if not XXHASH_AVAILABLE:
+            raise ValueError("xxh3_128 için xxhash paketi gerekli")
+        return xxhash.xxh3_128()
+    return hashlib.new(algorithm)
+
+
+def hash_bytes(content: bytes, algorithm: str = 'sha256') -> str:
+    """Bellekteki içeriğin hash'i"""
+    hasher = new_hasher(algorithm)
+    hasher.update(content)
+    return hasher.hexdigest()
+
+
+def hash_path(file_path: str, algorithm: str = 'md5', buffer_size: int = 1024 * 1024) -> str:
+    """Dosyayı tek bir büyük tamponla (kopyasız readinto) okuyarak hash'le"""
+    hasher = new_hasher(algorithm)
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    with open(file_path, 'rb', buffering=0) as handle:
+        while True:
+            read = handle.readinto(buffer)
+            if not read:
+                break
+            hasher.update(view[:read])
+    return hasher.hexdigest()
+
+
+class FileHashCache:
+    """
+    (device, inode, boyut, mtime) ile doğrulanan kalıcı hash önbelleği
+
+    Kayıt yol + algoritma başına tutulur. Dosyanın stat bilgisi kayıttakiyle
+    aynıysa hash okunmadan döner; farklıysa dosya yeniden hash'lenir ve kayıt
+    güncellenir. SQLite (WAL) dosyası birden çok süreç tarafından paylaşılabilir.
+    """
+
+    def __init__(self, config: Dict = None):
+        config = config or {}
+        database = Path(config.get('path', os.path.join('storage', 'cache', 'file_hashes.db')))
+        database.parent.mkdir(parents=True, exist_ok=True)
+        self.database = str(database)
+        self.buffer_size = config.get('buffer_size', 1024 * 1024)
+        self.workers = config.get('workers', 0) or min(8, os.cpu_count() or 1)
+        self.busy_timeout = config.get('busy_timeout', 5000)
+        self._local = threading.local()
+        self._pid = os.getpid()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+        self._connection().executescript("""
+            CREATE TABLE IF NOT EXISTS file_hashes (
+                path TEXT NOT NULL,
+                algorithm TEXT NOT NULL,
+                device INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                digest TEXT NOT NULL,
+                hashed_at REAL NOT NULL,
+                PRIMARY KEY (path, algorithm)
+            );
+            CREATE INDEX IF NOT EXISTS idx_file_hashes_digest
+                ON file_hashes (algorithm, digest);
+            CREATE INDEX IF NOT EXISTS idx_file_hashes_inode
+                ON file_hashes (inode, device);
+        """)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Thread (ve süreç) başına bağlantı"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            conn = sqlite3.connect(self.database, timeout=self.busy_timeout / 1000,
+                                   isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout)}")
+            self._local.conn = conn
+        return conn
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='file-hash')
+        return self._executor
+
+    @staticmethod
+    def _signature(stat: os.stat_result) -> tuple:
+        return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def _cached(self, paths: List[str], algorithm: str) -> Dict[str, tuple]:
+        """Yolların kayıtlı (signature, digest) bilgileri"""
+        rows = {}
+        conn = self._connection()
+        for start in range(0, len(paths), 500):
+            chunk = paths[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            for path, device, inode, size, mtime_ns, digest in conn.execute(
+                f"SELECT path, device, inode, size, mtime_ns, digest FROM file_hashes "
+                f"WHERE algorithm = ? AND path IN ({placeholders})", [algorithm, *chunk]
+            ):
+                rows[path] = ((device, inode, size, mtime_ns), digest)
+        return rows
+
+    def _cached_by_signature(self, signature: tuple, algorithm: str) -> Optional[str]:
+        """Aynı stat imzasına sahip (örn. taşınmış ya da hard link) kaydın özeti"""
+        row = self._connection().execute(
+            "SELECT digest FROM file_hashes WHERE inode = ? AND device = ? AND size = ? "
+            "AND mtime_ns = ? AND algorithm = ? LIMIT 1",
+            (signature[1], signature[0], signature[2], signature[3], algorithm)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _store(self, entries: List[tuple]):
+        """(path, algorithm, signature, digest) kayıtlarını tek transaction'da yaz"""
+        if not entries:
+            return
+        now = time.time()
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO file_hashes "
+                "(path, algorithm, device, inode, size, mtime_ns, digest, hashed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(path, algorithm, *signature, digest, now) for path, algorithm, signature, digest in entries]
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def hash_file(self, file_path: str, algorithm: str = DEDUP_ALGORITHM) -> Optional[str]:
+        """
+        Dosyanın hash'i (değişmediyse önbellekten)
+
+        Returns:
+            Hex özet; dosya okunamazsa None
+        """
+        return self.hash_files([file_path], algorithm).get(file_path)
+
+    def hash_files(self, file_paths: Iterable[str], algorithm: str = DEDUP_ALGORITHM) -> Dict[str, Optional[str]]:
+        """
+        Çok sayıda dosyanın hash'i
+
+        Önbellekte geçerli kaydı olmayan dosyalar thread havuzunda paralel
+        hash'lenir ve tek transaction'da kaydedilir.
+
+        Returns:
+            Dict[str, Optional[str]]: yol -> hex özet (okunamayanlar None)
+        """
+        file_paths = list(dict.fromkeys(file_paths))
+        results: Dict[str, Optional[str]] = {}
+        signatures = {}
+        for path in file_paths:
+            try:
+                signatures[path] = self._signature(os.stat(path))
+            except OSError:
+                results[path] = None
+
+        cached = self._cached(list(signatures), algorithm)
+        missing = []
+        entries = []
+        for path, signature in signatures.items():
+            entry = cached.get(path)
+            if entry is not None and entry[0] == signature:
+                results[path] = entry[1]
+                continue
+
+            # Taşınan dosyalar inode ve mtime'ını korur; yeni yol için okumaya gerek yok
+            digest = self._cached_by_signature(signature, algorithm)
+            if digest is not None:
+                results[path] = digest
+                entries.append((path, algorithm, signature, digest))
+            else:
+                missing.append(path)
+
+        def compute(path: str):
+            try:
+                digest = hash_path(path, algorithm, self.buffer_size)
+                # Okuma sırasında değişen dosyanın hash'i kaydedilmez
+                return digest, self._signature(os.stat(path))
+            except OSError:
+                return None, None
+
+        if len(missing) > 1:
+            computed = zip(missing, self._pool().map(compute, missing))
+        else:
+            computed = ((path, compute(path)) for path in missing)
+
+        for path, (digest, signature) in computed:
+            results[path] = digest
+            if digest is not None and signature == signatures[path]:
+                entries.append((path, algorithm, signature, digest))
+        self._store(entries)
+
+        return {path: results.get(path) for path in file_paths}
+
+    def remember(self, file_path: str, algorithm: str, digest: str, stat: os.stat_result = None):
+        """
+        Başka yoldan (örn. dosya zaten bellekteyken) hesaplanmış hash'i kaydet
+
+        Args:
+            stat: Hash hesaplanırken alınan stat (verilmezse şimdi alınır)
+        """
+        try:
+            stat = stat or os.stat(file_path)
+        except OSError:
+            return
+        self._store([(file_path, algorithm, self._signature(stat), digest)])
+
+    def find(self, digest: str, algorithm: str = DEDUP_ALGORITHM) -> List[str]:
+        """Aynı içeriğe (özete) sahip kayıtlı dosyalar"""
+        rows = self._connection().execute(
+            "SELECT path FROM file_hashes WHERE algorithm = ? AND digest = ?", (algorithm, digest)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def forget(self, file_path: str):
+        """Dosyanın tüm kayıtlarını sil"""
+        self._connection().execute("DELETE FROM file_hashes WHERE path = ?", (file_path,))
+
+    def prune(self) -> int:
+        """Artık var olmayan dosyaların kayıtlarını temizle"""
+        conn = self._connection()
+        paths = [row[0] for row in conn.execute("SELECT DISTINCT path FROM file_hashes")]
+        removed = [(path,) for path in paths if not os.path.exists(path)]
+        if removed:
+            conn.executemany("DELETE FROM file_hashes WHERE path = ?", removed)
+        return len(removed)
+
+
+_file_hash_cache = None
+_file_hash_cache_lock = threading.Lock()
+
+
+def get_file_hash_cache() -> FileHashCache:
+    """Global dosya hash önbelleği instance'ını al"""
+    global _file_hash_cache
+    if _file_hash_cache is None:
+        with _file_hash_cache_lock:
+            if _file_hash_cache is None:
+                _file_hash_cache = FileHashCache(get_config('storage.hash_cache', {}) or {})
+    return _file_hash_cache
@@ -4,7 +4,6 @@ Bu modül GittiGidiyor'un resmi API'sini kullanır.
 API Dokümantasyonu: https://dev.gittigidiyor.com/
 """
 
-import requests
 import json
 import hashlib
 import hmac
@@ -15,6 +14,8 @@ import logging
 from urllib.parse import urlencode, quote
 import xml.etree.ElementTree as ET
 
+from .http_transport import TransportError, get_http_transport
+
 class GittiGidiyorMarketplaceAPI:
     """GittiGidiyor Marketplace API Client"""
     
@@ -29,7 +30,7 @@ class GittiGidiyorMarketplaceAPI:
         else:
             self.base_url = "https://www.gittigidiyor.com/listingapi/ws"
             
-        self.session = requests.Session()
+        self.session = get_http_transport().session('gittigidiyor')
         self.session.headers.update({
             'Content-Type': 'application/xml; charset=utf-8',
             'User-Agent': 'GittiGidiyor-Python-Client/1.0'
@@ -110,7 +111,7 @@ class GittiGidiyorMarketplaceAPI:
             else:
                 return {"success": True}
             
-        except requests.exceptions.RequestException as e:
+        except TransportError as e:
             self.logger.error(f"GittiGidiyor API request failed: {e}")
             if hasattr(e, 'response') and e.response:
                 self.logger.error(f"Response: {e.response.text}")
@@ -2,15 +2,37 @@
 Advanced GraphQL Service
 Modern, flexible API sorguları için GraphQL implementasyonu
 """
+import hashlib
 import json
+import re
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 from core.Services.base_service import BaseService
 from core.Services.cache_service import CacheService
 
+
+class Variable:
+    """Sorgudaki `$ad` argüman değeri; çalıştırma anında variables'tan okunur"""
+    
+    def __init__(self, name: str):
+        self.name = name
+    
+    def __eq__(self, other):
+        return isinstance(other, Variable) and other.name == self.name
+    
+    def __repr__(self):
+        return f"${self.name}"
+
+
 class GraphQLService(BaseService):
     """İleri seviye GraphQL servisi"""
     
+    _FIELD_NAME = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+    _FIELD_DEFINITION = re.compile(r'^(\w+)\s*(?:\([^)]*\))?\s*:\s*(.+)$')
+    _NUMBER = re.compile(r'-?\d+(\.\d+)?([eE][+-]?\d+)?')
+    _STRING = re.compile(r'"(?:[^"\\]|\\.)*"')
+    _LITERALS = {'true': True, 'false': False, 'null': None}
+    
     def __init__(self):
         super().__init__()
         self.cache = CacheService()
@@ -82,7 +104,7 @@ class GraphQLService(BaseService):
             if not line or line.startswith('#'):
                 continue
                 
-            if line.startswith('type '):
+            if line.startswith('type ') or line.startswith('input '):
                 current_type = line.split()[1].rstrip('{')
                 schema['types'][current_type] = {'fields': {}}
                 current_section = 'type'
@@ -93,9 +115,11 @@ class GraphQLService(BaseService):
             elif line.startswith('type Subscription'):
                 current_section = 'subscriptions'
             elif ':' in line and current_section:
-                field_def = line.rstrip(',')
-                field_name = field_def.split(':')[0].strip()
-                field_type = field_def.split(':')[1].strip()
+                # Argümanlı alanlar: posts(limit: Int, offset: Int): [Post!]!
+                match = self._FIELD_DEFINITION.match(line.rstrip(','))
+                if not match:
+                    continue
+                field_name, field_type = match.group(1), match.group(2).strip()
                 
                 if current_section == 'type' and current_type:
                     schema['types'][current_type]['fields'][field_name] = field_type
@@ -125,29 +149,139 @@ class GraphQLService(BaseService):
         }
     
     def _extract_fields(self, query: str) -> List[Dict]:
-        """Query'den field'ları çıkar"""
+        """Query'den field'ları (iç içe seçimlerle birlikte) çıkar"""
         # Basit field extraction
         # Gerçek uygulamada daha sophisticated parser kullanılmalı
-        fields = []
-        
-        # { } içindeki field'ları bul
         start = query.find('{')
-        end = query.rfind('}')
+        if start == -1:
+            return []
+        
+        fields, _ = self._parse_selection(query, start + 1)
+        return fields
+    
+    def _parse_selection(self, query: str, pos: int):
+        """'{' sonrasından eşleşen '}' karakterine kadar seçim kümesini ayrıştır"""
+        fields = []
         
-        if start != -1 and end != -1:
-            field_section = query[start+1:end].strip()
-            field_lines = [line.strip() for line in field_section.split('\n') if line.strip()]
+        while pos < len(query):
+            char = query[pos]
+            
+            if char == '}':
+                return fields, pos + 1
+            
+            if char == '#':
+                # Satır sonuna kadar yorum
+                end = query.find('\n', pos)
+                pos = len(query) if end == -1 else end
+                continue
+            
+            if char == '(':
+                arguments, pos = self._parse_arguments(query, pos + 1)
+                if fields:
+                    fields[-1]['arguments'] = arguments
+                continue
+            
+            if char == '{':
+                sub_fields, pos = self._parse_selection(query, pos + 1)
+                if fields:
+                    fields[-1]['sub_fields'] = sub_fields
+                continue
+            
+            match = self._FIELD_NAME.match(query, pos)
+            if match:
+                fields.append({
+                    'name': match.group(),
+                    'arguments': {},
+                    'sub_fields': []
+                })
+                pos = match.end()
+                continue
             
-            for line in field_lines:
-                if line and not line.startswith('#'):
-                    field_name = line.split('(')[0].strip()  # Remove arguments for now
-                    fields.append({
-                        'name': field_name,
-                        'arguments': {},  # TODO: Parse arguments
-                        'sub_fields': []  # TODO: Parse nested fields
-                    })
+            pos += 1
         
-        return fields
+        return fields, pos
+    
+    def _skip_ignored(self, query: str, pos: int) -> int:
+        """Boşluk, virgül ve yorumları atla"""
+        while pos < len(query):
+            if query[pos] == '#':
+                end = query.find('\n', pos)
+                pos = len(query) if end == -1 else end
+            elif query[pos].isspace() or query[pos] == ',':
+                pos += 1
+            else:
+                break
+        return pos
+    
+    def _parse_arguments(self, query: str, pos: int, closing: str = ')'):
+        """'(' (ya da input nesnesinde '{') sonrasından `ad: değer` çiftlerini ayrıştır"""
+        arguments = {}
+        
+        while True:
+            pos = self._skip_ignored(query, pos)
+            if pos >= len(query):
+                raise ValueError(f"Syntax error: expected '{closing}'")
+            if query[pos] == closing:
+                return arguments, pos + 1
+            
+            match = self._FIELD_NAME.match(query, pos)
+            if not match:
+                raise ValueError(f"Syntax error: unexpected {query[pos]!r} at {pos}")
+            pos = self._skip_ignored(query, match.end())
+            if query[pos:pos + 1] != ':':
+                raise ValueError(f"Syntax error: expected ':' after argument {match.group()}")
+            arguments[match.group()], pos = self._parse_value(query, pos + 1)
+    
+    def _parse_value(self, query: str, pos: int):
+        """Argüman değerini ayrıştır: değişken, sayı, string, liste, input nesnesi ya da enum"""
+        pos = self._skip_ignored(query, pos)
+        char = query[pos:pos + 1]
+        
+        if char == '$':
+            match = self._FIELD_NAME.match(query, pos + 1)
+            if not match:
+                raise ValueError(f"Syntax error: invalid variable at {pos}")
+            return Variable(match.group()), match.end()
+        
+        if char == '[':
+            values = []
+            pos = self._skip_ignored(query, pos + 1)
+            while query[pos:pos + 1] != ']':
+                if pos >= len(query):
+                    raise ValueError("Syntax error: expected ']'")
+                value, pos = self._parse_value(query, pos)
+                values.append(value)
+                pos = self._skip_ignored(query, pos)
+            return values, pos + 1
+        
+        if char == '{':
+            return self._parse_arguments(query, pos + 1, '}')
+        
+        match = self._STRING.match(query, pos)
+        if match:
+            return json.loads(match.group()), match.end()
+        
+        match = self._NUMBER.match(query, pos)
+        if match:
+            number = match.group()
+            return (float(number) if match.group(1) or match.group(2) else int(number)), match.end()
+        
+        match = self._FIELD_NAME.match(query, pos)
+        if match:
+            # Enum değerleri string olarak verilir
+            return self._LITERALS.get(match.group(), match.group()), match.end()
+        
+        raise ValueError(f"Syntax error: unexpected {char!r} at {pos}")
+    
+    def _bind_arguments(self, value: Any, variables: Optional[Dict]) -> Any:
+        """Argümanlardaki değişkenleri variables değerleriyle değiştir"""
+        if isinstance(value, Variable):
+            return (variables or {}).get(value.name)
+        if isinstance(value, dict):
+            return {key: self._bind_arguments(item, variables) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._bind_arguments(item, variables) for item in value]
+        return value
     
     def _execute_query(self, parsed_query: Dict, variables: Dict, context: Dict) -> Dict:
         """Query'yi execute et"""
@@ -158,9 +292,14 @@ class GraphQLService(BaseService):
             field_name = field['name']
             
             try:
-                # Cache kontrolü
-                cache_key = f"graphql_query:{field_name}:{hash(str(variables))}"
-                cached_result = self.cache.get(cache_key)
+                field = dict(field, arguments=self._bind_arguments(field['arguments'], variables))
+                
+                # Cache kontrolü (mutation'lar ilgili tag'leri geçersiz kılar)
+                cache_source = json.dumps([variables, field['arguments'], field['sub_fields']],
+                                          sort_keys=True, default=str)
+                cache_key = f"graphql_query:{field_name}:{hashlib.md5(cache_source.encode()).hexdigest()}"
+                query_cache = self.cache.tags(*self._query_cache_tags(field_name))
+                cached_result = query_cache.get(cache_key)
                 
                 if cached_result:
                     data[field_name] = cached_result
@@ -170,10 +309,13 @@ class GraphQLService(BaseService):
                 resolver = self._find_resolver('Query', field_name)
                 if resolver:
                     result = resolver(field, variables, context)
+                    if field['sub_fields']:
+                        self._resolve_selection(self._field_type('Query', field_name), result,
+                                                field['sub_fields'], variables, context)
                     data[field_name] = result
                     
                     # Cache'le (5 dakika)
-                    self.cache.set(cache_key, result, 300)
+                    query_cache.set(cache_key, result, 300)
                 else:
                     errors.append(f"No resolver found for field: {field_name}")
                     
@@ -198,6 +340,7 @@ class GraphQLService(BaseService):
                 # Resolver'ı bul ve çalıştır
                 resolver = self._find_resolver('Mutation', field_name)
                 if resolver:
+                    field = dict(field, arguments=self._bind_arguments(field['arguments'], variables))
                     result = resolver(field, variables, context)
                     data[field_name] = result
                     
@@ -238,27 +381,68 @@ class GraphQLService(BaseService):
             }
         }
     
+    def _resolve_selection(self, type_name: str, result: Any, selection: List[Dict],
+                           variables: Dict, context: Dict):
+        """
+        Alt alanları toplu çöz
+        
+        Resolver'ı olan her alt alan, tüm ebeveynler için 'parents' listesiyle
+        tek kez çağrılır (N+1 yerine alan başına tek sorgu); dönen liste
+        ebeveynlere sırayla yazılır. Resolver'ı olmayan alanlar ebeveyn
+        sözlüğünden gelir.
+        """
+        parents = [item for item in (result if isinstance(result, list) else [result])
+                   if isinstance(item, dict)]
+        if not parents:
+            return
+        
+        for sub_field in selection:
+            resolver = self._find_resolver(type_name, sub_field['name'])
+            if not resolver:
+                continue
+            
+            arguments = self._bind_arguments(sub_field['arguments'], variables)
+            values = resolver(dict(sub_field, arguments=arguments, parents=parents), variables, context)
+            for parent, value in zip(parents, values):
+                parent[sub_field['name']] = value
+            
+            if sub_field['sub_fields']:
+                children = []
+                for value in values:
+                    children.extend(value if isinstance(value, list) else [value])
+                self._resolve_selection(self._field_type(type_name, sub_field['name']), children,
+                                        sub_field['sub_fields'], variables, context)
+    
+    def _field_type(self, type_name: str, field_name: str) -> Optional[str]:
+        """Schema'daki alan tipinin adı ('[Post!]!' -> 'Post')"""
+        field_type = self.schema.get('types', {}).get(type_name, {}).get('fields', {}).get(field_name)
+        return field_type.strip('[]!') if field_type else None
+    
     def _find_resolver(self, type_name: str, field_name: str):
         """Resolver fonksiyonunu bul"""
         return self.resolvers.get(type_name, {}).get(field_name)
     
+    # Sorgu alanı -> cache tag'leri
+    QUERY_CACHE_TAGS = {
+        'users': ['users'], 'user': ['users'],
+        'posts': ['posts', 'users'], 'post': ['posts', 'users']
+    }
+    
+    # Mutation -> geçersiz kılınacak tag'ler
+    MUTATION_CACHE_TAGS = {
+        'createUser': ['users'], 'updateUser': ['users'], 'deleteUser': ['users'],
+        'createPost': ['posts'], 'updatePost': ['posts'], 'deletePost': ['posts']
+    }
+    
+    def _query_cache_tags(self, field_name: str) -> List[str]:
+        """Sorgu alanının cache tag'leri"""
+        return self.QUERY_CACHE_TAGS.get(field_name, [f"graphql:{field_name}"])
+    
     def _invalidate_related_cache(self, mutation_name: str):
-        """Mutation sonrası ilgili cache'leri temizle"""
-        # Mutation'a göre cache invalidation stratejisi
-        cache_patterns = {
-            'createUser': ['graphql_query:users*', 'graphql_query:user*'],
-            'updateUser': ['graphql_query:users*', 'graphql_query:user*'],
-            'deleteUser': ['graphql_query:users*', 'graphql_query:user*'],
-            'createPost': ['graphql_query:posts*', 'graphql_query:post*'],
-            'updatePost': ['graphql_query:posts*', 'graphql_query:post*'],
-            'deletePost': ['graphql_query:posts*', 'graphql_query:post*']
-        }
-        
-        patterns = cache_patterns.get(mutation_name, [])
-        for pattern in patterns:
-            # Pattern'e göre cache'leri temizle
-            # Bu basit implementasyon, gerçek uygulamada daha sophisticated olmalı
-            pass
+        """Mutation sonrası ilgili cache'leri temizle (tag başına tek sürüm yazımı)"""
+        tags = self.MUTATION_CACHE_TAGS.get(mutation_name, [])
+        if tags:
+            self.cache.tags(*tags).flush()
     
     def create_default_schema(self):
         """Varsayılan schema oluştur"""
@@ -389,7 +573,8 @@ class GraphQLService(BaseService):
         limit = variables.get('limit', 10)
         offset = variables.get('offset', 0)
         
-        posts = Post.query().where({'status': 'published'}).limit(limit).offset(offset).get()
+        # to_dict() yazar, yorum ve beğeni sayısı için ilişkileri kullanır; toplu yükle
+        posts = Post.with_('user', 'comments', 'likes').where({'status': 'published'}).limit(limit).offset(offset).get()
         return [post.to_dict() for post in posts]
     
     def _resolve_post(self, field, variables, context):
@@ -411,7 +596,7 @@ class GraphQLService(BaseService):
         if not query:
             return []
         
-        posts = Post.query().where_like('title', f'%{query}%').get()
+        posts = Post.with_('user', 'comments', 'likes').where_like('title', f'%{query}%').get()
         return [post.to_dict() for post in posts]
     
     def _resolve_create_user(self, field, variables, context):
@@ -512,20 +697,35 @@ class GraphQLService(BaseService):
         return post.delete()
     
     def _resolve_user_posts(self, field, variables, context):
-        """User posts resolver"""
+        """User posts resolver (toplu 'parents' desteği ile)"""
         from app.Models.Post import Post
         
+        parents = field.get('parents')
+        if parents is not None:
+            posts = Post.eager_load(Post.find_many_by('user_id', [user['id'] for user in parents]),
+                                    'user', 'comments', 'likes')
+            grouped = {}
+            for post in posts:
+                grouped.setdefault(post.user_id, []).append(post.to_dict())
+            return [grouped.get(user['id'], []) for user in parents]
+        
         user_data = field.get('parent')  # Parent User object
         if not user_data:
             return []
         
-        posts = Post.query().where({'user_id': user_data['id']}).get()
+        posts = Post.with_('user', 'comments', 'likes').where({'user_id': user_data['id']}).get()
         return [post.to_dict() for post in posts]
     
     def _resolve_post_author(self, field, variables, context):
-        """Post author resolver"""
+        """Post author resolver (toplu 'parents' desteği ile)"""
         from app.Models.User import User
         
+        parents = field.get('parents')
+        if parents is not None:
+            # N post için tek IN sorgusu
+            users = {user.id: user.to_dict() for user in User.find_many_by('id', [post['user_id'] for post in parents])}
+            return [users.get(post['user_id']) for post in parents]
+        
         post_data = field.get('parent')  # Parent Post object
         if not post_data:
             return None
@@ -534,14 +734,25 @@ class GraphQLService(BaseService):
         return user.to_dict() if user else None
     
     def _resolve_post_comments(self, field, variables, context):
-        """Post comments resolver"""
+        """Post comments resolver (toplu 'parents' desteği ile)"""
         from app.Models.Comment import Comment
         
+        parents = field.get('parents')
+        if parents is not None:
+            comments = Comment.find_many_by('post_id', [post['id'] for post in parents],
+                                            conditions={'status': 'approved'})
+            # to_dict() yazar, post, üst yorum ve yanıt sayısını ekler; yorum başına sorgu atmasın
+            Comment.eager_load(comments, 'user', 'post', 'parent', 'replies')
+            grouped = {}
+            for comment in comments:
+                grouped.setdefault(comment.post_id, []).append(comment.to_dict())
+            return [grouped.get(post['id'], []) for post in parents]
+        
         post_data = field.get('parent')  # Parent Post object
         if not post_data:
             return []
         
-        comments = Comment.query().where({'post_id': post_data['id']}).get()
+        comments = Comment.with_('user', 'post', 'parent', 'replies').where({'post_id': post_data['id'], 'status': 'approved'}).get()
         return [comment.to_dict() for comment in comments]
     
     def introspect_schema(self) -> Dict:
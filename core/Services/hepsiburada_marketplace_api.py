@@ -4,15 +4,18 @@ Bu modül Hepsiburada'nın resmi Marketplace API'sini kullanır.
 API Dokümantasyonu: https://developers.hepsiburada.com/
 """
 
-import requests
+import asyncio
 import json
 import hashlib
 import hmac
 import base64
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, AsyncIterator
 import logging
 
+from .http_transport import TransportError, get_http_transport
+from .pagination import has_next_page, paginate
+
 class HepsiburadaMarketplaceAPI:
     """Hepsiburada Marketplace API Client"""
     
@@ -34,7 +37,7 @@ class HepsiburadaMarketplaceAPI:
         else:
             self.base_url = "https://oms-external.hepsiburada.com"
             
-        self.session = requests.Session()
+        self.session = get_http_transport().session('hepsiburada')
         self.session.headers.update({
             'Content-Type': 'application/json',
             'User-Agent': 'HepsiburadaMarketplace-Python-Client/1.0'
@@ -73,6 +76,17 @@ class HepsiburadaMarketplaceAPI:
             self.logger.error(f"Authentication error: {e}")
             return False
 
+    @staticmethod
+    def _request_kwargs(method: str, data: Optional[Dict]) -> Dict:
+        """HTTP metoduna göre istek parametreleri"""
+        if method == 'GET':
+            return {'params': data}
+        if method in ('POST', 'PUT'):
+            return {'json': data}
+        if method == 'DELETE':
+            return {}
+        raise ValueError(f"Unsupported HTTP method: {method}")
+
     def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict:
         """API isteği yapar"""
         # Token yoksa veya süresi dolmuşsa yeniden authenticate et
@@ -81,30 +95,47 @@ class HepsiburadaMarketplaceAPI:
                 return {"success": False, "error": "Authentication failed"}
         
         url = f"{self.base_url}{endpoint}"
+        method = method.upper()
+        kwargs = self._request_kwargs(method, data)
         
         try:
-            if method.upper() == 'GET':
-                response = self.session.get(url, params=data)
-            elif method.upper() == 'POST':
-                response = self.session.post(url, json=data)
-            elif method.upper() == 'PUT':
-                response = self.session.put(url, json=data)
-            elif method.upper() == 'DELETE':
-                response = self.session.delete(url)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-                
+            response = self.session.request(method, url, **kwargs)
             response.raise_for_status()
             return response.json()
             
-        except requests.exceptions.RequestException as e:
+        except TransportError as e:
             self.logger.error(f"Hepsiburada API request failed: {e}")
             # 401 hatası alırsa yeniden authenticate et
-            if hasattr(e, 'response') and e.response.status_code == 401:
+            if getattr(e, 'response', None) is not None and e.response.status_code == 401:
                 self.access_token = None
                 return self._make_request(method, endpoint, data)
             return {"success": False, "error": str(e)}
 
+    async def _amake_request(self, method: str, endpoint: str, data: Optional[Dict] = None,
+                             retry_auth: bool = True) -> Dict:
+        """_make_request'in event loop'u bloklamayan async karşılığı"""
+        if not self.access_token:
+            # Kimlik doğrulama nadirdir; mevcut senkron akış thread havuzunda yürütülür
+            authenticated = await asyncio.get_running_loop().run_in_executor(None, self._authenticate)
+            if not authenticated:
+                return {"success": False, "error": "Authentication failed"}
+        
+        url = f"{self.base_url}{endpoint}"
+        method = method.upper()
+        kwargs = self._request_kwargs(method, data)
+        
+        try:
+            response = await self.session.arequest(method, url, **kwargs)
+            response.raise_for_status()
+            return response.json()
+            
+        except TransportError as e:
+            self.logger.error(f"Hepsiburada API request failed: {e}")
+            if retry_auth and getattr(e, 'response', None) is not None and e.response.status_code == 401:
+                self.access_token = None
+                return await self._amake_request(method, endpoint, data, retry_auth=False)
+            return {"success": False, "error": str(e)}
+
     # ÜRÜN YÖNETİMİ
     def create_product(self, product_data: Dict) -> Dict:
         """Yeni ürün oluşturur"""
@@ -151,6 +182,17 @@ class HepsiburadaMarketplaceAPI:
             
         return self._make_request('GET', endpoint, params)
 
+    async def iter_products(self, size: int = 100, max_pages: int = None) -> AsyncIterator[Dict]:
+        """Tüm ürünleri sayfa sayfa (sonraki sayfa önceden istenerek) normalize edilmiş olarak döndürür"""
+        endpoint = f"/products/api/products/{self.merchant_id}"
+        
+        def fetch(page: int):
+            return self._amake_request('GET', endpoint, {"offset": page * size, "limit": size})
+        
+        async for product in paginate('hepsiburada', fetch, self._parse_page(size, 'listings'),
+                                      self.normalize_product, max_pages=max_pages):
+            yield product
+
     def get_product(self, sku: str) -> Dict:
         """Tek ürün bilgisini getirir"""
         endpoint = f"/products/api/products/{self.merchant_id}/{sku}"
@@ -162,15 +204,35 @@ class HepsiburadaMarketplaceAPI:
         
         inventory_updates = []
         for update in updates:
-            inventory_updates.append({
-                "sku": update.get("sku"),
-                "price": update.get("price"),
-                "availableStock": update.get("stock")
-            })
+            # Verilmeyen alan gönderilmez; platformdaki değeri korunur
+            item = {"sku": update.get("sku")}
+            if update.get("price") is not None:
+                item["price"] = update["price"]
+            if update.get("stock") is not None:
+                item["availableStock"] = update["stock"]
+            inventory_updates.append(item)
         
         data = {"items": inventory_updates}
         return self._make_request('PUT', endpoint, data)
 
+    # update_stock_price'ın platforma gönderdiği alanlar
+    STOCK_PRICE_FIELDS = ('quantity', 'price')
+
+    @staticmethod
+    def stock_price_item(record: Dict) -> Dict:
+        """{sku, quantity, price} kaydını update_stock_price formatına çevirir"""
+        item = {"sku": record["sku"]}
+        if record.get("price") is not None:
+            item["price"] = record["price"]
+        if record.get("quantity") is not None:
+            item["stock"] = record["quantity"]
+        return item
+
+    @staticmethod
+    def format_date(timestamp: float) -> str:
+        """Epoch saniyeyi Hepsiburada tarih filtresi formatına çevirir"""
+        return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+
     def delete_product(self, sku: str) -> Dict:
         """Ürün siler"""
         endpoint = f"/products/api/products/{self.merchant_id}/{sku}"
@@ -181,7 +243,11 @@ class HepsiburadaMarketplaceAPI:
                    status: str = None, page: int = 0, size: int = 50) -> Dict:
         """Sipariş listesini getirir"""
         endpoint = f"/orders/api/orders/{self.merchant_id}"
-        
+        params = self._order_params(start_date, end_date, status, page, size)
+        return self._make_request('GET', endpoint, params)
+
+    @staticmethod
+    def _order_params(start_date: str, end_date: str, status: str, page: int, size: int) -> Dict:
         params = {
             "offset": page * size,
             "limit": size
@@ -193,8 +259,73 @@ class HepsiburadaMarketplaceAPI:
             params["endDate"] = end_date
         if status:
             params["status"] = status
-            
-        return self._make_request('GET', endpoint, params)
+        return params
+
+    async def iter_orders(self, start_date: str = None, end_date: str = None, status: str = None,
+                          size: int = 100, max_pages: int = None) -> AsyncIterator[Dict]:
+        """Tüm siparişleri sayfa sayfa (sonraki sayfa önceden istenerek) normalize edilmiş olarak döndürür"""
+        endpoint = f"/orders/api/orders/{self.merchant_id}"
+        
+        def fetch(page: int):
+            return self._amake_request('GET', endpoint, self._order_params(start_date, end_date, status, page, size))
+        
+        async for order in paginate('hepsiburada', fetch, self._parse_page(size, 'orders'),
+                                    self.normalize_order, max_pages=max_pages):
+            yield order
+
+    @staticmethod
+    def _parse_page(size: int, list_key: str):
+        def parse(response: Dict, page: int):
+            payload = response.get("data", response)
+            if isinstance(payload, list):
+                items, total = payload, None
+            else:
+                items = payload.get("items") or payload.get(list_key) or []
+                total = payload.get("totalCount")
+            return items, has_next_page(page, size, len(items), total_count=total)
+        return parse
+
+    @staticmethod
+    def normalize_order(order: Dict) -> Dict:
+        """Hepsiburada siparişini ortak sipariş formatına çevirir"""
+        total = order.get("totalPrice")
+        return {
+            "platform": "hepsiburada",
+            "order_number": order.get("orderNumber"),
+            "package_id": order.get("packageNumber") or order.get("id"),
+            "status": order.get("status"),
+            "order_date": order.get("orderDate"),
+            "updated_at": order.get("lastStatusUpdateDate") or order.get("updatedAt"),
+            "total_price": total.get("amount") if isinstance(total, dict) else total,
+            "currency": total.get("currency", "TRY") if isinstance(total, dict) else "TRY",
+            "customer": order.get("customerName"),
+            "lines": [
+                {
+                    "sku": line.get("merchantSku") or line.get("sku"),
+                    "barcode": line.get("hepsiburadaSku"),
+                    "quantity": line.get("quantity"),
+                    "price": line.get("price")
+                }
+                for line in order.get("items", order.get("lines", []))
+            ],
+            "raw": order
+        }
+
+    @staticmethod
+    def normalize_product(product: Dict) -> Dict:
+        """Hepsiburada listesini ortak ürün formatına çevirir"""
+        return {
+            "platform": "hepsiburada",
+            "sku": product.get("merchantSku"),
+            "barcode": product.get("hepsiburadaSku"),
+            "title": product.get("productName"),
+            "quantity": product.get("availableStock"),
+            "sale_price": product.get("price"),
+            "list_price": product.get("price"),
+            "approved": product.get("isSalable"),
+            "updated_at": product.get("updatedAt"),
+            "raw": product
+        }
 
     def get_order(self, order_number: str) -> Dict:
         """Tek sipariş bilgisini getirir"""
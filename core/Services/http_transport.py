@@ -0,0 +1,621 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PofuAi HTTP Transport
+====================
+
+Marketplace, kargo ve fiyat karşılaştırma istemcileri için paylaşılan HTTP katmanı
+- Tüm istekler tek bir arka plan event loop'unda async olarak yürür
+- Host başına keep-alive bağlantı havuzları tüm istemciler arasında paylaşılır
+- httpx + h2 kuruluysa HTTP/2, değilse aiohttp (o da yoksa requests) kullanılır
+- Entegrasyon başına zaman aşımı, varsayılan header ve kimlik bilgisi
+- Mevcut istemciler için requests.Session uyumlu senkron facade
+"""
+
+import asyncio
+import atexit
+import base64
+import http.cookiejar
+import json as jsonlib
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from core.Config.config import get_config
+from .retry_policy import RetryBudget, RetryEngine, RetryPolicy, RetryStats
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import httpx
+    import h2  # noqa: F401 - httpx'in HTTP/2 desteği için gerekli
+    HTTPX_HTTP2_AVAILABLE = True
+except ImportError:
+    HTTPX_HTTP2_AVAILABLE = False
+
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+    _RequestException = requests.exceptions.RequestException
+    _Timeout = requests.exceptions.Timeout
+    _ConnectionError = requests.exceptions.ConnectionError
+    _HTTPError = requests.exceptions.HTTPError
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+    class _RequestException(IOError):
+        def __init__(self, *args, response=None, request=None, **kwargs):
+            self.response = response
+            self.request = request
+            super().__init__(*args)
+
+    class _Timeout(_RequestException):
+        pass
+
+    class _ConnectionError(_RequestException):
+        pass
+
+    class _HTTPError(_RequestException):
+        pass
+
+
+# requests istisnalarından türetilir; mevcut `except requests.exceptions.*` blokları çalışmaya devam eder
+class TransportError(_RequestException):
+    """HTTP isteği başarısız"""
+
+
+class TransportTimeout(TransportError, _Timeout):
+    """HTTP isteği zaman aşımına uğradı"""
+
+
+class TransportConnectionError(TransportError, _ConnectionError):
+    """Sunucuya bağlanılamadı"""
+
+
+class HTTPStatusError(TransportError, _HTTPError):
+    """Sunucu 4xx/5xx döndü"""
+
+
+TimeoutValue = Union[None, float, Tuple[float, float]]
+
+
+class Headers(dict):
+    """Büyük/küçük harf duyarsız header sözlüğü"""
+
+    def __init__(self, items: Iterable = ()):
+        super().__init__()
+        for key, value in (items.items() if hasattr(items, 'items') else items):
+            self[key] = value
+
+    def __setitem__(self, key: str, value: str):
+        super().__setitem__(key.lower(), value)
+
+    def __getitem__(self, key: str) -> str:
+        return super().__getitem__(key.lower())
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and super().__contains__(key.lower())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return super().get(key.lower(), default)
+
+
+class HttpResponse:
+    """Gövdesi tamamen okunmuş HTTP yanıtı (requests.Response ile uyumlu alanlar)"""
+
+    def __init__(self, status_code: int, headers: Headers, content: bytes, url: str,
+                 elapsed: float = 0.0, http_version: str = 'HTTP/1.1', reason: str = ''):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.elapsed = elapsed
+        self.http_version = http_version
+        self.reason = reason
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def encoding(self) -> str:
+        content_type = self.headers.get('content-type', '')
+        for part in content_type.split(';')[1:]:
+            key, _, value = part.strip().partition('=')
+            if key.lower() == 'charset' and value:
+                return value.strip('"\'')
+        return 'utf-8'
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors='replace')
+
+    def json(self, **kwargs) -> Any:
+        return jsonlib.loads(self.text, **kwargs)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            kind = 'Client' if self.status_code < 500 else 'Server'
+            raise HTTPStatusError(
+                f"{self.status_code} {kind} Error: {self.reason} for url: {self.url}", response=self
+            )
+
+    def __repr__(self) -> str:
+        return f"<HttpResponse [{self.status_code}]>"
+
+
+def _merge_headers(*sources: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """Header sözlüklerini sırayla birleştir (sonraki kazanır, harf duyarsız)"""
+    merged: Dict[str, Tuple[str, str]] = {}
+    for source in sources:
+        for key, value in (source or {}).items():
+            if value is not None:
+                merged[key.lower()] = (key, str(value))
+    return dict(merged.values())
+
+
+def _normalize_params(params: Any) -> Optional[list]:
+    """requests gibi: None değerler atlanır, listeler tekrarlı anahtara açılır"""
+    if params is None:
+        return None
+    items = params.items() if hasattr(params, 'items') else params
+    normalized = []
+    for key, value in items:
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for item in values:
+            if item is None:
+                continue
+            if isinstance(item, bool):
+                item = 'true' if item else 'false'
+            normalized.append((str(key), str(item)))
+    return normalized
+
+
+# Hiçbir alan adı için çerez kabul etmeyen politika
+_COOKIELESS_POLICY = http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+
+
+def _cookieless_jar() -> http.cookiejar.CookieJar:
+    """Yanıtlardaki çerezleri saklamayan jar (httpx için)"""
+    return http.cookiejar.CookieJar(policy=_COOKIELESS_POLICY)
+
+
+def basic_auth(username: str, password: str) -> str:
+    """HTTP Basic Authorization header değeri"""
+    token = base64.b64encode(f"{username}:{password}".encode('utf-8')).decode('ascii')
+    return f"Basic {token}"
+
+
+class HttpTransport:
+    """
+    Paylaşılan async HTTP taşıma katmanı
+
+    Kendi thread'inde çalışan tek bir event loop ve tek bir HTTP istemcisi
+    (bağlantı havuzu) tutar. Async çağıranlar (başka bir loop'tan bile)
+    isteği bu loop'a devreder ve bloklanmadan bekler; senkron çağıranlar
+    sonucu bekler. Böylece bağlantılar tüm entegrasyonlar ve thread'ler
+    arasında yeniden kullanılır.
+    """
+
+    def __init__(self, config: Dict[str, Any] = None):
+        config = config or {}
+        backend = config.get('backend')
+        if not backend:
+            if HTTPX_HTTP2_AVAILABLE and config.get('http2', True):
+                backend = 'httpx'
+            elif AIOHTTP_AVAILABLE:
+                backend = 'aiohttp'
+            else:
+                backend = 'requests'
+        self.backend = backend
+        self.timeout = config.get('timeout', 30)
+        self.connect_timeout = config.get('connect_timeout', 10)
+        self.pool_size = config.get('pool_size', 100)
+        self.pool_size_per_host = config.get('pool_size_per_host', 20)
+        self.keepalive_timeout = config.get('keepalive_timeout', 60)
+        self.user_agent = config.get('user_agent', 'PofuAi-HttpTransport/1.0')
+        self.integrations: Dict[str, Dict[str, Any]] = config.get('integrations', {})
+        self.retry_config: Dict[str, Any] = config.get('retry', {})
+        self.logger = logging.getLogger('http_transport')
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._client = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._retry_state: Dict[str, Tuple[RetryBudget, RetryStats]] = {}
+
+    # Event loop yönetimi
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is not None and self._pid == os.getpid():
+            return self._loop
+
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                # Fork sonrası ebeveynin loop'u ve bağlantıları kullanılamaz
+                self._pid = os.getpid()
+                self._client = None
+                self._executor = None
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run_loop, args=(loop, ready), name='http-transport', daemon=True
+                )
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+        return self._loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop, ready: threading.Event):
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        loop.run_forever()
+
+    def _in_transport_loop(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def timeouts_for(self, integration: str, timeout: TimeoutValue = None) -> Tuple[float, float]:
+        """(connect, total) zaman aşımları: istek > entegrasyon > varsayılan"""
+        settings = self.integrations.get(integration, {})
+        connect = settings.get('connect_timeout', self.connect_timeout)
+        total = settings.get('timeout', self.timeout)
+        if isinstance(timeout, (tuple, list)):
+            connect, read = timeout
+            total = connect + read
+        elif timeout is not None:
+            total = timeout
+        return min(connect, total), total
+
+    # İstek
+
+    async def request(self, method: str, url: str, integration: str = 'default', **kwargs) -> HttpResponse:
+        """
+        Async HTTP isteği
+
+        Args:
+            method: HTTP metodu
+            url: Tam URL
+            integration: Zaman aşımı ayarlarının alınacağı entegrasyon adı
+            **kwargs: params, json, data, files, headers, timeout
+
+        Returns:
+            HttpResponse (4xx/5xx istisna fırlatmaz; raise_for_status kullanın)
+        """
+        loop = self._ensure_loop()
+        coroutine = self._send(method.upper(), url, integration, **kwargs)
+        if self._in_transport_loop():
+            return await coroutine
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coroutine, loop))
+
+    def request_sync(self, method: str, url: str, integration: str = 'default', **kwargs) -> HttpResponse:
+        """Senkron HTTP isteği (istek transport loop'unda yürür, bağlantılar paylaşılır)"""
+        loop = self._ensure_loop()
+        if self._in_transport_loop():
+            raise RuntimeError("request_sync transport loop içinden çağrılamaz; request() kullanın")
+        return asyncio.run_coroutine_threadsafe(
+            self._send(method.upper(), url, integration, **kwargs), loop
+        ).result()
+
+    async def _send(self, method: str, url: str, integration: str, params: Any = None, json: Any = None,
+                    data: Any = None, files: Dict[str, Any] = None, headers: Dict[str, str] = None,
+                    timeout: TimeoutValue = None) -> HttpResponse:
+        connect, total = self.timeouts_for(integration, timeout)
+        headers = _merge_headers({'User-Agent': self.user_agent}, headers)
+        params = _normalize_params(params)
+        started = time.monotonic()
+
+        if self.backend == 'httpx':
+            return await self._send_httpx(method, url, params, json, data, files, headers, connect, total, started)
+        if self.backend == 'aiohttp':
+            return await self._send_aiohttp(method, url, params, json, data, files, headers, connect, total, started)
+        return await self._send_requests(method, url, params, json, data, files, headers, connect, total, started)
+
+    async def _send_aiohttp(self, method, url, params, json, data, files, headers, connect, total, started):
+        if self._client is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.pool_size_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300
+            )
+            # İstemci entegrasyonlar arasında paylaşıldığı için çerez tutulmaz
+            self._client = aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+
+        if files:
+            form = aiohttp.FormData()
+            for key, value in (data or {}).items():
+                form.add_field(key, str(value))
+            for key, value in files.items():
+                if isinstance(value, (tuple, list)):
+                    form.add_field(key, value[1], filename=value[0],
+                                   content_type=value[2] if len(value) > 2 else None)
+                else:
+                    form.add_field(key, value, filename=os.path.basename(getattr(value, 'name', key)))
+            data = form
+
+        try:
+            async with self._client.request(
+                method, url, params=params, json=json, data=data, headers=headers,
+                timeout=aiohttp.ClientTimeout(total=total, connect=connect)
+            ) as response:
+                content = await response.read()
+                return HttpResponse(
+                    response.status, Headers(response.headers.items()), content, str(response.url),
+                    time.monotonic() - started, f"HTTP/{response.version.major}.{response.version.minor}",
+                    response.reason or ''
+                )
+        except asyncio.TimeoutError as e:
+            raise TransportTimeout(f"{method} {url} zaman aşımı ({total}s)") from e
+        except aiohttp.ClientConnectionError as e:
+            raise TransportConnectionError(f"{method} {url} bağlantı hatası: {e}") from e
+        except aiohttp.ClientError as e:
+            raise TransportError(f"{method} {url} başarısız: {e}") from e
+
+    async def _send_httpx(self, method, url, params, json, data, files, headers, connect, total, started):
+        if self._client is None:
+            # aiohttp yolundaki DummyCookieJar gibi: paylaşılan istemcide çerez tutulmaz
+            self._client = httpx.AsyncClient(
+                http2=True,
+                follow_redirects=True,
+                cookies=_cookieless_jar(),
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size,
+                    keepalive_expiry=self.keepalive_timeout
+                )
+            )
+
+        # httpx ham gövdeyi `content` ile alır
+        content = None
+        if isinstance(data, (str, bytes)):
+            content, data = data, None
+
+        try:
+            response = await self._client.request(
+                method, url, params=params, json=json, data=data, content=content, files=files,
+                headers=headers, timeout=httpx.Timeout(total, connect=connect)
+            )
+            return HttpResponse(
+                response.status_code, Headers(response.headers.items()), response.content, str(response.url),
+                time.monotonic() - started, response.http_version, response.reason_phrase
+            )
+        except httpx.TimeoutException as e:
+            raise TransportTimeout(f"{method} {url} zaman aşımı ({total}s)") from e
+        except (httpx.ConnectError, httpx.NetworkError) as e:
+            raise TransportConnectionError(f"{method} {url} bağlantı hatası: {e}") from e
+        except httpx.HTTPError as e:
+            raise TransportError(f"{method} {url} başarısız: {e}") from e
+
+    async def _send_requests(self, method, url, params, json, data, files, headers, connect, total, started):
+        # Async istemci kurulu değilse: havuzlu requests.Session thread havuzunda
+        if self._client is None:
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            session.cookies.set_policy(_COOKIELESS_POLICY)
+            adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size_per_host)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._client = session
+            self._executor = ThreadPoolExecutor(max_workers=self.pool_size_per_host, thread_name_prefix='http-transport')
+
+        def send():
+            return self._client.request(
+                method, url, params=params, json=json, data=data, files=files,
+                headers=headers, timeout=(connect, total)
+            )
+
+        try:
+            response = await asyncio.get_running_loop().run_in_executor(self._executor, send)
+        except requests.exceptions.Timeout as e:
+            raise TransportTimeout(f"{method} {url} zaman aşımı ({total}s)") from e
+        except requests.exceptions.ConnectionError as e:
+            raise TransportConnectionError(f"{method} {url} bağlantı hatası: {e}") from e
+        except requests.exceptions.RequestException as e:
+            raise TransportError(f"{method} {url} başarısız: {e}") from e
+
+        return HttpResponse(
+            response.status_code, Headers(response.headers), response.content, response.url,
+            time.monotonic() - started, 'HTTP/1.1', response.reason or ''
+        )
+
+    # Retry
+
+    def retry_engine(self, integration: str, **overrides) -> RetryEngine:
+        """
+        Entegrasyonun retry motoru
+
+        Policy varsayılan `retry` ayarı, entegrasyonun `retry` ayarı ve
+        (None olmayan) override'lar birleştirilerek oluşturulur. Bütçe ve
+        metrikler aynı entegrasyonun tüm oturumları arasında paylaşılır.
+        """
+        settings = dict(self.retry_config)
+        settings.update(self.integrations.get(integration, {}).get('retry', {}))
+        with self._lock:
+            state = self._retry_state.get(integration)
+            if state is None:
+                state = self._retry_state[integration] = (
+                    RetryBudget.from_config(settings.get('budget')), RetryStats()
+                )
+        return RetryEngine(integration, RetryPolicy.from_config(settings, **overrides), *state, self.logger)
+
+    def retry_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Entegrasyon başına retry metrikleri"""
+        with self._lock:
+            states = dict(self._retry_state)
+        metrics = {}
+        for integration, (budget, stats) in states.items():
+            metrics[integration] = stats.snapshot()
+            metrics[integration]['budget_remaining'] = budget.remaining()
+        return metrics
+
+    # Oturumlar
+
+    def session(self, integration: str, headers: Dict[str, str] = None, auth: Tuple[str, str] = None,
+                base_url: str = None, retries: int = None, backoff_factor: float = None,
+                status_forcelist: Iterable[int] = None) -> 'TransportSession':
+        """
+        Entegrasyona özel oturum (havuz paylaşılır, header ve ayarlar oturuma aittir)
+
+        retries / backoff_factor / status_forcelist verilmezse config'teki
+        retry ayarları kullanılır.
+        """
+        retry = self.retry_engine(
+            integration, max_retries=retries, base_delay=backoff_factor, status_forcelist=status_forcelist
+        )
+        return TransportSession(self, integration, headers, auth, base_url, retry)
+
+    def close(self):
+        """İstemciyi ve event loop'u kapat"""
+        with self._lock:
+            loop, client = self._loop, self._client
+            self._loop = self._client = None
+        if loop is None or self._pid != os.getpid():
+            return
+
+        async def shutdown():
+            if client is None:
+                return
+            if self.backend == 'aiohttp':
+                await client.close()
+            elif self.backend == 'httpx':
+                await client.aclose()
+            else:
+                client.close()
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout=5)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+
+class TransportSession:
+    """
+    requests.Session benzeri entegrasyon oturumu
+
+    get/post/put/delete senkron facade'dır; aget/apost/... aynı isteği
+    event loop'u bloklamadan yapar. Header'lar ve Basic auth oturuma aittir.
+    Bağlantı hataları ve tekrarlanabilir yanıtlar (429, 5xx) oturumun
+    RetryEngine'i ile tekrarlanır; bekleme transport loop'unda yapılır,
+    thread bloklanmaz. İstek başına `retries=` ile deneme sayısı değiştirilebilir.
+    Senkron facade'da çağıran thread sonucu beklediğinden retry'lar policy'nin
+    kısa senkron deadline ve Retry-After sınırlarıyla yapılır.
+    """
+
+    def __init__(self, transport: HttpTransport, integration: str, headers: Dict[str, str] = None,
+                 auth: Tuple[str, str] = None, base_url: str = None, retry: RetryEngine = None):
+        self.transport = transport
+        self.integration = integration
+        self.headers: Dict[str, str] = dict(headers or {})
+        self.base_url = base_url.rstrip('/') if base_url else None
+        self.retry = retry or transport.retry_engine(integration)
+        self.auth = auth
+
+    @property
+    def auth(self) -> Optional[Tuple[str, str]]:
+        return self._auth
+
+    @auth.setter
+    def auth(self, value: Optional[Tuple[str, str]]):
+        self._auth = value
+        self._auth_header = basic_auth(*value) if value else None
+
+    def _url(self, url: str) -> str:
+        if self.base_url and not url.startswith(('http://', 'https://')):
+            return f"{self.base_url}/{url.lstrip('/')}"
+        return url
+
+    def _headers(self, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+        return _merge_headers(
+            {'Authorization': self._auth_header} if self._auth_header else None, self.headers, headers
+        )
+
+    async def _send(self, method: str, url: str, retries: int = None, blocking: bool = False,
+                    **kwargs) -> HttpResponse:
+        method = method.upper()
+        url = self._url(url)
+        kwargs['headers'] = self._headers(kwargs.get('headers'))
+        return await self.retry.execute(
+            method,
+            lambda: self.transport._send(method, url, self.integration, **kwargs),
+            (TransportTimeout, TransportConnectionError),
+            retries,
+            blocking
+        )
+
+    async def arequest(self, method: str, url: str, **kwargs) -> HttpResponse:
+        """Async istek"""
+        loop = self.transport._ensure_loop()
+        coroutine = self._send(method, url, **kwargs)
+        if self.transport._in_transport_loop():
+            return await coroutine
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coroutine, loop))
+
+    def request(self, method: str, url: str, **kwargs) -> HttpResponse:
+        """Senkron istek"""
+        loop = self.transport._ensure_loop()
+        if self.transport._in_transport_loop():
+            raise RuntimeError("Senkron istek transport loop içinden yapılamaz; arequest() kullanın")
+        return asyncio.run_coroutine_threadsafe(
+            self._send(method, url, blocking=True, **kwargs), loop
+        ).result()
+
+    def get(self, url: str, params: Any = None, **kwargs) -> HttpResponse:
+        return self.request('GET', url, params=params, **kwargs)
+
+    def post(self, url: str, data: Any = None, json: Any = None, **kwargs) -> HttpResponse:
+        return self.request('POST', url, data=data, json=json, **kwargs)
+
+    def put(self, url: str, data: Any = None, json: Any = None, **kwargs) -> HttpResponse:
+        return self.request('PUT', url, data=data, json=json, **kwargs)
+
+    def patch(self, url: str, data: Any = None, json: Any = None, **kwargs) -> HttpResponse:
+        return self.request('PATCH', url, data=data, json=json, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> HttpResponse:
+        return self.request('DELETE', url, **kwargs)
+
+    async def aget(self, url: str, params: Any = None, **kwargs) -> HttpResponse:
+        return await self.arequest('GET', url, params=params, **kwargs)
+
+    async def apost(self, url: str, data: Any = None, json: Any = None, **kwargs) -> HttpResponse:
+        return await self.arequest('POST', url, data=data, json=json, **kwargs)
+
+    async def aput(self, url: str, data: Any = None, json: Any = None, **kwargs) -> HttpResponse:
+        return await self.arequest('PUT', url, data=data, json=json, **kwargs)
+
+    async def apatch(self, url: str, data: Any = None, json: Any = None, **kwargs) -> HttpResponse:
+        return await self.arequest('PATCH', url, data=data, json=json, **kwargs)
+
+    async def adelete(self, url: str, **kwargs) -> HttpResponse:
+        return await self.arequest('DELETE', url, **kwargs)
+
+    def close(self):
+        """Bağlantı havuzu paylaşıldığı için oturum kapatmak bir şey yapmaz"""
+
+
+_http_transport = None
+_http_transport_lock = threading.Lock()
+
+
+def get_http_transport() -> HttpTransport:
+    """Global HTTP transport instance'ını al"""
+    global _http_transport
+    if _http_transport is None:
+        with _http_transport_lock:
+            if _http_transport is None:
+                _http_transport = HttpTransport(get_config('http', {}) or {})
+                atexit.register(_http_transport.close)
+    return _http_transport
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PofuAi Platform Pazaryeri Sonuçları
+==================================
+
+Pazaryeri client yanıtlarının platform düzeyinde başarı kontrolü
+- HTTP 200 dönen ama platformun reddettiği yanıtlar başarısız sayılır
+- Fan-out özetleri ve delta senkronizasyonu aynı kuralı kullanır
+"""
+
+from typing import Any, Optional
+
+FAILED_STATUSES = ('FAILED', 'FAILURE', 'ERROR')
+
+
+def status_text(value: Any) -> Optional[str]:
+    """Durum alanını ('failure' ya da {'text': ...}) büyük harfli metne çevir"""
+    if isinstance(value, dict):
+        value = value.get('text')
+    return str(value).upper() if value not in (None, '') else None
+
+
+def is_success(result: Any) -> bool:
+    """
+    Client sonucunun başarılı olup olmadığı
+
+    HTTP düzeyinde başarılı yanıtlar da platform düzeyinde başarısız
+    olabilir: N11 SOAP yanıtı {'result': {'status': 'failure'}} ve üst
+    düzey 'status' alanı FAILED/FAILURE/ERROR olan yanıtlar başarısız sayılır.
+    """
+    if isinstance(result, bool):
+        return result
+    if not isinstance(result, dict) or result.get('success') is False:
+        return False
+    platform_result = result.get('result')
+    if isinstance(platform_result, dict):
+        status = status_text(platform_result.get('status'))
+        if status is not None and status != 'SUCCESS':
+            return False
+    return status_text(result.get('status')) not in FAILED_STATUSES
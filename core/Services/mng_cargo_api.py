@@ -6,7 +6,6 @@ Bu modül MNG Kargo'nun kargo gönderimi, takip, fiyat sorgulama
 ve diğer lojistik hizmetlerini destekler.
 """
 
-import requests
 import json
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
@@ -16,6 +15,7 @@ import hmac
 from base64 import b64encode
 
 from .base_service import BaseService
+from .http_transport import get_http_transport
 
 
 class MNGCargoAPI(BaseService):
@@ -67,6 +67,8 @@ class MNGCargoAPI(BaseService):
             'pallet': 3,      # Palet
             'bulk': 4         # Dökme
         }
+        
+        self.session = get_http_transport().session('mng_cargo')
     
     def _get_auth_headers(self) -> Dict[str, str]:
         """Kimlik doğrulama başlıklarını oluştur"""
@@ -165,11 +167,10 @@ class MNGCargoAPI(BaseService):
                     })
             
             # API isteği gönder
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}{self.endpoints['create_shipment']}",
                 headers=self._get_auth_headers(),
-                json=request_data,
-                timeout=30
+                json=request_data
             )
             
             result = response.json()
@@ -211,11 +212,10 @@ class MNGCargoAPI(BaseService):
         """
         try:
             # API isteği gönder
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}{self.endpoints['track_shipment']}",
                 headers=self._get_auth_headers(),
-                params={'tracking_number': tracking_number},
-                timeout=30
+                params={'tracking_number': tracking_number}
             )
             
             result = response.json()
@@ -286,11 +286,10 @@ class MNGCargoAPI(BaseService):
             }
             
             # API isteği gönder
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}{self.endpoints['get_price']}",
                 headers=self._get_auth_headers(),
-                params=params,
-                timeout=30
+                params=params
             )
             
             result = response.json()
@@ -343,11 +342,10 @@ class MNGCargoAPI(BaseService):
             }
             
             # API isteği gönder
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}{self.endpoints['cancel_shipment']}",
                 headers=self._get_auth_headers(),
-                json=request_data,
-                timeout=30
+                json=request_data
             )
             
             result = response.json()
@@ -373,10 +371,9 @@ class MNGCargoAPI(BaseService):
             Şehir listesi
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}{self.endpoints['get_cities']}",
-                headers=self._get_auth_headers(),
-                timeout=30
+                headers=self._get_auth_headers()
             )
             
             result = response.json()
@@ -412,11 +409,10 @@ class MNGCargoAPI(BaseService):
             İlçe listesi
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}{self.endpoints['get_districts']}",
                 headers=self._get_auth_headers(),
-                params={'city_code': city_code},
-                timeout=30
+                params={'city_code': city_code}
             )
             
             result = response.json()
@@ -478,11 +474,10 @@ class MNGCargoAPI(BaseService):
             }
             
             # API isteği gönder
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}{self.endpoints['create_pickup']}",
                 headers=self._get_auth_headers(),
-                json=request_data,
-                timeout=30
+                json=request_data
             )
             
             result = response.json()
@@ -527,11 +522,10 @@ class MNGCargoAPI(BaseService):
                 'format': format.upper()
             }
             
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}{self.endpoints['get_barcode']}",
                 headers=self._get_auth_headers(),
-                params=params,
-                timeout=30
+                params=params
             )
             
             if response.status_code == 200:
@@ -580,11 +574,10 @@ class MNGCargoAPI(BaseService):
                 'format': format.upper()
             }
             
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}{self.endpoints['get_waybill']}",
                 headers=self._get_auth_headers(),
-                params=params,
-                timeout=30
+                params=params
             )
             
             if response.status_code == 200:
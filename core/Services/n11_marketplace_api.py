@@ -4,17 +4,19 @@ Bu modül N11'in resmi Marketplace API'sini kullanır.
 API Dokümantasyonu: https://www.n11.com/
 """
 
-import requests
 import json
 import hashlib
 import hmac
 import base64
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, AsyncIterator
 import logging
 import xml.etree.ElementTree as ET
 from xml.dom import minidom
 
+from .http_transport import TransportError, get_http_transport
+from .pagination import PaginationError, has_next_page, paginate
+
 class N11MarketplaceAPI:
     """N11 Marketplace API Client"""
     
@@ -29,7 +31,7 @@ class N11MarketplaceAPI:
         else:
             self.base_url = "https://api.n11.com/ws"  # N11 production URL (aynı endpoint)
             
-        self.session = requests.Session()
+        self.session = get_http_transport().session('n11')
         self.session.headers.update({
             'Content-Type': 'application/xml',
             'User-Agent': 'N11Marketplace-Python-Client/1.0'
@@ -60,21 +62,38 @@ class N11MarketplaceAPI:
         
         try:
             response = self.session.post(url, data=xml_data)
-            response.raise_for_status()
-            
-            # XML yanıtını parse et
-            root = ET.fromstring(response.content)
-            
-            # XML'i dictionary'ye çevir
-            return self._xml_to_dict(root)
-            
-        except requests.exceptions.RequestException as e:
+            return self._parse_response(response)
+        except TransportError as e:
             self.logger.error(f"N11 API request failed: {e}")
             return {"success": False, "error": str(e)}
         except ET.ParseError as e:
             self.logger.error(f"N11 XML parse error: {e}")
             return {"success": False, "error": f"XML parse error: {str(e)}"}
 
+    async def _amake_request(self, service: str, xml_data: str) -> Dict:
+        """_make_request'in event loop'u bloklamayan async karşılığı"""
+        url = f"{self.base_url}/{service}"
+        
+        try:
+            response = await self.session.apost(url, data=xml_data)
+            return self._parse_response(response)
+        except TransportError as e:
+            self.logger.error(f"N11 API request failed: {e}")
+            return {"success": False, "error": str(e)}
+        except ET.ParseError as e:
+            self.logger.error(f"N11 XML parse error: {e}")
+            return {"success": False, "error": f"XML parse error: {str(e)}"}
+
+    def _parse_response(self, response) -> Dict:
+        """XML yanıtını dictionary'ye çevirir"""
+        response.raise_for_status()
+        
+        # XML yanıtını parse et
+        root = ET.fromstring(response.content)
+        
+        # XML'i dictionary'ye çevir
+        return self._xml_to_dict(root)
+
     def _xml_to_dict(self, element: ET.Element) -> Dict:
         """XML elementini dictionary'ye çevirir"""
         result = {}
@@ -169,6 +188,9 @@ class N11MarketplaceAPI:
 
     def get_product_list(self, page_index: int = 0, page_size: int = 100) -> Dict:
         """Ürün listesini getirir"""
+        return self._make_request("ProductService.wsdl", self._product_list_xml(page_index, page_size))
+
+    def _product_list_xml(self, page_index: int, page_size: int) -> str:
         root = ET.Element("productListRequest")
         self._create_auth_element(root)
         
@@ -176,8 +198,16 @@ class N11MarketplaceAPI:
         ET.SubElement(pagingData, "currentPage").text = str(page_index)
         ET.SubElement(pagingData, "pageSize").text = str(page_size)
         
-        xml_data = ET.tostring(root, encoding='unicode')
-        return self._make_request("ProductService.wsdl", xml_data)
+        return ET.tostring(root, encoding='unicode')
+
+    async def iter_products(self, page_size: int = 100, max_pages: int = None) -> AsyncIterator[Dict]:
+        """Tüm ürünleri sayfa sayfa (sonraki sayfa önceden istenerek) normalize edilmiş olarak döndürür"""
+        def fetch(page: int):
+            return self._amake_request("ProductService.wsdl", self._product_list_xml(page, page_size))
+        
+        async for product in paginate('n11', fetch, self._parse_page('products', 'product', page_size),
+                                      self.normalize_product, max_pages=max_pages):
+            yield product
 
     def get_product(self, product_id: str) -> Dict:
         """Tek ürün bilgisini getirir"""
@@ -199,6 +229,9 @@ class N11MarketplaceAPI:
         xml_data = ET.tostring(root, encoding='unicode')
         return self._make_request("ProductService.wsdl", xml_data)
 
+    # update_stock_by_stock_code'un platforma gönderdiği alanlar (fiyat gönderilmez)
+    STOCK_PRICE_FIELDS = ('quantity',)
+
     def update_stock_by_stock_code(self, stock_code: str, quantity: int) -> Dict:
         """Stok koduna göre stok günceller"""
         root = ET.Element("stockUpdateRequest")
@@ -212,10 +245,20 @@ class N11MarketplaceAPI:
         xml_data = ET.tostring(root, encoding='unicode')
         return self._make_request("ProductStockService.wsdl", xml_data)
 
+    @staticmethod
+    def format_date(timestamp: float) -> str:
+        """Epoch saniyeyi N11 tarih filtresi formatına (gg/aa/yyyy) çevirir"""
+        return datetime.fromtimestamp(timestamp).strftime("%d/%m/%Y")
+
     # SİPARİŞ YÖNETİMİ
     def get_order_list(self, start_date: str = None, end_date: str = None,
                        status: str = None, page_index: int = 0, page_size: int = 100) -> Dict:
         """Sipariş listesini getirir"""
+        xml_data = self._order_list_xml(start_date, end_date, status, page_index, page_size)
+        return self._make_request("OrderService.wsdl", xml_data)
+
+    def _order_list_xml(self, start_date: str, end_date: str, status: str,
+                        page_index: int, page_size: int) -> str:
         root = ET.Element("orderListRequest")
         self._create_auth_element(root)
         
@@ -232,8 +275,86 @@ class N11MarketplaceAPI:
         ET.SubElement(pagingData, "currentPage").text = str(page_index)
         ET.SubElement(pagingData, "pageSize").text = str(page_size)
         
-        xml_data = ET.tostring(root, encoding='unicode')
-        return self._make_request("OrderService.wsdl", xml_data)
+        return ET.tostring(root, encoding='unicode')
+
+    async def iter_orders(self, start_date: str = None, end_date: str = None, status: str = None,
+                          page_size: int = 100, max_pages: int = None) -> AsyncIterator[Dict]:
+        """Tüm siparişleri sayfa sayfa (sonraki sayfa önceden istenerek) normalize edilmiş olarak döndürür"""
+        def fetch(page: int):
+            xml_data = self._order_list_xml(start_date, end_date, status, page, page_size)
+            return self._amake_request("OrderService.wsdl", xml_data)
+        
+        async for order in paginate('n11', fetch, self._parse_page('orderList', 'order', page_size),
+                                    self.normalize_order, max_pages=max_pages):
+            yield order
+
+    @staticmethod
+    def _text(node: Any) -> Optional[str]:
+        """_xml_to_dict çıktısındaki yaprak değeri"""
+        return node.get('text') if isinstance(node, dict) else node
+
+    @classmethod
+    def _parse_page(cls, list_tag: str, item_tag: str, page_size: int):
+        def parse(response: Dict, page: int):
+            result = response.get('result', {})
+            if cls._text(result.get('status')) == 'failure':
+                raise PaginationError('n11', page, {'error': cls._text(result.get('errorMessage'))})
+            
+            items = (response.get(list_tag) or {}).get(item_tag) or []
+            if isinstance(items, dict):
+                items = [items]
+            paging = response.get('pagingData') or {}
+            return items, has_next_page(page, page_size, len(items), cls._text(paging.get('pageCount')),
+                                        cls._text(paging.get('totalCount')))
+        return parse
+
+    @classmethod
+    def normalize_order(cls, order: Dict) -> Dict:
+        """N11 siparişini ortak sipariş formatına çevirir"""
+        items = (order.get('itemList') or {}).get('item') or []
+        if isinstance(items, dict):
+            items = [items]
+        return {
+            "platform": "n11",
+            "order_number": cls._text(order.get('orderNumber')),
+            "package_id": cls._text(order.get('id')),
+            "status": cls._text(order.get('status')),
+            "order_date": cls._text(order.get('createDate')),
+            "updated_at": cls._text(order.get('lastModifiedDate')),
+            "total_price": cls._text(order.get('totalAmount')),
+            "currency": "TRY",
+            "customer": cls._text((order.get('buyer') or {}).get('fullName')),
+            "lines": [
+                {
+                    "sku": cls._text(item.get('sellerStockCode')),
+                    "barcode": cls._text(item.get('productSellerCode')),
+                    "quantity": cls._text(item.get('quantity')),
+                    "price": cls._text(item.get('price'))
+                }
+                for item in items
+            ],
+            "raw": order
+        }
+
+    @classmethod
+    def normalize_product(cls, product: Dict) -> Dict:
+        """N11 ürününü ortak ürün formatına çevirir"""
+        stock_items = (product.get('stockItems') or {}).get('stockItem') or []
+        if isinstance(stock_items, dict):
+            stock_items = [stock_items]
+        first = stock_items[0] if stock_items else {}
+        return {
+            "platform": "n11",
+            "sku": cls._text(first.get('sellerStockCode')) or cls._text(product.get('productSellerCode')),
+            "barcode": cls._text(product.get('productSellerCode')),
+            "title": cls._text(product.get('title')),
+            "quantity": cls._text(first.get('quantity')),
+            "sale_price": cls._text(product.get('displayPrice')),
+            "list_price": cls._text(product.get('price')),
+            "approved": cls._text(product.get('approvalStatus')),
+            "updated_at": None,
+            "raw": product
+        }
 
     def get_order_detail(self, order_id: str) -> Dict:
         """Sipariş detayını getirir"""
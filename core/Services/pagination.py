@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PofuAi Pagination
+================
+
+Marketplace listeleri için otomatik sayfalayan async iterator yardımcıları
+- Sonraki sayfa, mevcut sayfanın kayıtları işlenirken arka planda istenir
+- Bellekte en fazla iki sayfa tutulur; kayıtlar tek tek yield edilir
+- Birden çok iterator'ı eşzamanlı tüketip tek akışta birleştirme
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# Sayfa yanıtı -> (kayıtlar, sonraki sayfa var mı)
+PageParser = Callable[[Dict[str, Any], int], Tuple[List[Any], bool]]
+
+
+class PaginationError(Exception):
+    """Sayfa alınamadı; o ana kadar yield edilen kayıtlar eksik listedir"""
+
+    def __init__(self, platform: str, page: int, response: Any):
+        self.platform = platform
+        self.page = page
+        self.response = response
+        error = response.get('error') if isinstance(response, dict) else response
+        super().__init__(f"{platform} sayfa {page} alınamadı: {error}")
+
+
+def has_next_page(page: int, page_size: int, count: int, total_pages: Any = None,
+                  total_count: Any = None) -> bool:
+    """Toplam sayfa/kayıt bilgisi varsa ona, yoksa sayfanın dolu olmasına göre karar ver"""
+    try:
+        if total_pages is not None:
+            return page + 1 < int(total_pages)
+        if total_count is not None:
+            return (page + 1) * page_size < int(total_count)
+    except (TypeError, ValueError):
+        pass
+    return count >= page_size > 0
+
+
+async def paginate(platform: str, fetch_page: Callable[[int], Awaitable[Dict[str, Any]]],
+                   parse_page: PageParser, normalize: Callable[[Any], Any] = None,
+                   start_page: int = 0, max_pages: Optional[int] = None,
+                   prefetch: bool = True) -> AsyncIterator[Any]:
+    """
+    Sayfaları sırayla çekip kayıtları tek tek yield et
+
+    Args:
+        platform: Hata mesajları için platform adı
+        fetch_page: Sayfa numarasını alıp yanıt döndüren coroutine fonksiyonu
+        parse_page: Yanıttan (kayıtlar, sonraki sayfa var mı) çıkaran fonksiyon
+        normalize: Her kayda uygulanacak dönüşüm
+        start_page: İlk sayfa
+        max_pages: En fazla çekilecek sayfa sayısı
+        prefetch: Kayıtlar işlenirken sonraki sayfayı önceden iste
+
+    Raises:
+        PaginationError: Bir sayfa hata döndürdüğünde ({'success': False, ...})
+    """
+    page = start_page
+    pending = asyncio.ensure_future(fetch_page(page))
+    try:
+        while pending is not None:
+            response = await pending
+            pending = None
+            if not isinstance(response, dict) or response.get('success') is False:
+                raise PaginationError(platform, page, response)
+
+            items, more = parse_page(response, page)
+            if more and items and (max_pages is None or page - start_page + 1 < max_pages):
+                page += 1
+                if prefetch:
+                    pending = asyncio.ensure_future(fetch_page(page))
+                else:
+                    pending = fetch_page(page)
+            # Yanıtın geri kalanı (ham sayfa) kayıtlar işlenirken tutulmaz
+            del response
+
+            for item in items:
+                yield normalize(item) if normalize else item
+    finally:
+        if pending is not None:
+            if isinstance(pending, asyncio.Future):
+                pending.cancel()
+            else:
+                pending.close()
+
+
+async def merge_iterators(iterators: Dict[str, AsyncIterator[Any]],
+                          buffer_size: int = 100) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Birden çok async iterator'ı eşzamanlı tüketip (ad, kayıt) olarak birleştir
+
+    Hata veren iterator diğerlerini durdurmaz; hatası (ad, istisna) olarak
+    yield edilir. Tüketici yavaşsa kuyruk (`buffer_size`) dolar ve
+    üreticiler bekler. Birleştirme kapatıldığında (tüketici erken çıktığında)
+    üreticiler iptal edilir ve kaynak iterator'lar aclose() ile kapatılır.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+    done = object()
+
+    async def drain(name: str, iterator: AsyncIterator[Any]):
+        try:
+            try:
+                async for item in iterator:
+                    await queue.put((name, item))
+            finally:
+                aclose = getattr(iterator, 'aclose', None)
+                if aclose is not None:
+                    await aclose()
+        except Exception as e:
+            await queue.put((name, e))
+        # İptalde buraya gelinmez; dolu kuyrukta bekleyip kapanışı kilitlemez
+        await queue.put((name, done))
+
+    tasks = [asyncio.ensure_future(drain(name, iterator)) for name, iterator in iterators.items()]
+    remaining = len(tasks)
+    try:
+        while remaining:
+            name, item = await queue.get()
+            if item is done:
+                remaining -= 1
+                continue
+            yield name, item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
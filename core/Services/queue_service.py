@@ -4,6 +4,8 @@ Arka plan işlerini (background jobs) ve kuyruk işlemlerini yöneten servis.
 """
 
 import json
+import os
+import socket
 import time
 import uuid
 import threading
@@ -47,6 +49,8 @@ class Job:
         self.max_attempts = 3
         self.error_message = None
         self.result = None
+        self.batch_id = None
+        self.lease_token = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Job'u dictionary'e çevir"""
@@ -62,7 +66,8 @@ class Job:
             'attempts': self.attempts,
             'max_attempts': self.max_attempts,
             'error_message': self.error_message,
-            'result': self.result
+            'result': self.result,
+            'batch_id': self.batch_id
         }
     
     @classmethod
@@ -82,6 +87,7 @@ class Job:
         job.max_attempts = data['max_attempts']
         job.error_message = data['error_message']
         job.result = data['result']
+        job.batch_id = data.get('batch_id')
         
         return job
 
@@ -261,6 +267,439 @@ class FileQueueDriver(QueueDriver):
         except Exception:
             return 0
 
+class SQLiteQueueDriver(QueueDriver):
+    """
+    SQLite (WAL) tabanlı kalıcı queue sürücüsü
+    
+    Her job tek satırdır; ekleme tek INSERT, alma (claim) indeks üzerinden
+    O(log n) seçim + UPDATE ile tek transaction'da yapılır. Alınan job'a
+    görünürlük süresi (lease) verilir; süre dolarsa job başka bir işçi
+    tarafından yeniden alınabilir. Birden çok süreç aynı dosyayı güvenle
+    paylaşabilir.
+    """
+    
+    def __init__(self, config: Dict[str, Any]):
+        queue_path = Path(config.get('path', 'storage/Queue'))
+        queue_path.mkdir(parents=True, exist_ok=True)
+        self.database = str(queue_path / config.get('database', 'queue.db'))
+        self.visibility_timeout = config.get('visibility_timeout', 300)
+        self.busy_timeout = config.get('busy_timeout', 5000)
+        self._local = threading.local()
+        self._pid = os.getpid()
+        
+        conn = self._connection()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS queue_jobs (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                id TEXT NOT NULL UNIQUE,
+                type TEXT NOT NULL,
+                priority INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                available_at REAL NOT NULL,
+                lease_until REAL,
+                lease_token TEXT,
+                finished_at REAL,
+                batch_id TEXT,
+                done_seq INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS idx_queue_jobs_pending
+                ON queue_jobs (status, priority DESC, seq);
+            CREATE INDEX IF NOT EXISTS idx_queue_jobs_lease
+                ON queue_jobs (status, lease_until);
+            CREATE INDEX IF NOT EXISTS idx_queue_jobs_finished
+                ON queue_jobs (status, finished_at);
+            CREATE TABLE IF NOT EXISTS queue_workers (
+                worker_id TEXT PRIMARY KEY,
+                pid INTEGER,
+                hostname TEXT,
+                kind TEXT,
+                started_at REAL,
+                heartbeat_at REAL,
+                current_job TEXT,
+                processed INTEGER DEFAULT 0,
+                failed INTEGER DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_queue_jobs_batch
+                ON queue_jobs (batch_id, done_seq);
+            CREATE TABLE IF NOT EXISTS queue_batches (
+                id TEXT PRIMARY KEY,
+                name TEXT,
+                total INTEGER NOT NULL,
+                completed INTEGER NOT NULL DEFAULT 0,
+                failed INTEGER NOT NULL DEFAULT 0,
+                cancelled INTEGER NOT NULL DEFAULT 0,
+                meta TEXT,
+                created_at REAL NOT NULL,
+                finished_at REAL,
+                notified INTEGER NOT NULL DEFAULT 0
+            );
+            -- Batch sayaçları job durum geçişiyle aynı transaction'da güncellenir;
+            -- done_seq batch içi bitiş sırasıdır ve sonuç akışında imleç olarak kullanılır
+            CREATE TRIGGER IF NOT EXISTS trg_queue_jobs_batch_done
+            AFTER UPDATE OF status ON queue_jobs
+            WHEN NEW.batch_id IS NOT NULL
+                AND OLD.status NOT IN ('completed', 'failed', 'cancelled')
+                AND NEW.status IN ('completed', 'failed', 'cancelled')
+            BEGIN
+                UPDATE queue_batches SET
+                    completed = completed + (NEW.status = 'completed'),
+                    failed = failed + (NEW.status = 'failed'),
+                    cancelled = cancelled + (NEW.status = 'cancelled'),
+                    finished_at = CASE WHEN completed + failed + cancelled + 1 >= total
+                                       THEN (julianday('now') - 2440587.5) * 86400.0 ELSE finished_at END
+                WHERE id = NEW.batch_id;
+                UPDATE queue_jobs SET done_seq = (
+                    SELECT completed + failed + cancelled FROM queue_batches WHERE id = NEW.batch_id
+                ) WHERE seq = NEW.seq;
+            END;
+        """)
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Thread (ve süreç) başına bağlantı"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            conn = sqlite3.connect(self.database, timeout=self.busy_timeout / 1000,
+                                   isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout)}")
+            self._local.conn = conn
+        return conn
+    
+    def _row_values(self, job: Job, available_at: float = None) -> tuple:
+        finished_at = time.time() if job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED) else None
+        return (
+            job.id, job.type, job.priority.value, job.status.value,
+            json.dumps(job.to_dict(), ensure_ascii=False, default=str),
+            available_at if available_at is not None else time.time(), finished_at
+        )
+    
+    def _to_job(self, row) -> Job:
+        payload, status, priority, lease_token = row
+        job = Job.from_dict(json.loads(payload))
+        job.status = JobStatus(status)
+        job.priority = JobPriority(priority)
+        job.lease_token = lease_token
+        return job
+    
+    def push(self, job: Job, delay: float = 0) -> bool:
+        """Job'u kuyruğa ekle"""
+        try:
+            self._connection().execute(
+                "INSERT INTO queue_jobs (id, type, priority, status, payload, available_at, finished_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self._row_values(job, time.time() + delay)
+            )
+            return True
+        except Exception as e:
+            print(f"Job ekleme hatası: {e}")
+            return False
+    
+    def push_many(self, jobs: List[Job], batch_id: str = None, name: str = None,
+                  meta: Dict[str, Any] = None, delay: float = 0) -> int:
+        """
+        Job'ları tek transaction ile kuyruğa ekle
+        
+        Args:
+            jobs: Eklenecek job'lar
+            batch_id: Verilirse job'lar bu batch'e bağlanır ve batch kaydı oluşturulur
+            name: Batch adı
+            meta: Batch ile saklanacak ek bilgiler
+            delay: Job'ların hazır olacağı gecikme (saniye)
+        
+        Returns:
+            int: Eklenen job sayısı (hata durumunda 0)
+        """
+        conn = self._connection()
+        available_at = time.time() + delay
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if batch_id:
+                    conn.execute(
+                        "INSERT INTO queue_batches (id, name, total, meta, created_at) VALUES (?, ?, ?, ?, ?)",
+                        (batch_id, name, len(jobs), json.dumps(meta or {}, default=str), time.time())
+                    )
+                for job in jobs:
+                    job.batch_id = batch_id or job.batch_id
+                conn.executemany(
+                    "INSERT INTO queue_jobs (id, type, priority, status, payload, available_at, finished_at, batch_id) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (self._row_values(job, available_at) + (job.batch_id,) for job in jobs)
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            return len(jobs)
+        except Exception as e:
+            print(f"Toplu job ekleme hatası: {e}")
+            return 0
+    
+    def pop(self, visibility_timeout: float = None, job_types: List[str] = None,
+            exclude_types: List[str] = None, limits: Dict[str, int] = None) -> Optional[Job]:
+        """
+        En yüksek öncelikli hazır job'u atomik olarak al (claim)
+        
+        Args:
+            visibility_timeout: Lease süresi (saniye); varsayılan sürücü ayarı
+            job_types: Sadece bu tiplerden al
+            exclude_types: Bu tipleri alma
+            limits: Tip başına eşzamanlı çalışan job üst sınırı (tüm işçiler için)
+        """
+        conn = self._connection()
+        now = time.time()
+        lease_until = now + (visibility_timeout or self.visibility_timeout)
+        token = uuid.uuid4().hex
+        
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Süresi dolan lease'ler kuyruğa geri döner; deneme hakkı bitenler başarısız sayılır
+                conn.execute(
+                    "UPDATE queue_jobs SET status = 'failed', lease_until = NULL, lease_token = NULL, "
+                    "finished_at = ?, payload = json_set(payload, '$.status', 'failed', '$.completed_at', ?, "
+                    "'$.error_message', 'Lease süresi doldu ve deneme hakkı bitti') "
+                    "WHERE status = 'processing' AND lease_until < ? "
+                    "AND json_extract(payload, '$.attempts') >= json_extract(payload, '$.max_attempts')",
+                    (now, datetime.now().isoformat(), now)
+                )
+                conn.execute(
+                    "UPDATE queue_jobs SET status = 'pending', lease_until = NULL, lease_token = NULL "
+                    "WHERE status = 'processing' AND lease_until < ?", (now,)
+                )
+                excluded = set(exclude_types or ())
+                if limits:
+                    running = dict(conn.execute(
+                        "SELECT type, COUNT(*) FROM queue_jobs WHERE status = 'processing' GROUP BY type"
+                    ).fetchall())
+                    excluded.update(name for name, limit in limits.items() if running.get(name, 0) >= limit)
+                
+                query = "SELECT seq FROM queue_jobs WHERE status = 'pending' AND available_at <= ?"
+                params = [now]
+                if job_types is not None:
+                    allowed = [name for name in job_types if name not in excluded]
+                    if not allowed:
+                        conn.execute("COMMIT")
+                        return None
+                    query += f" AND type IN ({', '.join('?' * len(allowed))})"
+                    params.extend(allowed)
+                elif excluded:
+                    query += f" AND type NOT IN ({', '.join('?' * len(excluded))})"
+                    params.extend(excluded)
+                
+                row = conn.execute(query + " ORDER BY priority DESC, seq LIMIT 1", params).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                
+                started_at = datetime.now().isoformat()
+                conn.execute(
+                    "UPDATE queue_jobs SET status = 'processing', lease_until = ?, lease_token = ?, "
+                    "payload = json_set(payload, '$.status', 'processing', '$.started_at', ?) WHERE seq = ?",
+                    (lease_until, token, started_at, row[0])
+                )
+                job_row = conn.execute(
+                    "SELECT payload, status, priority, lease_token FROM queue_jobs WHERE seq = ?", (row[0],)
+                ).fetchone()
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            
+            return self._to_job(job_row)
+        except Exception as e:
+            print(f"Job alma hatası: {e}")
+            return None
+    
+    def extend_lease(self, job: Job, seconds: float = None) -> bool:
+        """Uzun süren job'un lease süresini uzat"""
+        cursor = self._connection().execute(
+            "UPDATE queue_jobs SET lease_until = ? WHERE id = ? AND status = 'processing' AND lease_token = ?",
+            (time.time() + (seconds or self.visibility_timeout), job.id, job.lease_token)
+        )
+        return cursor.rowcount > 0
+    
+    def release(self, job: Job, delay: float = 0) -> bool:
+        """Job'u (örn. yeniden deneme için) gecikmeli olarak kuyruğa geri bırak"""
+        job.status = JobStatus.PENDING
+        return self.update(job, available_at=time.time() + delay)
+    
+    def get(self, job_id: str) -> Optional[Job]:
+        """Job ID ile job getir"""
+        try:
+            row = self._connection().execute(
+                "SELECT payload, status, priority, lease_token FROM queue_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            return self._to_job(row) if row else None
+        except Exception as e:
+            print(f"Job getirme hatası: {e}")
+            return None
+    
+    def update(self, job: Job, available_at: float = None) -> bool:
+        """
+        Job'u güncelle
+        
+        Lease'i başka bir işçiye geçmiş (süresi dolup yeniden alınmış) bir
+        job'un eski sahibinin güncellemesi reddedilir.
+        """
+        try:
+            _, job_type, priority, status, payload, _, finished_at = self._row_values(job)
+            assignments = ["type = ?", "priority = ?", "status = ?", "payload = ?", "finished_at = ?"]
+            params = [job_type, priority, status, payload, finished_at]
+            
+            if available_at is not None:
+                assignments.append("available_at = ?")
+                params.append(available_at)
+            if job.status != JobStatus.PROCESSING:
+                assignments.append("lease_until = NULL, lease_token = NULL")
+            
+            query = f"UPDATE queue_jobs SET {', '.join(assignments)} WHERE id = ?"
+            params.append(job.id)
+            if job.lease_token:
+                query += " AND (lease_token IS NULL OR lease_token = ?)"
+                params.append(job.lease_token)
+            
+            cursor = self._connection().execute(query, params)
+            return cursor.rowcount > 0
+        except Exception as e:
+            print(f"Job güncelleme hatası: {e}")
+            return False
+    
+    def delete(self, job_id: str) -> bool:
+        """Job'u sil"""
+        try:
+            self._connection().execute("DELETE FROM queue_jobs WHERE id = ?", (job_id,))
+            return True
+        except Exception as e:
+            print(f"Job silme hatası: {e}")
+            return False
+    
+    def clear(self) -> bool:
+        """Tüm kuyruğu temizle"""
+        try:
+            self._connection().execute("DELETE FROM queue_jobs")
+            return True
+        except Exception as e:
+            print(f"Queue temizleme hatası: {e}")
+            return False
+    
+    def size(self) -> int:
+        """Kuyruk boyutunu getir (bekleyen job'lar)"""
+        try:
+            return self._connection().execute(
+                "SELECT COUNT(*) FROM queue_jobs WHERE status = 'pending'"
+            ).fetchone()[0]
+        except Exception:
+            return 0
+    
+    def counts(self) -> Dict[str, int]:
+        """Duruma göre job sayıları"""
+        rows = self._connection().execute("SELECT status, COUNT(*) FROM queue_jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+    
+    def heartbeat(self, worker_id: str, kind: str = 'process', current_job: str = None,
+                  processed: int = 0, failed: int = 0) -> None:
+        """İşçinin canlılık kaydını güncelle"""
+        now = time.time()
+        self._connection().execute(
+            "INSERT INTO queue_workers (worker_id, pid, hostname, kind, started_at, heartbeat_at, current_job, processed, failed) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (worker_id) DO UPDATE SET "
+            "heartbeat_at = excluded.heartbeat_at, current_job = excluded.current_job, "
+            "processed = excluded.processed, failed = excluded.failed",
+            (worker_id, os.getpid(), socket.gethostname(), kind, now, now, current_job, processed, failed)
+        )
+    
+    def workers(self, stale_after: float = None) -> List[Dict[str, Any]]:
+        """Kayıtlı işçiler (stale_after verilirse son heartbeat'i eski olanlar işaretlenir)"""
+        cursor = self._connection().execute("SELECT * FROM queue_workers ORDER BY started_at")
+        columns = [column[0] for column in cursor.description]
+        workers = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        if stale_after:
+            for worker in workers:
+                worker['stale'] = time.time() - worker['heartbeat_at'] > stale_after
+        return workers
+    
+    def remove_worker(self, worker_id: str) -> None:
+        """İşçi kaydını sil"""
+        self._connection().execute("DELETE FROM queue_workers WHERE worker_id = ?", (worker_id,))
+    
+    def get_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """Batch ilerleme bilgisi"""
+        cursor = self._connection().execute("SELECT * FROM queue_batches WHERE id = ?", (batch_id,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        
+        batch = dict(zip([column[0] for column in cursor.description], row))
+        batch['meta'] = json.loads(batch['meta'] or '{}')
+        batch['done'] = batch['completed'] + batch['failed'] + batch['cancelled']
+        batch['pending'] = batch['total'] - batch['done']
+        batch['progress'] = round(batch['done'] / batch['total'] * 100, 2) if batch['total'] else 100.0
+        batch['finished'] = batch['finished_at'] is not None
+        del batch['notified']
+        return batch
+    
+    def batch_results(self, batch_id: str, after: int = 0, limit: int = 500) -> List[Job]:
+        """
+        Batch'in biten job'larını bitiş sırasıyla getir
+        
+        Args:
+            after: Bu done_seq değerinden sonrakiler (akış imleci)
+            limit: Maksimum job sayısı
+        """
+        rows = self._connection().execute(
+            "SELECT payload, status, priority, lease_token, done_seq FROM queue_jobs "
+            "WHERE batch_id = ? AND done_seq > ? ORDER BY done_seq LIMIT ?",
+            (batch_id, after, limit)
+        ).fetchall()
+        jobs = []
+        for row in rows:
+            job = self._to_job(row[:4])
+            job.done_seq = row[4]
+            jobs.append(job)
+        return jobs
+    
+    def claim_batch_completion(self, batch_id: str) -> bool:
+        """Biten batch için tamamlanma bildirimini yalnızca bir kez ver"""
+        cursor = self._connection().execute(
+            "UPDATE queue_batches SET notified = 1 WHERE id = ? AND finished_at IS NOT NULL AND notified = 0",
+            (batch_id,)
+        )
+        return cursor.rowcount > 0
+    
+    def compact(self, keep_completed: int = 1000, keep_failed: int = 10000,
+                older_than: float = 7 * 24 * 3600) -> int:
+        """
+        Tamamlanan/başarısız job'ları buda
+        
+        Her durum için en yeni `keep_*` kayıt ve `older_than` saniyeden yeni
+        olanlar tutulur; ardından WAL dosyası küçültülür.
+        
+        Returns:
+            int: Silinen job sayısı
+        """
+        conn = self._connection()
+        cutoff = time.time() - older_than
+        removed = 0
+        for statuses, keep in ((('completed', 'cancelled'), keep_completed), (('failed',), keep_failed)):
+            placeholders = ', '.join('?' * len(statuses))
+            cursor = conn.execute(
+                f"DELETE FROM queue_jobs WHERE status IN ({placeholders}) AND finished_at < ? AND seq NOT IN ("
+                f"SELECT seq FROM queue_jobs WHERE status IN ({placeholders}) ORDER BY finished_at DESC LIMIT ?)",
+                (*statuses, cutoff, *statuses, keep)
+            )
+            removed += cursor.rowcount
+        conn.execute(
+            "DELETE FROM queue_batches WHERE finished_at < ? "
+            "AND NOT EXISTS (SELECT 1 FROM queue_jobs WHERE queue_jobs.batch_id = queue_batches.id)",
+            (cutoff,)
+        )
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return removed
+
 class QueueService(BaseService):
     """Kuyruk işlemleri için merkezi servis"""
     
@@ -274,9 +713,11 @@ class QueueService(BaseService):
     
     def _create_driver(self) -> QueueDriver:
         """Queue sürücüsü oluştur"""
-        driver_name = self.queue_config.get('driver', 'file')
+        driver_name = self.queue_config.get('driver', 'sqlite')
         
-        if driver_name == 'file':
+        if driver_name == 'sqlite':
+            return SQLiteQueueDriver(self.queue_config)
+        elif driver_name == 'file':
             return FileQueueDriver(self.queue_config)
         else:
             raise ValueError(f"Desteklenmeyen queue sürücüsü: {driver_name}")
@@ -300,6 +741,111 @@ class QueueService(BaseService):
         except Exception as e:
             return self.handle_exception(e, "Job ekleme hatası")
     
+    def add_jobs_batch(self, job_type: str, items: List[Dict[str, Any]],
+                       priority: JobPriority = JobPriority.NORMAL, name: str = None,
+                       meta: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Aynı tipte çok sayıda job'u tek yazma işlemiyle kuyruğa ekle
+        
+        Args:
+            job_type: Job tipi
+            items: Her job için veri
+            priority: Job önceliği
+            name: Batch adı
+            meta: Batch ile saklanacak ek bilgiler
+        
+        Returns:
+            Dict: batch_id ve eklenen job sayısı
+        """
+        try:
+            if not items:
+                return self.error_response("Batch boş", status=400)
+            
+            jobs = [Job(job_type, data, priority) for data in items]
+            batch_id = str(uuid.uuid4())
+            
+            if hasattr(self.driver, 'push_many'):
+                count = self.driver.push_many(jobs, batch_id, name, meta)
+            else:
+                for job in jobs:
+                    job.batch_id = batch_id
+                count = sum(1 for job in jobs if self.driver.push(job))
+            
+            if count:
+                self.log(f"Job batch eklendi: {batch_id} ({job_type}, {count} job)")
+                return self.success_response(
+                    data={'batch_id': batch_id, 'type': job_type, 'count': count},
+                    message="Job batch kuyruğa eklendi"
+                )
+            else:
+                return self.error_response("Job batch eklenemedi")
+                
+        except Exception as e:
+            return self.handle_exception(e, "Job batch ekleme hatası")
+    
+    def get_batch(self, batch_id: str) -> Dict[str, Any]:
+        """Batch ilerleme bilgilerini getir"""
+        try:
+            batch = self.driver.get_batch(batch_id) if hasattr(self.driver, 'get_batch') else None
+            
+            if batch:
+                return self.success_response(data=batch, message="Batch bilgileri getirildi")
+            else:
+                return self.error_response("Batch bulunamadı", status=404)
+                
+        except Exception as e:
+            return self.handle_exception(e, "Batch getirme hatası")
+    
+    def iter_batch_results(self, batch_id: str, poll_interval: float = 0.5,
+                           timeout: float = None, chunk_size: int = 500):
+        """
+        Batch'in job'larını bittikçe (tamamlanan ya da başarısız) akış halinde getir
+        
+        Job'lar bitiş sırasıyla bir kez verilir; batch bitince ya da `timeout`
+        dolunca generator sonlanır.
+        
+        Yields:
+            Job: Biten job
+        """
+        if not hasattr(self.driver, 'batch_results'):
+            self.log("Queue driver batch sonuçlarını desteklemiyor", 'warning')
+            return
+        
+        deadline = time.time() + timeout if timeout else None
+        cursor = 0
+        
+        while True:
+            jobs = self.driver.batch_results(batch_id, cursor, chunk_size)
+            for job in jobs:
+                cursor = job.done_seq
+                yield job
+            if len(jobs) == chunk_size:
+                continue
+            
+            batch = self.driver.get_batch(batch_id) if hasattr(self.driver, 'get_batch') else None
+            if batch is None or (batch['finished'] and cursor >= batch['done']):
+                return
+            if deadline and time.time() >= deadline:
+                return
+            time.sleep(poll_interval)
+    
+    def wait_batch(self, batch_id: str, callback: Callable[[Job], Any] = None,
+                   poll_interval: float = 0.5, timeout: float = None) -> Dict[str, Any]:
+        """
+        Batch bitene kadar bekle; her biten job için `callback` çağrılır
+        
+        Returns:
+            Dict: Son batch ilerleme bilgisi
+        """
+        for job in self.iter_batch_results(batch_id, poll_interval, timeout):
+            if callback:
+                try:
+                    callback(job)
+                except Exception as e:
+                    self.log(f"Batch callback hatası ({job.id}): {e}", 'error')
+        
+        return self.get_batch(batch_id)
+    
     def get_job(self, job_id: str) -> Dict[str, Any]:
         """Job bilgilerini getir"""
         try:
@@ -352,12 +898,45 @@ class QueueService(BaseService):
         self.job_handlers[job_type] = handler
         self.log(f"Job handler kaydedildi: {job_type}")
     
+    def start_workers(self, processes: int = None, **options):
+        """
+        Arka planda çok süreçli işçi havuzunu başlat
+        
+        Args:
+            processes: İşçi süreç sayısı (varsayılan: config ya da CPU sayısı)
+            **options: WorkerPool seçenekleri (async_workers, limits, retry...)
+        
+        Returns:
+            WorkerPool: Başlatılan havuz
+        """
+        from core.Services.queue_worker import WorkerPool
+        
+        pool = WorkerPool.from_service(self, processes=processes, **options).start()
+        self.workers.append(pool)
+        self.is_running = True
+        return pool
+    
+    def stop_workers(self, timeout: float = None):
+        """Başlatılan işçi havuzlarını nazikçe durdur"""
+        for pool in self.workers:
+            pool.stop(timeout)
+        self.workers = []
+        self.is_running = False
+    
+    def work(self, processes: int = None, **options):
+        """İşçi havuzunu ön planda, SIGINT/SIGTERM gelene kadar çalıştır"""
+        from core.Services.queue_worker import WorkerPool
+        
+        WorkerPool.from_service(self, processes=processes, **options).run()
+    
     def get_stats(self) -> Dict[str, Any]:
         """Queue istatistiklerini getir"""
         try:
             stats = {
                 'queue_size': self.driver.size(),
-                'worker_count': len(self.workers),
+                'status_counts': self.driver.counts() if hasattr(self.driver, 'counts') else {},
+                'worker_count': sum(len(pool.workers) for pool in self.workers),
+                'workers': self.driver.workers() if hasattr(self.driver, 'workers') else [],
                 'is_running': self.is_running,
                 'registered_handlers': list(self.job_handlers.keys())
             }
@@ -371,6 +950,9 @@ class QueueService(BaseService):
 class JobHandlers:
     """Önceden tanımlanmış iş handler'ları"""
     
+    # İşçi süreci başına bir kez bağlanan entegrasyon yöneticisi
+    _integration_manager = None
+    
     @staticmethod
     def send_email(data: Dict[str, Any]):
         """Email gönderme işi"""
@@ -400,16 +982,72 @@ class JobHandlers:
         )
     
     @staticmethod
-    def process_image(data: Dict[str, Any]):
-        """Resim işleme işi"""
-        # Resim işleme mantığı
-        pass
+    def sync_product(data: Dict[str, Any]):
+        """Ürünü tüm pazaryerlerine senkronize etme işi (SKU başına bir job)"""
+        if JobHandlers._integration_manager is None:
+            from core.Services.real_integration_manager import RealIntegrationManager
+            
+            manager = RealIntegrationManager()
+            manager.test_all_connections()
+            JobHandlers._integration_manager = manager
+        
+        return JobHandlers._integration_manager.sync_product_to_all_platforms(data)
+    
+    @staticmethod
+    async def process_image(data: Dict[str, Any]):
+        """Resim işleme işi (AI çekirdeği ile analiz)"""
+        from core.AI.ai_core import ai_core
+        
+        return await ai_core.process_image(data['image_path'], data.get('user_id'))
     
     @staticmethod
     def generate_report(data: Dict[str, Any]):
-        """Rapor oluşturma işi"""
-        # Rapor oluşturma mantığı
-        pass
+        """Rapor oluşturma işi; rapor `output` dosyasına (verilmezse storage/reports altına) yazılır, sonuç dosya bilgisidir"""
+        from core.Services.advanced_reporting_service import (
+            AdvancedReportingService, ReportConfig, ReportFilter, ReportType
+        )
+        
+        report_type = ReportType(data['type'])
+        date_range = {
+            key: datetime.fromisoformat(value)
+            for key, value in (data.get('date_range') or {}).items() if value
+        }
+        config = ReportConfig(
+            name=data.get('name', report_type.value),
+            type=report_type,
+            filters=[ReportFilter(**item) for item in data.get('filters', [])],
+            groupby=data.get('groupby', []),
+            orderby=data.get('orderby', []),
+            limit=data.get('limit'),
+            date_range=date_range or None,
+            custom_fields=data.get('custom_fields')
+        )
+        
+        service = AdvancedReportingService()
+        generators = {
+            ReportType.USER_BEHAVIOR: service.generate_user_behavior_report,
+            ReportType.SALES_ANALYSIS: service.generate_sales_analysis_report,
+            ReportType.SYSTEM_PERFORMANCE: service.generate_system_performance_report,
+            ReportType.CUSTOM_QUERY: service.generate_custom_report,
+            ReportType.ORDER_HISTORY: service.generate_order_history_report,
+        }
+        if report_type not in generators:
+            raise ValueError(f"Desteklenmeyen rapor tipi: {report_type.value}")
+        report = generators[report_type](config)
+        export_format = data.get('format', 'json').lower()
+        
+        # Rapor her zaman dosyaya yazılır; kuyruk kaydında yalnızca dosya bilgisi tutulur
+        output = data.get('output')
+        if output is None:
+            from core.Config.config import get_config
+            
+            extension = 'xlsx' if export_format == 'excel' else export_format
+            reports_dir = os.path.join(get_config('storage.root', 'storage'), 'reports')
+            os.makedirs(reports_dir, exist_ok=True)
+            output = os.path.join(reports_dir, f"{uuid.uuid4().hex}.{extension}")
+        
+        service.export_report(report, export_format, output=output)
+        return {'output': output, 'format': export_format, 'size': os.path.getsize(output)}
 
 # Global queue service instance
 _queue_service = None
@@ -425,5 +1063,6 @@ def get_queue_service() -> QueueService:
         _queue_service.register_handler('send_notification', JobHandlers.send_notification)
         _queue_service.register_handler('process_image', JobHandlers.process_image)
         _queue_service.register_handler('generate_report', JobHandlers.generate_report)
+        _queue_service.register_handler('sync_product', JobHandlers.sync_product)
     
     return _queue_service 
\ No newline at end of file
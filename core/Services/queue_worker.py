@@ -0,0 +1,425 @@
+"""
+Queue Worker
+Kuyruğu tüketen işçiler ve çok süreçli işçi havuzu (supervisor)
+
+Kullanım:
+    python -m core.Services.queue_worker --processes 4 --async-workers 1
+"""
+import argparse
+import asyncio
+import functools
+import inspect
+import multiprocessing
+import os
+import random
+import signal
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from core.Services.events import Event, SystemEvents, get_dispatcher
+from core.Services.queue_service import Job, JobStatus, SQLiteQueueDriver
+
+
+class BackoffPolicy:
+    """Üstel geri çekilme (exponential backoff) ile yeniden deneme politikası"""
+
+    def __init__(self, base_delay: float = 5.0, factor: float = 2.0,
+                 max_delay: float = 3600.0, jitter: float = 0.1):
+        self.base_delay = base_delay
+        self.factor = factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def delay(self, attempts: int) -> float:
+        """`attempts` başarısız denemeden sonra beklenecek süre (saniye)"""
+        delay = min(self.max_delay, self.base_delay * self.factor ** max(attempts - 1, 0))
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
+
+
+class QueueWorker:
+    """
+    Kuyruktan job alıp çalıştıran işçi
+
+    Job'lar öncelik sırasıyla lease alınarak çekilir. Çalışma süresince arka
+    plan thread'i lease'leri yeniler ve işçinin heartbeat kaydını günceller;
+    süreç ölürse lease dolar ve job başka bir işçiye geçer. Başarısız job'lar
+    BackoffPolicy'ye göre gecikmeli olarak kuyruğa geri bırakılır.
+    """
+
+    def __init__(self, driver: SQLiteQueueDriver, handlers: Dict[str, Callable],
+                 worker_id: str = None, kind: str = 'process',
+                 job_types: List[str] = None, exclude_types: List[str] = None,
+                 limits: Dict[str, int] = None, retry_policy: BackoffPolicy = None,
+                 visibility_timeout: float = None, heartbeat_interval: float = None,
+                 poll_interval: float = 1.0, stop_event=None):
+        self.driver = driver
+        self.handlers = handlers
+        self.worker_id = worker_id or f"{kind}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.kind = kind
+        self.job_types = job_types
+        self.exclude_types = exclude_types
+        self.limits = limits or {}
+        self.retry_policy = retry_policy or BackoffPolicy()
+        self.visibility_timeout = visibility_timeout or driver.visibility_timeout
+        self.heartbeat_interval = heartbeat_interval or self.visibility_timeout / 3
+        self.poll_interval = poll_interval
+        self.stop_event = stop_event or threading.Event()
+        self.processed = 0
+        self.failed = 0
+        self.current: Dict[str, Job] = {}
+
+    def stop(self):
+        """Mevcut job'lar bittikten sonra dur"""
+        self.stop_event.set()
+
+    def _dispatch(self, event_name: str, job: Job, **data):
+        try:
+            get_dispatcher().dispatch(Event(
+                name=event_name,
+                data={'job_id': job.id, 'type': job.type, 'attempts': job.attempts,
+                      'batch_id': job.batch_id, 'worker_id': self.worker_id, **data},
+                source='QueueWorker'
+            ))
+        except Exception as e:
+            print(f"Job event hatası: {e}")
+
+    def _heartbeat_loop(self, done: threading.Event):
+        """Lease'leri yenile ve heartbeat gönder"""
+        while not done.wait(self.heartbeat_interval):
+            self._heartbeat()
+
+    def _heartbeat(self):
+        try:
+            for job in list(self.current.values()):
+                self.driver.extend_lease(job, self.visibility_timeout)
+            self.driver.heartbeat(self.worker_id, self.kind, ','.join(self.current) or None,
+                                  self.processed, self.failed)
+        except Exception as e:
+            print(f"Heartbeat hatası: {e}")
+
+    def _claim(self) -> Optional[Job]:
+        return self.driver.pop(self.visibility_timeout, self.job_types, self.exclude_types, self.limits)
+
+    def _exhausted(self, job: Job) -> bool:
+        """Lease'i dolup yeniden alınan job'un deneme hakkı bittiyse başarısız say"""
+        if job.attempts < job.max_attempts:
+            return False
+        self._finish(job, error=RuntimeError(
+            f"Deneme hakkı bitti ({job.attempts}/{job.max_attempts}); önceki deneme yarıda kaldı"
+        ), retry=False)
+        return True
+
+    def _begin(self, job: Job) -> Optional[Callable]:
+        """Deneme sayısını kaydet ve handler'ı getir"""
+        self.current[job.id] = job
+        job.attempts += 1
+        job.started_at = datetime.now()
+        self.driver.update(job)
+        self._dispatch(SystemEvents.JOB_STARTED, job)
+        return self.handlers.get(job.type)
+
+    def _finish(self, job: Job, result: Any = None, error: Exception = None, retry: bool = True):
+        """Sonucu kaydet; hata varsa yeniden dene ya da başarısız say"""
+        self.current.pop(job.id, None)
+
+        if error is None:
+            job.status = JobStatus.COMPLETED
+            job.completed_at = datetime.now()
+            job.result = result
+            job.error_message = None
+            if not self._save_outcome(job):
+                return
+            self.processed += 1
+            self._dispatch(SystemEvents.JOB_COMPLETED, job)
+        elif retry and job.attempts < job.max_attempts:
+            job.error_message = str(error)
+            delay = self.retry_policy.delay(job.attempts)
+            if not self.driver.release(job, delay):
+                print(f"Job {job.id} ({job.type}) lease'i başka işçiye geçmiş, yeniden deneme kaydedilmedi")
+                return
+            print(f"Job {job.id} ({job.type}) başarısız, {delay:.0f}s sonra tekrar denenecek: {error}")
+        else:
+            job.status = JobStatus.FAILED
+            job.completed_at = datetime.now()
+            job.error_message = str(error)
+            if not self._save_outcome(job):
+                return
+            self.failed += 1
+            self._dispatch(SystemEvents.JOB_FAILED, job, error=str(error))
+
+        if job.batch_id and job.status != JobStatus.PENDING and self.driver.claim_batch_completion(job.batch_id):
+            self._dispatch(SystemEvents.BATCH_COMPLETED, job, batch=self.driver.get_batch(job.batch_id))
+
+    def _save_outcome(self, job: Job) -> bool:
+        """Sonucu yaz; lease başka işçiye geçmişse (token uyuşmazlığı) False"""
+        if self.driver.update(job):
+            return True
+        print(f"Job {job.id} ({job.type}) lease'i başka işçiye geçmiş, sonuç kaydedilmedi")
+        return False
+
+    def execute(self, job: Job):
+        """Tek bir job'u bu thread'de çalıştır"""
+        if self._exhausted(job):
+            return
+        handler = self._begin(job)
+        if handler is None:
+            self._finish(job, error=LookupError(f"Job handler bulunamadı: {job.type}"), retry=False)
+            return
+
+        try:
+            result = handler(job.data)
+            if inspect.isawaitable(result):
+                result = asyncio.run(result)
+        except Exception as e:
+            self._finish(job, error=e)
+        else:
+            self._finish(job, result)
+
+    def run(self, max_jobs: int = None) -> int:
+        """
+        Durdurulana kadar job'ları sırayla çalıştır
+
+        Args:
+            max_jobs: Bu kadar job işlendikten sonra dur
+
+        Returns:
+            int: İşlenen job sayısı
+        """
+        done = threading.Event()
+        threading.Thread(target=self._heartbeat_loop, args=(done,), daemon=True).start()
+        self._heartbeat()
+        handled = 0
+
+        try:
+            while not self.stop_event.is_set() and (max_jobs is None or handled < max_jobs):
+                job = self._claim()
+                if job is None:
+                    self.stop_event.wait(self.poll_interval)
+                    continue
+                self.execute(job)
+                handled += 1
+        finally:
+            done.set()
+            self.driver.remove_worker(self.worker_id)
+        return handled
+
+    async def _execute_async(self, job: Job):
+        loop = asyncio.get_running_loop()
+        if await loop.run_in_executor(None, self._exhausted, job):
+            return
+        handler = await loop.run_in_executor(None, self._begin, job)
+        if handler is None:
+            error = LookupError(f"Job handler bulunamadı: {job.type}")
+            await loop.run_in_executor(None, functools.partial(self._finish, job, error=error, retry=False))
+            return
+
+        try:
+            if inspect.iscoroutinefunction(handler):
+                result = await handler(job.data)
+            else:
+                result = await loop.run_in_executor(None, handler, job.data)
+                if inspect.isawaitable(result):
+                    result = await result
+        except Exception as e:
+            await loop.run_in_executor(None, functools.partial(self._finish, job, error=e))
+        else:
+            await loop.run_in_executor(None, self._finish, job, result)
+
+    async def run_async(self, concurrency: int = 20):
+        """
+        I/O ağırlıklı job'ları tek event loop'ta eşzamanlı çalıştır
+
+        Args:
+            concurrency: Aynı anda çalışan en fazla job sayısı
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks = set()
+        done = threading.Event()
+        threading.Thread(target=self._heartbeat_loop, args=(done,), daemon=True).start()
+        await loop.run_in_executor(None, self._heartbeat)
+
+        def finished(task):
+            tasks.discard(task)
+            semaphore.release()
+
+        try:
+            while not self.stop_event.is_set():
+                await semaphore.acquire()
+                job = await loop.run_in_executor(None, self._claim)
+                if job is None:
+                    semaphore.release()
+                    await asyncio.sleep(self.poll_interval)
+                    continue
+                task = asyncio.ensure_future(self._execute_async(job))
+                tasks.add(task)
+                task.add_done_callback(finished)
+
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            done.set()
+            await loop.run_in_executor(None, self.driver.remove_worker, self.worker_id)
+
+
+def _run_worker_process(worker_id: str, kind: str, options: Dict[str, Any], stop_event):
+    """İşçi sürecinin giriş noktası"""
+    # Ctrl+C yönetici tarafından ele alınır; SIGTERM nazik kapanış başlatır
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+
+    worker = QueueWorker(
+        SQLiteQueueDriver(options['driver_config']),
+        options['handlers'],
+        worker_id=worker_id,
+        kind=kind,
+        job_types=options['async_job_types'] if kind == 'async' else None,
+        exclude_types=None if kind == 'async' else options['exclude_types'],
+        limits=options['limits'],
+        retry_policy=BackoffPolicy(**options['retry']),
+        visibility_timeout=options['visibility_timeout'],
+        heartbeat_interval=options['heartbeat_interval'],
+        poll_interval=options['poll_interval'],
+        stop_event=stop_event
+    )
+
+    if kind == 'async':
+        asyncio.run(worker.run_async(options['async_concurrency']))
+    else:
+        worker.run()
+
+
+class WorkerPool:
+    """
+    Çok süreçli işçi havuzu
+
+    CPU ağırlıklı job'lar (resim işleme, rapor üretimi) için `processes`
+    kadar süreç, I/O ağırlıklı tipler (`async_job_types`) için event loop
+    çalıştıran `async_workers` kadar süreç başlatır. Tip başına eşzamanlılık
+    sınırları (`limits`) tüm süreçler genelinde kuyruk veritabanında
+    uygulanır. Ölen süreçler yeniden başlatılır; durdurulurken işçiler
+    ellerindeki job'u bitirip çıkar.
+    """
+
+    def __init__(self, driver_config: Dict[str, Any], handlers: Dict[str, Callable],
+                 processes: int = None, async_workers: int = 0, async_concurrency: int = 20,
+                 async_job_types: List[str] = None, limits: Dict[str, int] = None,
+                 retry: Dict[str, Any] = None, heartbeat_interval: float = None,
+                 poll_interval: float = 1.0, shutdown_timeout: float = 30.0,
+                 visibility_timeout: float = None):
+        self.driver_config = driver_config
+        self.processes = processes or os.cpu_count() or 1
+        self.async_workers = async_workers if async_job_types else 0
+        self.shutdown_timeout = shutdown_timeout
+        self.options = {
+            'driver_config': driver_config,
+            'handlers': handlers,
+            'async_job_types': list(async_job_types or []),
+            'exclude_types': list(async_job_types or []) if self.async_workers else None,
+            'async_concurrency': async_concurrency,
+            'limits': limits or {},
+            'retry': retry or {},
+            'visibility_timeout': visibility_timeout or driver_config.get('visibility_timeout', 300),
+            'heartbeat_interval': heartbeat_interval,
+            'poll_interval': poll_interval,
+        }
+        self.stop_event = multiprocessing.Event()
+        self.workers: Dict[str, multiprocessing.Process] = {}
+        self._stopping = False
+
+    @classmethod
+    def from_service(cls, service, **overrides) -> 'WorkerPool':
+        """QueueService yapılandırması ve handler'larından havuz oluştur"""
+        options = dict(service.queue_config.get('workers', {}))
+        options.update({key: value for key, value in overrides.items() if value is not None})
+        return cls(service.queue_config, dict(service.job_handlers), **options)
+
+    def _spawn(self, worker_id: str, kind: str):
+        process = multiprocessing.Process(
+            target=_run_worker_process,
+            args=(worker_id, kind, self.options, self.stop_event),
+            name=f"queue-{worker_id}",
+            daemon=False
+        )
+        process.start()
+        self.workers[worker_id] = process
+
+    def start(self) -> 'WorkerPool':
+        """İşçi süreçlerini başlat"""
+        for index in range(self.processes):
+            self._spawn(f"process-{index}", 'process')
+        for index in range(self.async_workers):
+            self._spawn(f"async-{index}", 'async')
+        print(f"Queue worker havuzu başlatıldı: {self.processes} süreç, {self.async_workers} async işçi")
+        return self
+
+    def supervise(self):
+        """Beklenmedik şekilde ölen işçileri yeniden başlat"""
+        for worker_id, process in list(self.workers.items()):
+            if not process.is_alive() and not self._stopping and not self.stop_event.is_set():
+                print(f"Queue işçisi {worker_id} durdu (çıkış kodu {process.exitcode}), yeniden başlatılıyor")
+                self._spawn(worker_id, worker_id.split('-')[0])
+
+    def stop(self, timeout: float = None):
+        """Nazik kapanış: işçiler mevcut job'u bitirir, süre dolarsa sonlandırılır"""
+        self._stopping = True
+        self.stop_event.set()
+        deadline = time.time() + (self.shutdown_timeout if timeout is None else timeout)
+
+        for worker_id, process in self.workers.items():
+            process.join(max(deadline - time.time(), 0))
+            if process.is_alive():
+                # Yarım kalan job'un lease'i dolunca başka bir işçiye geçer
+                print(f"Queue işçisi {worker_id} zamanında durmadı, sonlandırılıyor")
+                process.terminate()
+                process.join(5)
+
+        print("Queue worker havuzu durduruldu")
+
+    def run(self, supervise_interval: float = 5.0):
+        """Havuzu başlat ve SIGINT/SIGTERM gelene kadar çalıştır"""
+        def request_stop(signum, frame):
+            self._stopping = True
+            self.stop_event.set()
+
+        signal.signal(signal.SIGINT, request_stop)
+        signal.signal(signal.SIGTERM, request_stop)
+
+        self.start()
+        try:
+            while not self.stop_event.wait(supervise_interval):
+                self.supervise()
+        finally:
+            self.stop()
+
+    def status(self) -> Dict[str, Any]:
+        """Süreç durumları ve işçi heartbeat kayıtları"""
+        heartbeats = SQLiteQueueDriver(self.driver_config).workers(
+            stale_after=(self.options['heartbeat_interval'] or self.options['visibility_timeout'] / 3) * 3
+        )
+        return {
+            'processes': {worker_id: process.is_alive() for worker_id, process in self.workers.items()},
+            'workers': heartbeats
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PofuAi queue işçileri")
+    parser.add_argument('--processes', type=int, default=None, help="İşçi süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument('--async-workers', type=int, default=None, help="Async işçi süreç sayısı")
+    parser.add_argument('--async-concurrency', type=int, default=None, help="Async işçi başına eşzamanlı job")
+    args = parser.parse_args()
+
+    from core.Services.queue_service import get_queue_service
+    get_queue_service().work(
+        processes=args.processes,
+        async_workers=args.async_workers,
+        async_concurrency=args.async_concurrency
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,8 @@ Bu modül gerçek marketplace ve ödeme API'lerini kullanır.
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+from functools import partial
+from typing import Dict, List, Optional, Any, AsyncIterator
 from datetime import datetime
 import json
 import os
@@ -15,6 +16,9 @@ from .trendyol_marketplace_api import TrendyolMarketplaceAPI
 from .n11_marketplace_api import N11MarketplaceAPI
 from .hepsiburada_marketplace_api import HepsiburadaMarketplaceAPI
 from .iyzico_payment_api import IyzicoPaymentAPI
+from .fan_out import get_fan_out_executor, summarize
+from .pagination import merge_iterators
+from .delta_sync import get_delta_sync_engine
 
 # Configuration management
 import sys
@@ -42,8 +46,15 @@ class RealIntegrationManager:
             'iyzico': {'connected': False, 'last_check': None, 'error': None}
         }
         
+        # Platform başına eşzamanlılık sınırı ve süre sınırıyla paralel çağrılar
+        self.fan_out = get_fan_out_executor()
+        
         self._initialize_apis()
 
+    def _connected(self, platform: str) -> bool:
+        """Platform client'ı var ve bağlı mı?"""
+        return getattr(self, platform) is not None and self.integration_status[platform]['connected']
+
     def _initialize_apis(self):
         """API client'larını başlatır - güvenli config management ile"""
         try:
@@ -171,110 +182,209 @@ class RealIntegrationManager:
         return results
 
     # ÜRÜN YÖNETİMİ
-    def sync_product_to_all_platforms(self, product_data: Dict) -> Dict:
-        """Ürünü tüm platformlara senkronize eder"""
-        results = {}
+    def sync_product_to_all_platforms(self, product_data: Dict, deadlines: Dict[str, float] = None) -> Dict:
+        """Ürünü tüm platformlara paralel senkronize eder
         
-        # Trendyol'a ürün ekle
-        if self.trendyol and self.integration_status['trendyol']['connected']:
-            try:
-                results['trendyol'] = self.trendyol.create_product(product_data)
-            except Exception as e:
-                results['trendyol'] = {'success': False, 'error': str(e)}
+        Args:
+            deadlines: Platform başına süre sınırı (saniye); süresi dolan platformun
+                sonucu {'success': False, 'timed_out': True} olur. Ürün oluşturma
+                idempotent olmadığından istek başlamışsa outcome 'unknown' döner;
+                ürün oluşmuş olabilir, tekrar denemeden önce platformda kontrol edilmelidir
+        """
+        calls = {}
         
-        # N11'e ürün ekle
-        if self.n11 and self.integration_status['n11']['connected']:
-            try:
-                results['n11'] = self.n11.save_product(product_data)
-            except Exception as e:
-                results['n11'] = {'success': False, 'error': str(e)}
+        if self._connected('trendyol'):
+            calls['trendyol'] = lambda: self.trendyol.create_product(product_data)
+        if self._connected('n11'):
+            calls['n11'] = lambda: self.n11.save_product(product_data)
+        if self._connected('hepsiburada'):
+            calls['hepsiburada'] = lambda: self.hepsiburada.create_product(product_data)
         
-        # Hepsiburada'ya ürün ekle
-        if self.hepsiburada and self.integration_status['hepsiburada']['connected']:
-            try:
-                results['hepsiburada'] = self.hepsiburada.create_product(product_data)
-            except Exception as e:
-                results['hepsiburada'] = {'success': False, 'error': str(e)}
+        return self.fan_out.run(calls, deadlines)
+
+    def queue_product_sync(self, products: List[Dict], name: str = None) -> Dict:
+        """
+        Ürünleri SKU başına bir job olarak tek batch halinde kuyruğa ekler
         
-        return results
+        İlerleme QueueService.get_batch(batch_id) ile, sonuçlar
+        QueueService.iter_batch_results(batch_id) ile izlenebilir.
+        """
+        from core.Services.queue_service import get_queue_service
+        
+        return get_queue_service().add_jobs_batch(
+            'sync_product', products, name=name or 'product_sync',
+            meta={'skus': len(products), 'requested_at': datetime.now().isoformat()}
+        )
 
-    def sync_stock_to_all_platforms(self, stock_updates: List[Dict]) -> Dict:
-        """Stok bilgilerini tüm platformlara senkronize eder"""
-        results = {}
+    def sync_stock_to_all_platforms(self, stock_updates: List[Dict], deadlines: Dict[str, float] = None) -> Dict:
+        """Stok bilgilerini tüm platformlara paralel senkronize eder
         
-        # Trendyol stok güncelle
-        if self.trendyol and self.integration_status['trendyol']['connected']:
-            try:
-                results['trendyol'] = self.trendyol.update_stock_price(stock_updates)
-            except Exception as e:
-                results['trendyol'] = {'success': False, 'error': str(e)}
+        Trendyol ve Hepsiburada toplu endpoint ile tek istekte güncellenir.
+        N11 SKU başına istek gerektirdiğinden istekler N11 eşzamanlılık
+        sınırı içinde paralel gönderilir; sonuç SKU bazında döner:
+        {'success', 'total', 'failed': [sku], 'results': {sku: sonuç}}
+        Aynı SKU birden çok kez verilmişse son güncelleme gönderilir;
+        stockCode/sku içermeyen güncellemelerin sırası 'invalid' altında döner.
+        """
+        calls = []
+        invalid = []
         
-        # N11 stok güncelle
-        if self.n11 and self.integration_status['n11']['connected']:
-            try:
-                for update in stock_updates:
-                    result = self.n11.update_stock_by_stock_code(
-                        update.get('stockCode', update.get('sku')),
-                        update.get('quantity', 0)
-                    )
-                    results['n11'] = result
-            except Exception as e:
-                results['n11'] = {'success': False, 'error': str(e)}
+        if self._connected('trendyol'):
+            calls.append(('trendyol', None, lambda: self.trendyol.update_stock_price(stock_updates)))
         
-        # Hepsiburada stok güncelle
-        if self.hepsiburada and self.integration_status['hepsiburada']['connected']:
-            try:
-                results['hepsiburada'] = self.hepsiburada.update_stock_price(stock_updates)
-            except Exception as e:
-                results['hepsiburada'] = {'success': False, 'error': str(e)}
+        if self._connected('n11'):
+            latest = {}
+            for position, update in enumerate(stock_updates):
+                stock_code = update.get('stockCode', update.get('sku'))
+                if stock_code is None:
+                    invalid.append(position)
+                else:
+                    latest[stock_code] = update
+            for stock_code, update in latest.items():
+                calls.append(('n11', stock_code, partial(
+                    self.n11.update_stock_by_stock_code, stock_code, update.get('quantity', 0)
+                )))
+        
+        if self._connected('hepsiburada'):
+            calls.append(('hepsiburada', None, lambda: self.hepsiburada.update_stock_price(stock_updates)))
         
+        results = self.fan_out.execute(calls, deadlines)
+        if self._connected('n11'):
+            results['n11'] = summarize(results.get('n11', {}))
+            if invalid:
+                results['n11']['success'] = False
+                results['n11']['invalid'] = invalid
         return results
 
     # SİPARİŞ YÖNETİMİ
-    def get_all_orders(self, start_date: str = None, end_date: str = None) -> Dict:
-        """Tüm platformlardan siparişleri getirir"""
-        all_orders = {}
+    def get_all_orders(self, start_date: str = None, end_date: str = None,
+                       deadlines: Dict[str, float] = None) -> Dict:
+        """Tüm platformlardan tüm sipariş sayfalarını paralel getirir
         
-        # Trendyol siparişleri
-        if self.trendyol and self.integration_status['trendyol']['connected']:
-            try:
-                orders = self.trendyol.get_orders(
-                    start_date=start_date,
-                    end_date=end_date,
-                    page=0,
-                    size=100
-                )
-                all_orders['trendyol'] = orders
-            except Exception as e:
-                all_orders['trendyol'] = {'success': False, 'error': str(e)}
+        Senkron sarmalayıcıdır; event loop içinden collect_all_orders kullanılmalıdır.
+        """
+        return asyncio.run(self.collect_all_orders(start_date, end_date, deadlines=deadlines))
+
+    async def collect_all_orders(self, start_date: str = None, end_date: str = None,
+                                 status: str = None, deadlines: Dict[str, float] = None,
+                                 keep_orders: bool = True) -> Dict:
+        """Her platformun iter_orders iterator'ını eşzamanlı tüketip normalize siparişleri toplar
         
-        # N11 siparişleri
-        if self.n11 and self.integration_status['n11']['connected']:
-            try:
-                orders = self.n11.get_order_list(
-                    start_date=start_date,
-                    end_date=end_date,
-                    page_index=0,
-                    page_size=100
-                )
-                all_orders['n11'] = orders
-            except Exception as e:
-                all_orders['n11'] = {'success': False, 'error': str(e)}
+        keep_orders False ise siparişler bellekte tutulmaz, yalnızca sayılır.
         
-        # Hepsiburada siparişleri
-        if self.hepsiburada and self.integration_status['hepsiburada']['connected']:
-            try:
-                orders = self.hepsiburada.get_orders(
-                    start_date=start_date,
-                    end_date=end_date,
-                    page=0,
-                    size=100
+        Returns:
+            {platform: {'success', 'total', 'orders': [...]}}; süresi dolan ya da
+            hata veren platform diğerlerini beklemez, o ana kadar alınan siparişlerle
+            {'success': False, 'error': ...} döner
+        """
+        deadlines = deadlines or {}
+        platforms = [platform for platform in ('trendyol', 'n11', 'hepsiburada') if self._connected(platform)]
+        results = await asyncio.gather(*(
+            self._collect_orders(
+                platform, start_date, end_date, status,
+                self.fan_out.deadline_for(platform, deadlines.get(platform)), keep_orders
+            )
+            for platform in platforms
+        ))
+        return dict(zip(platforms, results))
+
+    async def _collect_orders(self, platform: str, start_date: str, end_date: str, status: str,
+                              deadline: float, keep_orders: bool = True) -> Dict:
+        result = {'success': True, 'total': 0, 'orders': []}
+        iterator = getattr(self, platform).iter_orders(start_date=start_date, end_date=end_date, status=status)
+        
+        async def consume():
+            async for order in iterator:
+                result['total'] += 1
+                if keep_orders:
+                    result['orders'].append(order)
+        
+        try:
+            await asyncio.wait_for(consume(), deadline)
+        except asyncio.TimeoutError:
+            result.update(success=False, error=f'{platform} deadline exceeded ({deadline:g}s)', timed_out=True)
+        except Exception as e:
+            self.logger.error(f"{platform} siparişleri alınamadı: {e}")
+            self.integration_status[platform]['error'] = str(e)
+            result.update(success=False, error=str(e))
+        finally:
+            await iterator.aclose()
+        return result
+
+    async def iter_all_orders(self, start_date: str = None, end_date: str = None,
+                              status: str = None) -> AsyncIterator[Dict]:
+        """Bağlı tüm platformların tüm sipariş sayfalarını eşzamanlı gezip normalize siparişleri döndürür
+        
+        Bir platformun hatası diğerlerini durdurmaz; hata loglanır ve
+        integration_status'a yazılır.
+        """
+        iterators = {}
+        for platform in ('trendyol', 'n11', 'hepsiburada'):
+            if self._connected(platform):
+                iterators[platform] = getattr(self, platform).iter_orders(
+                    start_date=start_date, end_date=end_date, status=status
                 )
-                all_orders['hepsiburada'] = orders
-            except Exception as e:
-                all_orders['hepsiburada'] = {'success': False, 'error': str(e)}
         
-        return all_orders
+        merged = merge_iterators(iterators)
+        try:
+            async for platform, order in merged:
+                if isinstance(order, Exception):
+                    self.logger.error(f"{platform} siparişleri alınamadı: {order}")
+                    self.integration_status[platform]['error'] = str(order)
+                    continue
+                yield order
+        finally:
+            await merged.aclose()
+
+    # DELTA SENKRONİZASYON
+    def _connected_platforms(self) -> Dict[str, Any]:
+        return {
+            platform: getattr(self, platform)
+            for platform in ('trendyol', 'n11', 'hepsiburada') if self._connected(platform)
+        }
+
+    async def sync_stock_changes(self, stock_updates: List[Dict]) -> Dict:
+        """Yalnızca son senkrondan bu yana değişen stok/fiyatları tüm platformlara paralel gönderir
+        
+        Trendyol ve Hepsiburada'ya toplu endpoint (update_stock_price) ile
+        parçalar halinde, N11'e SKU başına sınırlı eşzamanlılıkla gönderilir.
+        """
+        engine = get_delta_sync_engine()
+        platforms = self._connected_platforms()
+        results = await asyncio.gather(
+            *(engine.push_stock(platform, client, stock_updates) for platform, client in platforms.items()),
+            return_exceptions=True
+        )
+        return {
+            platform: result if not isinstance(result, Exception) else {'success': False, 'error': str(result)}
+            for platform, result in zip(platforms, results)
+        }
+
+    async def sync_order_changes(self, handler=None) -> Dict:
+        """Her platformdan son senkrondan bu yana değişen siparişleri çekip `handler` ile işler
+        
+        Watermark'lar kalıcıdır; bir platform başarısız olursa onun
+        watermark'ı ilerlemez ve sonraki senkronda aynı aralık tekrar denenir.
+        """
+        engine = get_delta_sync_engine()
+        platforms = self._connected_platforms()
+        results = await asyncio.gather(
+            *(engine.pull_orders(platform, client, handler) for platform, client in platforms.items())
+        )
+        return dict(zip(platforms, results))
+
+    async def sync_listing_changes(self, handler=None) -> Dict:
+        """Her platformda son senkrondan bu yana stok/fiyatı değişen listeleri çekip `handler` ile işler
+        
+        Snapshot'lar platformdaki duruma göre güncellenir; sonraki stok
+        senkronu yalnızca gerçekten farklı olan SKU'ları gönderir.
+        """
+        engine = get_delta_sync_engine()
+        platforms = self._connected_platforms()
+        results = await asyncio.gather(
+            *(engine.pull_listings(platform, client, handler) for platform, client in platforms.items())
+        )
+        return dict(zip(platforms, results))
 
     def ship_order_on_platform(self, platform: str, order_id: str, 
                                tracking_number: str, cargo_company: str) -> Dict:
@@ -332,14 +442,14 @@ class RealIntegrationManager:
         """Tüm platformlardan satış özeti"""
         sales_data = {}
         
-        # Her platformdan sipariş verilerini al
-        orders = self.get_all_orders(start_date, end_date)
+        # Her platformun tüm sipariş sayfalarını say (siparişler bellekte tutulmaz)
+        orders = asyncio.run(self.collect_all_orders(start_date, end_date, keep_orders=False))
         
         for platform, order_data in orders.items():
             if order_data.get('success', True):
                 # Platform bazında satış özetini hesapla
                 sales_data[platform] = {
-                    'total_orders': len(order_data.get('content', order_data.get('data', []))),
+                    'total_orders': order_data['total'],
                     'platform': platform,
                     'status': 'success'
                 }
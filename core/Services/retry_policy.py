@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PofuAi Retry Policy
+==================
+
+HTTP istekleri için paylaşılan, bloklamayan retry motoru
+- Bekleme asyncio.sleep ile yapılır; çağıran thread ya da event loop donmaz
+- Üstel bekleme yerine "decorrelated jitter" (istemciler aynı anda yeniden denemez)
+- Retry-After ve X-RateLimit-Reset başlıklarına uyulur
+- Entegrasyon başına retry bütçesi: arızalı bir servis retry fırtınası üretemez
+- Entegrasyon başına retry metrikleri
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections import Counter, deque
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, Mapping, Optional, Tuple, Type
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE'})
+
+# İstek sunucuya ulaşmadan reddedildiğinden her metod için güvenle tekrarlanabilir
+ALWAYS_RETRYABLE_STATUSES = frozenset({429})
+
+RATE_LIMIT_RESET_HEADERS = ('X-RateLimit-Reset', 'RateLimit-Reset', 'X-Rate-Limit-Reset')
+
+
+def parse_retry_after(headers: Mapping[str, str], now: float = None) -> Optional[float]:
+    """
+    Yanıt başlıklarından beklenmesi gereken süre (saniye)
+
+    Retry-After (saniye ya da HTTP tarihi) öncelikli; yoksa rate limit reset
+    başlıkları (epoch ya da kalan saniye) kullanılır.
+    """
+    if not headers:
+        return None
+    now = time.time() if now is None else now
+
+    value = headers.get('Retry-After')
+    if value:
+        value = value.strip()
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - now)
+            except (TypeError, ValueError, IndexError):
+                pass
+
+    for name in RATE_LIMIT_RESET_HEADERS:
+        value = headers.get(name)
+        if not value:
+            continue
+        try:
+            reset = float(value)
+        except ValueError:
+            continue
+        # Büyük değerler epoch (saniye ya da milisaniye), küçükler kalan süre
+        if reset > 1e12:
+            reset /= 1000.0
+        return max(0.0, reset - now) if reset > 1e9 else max(0.0, reset)
+    return None
+
+
+class RetryPolicy:
+    """
+    Hangi hatanın, ne kadar bekleyerek, kaç kez tekrarlanacağı
+
+    Bekleme süresi decorrelated jitter ile seçilir:
+    `min(max_delay, uniform(base_delay, önceki_bekleme * 3))`. Sunucu
+    Retry-After bildirdiyse o süre (en fazla `max_retry_after`) beklenir;
+    daha uzunsa tekrar denenmez. `deadline` ilk denemeden itibaren retry
+    için ayrılan toplam süredir. Çağıran thread'in sonucu beklediği
+    senkron isteklerde bunların yerine daha kısa `sync_deadline` ve
+    `sync_max_retry_after` kullanılır.
+    """
+
+    def __init__(self, max_retries: int = 2, base_delay: float = 0.5, max_delay: float = 30.0,
+                 status_forcelist: Iterable[int] = (429, 500, 502, 503, 504),
+                 respect_retry_after: bool = True, max_retry_after: float = 120.0,
+                 deadline: Optional[float] = 60.0, sync_deadline: Optional[float] = 10.0,
+                 sync_max_retry_after: Optional[float] = 5.0):
+        self.max_retries = max(0, int(max_retries))
+        self.base_delay = max(0.0, float(base_delay))
+        self.max_delay = max(self.base_delay, float(max_delay))
+        self.status_forcelist = frozenset(status_forcelist)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.deadline = deadline
+        self.sync_deadline = sync_deadline
+        self.sync_max_retry_after = sync_max_retry_after
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None, **overrides) -> 'RetryPolicy':
+        """Config sözlüğünden (ve None olmayan override'lardan) policy oluştur"""
+        settings = {
+            key: value for key, value in (config or {}).items()
+            if key in ('max_retries', 'base_delay', 'max_delay', 'status_forcelist',
+                       'respect_retry_after', 'max_retry_after', 'deadline',
+                       'sync_deadline', 'sync_max_retry_after')
+        }
+        settings.update({key: value for key, value in overrides.items() if value is not None})
+        return cls(**settings)
+
+    def next_delay(self, previous: float) -> float:
+        """Bir sonraki bekleme (decorrelated jitter)"""
+        if self.base_delay <= 0:
+            return 0.0
+        upper = max(self.base_delay, previous * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+    def should_retry_status(self, method: str, status_code: int, retry_after: Optional[float]) -> bool:
+        if status_code not in self.status_forcelist:
+            return False
+        if method in IDEMPOTENT_METHODS or status_code in ALWAYS_RETRYABLE_STATUSES:
+            return True
+        # Sunucu açıkça "sonra tekrar dene" dediyse (örn. 503 + Retry-After) istek işlenmemiştir
+        return retry_after is not None
+
+    @staticmethod
+    def should_retry_error(method: str) -> bool:
+        # Zaman aşımı / bağlantı kopması sonrası idempotent olmayan istek sunucuda işlenmiş olabilir
+        return method in IDEMPOTENT_METHODS
+
+
+class RetryBudget:
+    """
+    Entegrasyon başına retry bütçesi
+
+    Son `window` saniyedeki retry sayısı, aynı penceredeki istek sayısının
+    `ratio` katı ile `min_per_second * window` toplamını aşamaz. Servis
+    çöktüğünde istekler yalnızca birkaç kez değil, bütçe kadar tekrarlanır;
+    gerisi hemen hata döner.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 1.0, window: float = 10.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.window = window
+        self._requests = deque()
+        self._retries = deque()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> 'RetryBudget':
+        config = config or {}
+        return cls(config.get('ratio', 0.2), config.get('min_per_second', 1.0), config.get('window', 10.0))
+
+    def _prune(self, now: float):
+        horizon = now - self.window
+        for events in (self._requests, self._retries):
+            while events and events[0] < horizon:
+                events.popleft()
+
+    def _allowance(self) -> float:
+        return self.min_per_second * self.window + self.ratio * len(self._requests)
+
+    def record_request(self):
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            self._requests.append(now)
+
+    def try_spend(self) -> bool:
+        """Bütçe varsa bir retry harca"""
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            if len(self._retries) >= self._allowance():
+                return False
+            self._retries.append(now)
+            return True
+
+    def remaining(self) -> int:
+        with self._lock:
+            self._prune(time.monotonic())
+            return max(0, int(self._allowance()) - len(self._retries))
+
+
+class RetryStats:
+    """Entegrasyon başına retry metrikleri"""
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.recovered = 0
+        self.exhausted = 0
+        self.budget_exhausted = 0
+        self.deadline_exceeded = 0
+        self.retry_after_honored = 0
+        self.retry_after_too_long = 0
+        self.sleep_seconds = 0.0
+        self.reasons = Counter()
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, amount: float = 1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def record_retry(self, reason: str, delay: float):
+        with self._lock:
+            self.retries += 1
+            self.sleep_seconds += delay
+            self.reasons[reason] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'retries': self.retries,
+                'recovered': self.recovered,
+                'exhausted': self.exhausted,
+                'budget_exhausted': self.budget_exhausted,
+                'deadline_exceeded': self.deadline_exceeded,
+                'retry_after_honored': self.retry_after_honored,
+                'retry_after_too_long': self.retry_after_too_long,
+                'sleep_seconds': round(self.sleep_seconds, 3),
+                'retry_rate': self.retries / self.requests if self.requests else 0.0,
+                'reasons': dict(self.reasons)
+            }
+
+
+class RetryEngine:
+    """
+    Policy, bütçe ve metrikleri birleştirerek bir isteği yürütür
+
+    `send` her denemede çağrılan ve yanıt (status_code, headers) döndüren
+    coroutine fabrikasıdır. Tekrarlanabilir hatalar `retry_exceptions` ile
+    verilir; son denemenin yanıtı döner ya da hatası fırlatılır.
+    `blocking` senkron bir çağıranın beklediğini belirtir ve policy'nin
+    kısa senkron sınırlarını seçer.
+    """
+
+    def __init__(self, integration: str, policy: RetryPolicy, budget: RetryBudget, stats: RetryStats,
+                 logger: Any = None):
+        self.integration = integration
+        self.policy = policy
+        self.budget = budget
+        self.stats = stats
+        self.logger = logger
+
+    async def execute(self, method: str, send: Callable[[], Awaitable[Any]],
+                      retry_exceptions: Tuple[Type[BaseException], ...] = (),
+                      max_retries: int = None, blocking: bool = False) -> Any:
+        method = method.upper()
+        policy = self.policy
+        max_retries = policy.max_retries if max_retries is None else max_retries
+        deadline = policy.sync_deadline if blocking else policy.deadline
+        max_retry_after = policy.sync_max_retry_after if blocking else policy.max_retry_after
+        started = time.monotonic()
+        delay = policy.base_delay
+        self.budget.record_request()
+        self.stats.increment('requests')
+
+        for attempt in range(max_retries + 1):
+            response = error = None
+            retry_after = None
+            try:
+                response = await send()
+            except retry_exceptions as e:
+                if not policy.should_retry_error(method):
+                    raise
+                error = e
+                reason = type(e).__name__
+            else:
+                status_code = response.status_code
+                if status_code not in policy.status_forcelist:
+                    if attempt:
+                        self.stats.increment('recovered')
+                    return response
+                if policy.respect_retry_after:
+                    retry_after = parse_retry_after(response.headers)
+                if not policy.should_retry_status(method, status_code, retry_after):
+                    return response
+                reason = f"status_{status_code}"
+
+            if attempt == max_retries:
+                self.stats.increment('exhausted')
+                break
+
+            if retry_after is not None:
+                if max_retry_after is not None and retry_after > max_retry_after:
+                    self.stats.increment('retry_after_too_long')
+                    break
+                wait = retry_after
+                self.stats.increment('retry_after_honored')
+            else:
+                delay = wait = policy.next_delay(delay)
+
+            if deadline is not None and time.monotonic() - started + wait > deadline:
+                self.stats.increment('deadline_exceeded')
+                break
+            if not self.budget.try_spend():
+                self.stats.increment('budget_exhausted')
+                break
+
+            self.stats.record_retry(reason, wait)
+            if self.logger:
+                self.logger.warning(
+                    f"{self.integration} {method} {reason}; {wait:.2f}s sonra tekrar "
+                    f"({attempt + 1}/{max_retries})"
+                )
+            await asyncio.sleep(wait)
+
+        if error is not None:
+            raise error
+        return response
@@ -4,17 +4,18 @@ Bu modül Trendyol'un resmi Marketplace API'sini kullanır.
 API Dokümantasyonu: https://developers.trendyol.com/
 """
 
-import requests
 import json
 import base64
 import hashlib
 import hmac
-import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, AsyncIterator
 import logging
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+
+from .http_transport import (
+    HTTPStatusError, TransportConnectionError, TransportError, TransportTimeout, get_http_transport
+)
+from .pagination import has_next_page, paginate
 
 class TrendyolMarketplaceAPI:
     """Trendyol Marketplace API Client"""
@@ -37,91 +38,92 @@ class TrendyolMarketplaceAPI:
         else:
             self.base_url = "https://api.trendyol.com/sapigw"  # Production URL (same endpoint)
             
-        # Setup session with retry strategy
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+        # Paylaşılan bağlantı havuzu üzerinde oturum (retry ayarları: http.integrations.trendyol.retry)
+        self.session = get_http_transport().session(
+            'trendyol',
+            headers={
+                'Content-Type': 'application/json',
+                'User-Agent': 'TrendyolMarketplace-Python-Client/1.0'
+            },
+            auth=(self.api_key, self.api_secret)
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        
-        self.session.auth = (self.api_key, self.api_secret)
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'User-Agent': 'TrendyolMarketplace-Python-Client/1.0'
-        })
         
         self.logger = logging.getLogger(__name__)
 
+    @staticmethod
+    def _request_kwargs(method: str, data: Optional[Dict]) -> Dict:
+        """HTTP metoduna göre istek parametreleri"""
+        if method == 'GET':
+            return {'params': data}
+        if method in ('POST', 'PUT'):
+            return {'json': data}
+        if method == 'DELETE':
+            return {}
+        raise ValueError(f"Unsupported HTTP method: {method}")
+
+    def _parse_response(self, response) -> Dict:
+        """Yanıtı kontrol edip JSON olarak döndürür"""
+        response.raise_for_status()
+        
+        # JSON parse kontrolü
+        try:
+            return response.json()
+        except json.JSONDecodeError:
+            self.logger.warning(f"Invalid JSON response from Trendyol API: {response.text[:200]}")
+            return {"success": False, "error": "Invalid JSON response"}
+
+    def _request_failed(self, error: TransportError, method: str, endpoint: str) -> Dict:
+        """Transport hatasını sonuç sözlüğüne çevirir"""
+        if isinstance(error, TransportTimeout):
+            self.logger.warning(f"Trendyol API timeout ({method} {endpoint})")
+            return {"success": False, "error": "Request timeout"}
+        
+        if isinstance(error, TransportConnectionError):
+            self.logger.warning(f"Trendyol API connection error ({method} {endpoint})")
+            return {"success": False, "error": "Connection error"}
+        
+        if isinstance(error, HTTPStatusError):
+            if error.response.status_code == 429:
+                self.logger.warning(f"Trendyol API rate limit hit ({method} {endpoint})")
+            self.logger.error(f"Trendyol API HTTP error: {error}")
+            return {
+                "success": False, 
+                "error": f"HTTP {error.response.status_code}: {error.response.text[:200] if error.response else str(error)}"
+            }
+        
+        self.logger.error(f"Trendyol API request failed: {error}")
+        return {"success": False, "error": str(error)}
+
     def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, max_retries: int = 3) -> Dict:
-        """API isteği yapar - gelişmiş hata yönetimi ile"""
-        url = f"{self.base_url}{endpoint}"
+        """API isteği yapar - gelişmiş hata yönetimi ile
         
-        for attempt in range(max_retries):
-            try:
-                if method.upper() == 'GET':
-                    response = self.session.get(url, params=data, timeout=30)
-                elif method.upper() == 'POST':
-                    response = self.session.post(url, json=data, timeout=30)
-                elif method.upper() == 'PUT':
-                    response = self.session.put(url, json=data, timeout=30)
-                elif method.upper() == 'DELETE':
-                    response = self.session.delete(url, timeout=30)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-                    
-                response.raise_for_status()
-                
-                # JSON parse kontrolü
-                try:
-                    return response.json()
-                except json.JSONDecodeError:
-                    self.logger.warning(f"Invalid JSON response from Trendyol API: {response.text[:200]}")
-                    return {"success": False, "error": "Invalid JSON response"}
-                    
-            except requests.exceptions.Timeout:
-                self.logger.warning(f"Trendyol API timeout (attempt {attempt + 1}/{max_retries})")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                    continue
-                return {"success": False, "error": "Request timeout"}
-                
-            except requests.exceptions.ConnectionError:
-                self.logger.warning(f"Trendyol API connection error (attempt {attempt + 1}/{max_retries})")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-                return {"success": False, "error": "Connection error"}
-                
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 429:  # Rate limit
-                    self.logger.warning(f"Trendyol API rate limit hit (attempt {attempt + 1}/{max_retries})")
-                    if attempt < max_retries - 1:
-                        time.sleep(5)  # Wait longer for rate limits
-                        continue
-                elif e.response.status_code >= 500:  # Server errors
-                    self.logger.warning(f"Trendyol API server error {e.response.status_code} (attempt {attempt + 1}/{max_retries})")
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
-                        continue
-                
-                self.logger.error(f"Trendyol API HTTP error: {e}")
-                return {
-                    "success": False, 
-                    "error": f"HTTP {e.response.status_code}: {e.response.text[:200] if e.response else str(e)}"
-                }
-                
-            except requests.exceptions.RequestException as e:
-                self.logger.error(f"Trendyol API request failed: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-                return {"success": False, "error": str(e)}
-                
-        return {"success": False, "error": "Max retries exceeded"}
+        Zaman aşımı, bağlantı hatası, 429 ve 5xx yanıtları oturumun retry
+        motoru tarafından (Retry-After'a uyarak, thread bloklanmadan) tekrarlanır.
+        """
+        method = method.upper()
+        kwargs = self._request_kwargs(method, data)
+        
+        try:
+            response = self.session.request(
+                method, f"{self.base_url}{endpoint}", retries=max(0, max_retries - 1), **kwargs
+            )
+            return self._parse_response(response)
+        except TransportError as e:
+            return self._request_failed(e, method, endpoint)
+
+    async def _amake_request(self, method: str, endpoint: str, data: Optional[Dict] = None,
+                             max_retries: int = 3) -> Dict:
+        """_make_request'in event loop'u bloklamayan async karşılığı"""
+        method = method.upper()
+        kwargs = self._request_kwargs(method, data)
+        
+        try:
+            response = await self.session.arequest(
+                method, f"{self.base_url}{endpoint}", retries=max(0, max_retries - 1), **kwargs
+            )
+            return self._parse_response(response)
+        except TransportError as e:
+            return self._request_failed(e, method, endpoint)
 
     # ÜRÜN YÖNETİMİ
     def create_product(self, product_data: Dict) -> Dict:
@@ -163,6 +165,27 @@ class TrendyolMarketplaceAPI:
         params = {"page": page, "size": size}
         return self._make_request('GET', endpoint, params)
 
+    async def iter_products(self, size: int = 200, approved: bool = None, start_date: int = None,
+                            max_pages: int = None) -> AsyncIterator[Dict]:
+        """Tüm ürünleri sayfa sayfa (sonraki sayfa önceden istenerek) normalize edilmiş olarak döndürür
+        
+        start_date (ms epoch) verilirse yalnızca o tarihten sonra değişen ürünler döner.
+        """
+        endpoint = f"/suppliers/{self.supplier_id}/products"
+        
+        def fetch(page: int):
+            params = {"page": page, "size": size}
+            if approved is not None:
+                params["approved"] = str(approved).lower()
+            if start_date is not None:
+                params["startDate"] = start_date
+                params["dateQueryType"] = "LAST_MODIFIED_DATE"
+            return self._amake_request('GET', endpoint, params)
+        
+        async for product in paginate('trendyol', fetch, self._parse_page(size),
+                                      self.normalize_product, max_pages=max_pages):
+            yield product
+
     def get_product(self, barcode: str) -> Dict:
         """Tek ürün bilgisini getirir"""
         endpoint = f"/suppliers/{self.supplier_id}/products"
@@ -176,12 +199,35 @@ class TrendyolMarketplaceAPI:
         data = {"items": items}
         return self._make_request('POST', endpoint, data)
 
+    # update_stock_price'ın platforma gönderdiği alanlar
+    STOCK_PRICE_FIELDS = ('quantity', 'price', 'list_price')
+
+    @staticmethod
+    def stock_price_item(record: Dict) -> Dict:
+        """{sku, barcode, quantity, price, list_price} kaydını update_stock_price formatına çevirir"""
+        item = {"barcode": record.get("barcode") or record["sku"]}
+        if record.get("quantity") is not None:
+            item["quantity"] = record["quantity"]
+        if record.get("price") is not None:
+            item["salePrice"] = record["price"]
+            item["listPrice"] = record.get("list_price") or record["price"]
+        return item
+
+    @staticmethod
+    def format_date(timestamp: float) -> int:
+        """Epoch saniyeyi Trendyol tarih filtresi formatına (ms epoch) çevirir"""
+        return int(timestamp * 1000)
+
     # SİPARİŞ YÖNETİMİ
     def get_orders(self, start_date: str = None, end_date: str = None, 
                    page: int = 0, size: int = 50, status: str = None) -> Dict:
         """Sipariş listesini getirir"""
         endpoint = f"/suppliers/{self.supplier_id}/orders"
-        
+        params = self._order_params(start_date, end_date, status, page, size)
+        return self._make_request('GET', endpoint, params)
+
+    @staticmethod
+    def _order_params(start_date: str, end_date: str, status: str, page: int, size: int) -> Dict:
         params = {
             "page": page,
             "size": size
@@ -193,8 +239,68 @@ class TrendyolMarketplaceAPI:
             params["endDate"] = end_date
         if status:
             params["status"] = status
-            
-        return self._make_request('GET', endpoint, params)
+        return params
+
+    async def iter_orders(self, start_date: str = None, end_date: str = None, status: str = None,
+                          size: int = 200, max_pages: int = None) -> AsyncIterator[Dict]:
+        """Tüm siparişleri sayfa sayfa (sonraki sayfa önceden istenerek) normalize edilmiş olarak döndürür"""
+        endpoint = f"/suppliers/{self.supplier_id}/orders"
+        
+        def fetch(page: int):
+            return self._amake_request('GET', endpoint, self._order_params(start_date, end_date, status, page, size))
+        
+        async for order in paginate('trendyol', fetch, self._parse_page(size),
+                                    self.normalize_order, max_pages=max_pages):
+            yield order
+
+    @staticmethod
+    def _parse_page(size: int):
+        def parse(response: Dict, page: int):
+            items = response.get("content") or []
+            return items, has_next_page(page, size, len(items), response.get("totalPages"),
+                                        response.get("totalElements"))
+        return parse
+
+    @staticmethod
+    def normalize_order(order: Dict) -> Dict:
+        """Trendyol sipariş paketini ortak sipariş formatına çevirir"""
+        return {
+            "platform": "trendyol",
+            "order_number": order.get("orderNumber"),
+            "package_id": order.get("id"),
+            "status": order.get("status"),
+            "order_date": order.get("orderDate"),
+            "updated_at": order.get("lastModifiedDate"),
+            "total_price": order.get("totalPrice"),
+            "currency": order.get("currencyCode", "TRY"),
+            "customer": f"{order.get('customerFirstName', '')} {order.get('customerLastName', '')}".strip(),
+            "lines": [
+                {
+                    "sku": line.get("merchantSku") or line.get("barcode"),
+                    "barcode": line.get("barcode"),
+                    "quantity": line.get("quantity"),
+                    "price": line.get("price")
+                }
+                for line in order.get("lines", [])
+            ],
+            "raw": order
+        }
+
+    @staticmethod
+    def normalize_product(product: Dict) -> Dict:
+        """Trendyol ürününü ortak ürün formatına çevirir"""
+        return {
+            "platform": "trendyol",
+            "sku": product.get("stockCode") or product.get("barcode"),
+            "barcode": product.get("barcode"),
+            "title": product.get("title"),
+            "quantity": product.get("quantity"),
+            "sale_price": product.get("salePrice"),
+            "list_price": product.get("listPrice"),
+            "approved": product.get("approved"),
+            "updated_at": product.get("lastUpdateDate"),
+            "raw": product
+        }
 
     def get_order(self, order_number: str) -> Dict:
         """Tek sipariş bilgisini getirir"""
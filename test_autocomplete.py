@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Autocomplete Testleri
+PrefixIndex düğüm başına top-k sıralamasını, Türkçe önek normalizasyonunu ve
+model event'leriyle (kaydet, toplu kaydet, sil) indeks güncellemesini test eder.
+"""
+
+import os
+import sys
+import tempfile
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Config.config import get_config
+
+# Veritabanı modülü import edilmeden önce geçici veritabanına yönlendir
+DB_PATH = os.path.join(tempfile.mkdtemp(), 'autocomplete.db')
+get_config().set('database.driver', 'sqlite')
+get_config().set('database.database_path', DB_PATH)
+
+from core.Database.base_model import BaseModel
+from core.Database.connection import get_db_connection
+from core.Services.autocomplete_service import AutocompleteService, PrefixIndex, Suggestion, fold
+
+
+class AutocompleteProduct(BaseModel):
+    """Test modeli"""
+
+    __table__ = 'products'
+    __fillable__ = ['name', 'slug', 'sku', 'status', 'sold_count']
+
+
+def setup_module(module=None):
+    """Ürün tablosunu oluşturur"""
+    db = get_db_connection()
+    if db._config.get('database') != DB_PATH:
+        db._load_config()
+        db._create_connection()
+    with db.get_connection() as conn:
+        conn.execute("DROP TABLE IF EXISTS products")
+        conn.execute(
+            "CREATE TABLE products (id INTEGER PRIMARY KEY, name TEXT, slug TEXT, sku TEXT, "
+            "status TEXT, sold_count INTEGER, created_at TEXT, updated_at TEXT)"
+        )
+        conn.commit()
+
+
+def titles(suggestions) -> list:
+    return [suggestion.title for suggestion in suggestions]
+
+
+def test_top_k_is_ordered_per_node():
+    """Her düğüm alt ağacındaki en iyi k öneriyi skor, sonra kısa başlık sırasıyla tutar"""
+    index = PrefixIndex(top_k=3)
+    for number, (title, score) in enumerate([
+        ('Kalem', 5), ('Kalemlik', 9), ('Kazak', 7), ('Kase', 1), ('Kalemtıraş', 9), ('Kitap', 20)
+    ]):
+        index.add(Suggestion('product', number, title, score=score))
+
+    assert titles(index.search('k', limit=3)) == ['Kitap', 'Kalemlik', 'Kalemtıraş']
+    assert titles(index.search('ka', limit=3)) == ['Kalemlik', 'Kalemtıraş', 'Kazak']
+    assert titles(index.search('kale', limit=3)) == ['Kalemlik', 'Kalemtıraş', 'Kalem']
+    assert titles(index.search('ka', limit=10)) == ['Kalemlik', 'Kalemtıraş', 'Kazak', 'Kalem', 'Kase']
+
+    # Kaldırılan öneri yoldaki top listelerinden düşer, yerine sıradaki gelir
+    index.remove(('product', 1))
+    assert titles(index.search('ka', limit=3)) == ['Kalemtıraş', 'Kazak', 'Kalem']
+    assert titles(index.search('kalemli', limit=3)) == []
+
+
+def test_turkish_prefixes_are_folded():
+    """Büyük/küçük harf, I/İ ve Türkçe karakterler aynı öneki verir; kelime başları da eşleşir"""
+    index = PrefixIndex()
+    index.add(Suggestion('product', 1, 'Kırmızı İpek Elbise'))
+    index.add(Suggestion('product', 2, 'IŞIKLI Ayna'))
+
+    assert fold('KIRMIZI İpek') == fold('kirmizi ipek') == 'kirmizi ipek'
+    for prefix in ('kır', 'KIR', 'kir', 'Kırmızı ip', 'ipe', 'İPEK', 'elb'):
+        assert titles(index.search(prefix)) == ['Kırmızı İpek Elbise'], prefix
+    for prefix in ('ışık', 'IŞIK', 'isik', 'ayn'):
+        assert titles(index.search(prefix)) == ['IŞIKLI Ayna'], prefix
+
+
+def test_model_events_update_index():
+    """MODEL_SAVED, MODEL_BULK_SAVED ve MODEL_DELETED event'leri indeksi günceller"""
+    service = AutocompleteService()
+
+    product = AutocompleteProduct(name='Çelik Termos', slug='celik-termos', sku='T-1',
+                                  status='active', sold_count=3)
+    assert product.save()
+    assert service.suggest('celik') == [
+        {'type': 'product', 'title': 'Çelik Termos', 'subtitle': 'T-1', 'url': '/products/celik-termos'}
+    ]
+
+    AutocompleteProduct.bulk_update([{'id': product.id, 'name': 'Çelik Matara'}])
+    assert [item['title'] for item in service.suggest('çelik')] == ['Çelik Matara']
+    assert service.suggest('termos') == []
+
+    AutocompleteProduct.bulk_update([{'id': product.id, 'status': 'passive'}])
+    assert service.suggest('çelik') == []
+
+    AutocompleteProduct.bulk_update([{'id': product.id, 'status': 'active'}])
+    assert [item['title'] for item in service.suggest('mat')] == ['Çelik Matara']
+
+    assert product.delete()
+    assert service.suggest('çelik') == []
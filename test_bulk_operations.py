@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Toplu Model İşlemleri Testleri
+BaseModel.bulk_insert / bulk_upsert / bulk_update davranışını test eder.
+"""
+
+import os
+import sys
+import tempfile
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Config.config import get_config
+
+# Veritabanı modülü import edilmeden önce geçici veritabanına yönlendir
+DB_PATH = os.path.join(tempfile.mkdtemp(), 'bulk.db')
+get_config().set('database.driver', 'sqlite')
+get_config().set('database.database_path', DB_PATH)
+
+from core.Database.base_model import BaseModel
+from core.Database.connection import get_db_connection
+
+
+class BulkProduct(BaseModel):
+    """Test modeli"""
+
+    __table__ = 'bulk_products'
+    __fillable__ = ['sku', 'name', 'stock']
+    __timestamps__ = True
+
+
+def setup_function(function=None):
+    """Her test için boş tablo oluşturur"""
+    db = get_db_connection()
+    if db._config.get('database') != DB_PATH:
+        db._load_config()
+        db._create_connection()
+    with db.get_connection() as conn:
+        conn.execute("DROP TABLE IF EXISTS bulk_products")
+        conn.execute(
+            "CREATE TABLE bulk_products (id INTEGER PRIMARY KEY, sku TEXT UNIQUE, name TEXT, "
+            "stock INTEGER, created_at TEXT, updated_at TEXT)"
+        )
+        conn.commit()
+
+
+def rows() -> dict:
+    result = get_db_connection().execute_query("SELECT * FROM bulk_products ORDER BY sku")
+    return {row['sku']: row for row in result}
+
+
+def test_bulk_insert_batches_and_fillable():
+    """Parti sınırları aşılır, fillable dışı alanlar yazılmaz"""
+    written = BulkProduct.bulk_insert(
+        [{'sku': f"S{i:03d}", 'name': f"Ürün {i}", 'stock': i, 'secret': 'x'} for i in range(250)],
+        batch_size=100
+    )
+    assert written == 250
+    stored = rows()
+    assert len(stored) == 250
+    assert stored['S007']['stock'] == 7
+    assert stored['S007']['created_at'] is not None
+
+
+def test_bulk_upsert_updates_conflicts_and_keeps_created_at():
+    """Çakışan satır güncellenir, yeni satır eklenir, created_at korunur"""
+    BulkProduct.bulk_insert([{'sku': 'A', 'name': 'Eski', 'stock': 1}])
+    created_at = rows()['A']['created_at']
+
+    written = BulkProduct.bulk_upsert(
+        [{'sku': 'A', 'name': 'Yeni', 'stock': 5}, {'sku': 'B', 'name': 'İkinci', 'stock': 2}],
+        conflict_keys=['sku']
+    )
+    assert written == 2
+    stored = rows()
+    assert len(stored) == 2
+    assert (stored['A']['name'], stored['A']['stock']) == ('Yeni', 5)
+    assert stored['A']['created_at'] == created_at
+    assert stored['B']['stock'] == 2
+
+
+def test_bulk_upsert_mixed_columns():
+    """Farklı sütun kümeleri ayrı gruplarda yazılır; verilmeyen alan korunur"""
+    BulkProduct.bulk_insert([{'sku': 'A', 'name': 'Ad', 'stock': 1}])
+    BulkProduct.bulk_upsert([{'sku': 'A', 'stock': 9}, {'sku': 'C', 'name': 'Üç'}], conflict_keys=['sku'])
+    stored = rows()
+    assert (stored['A']['name'], stored['A']['stock']) == ('Ad', 9)
+    assert stored['C']['stock'] is None
+
+
+def test_bulk_update_requires_key():
+    """Eşleşme anahtarı olmayan satır hata verir, olanlar güncellenir"""
+    BulkProduct.bulk_insert([{'sku': 'A', 'name': 'Ad', 'stock': 1}, {'sku': 'B', 'name': 'Be', 'stock': 2}])
+    assert BulkProduct.bulk_update([{'sku': 'A', 'stock': 10}, {'sku': 'B', 'stock': 20}], key='sku') == 2
+    assert [row['stock'] for row in rows().values()] == [10, 20]
+    try:
+        BulkProduct.bulk_update([{'stock': 1}], key='sku')
+    except ValueError:
+        return
+    raise AssertionError("Anahtarsız satır kabul edildi")
+
+
+def main():
+    """Tüm testleri çalıştırır"""
+    tests = [value for name, value in globals().items() if name.startswith('test_') and callable(value)]
+    failed = 0
+    for test in tests:
+        try:
+            setup_function()
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e!r}")
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} test başarılı")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
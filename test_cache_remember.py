@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Cache remember() Testleri
+Tek uçuş hesaplama, süreçler arası kilit ve stale-while-revalidate davranışını test eder.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Services.cache_service import CacheService
+from core.Services.cache_stores import LRUCacheStore, SQLiteCacheStore
+
+L2_PATH = os.path.join(tempfile.mkdtemp(), 'cache.db')
+
+
+def make_cache(prefix: str = None, own_l1: bool = False) -> CacheService:
+    """Geçici SQLite L2 ile cache; her test kendi önekini kullanır"""
+    cache = CacheService()
+    cache.prefix = prefix or f"t{uuid.uuid4().hex[:8]}_"
+    cache.driver = 'sqlite'
+    cache.l2 = SQLiteCacheStore(L2_PATH)
+    if own_l1:
+        # Ayrı süreci taklit eder: L1 paylaşılmaz
+        cache.l1 = LRUCacheStore()
+    return cache
+
+
+class Counter:
+    """Çağrı sayan yavaş callback"""
+
+    def __init__(self, delay: float = 0.0):
+        self.calls = 0
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            value = self.calls
+        time.sleep(self.delay)
+        return f"değer {value}"
+
+
+def test_remember_computes_once():
+    """İlk çağrı hesaplar, sonrakiler cache'ten okur"""
+    cache = make_cache()
+    callback = Counter()
+    assert cache.remember('k', 60, callback, beta=0) == 'değer 1'
+    assert cache.remember('k', 60, callback, beta=0) == 'değer 1'
+    assert cache.get('k') == 'değer 1'
+    assert callback.calls == 1
+
+
+def test_remember_returns_plain_value():
+    """set() ile yazılmış değer callback çalışmadan döner"""
+    cache = make_cache()
+    cache.set('k', 42)
+    callback = Counter()
+    assert cache.remember('k', 60, callback) == 42
+    assert callback.calls == 0
+
+
+def test_concurrent_misses_single_flight():
+    """Aynı anda gelen ıskalamalarda callback bir kez çalışır"""
+    cache = make_cache()
+    callback = Counter(delay=0.2)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.remember('k', 60, callback, beta=0)))
+               for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert callback.calls == 1
+    assert results == ['değer 1'] * 10
+
+
+def test_waits_for_other_process_lock():
+    """Kilit başka süreçteyse onun sonucunu bekler, kendisi hesaplamaz"""
+    prefix = f"t{uuid.uuid4().hex[:8]}_"
+    owner = make_cache(prefix, own_l1=True)
+    waiter = make_cache(prefix, own_l1=True)
+    token = owner.acquire_lock('k', 5)
+    assert token
+
+    def finish():
+        time.sleep(0.2)
+        owner._store_computed('k', 60, lambda: 'sahibin değeri', 0)
+        owner.release_lock('k', token)
+
+    worker = threading.Thread(target=finish)
+    worker.start()
+    callback = Counter()
+    assert waiter.remember('k', 60, callback, lock_timeout=5) == 'sahibin değeri'
+    worker.join()
+    assert callback.calls == 0
+
+
+def test_stale_value_served_while_refreshing():
+    """Süresi dolan değer beklemeden döner, yenileme arka planda bir kez yapılır"""
+    cache = make_cache()
+    callback = Counter(delay=0.2)
+    # ttl=0: değer hemen bayatlar ama stale_ttl boyunca sunulabilir
+    assert cache.remember('k', 0, callback, stale_ttl=30, beta=0) == 'değer 1'
+
+    started = time.time()
+    results = [cache.remember('k', 60, callback, stale_ttl=30, beta=0) for _ in range(20)]
+    assert time.time() - started < 0.2
+    assert results == ['değer 1'] * 20
+
+    deadline = time.time() + 2
+    while cache.get('k') != 'değer 2' and time.time() < deadline:
+        time.sleep(0.05)
+    assert cache.get('k') == 'değer 2'
+    assert callback.calls == 2
+
+
+def test_early_refresh_with_high_beta():
+    """Yüksek beta ile TTL dolmadan yenilenir, çağıran eski değeri bekletilmeden alır"""
+    cache = make_cache()
+    slow = Counter(delay=0.05)
+    cache.remember('k', 1, slow, beta=0)
+    values = {cache.remember('k', 1, slow, beta=1000) for _ in range(5)}
+    assert slow.calls > 1
+    assert values <= {f"değer {n}" for n in range(1, slow.calls + 1)}
+
+
+def main():
+    """Tüm testleri çalıştırır"""
+    tests = [value for name, value in globals().items() if name.startswith('test_') and callable(value)]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e!r}")
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} test başarılı")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Cache Katmanı Testleri
+L1 kaçırmasında L2'ye düşüp değerin L1'e alınmasını, File/SQLite/LRU
+katmanlarında TTL bitişini ve LRU çıkarma sırasını test eder.
+"""
+
+import os
+import sys
+import time
+import uuid
+
+import pytest
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Services import cache_service, cache_stores
+from core.Services.cache_service import CacheService
+from core.Services.cache_stores import MISS, FileCacheStore, LRUCacheStore, SQLiteCacheStore
+
+
+class Clock:
+    """time modülünün yerine geçen ayarlanabilir saat"""
+
+    def __init__(self):
+        self.now = time.time()
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_stores, 'time', clock)
+    monkeypatch.setattr(cache_service, 'time', clock)
+    return clock
+
+
+@pytest.fixture(params=['file', 'sqlite', 'lru'])
+def store(request, tmp_path):
+    if request.param == 'file':
+        return FileCacheStore(str(tmp_path / 'files'))
+    if request.param == 'sqlite':
+        return SQLiteCacheStore(str(tmp_path / 'cache.db'))
+    return LRUCacheStore()
+
+
+def make_cache(tmp_path, l1_ttl: int = 60) -> CacheService:
+    """Kendi L1'i ve geçici SQLite L2'si olan cache"""
+    cache = CacheService()
+    cache.prefix = f"t{uuid.uuid4().hex[:8]}_"
+    cache.driver = 'sqlite'
+    cache.l1 = LRUCacheStore()
+    cache.l2 = SQLiteCacheStore(str(tmp_path / 'l2.db'))
+    cache.l1_ttl = l1_ttl
+    return cache
+
+
+def test_ttl_expiry(store, clock):
+    """Süresi dolan kayıt MISS döner ve sayaçlara yansır"""
+    store.set('k', {'değer': 1}, 10)
+    assert store.get('k') == ({'değer': 1}, pytest.approx(clock.now + 10))
+    assert store.keys() == ['k']
+
+    clock.sleep(9.5)
+    assert store.get('k')[0] == {'değer': 1}
+
+    clock.sleep(1)
+    assert store.get('k') == (MISS, None)
+    assert store.keys() == []
+    assert store.expirations == 1
+    assert store.hits == 2 and store.misses == 1
+
+    # Süresi dolmuş anahtara add() yazabilir, canlı anahtara yazamaz
+    assert store.add('k', 'yeni', 10)
+    assert not store.add('k', 'ikinci', 10)
+    assert store.get('k')[0] == 'yeni'
+
+
+def test_lru_eviction_order(clock):
+    """Taşmada en uzun süre erişilmeyen kayıt çıkarılır; okuma ve yazma kaydı tazeler"""
+    store = LRUCacheStore(max_items=3)
+    for key in 'abc':
+        store.set(key, key.upper(), 60)
+
+    store.get('a')
+    store.set('d', 'D', 60)
+    assert sorted(store.keys()) == ['a', 'c', 'd']
+
+    store.set('c', 'C2', 60)
+    store.set('e', 'E', 60)
+    assert sorted(store.keys()) == ['c', 'd', 'e'] and 'a' not in store.keys()
+    assert store.evictions == 2
+    assert len(store) == 3
+
+
+def test_l1_miss_falls_through_to_l2_and_promotes(tmp_path, clock):
+    """L1'de olmayan değer L2'den okunur ve L1'e alınır; sonraki okuma L2'ye gitmez"""
+    cache = make_cache(tmp_path)
+    full_key = cache._get_full_key('urun:1')
+
+    # Başka bir süreç L2'ye yazmış gibi
+    cache.l2.set(full_key, 'L2 değeri', 600)
+    assert cache.l1.get(full_key) == (MISS, None)
+
+    assert cache.get('urun:1') == 'L2 değeri'
+    assert cache.l2.hits == 1
+
+    value, expires_at = cache.l1.get(full_key)
+    assert value == 'L2 değeri'
+    # L1 ömrü l1_ttl ile sınırlanır
+    assert expires_at == pytest.approx(clock.now + 60)
+
+    assert cache.get('urun:1') == 'L2 değeri'
+    assert cache.l2.hits == 1
+
+    # L1 süresi dolunca yeniden L2'den okunur
+    clock.sleep(61)
+    assert cache.get('urun:1') == 'L2 değeri'
+    assert cache.l2.hits == 2
+
+
+def test_promotion_keeps_shorter_l2_ttl(tmp_path, clock):
+    """L2'de kalan süre l1_ttl'den kısaysa L1 kaydı L2 ile birlikte biter"""
+    cache = make_cache(tmp_path)
+    full_key = cache._get_full_key('kısa')
+    cache.l2.set(full_key, 'kısa ömürlü', 5)
+
+    assert cache.get('kısa') == 'kısa ömürlü'
+    assert cache.l1.get(full_key)[1] == pytest.approx(clock.now + 5)
+
+    clock.sleep(6)
+    assert cache.get('kısa', 'yok') == 'yok'
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tag'li Cache Testleri
+Tag sürümleriyle temizlemenin ilgili kayıtları geçersiz kıldığını ve diğerlerini koruduğunu test eder.
+"""
+
+import os
+import sys
+import tempfile
+import uuid
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Services.cache_service import CacheService
+from core.Services.cache_stores import LRUCacheStore, SQLiteCacheStore
+
+L2_PATH = os.path.join(tempfile.mkdtemp(), 'cache.db')
+
+
+def make_cache(prefix: str = None, own_l1: bool = False) -> CacheService:
+    """Geçici SQLite L2 ile cache; her test kendi önekini kullanır"""
+    cache = CacheService()
+    cache.prefix = prefix or f"t{uuid.uuid4().hex[:8]}_"
+    cache.driver = 'sqlite'
+    cache.l2 = SQLiteCacheStore(L2_PATH)
+    if own_l1:
+        # Ayrı süreci taklit eder: L1 paylaşılmaz
+        cache.l1 = LRUCacheStore()
+    return cache
+
+
+def test_flush_invalidates_tagged_entries():
+    """flush() tag'in tüm kayıtlarını tek yazmayla geçersiz kılar"""
+    cache = make_cache()
+    products = cache.tags('products')
+    products.set_many({'a': 1, 'b': 2})
+    assert products.get_many(['a', 'b']) == {'a': 1, 'b': 2}
+
+    products.flush()
+    assert products.get('a') is None
+    assert products.get_many(['a', 'b'], default=0) == {'a': 0, 'b': 0}
+    products.set('a', 3)
+    assert products.get('a') == 3
+
+
+def test_flush_only_affects_own_tags():
+    """Bir tag'in temizlenmesi diğer tag'leri ve tag'siz anahtarları etkilemez"""
+    cache = make_cache()
+    cache.set('plain', 'x')
+    cache.tags('orders').set('k', 'sipariş')
+    cache.tags('products').set('k', 'ürün')
+
+    cache.tags('products').flush()
+    assert cache.tags('orders').get('k') == 'sipariş'
+    assert cache.tags('products').get('k') is None
+    assert cache.get('plain') == 'x'
+
+
+def test_multi_tag_entry_flushed_by_any_tag():
+    """Birden çok tag'li kayıt, tag'lerinden herhangi biri temizlenince düşer"""
+    cache = make_cache()
+    cache.tags('products', 'stock').set('k', 1)
+    assert cache.tags('products', 'stock').get('k') == 1
+    # Tag sırası isim alanının parçasıdır
+    assert cache.tags('stock', 'products').get('k') is None
+
+    cache.tags('stock').flush()
+    assert cache.tags('products', 'stock').get('k') is None
+
+
+def test_flush_visible_to_other_process():
+    """Başka süreçteki flush, L1'de tutulan sürümü atlayarak görülür"""
+    prefix = f"t{uuid.uuid4().hex[:8]}_"
+    reader = make_cache(prefix, own_l1=True)
+    writer = make_cache(prefix, own_l1=True)
+    reader.tags('products').set('k', 'eski')
+    assert reader.tags('products').get('k') == 'eski'
+
+    writer.tags('products').flush()
+    assert reader.tags('products').get('k') is None
+
+
+def test_missing_version_created_once():
+    """Sürümü olmayan tag için tüm örnekler aynı sürümü kullanır"""
+    prefix = f"t{uuid.uuid4().hex[:8]}_"
+    first = make_cache(prefix, own_l1=True).tags('products')
+    second = make_cache(prefix, own_l1=True).tags('products')
+    assert first.namespace == second.namespace
+    first.set('k', 1)
+    assert second.get('k') == 1
+
+
+def test_tagged_remember_and_pattern():
+    """remember ve get_pattern tag isim alanında çalışır"""
+    cache = make_cache()
+    products = cache.tags('products')
+    calls = []
+    assert products.remember('k', 60, lambda: calls.append(1) or 'v', beta=0) == 'v'
+    assert products.remember('k', 60, lambda: calls.append(1) or 'v', beta=0) == 'v'
+    assert len(calls) == 1
+    products.set('other', 1)
+    assert sorted(products.get_pattern('*')) == ['k', 'other']
+
+    products.flush()
+    assert products.get_pattern('*') == []
+    products.remember('k', 60, lambda: calls.append(1) or 'v', beta=0)
+    assert len(calls) == 2
+
+
+def main():
+    """Tüm testleri çalıştırır"""
+    tests = [value for name, value in globals().items() if name.startswith('test_') and callable(value)]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e!r}")
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} test başarılı")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
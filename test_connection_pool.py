@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+SQLite Bağlantı Havuzu Testleri
+İç içe context'lerin savepoint davranışını ve havuz sayaçlarını test eder.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Database.connection import DatabaseConnection, SQLiteConnectionPool
+
+
+def make_pool(pool_size: int = 2) -> SQLiteConnectionPool:
+    """Geçici dosyada tek tablolu havuz oluşturur"""
+    path = os.path.join(tempfile.mkdtemp(), 'pool.db')
+    pool = SQLiteConnectionPool(path, pool_size=pool_size)
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.commit()
+    return pool
+
+
+def values(pool: SQLiteConnectionPool) -> list:
+    with pool.connection() as conn:
+        return sorted(row[0] for row in conn.execute("SELECT x FROM t"))
+
+
+def test_wal_enabled_by_default():
+    """Havuz varsayılan olarak WAL açar"""
+    pool = make_pool()
+    with pool.connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+
+def test_nested_rollback_keeps_outer_transaction():
+    """İç context'in rollback'i yalnızca kendi savepoint'ini geri alır"""
+    pool = make_pool()
+    with pool.connection() as outer:
+        outer.execute("INSERT INTO t VALUES (1)")
+        with pool.connection() as inner:
+            assert inner is outer
+            inner.execute("INSERT INTO t VALUES (2)")
+            inner.rollback()
+        assert outer.in_transaction
+        outer.commit()
+    assert values(pool) == [1]
+
+
+def test_nested_commit_waits_for_outer():
+    """İç context'in commit'i dış transaction'ı erken commit etmez"""
+    pool = make_pool()
+    with pool.connection() as outer:
+        outer.execute("INSERT INTO t VALUES (1)")
+        with pool.connection() as inner:
+            inner.execute("INSERT INTO t VALUES (2)")
+            inner.commit()
+        assert outer.in_transaction
+        outer.rollback()
+    assert values(pool) == []
+
+
+def test_unfinished_transaction_rolled_back_on_checkin():
+    """Yarım kalan transaction bir sonraki kullanıcıya devredilmez"""
+    pool = make_pool(pool_size=1)
+    with pool.connection() as conn:
+        conn.execute("INSERT INTO t VALUES (1)")
+    with pool.connection() as conn:
+        assert not conn.in_transaction
+    assert values(pool) == []
+
+
+def test_checkin_from_another_thread():
+    """Başka thread'de geri verilen bağlantı havuza döner"""
+    pool = make_pool(pool_size=1)
+    conn = pool.checkout()
+    worker = threading.Thread(target=pool.checkin, args=(conn,))
+    worker.start()
+    worker.join()
+    assert pool.get_pool_stats()['active_connections'] == 0
+    again = pool.checkout()
+    assert again is conn
+    pool.checkin(again)
+
+
+def test_closed_connection_not_reused():
+    """Kullanımda kapatılan bağlantı havuzdan düşer"""
+    pool = make_pool(pool_size=1)
+    conn = pool.checkout()
+    conn.close()
+    pool.checkin(conn)
+    assert pool.get_pool_stats()['total_connections'] == 0
+    with pool.connection() as fresh:
+        assert fresh is not conn
+
+
+def main():
+    """Tüm testleri çalıştırır"""
+    tests = [value for name, value in globals().items() if name.startswith('test_') and callable(value)]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e!r}")
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} test başarılı")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
+
+
+def test_database_created_from_seed_leaves_seed_untouched():
+    """Çalışma veritabanı seed'den kopyalanır; WAL'a geçen kopyadır, seed değişmez"""
+    directory = tempfile.mkdtemp()
+    seed = os.path.join(directory, 'app.seed.db')
+    pool = SQLiteConnectionPool(seed, journal_mode=None)
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.execute("INSERT INTO t VALUES (7)")
+        conn.commit()
+    pool.close_all()
+    with open(seed, 'rb') as handle:
+        original = handle.read()
+
+    path = os.path.join(directory, 'app.db')
+    DatabaseConnection._copy_sqlite_seed(path)
+    copied = SQLiteConnectionPool(path)
+    assert values(copied) == [7]
+    with copied.connection() as conn:
+        conn.execute("INSERT INTO t VALUES (8)")
+        conn.commit()
+
+    # Var olan veritabanı seed ile ezilmez
+    DatabaseConnection._copy_sqlite_seed(path)
+    assert values(copied) == [7, 8]
+    with open(seed, 'rb') as handle:
+        assert handle.read() == original
+    assert not os.path.exists(seed + '-wal')
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Delta Senkronizasyon Testleri
+Sipariş watermark'ı, stok/fiyat snapshot'ı ve liste çekme davranışını test eder.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Services.delta_sync import DeltaSyncEngine, SyncStateStore
+
+
+def make_engine(**config) -> DeltaSyncEngine:
+    """Geçici durum veritabanıyla motor oluşturur"""
+    settings = {'overlap': 300, 'batch_poll_interval': 0.01, 'batch_confirm_timeout': 0.1}
+    settings.update(config)
+    return DeltaSyncEngine(settings, SyncStateStore(os.path.join(tempfile.mkdtemp(), 'sync.db')))
+
+
+class OrderSource:
+    """Verilen siparişleri döndüren, istenen aralıkları kaydeden kaynak"""
+
+    def __init__(self, orders: list, fail_after: int = None):
+        self.orders = orders
+        self.fail_after = fail_after
+        self.ranges = []
+
+    def format_date(self, timestamp: float) -> float:
+        return timestamp
+
+    async def iter_orders(self, start_date=None, end_date=None):
+        self.ranges.append((start_date, end_date))
+        for position, order in enumerate(self.orders):
+            if self.fail_after is not None and position >= self.fail_after:
+                raise ConnectionError('bağlantı koptu')
+            yield order
+
+
+class StockTarget:
+    """SKU başına gönderim yapan (N11 benzeri) hedef"""
+
+    STOCK_PRICE_FIELDS = ('quantity',)
+
+    def __init__(self, failing: set = None):
+        self.failing = failing or set()
+        self.calls = []
+
+    def update_stock_by_stock_code(self, sku: str, quantity: int) -> dict:
+        self.calls.append((sku, quantity))
+        return {'result': {'status': {'text': 'failure' if sku in self.failing else 'success'}}}
+
+
+class BatchTarget:
+    """Asenkron toplu işlem kimliği dönen (Trendyol benzeri) hedef"""
+
+    STOCK_PRICE_FIELDS = ('quantity', 'price', 'list_price')
+
+    def __init__(self, failed: set = None, completes: bool = True):
+        self.failed = failed or set()
+        self.completes = completes
+        self.sent = []
+
+    def update_stock_price(self, items: list) -> dict:
+        self.sent.append(items)
+        return {'batchRequestId': f"b{len(self.sent)}"}
+
+    def check_batch_request_result(self, batch_id: str) -> dict:
+        if not self.completes:
+            return {'status': 'IN_PROGRESS'}
+        items = [item for batch in self.sent for item in batch]
+        return {'status': 'COMPLETED', 'items': [
+            {'requestItem': {'barcode': item['barcode']},
+             'status': 'FAILED' if item['barcode'] in self.failed else 'SUCCESS',
+             'failureReasons': ['geçersiz stok']}
+            for item in items
+        ]}
+
+
+class ListingSource:
+    """Platformdaki listeleri döndüren kaynak"""
+
+    STOCK_PRICE_FIELDS = ('quantity',)
+
+    def __init__(self, products: list):
+        self.products = products
+        self.start_dates = []
+
+    def format_date(self, timestamp: float) -> float:
+        return timestamp
+
+    async def iter_products(self, start_date=None):
+        self.start_dates.append(start_date)
+        for product in self.products:
+            yield dict(product)
+
+
+def collect_orders(engine: DeltaSyncEngine, source: OrderSource) -> list:
+    seen = []
+    result = asyncio.run(engine.pull_orders('test', source, lambda order: seen.append(order['order_number'])))
+    assert result['success'], result
+    return seen
+
+
+def test_first_sync_uses_initial_lookback():
+    """İlk senkron geriye dönük pencereyi çeker ve watermark'ı kaydeder"""
+    engine = make_engine(initial_lookback_days=2)
+    source = OrderSource([{'order_number': 'O1', 'updated_at': time.time() - 60}])
+    before = time.time()
+    assert collect_orders(engine, source) == ['O1']
+    start, end = source.ranges[0]
+    assert abs(start - (before - 2 * 86400)) < 5
+    assert engine.store.get_watermark('test', engine.ORDERS) == end
+
+
+def test_overlap_does_not_redeliver_unchanged_orders():
+    """Örtüşme penceresindeki değişmemiş sipariş tekrar verilmez, güncellenen verilir"""
+    engine = make_engine()
+    changed_at = time.time() - 60
+    source = OrderSource([{'order_number': 'O1', 'updated_at': changed_at},
+                          {'order_number': 'O2', 'updated_at': changed_at},
+                          {'order_number': 'O3'}])
+    assert collect_orders(engine, source) == ['O1', 'O2', 'O3']
+    watermark = engine.store.get_watermark('test', engine.ORDERS)
+
+    source.orders[1] = {'order_number': 'O2', 'updated_at': time.time()}
+    assert collect_orders(engine, source) == ['O2']
+    assert source.ranges[1][0] == watermark - 300
+
+
+def test_failed_sync_keeps_watermark():
+    """Hata olursa watermark ilerlemez; işlenen sayfalar yine de tekrar verilmez"""
+    engine = make_engine(page_size=2)
+    changed_at = time.time() - 60
+    orders = [{'order_number': f"O{n}", 'updated_at': changed_at} for n in range(4)]
+    failing = OrderSource(orders, fail_after=2)
+    seen = []
+    result = asyncio.run(engine.pull_orders('test', failing, lambda order: seen.append(order['order_number'])))
+    assert not result['success'] and result['changed'] == 2
+    assert engine.store.get_watermark('test', engine.ORDERS) is None
+
+    assert collect_orders(engine, OrderSource(orders)) == ['O2', 'O3']
+    assert engine.store.get_watermark('test', engine.ORDERS) is not None
+
+
+def test_push_sends_only_changes():
+    """Aynı stok tekrar gönderilmez; değişen SKU gönderilir"""
+    engine = make_engine()
+    target = StockTarget()
+    items = [{'sku': 'A', 'quantity': 5}, {'sku': 'B', 'quantity': 2}]
+    assert asyncio.run(engine.push_stock('n11', target, items))['changed'] == 2
+    assert asyncio.run(engine.push_stock('n11', target, items))['changed'] == 0
+
+    items[1]['quantity'] = 3
+    result = asyncio.run(engine.push_stock('n11', target, items))
+    assert (result['changed'], result['sent']) == (1, 1)
+    assert target.calls[-1] == ('B', 3)
+
+
+def test_unsent_fields_not_compared():
+    """Hedefin göndermediği fiyat değişikliği push tetiklemez ve snapshot'a yazılmaz"""
+    engine = make_engine()
+    target = StockTarget()
+    asyncio.run(engine.push_stock('n11', target, [{'sku': 'A', 'quantity': 5, 'price': 10}]))
+    assert engine.store.get_snapshot('n11', ['A'])['A'] == (5, None, None)
+    assert asyncio.run(engine.push_stock('n11', target, [{'sku': 'A', 'quantity': 5, 'price': 99}]))['changed'] == 0
+    assert len(target.calls) == 1
+
+
+def test_failed_push_retried_next_time():
+    """Başarısız SKU snapshot'a yazılmaz ve sonraki push'ta yeniden gönderilir"""
+    engine = make_engine()
+    target = StockTarget(failing={'A'})
+    result = asyncio.run(engine.push_stock('n11', target, [{'sku': 'A', 'quantity': 5}, {'sku': 'B', 'quantity': 1}]))
+    assert result['failed'] == ['A']
+    assert 'A' not in engine.store.get_snapshot('n11', ['A', 'B'])
+
+    target.failing.clear()
+    result = asyncio.run(engine.push_stock('n11', target, [{'sku': 'A', 'quantity': 5}, {'sku': 'B', 'quantity': 1}]))
+    assert (result['changed'], result['failed']) == (1, [])
+
+
+def test_batch_confirmation_per_item():
+    """Toplu işlemde yalnızca onaylanan öğeler snapshot'a yazılır"""
+    engine = make_engine(batch_size={'ty': 2})
+    target = BatchTarget(failed={'Y'})
+    items = [{'sku': sku, 'quantity': 1, 'price': 10.0} for sku in ('X', 'Y', 'Z')]
+    result = asyncio.run(engine.push_stock('ty', target, items))
+    assert len(target.sent) == 2
+    assert result['failed'] == ['Y']
+    assert result['results']['Y']['error'] == 'geçersiz stok'
+    assert sorted(engine.store.get_snapshot('ty', ['X', 'Y', 'Z'])) == ['X', 'Z']
+
+
+def test_unconfirmed_batch_not_snapshotted():
+    """Süresinde onaylanmayan toplu işlem bekliyor sayılır ve snapshot'a yazılmaz"""
+    engine = make_engine()
+    result = asyncio.run(engine.push_stock('ty', BatchTarget(completes=False), [{'sku': 'P', 'quantity': 1}]))
+    assert result['results']['P']['pending']
+    assert engine.store.get_snapshot('ty', ['P']) == {}
+
+
+def test_pull_listings_updates_snapshot():
+    """Platformdan okunan stok snapshot'ı günceller; aynı değer tekrar gönderilmez"""
+    engine = make_engine()
+    source = ListingSource([{'sku': 'A', 'quantity': 5, 'sale_price': 10.0},
+                            {'sku': 'B', 'quantity': 1, 'sale_price': 3.0}])
+    seen = []
+    result = asyncio.run(engine.pull_listings('n11', source, lambda product: seen.append(product['sku'])))
+    assert result['changed'] == 2 and seen == ['A', 'B']
+    assert engine.store.get_snapshot('n11', ['A'])['A'] == (5, None, None)
+    watermark = engine.store.get_watermark('n11', engine.LISTINGS)
+    assert source.start_dates == [None]
+
+    # Yalnızca fiyat (gönderilmeyen alan) değişti
+    source.products[0]['sale_price'] = 99.0
+    assert asyncio.run(engine.pull_listings('n11', source))['changed'] == 0
+    assert source.start_dates[1] == watermark - 300
+
+    source.products[1]['quantity'] = 7
+    assert asyncio.run(engine.pull_listings('n11', source))['changed'] == 1
+    assert asyncio.run(engine.push_stock('n11', StockTarget(), [{'sku': 'B', 'quantity': 7}]))['changed'] == 0
+
+
+def test_reset_clears_state():
+    """reset() platformun watermark ve snapshot'ını siler"""
+    engine = make_engine()
+    asyncio.run(engine.push_stock('n11', StockTarget(), [{'sku': 'A', 'quantity': 1}]))
+    collect_orders(engine, OrderSource([]))
+    engine.store.reset('n11')
+    engine.store.reset('test')
+    assert engine.store.get_snapshot('n11', ['A']) == {}
+    assert engine.store.get_watermark('test', engine.ORDERS) is None
+
+
+def main():
+    """Tüm testleri çalıştırır"""
+    tests = [value for name, value in globals().items() if name.startswith('test_') and callable(value)]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e!r}")
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} test başarılı")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Eager Loading Testleri
+BaseModel.with_() / eager_load() ilişkilerini ilişki başına tek IN sorgusuyla
+yüklediğini ve erişimcilerin yeniden sorgu atmadığını test eder.
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Config.config import get_config
+
+# Veritabanı modülü import edilmeden önce geçici veritabanına yönlendir
+DB_PATH = os.path.join(tempfile.mkdtemp(), 'eager.db')
+get_config().set('database.driver', 'sqlite')
+get_config().set('database.database_path', DB_PATH)
+
+from core.Database.connection import get_db_connection
+from app.Models.Order import Order
+from app.Models.Product import Product
+
+
+def setup_module(module=None):
+    """Sipariş, kalem, ürün, kategori ve kullanıcı tablolarını oluşturur"""
+    db = get_db_connection()
+    if db._config.get('database') != DB_PATH:
+        db._load_config()
+        db._create_connection()
+    with db.get_connection() as conn:
+        for table in ('orders', 'order_items', 'products', 'categories', 'users'):
+            conn.execute(f"DROP TABLE IF EXISTS {table}")
+        conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT)")
+        conn.execute("CREATE TABLE categories (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.execute("CREATE TABLE products (id INTEGER PRIMARY KEY, name TEXT, category_id INTEGER)")
+        conn.execute("CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER, order_number TEXT)")
+        conn.execute(
+            "CREATE TABLE order_items (id INTEGER PRIMARY KEY, order_id INTEGER, product_id INTEGER, "
+            "quantity INTEGER, unit_price REAL)"
+        )
+        conn.executemany("INSERT INTO users (id, name, email) VALUES (?, ?, ?)",
+                         [(1, 'Ayşe', 'ayse@example.com'), (2, 'Mehmet', 'mehmet@example.com')])
+        conn.execute("INSERT INTO categories (id, name) VALUES (1, 'Elektronik')")
+        conn.executemany("INSERT INTO products (id, name, category_id) VALUES (?, ?, ?)",
+                         [(1, 'Telefon', 1), (2, 'Kılıf', None), (3, 'Şarj', 99)])
+        # 3 numaralı siparişin kullanıcısı yok, 4 numaralının kalemi yok
+        conn.executemany("INSERT INTO orders (id, user_id, order_number) VALUES (?, ?, ?)",
+                         [(1, 1, 'A-1'), (2, 2, 'A-2'), (3, 77, 'A-3'), (4, 1, 'A-4')])
+        conn.executemany(
+            "INSERT INTO order_items (order_id, product_id, quantity, unit_price) VALUES (?, ?, ?, ?)",
+            [(1, 1, 1, 10.0), (1, 2, 2, 5.0), (2, 1, 1, 10.0), (3, 3, 1, 3.0)]
+        )
+        conn.commit()
+
+
+@pytest.fixture
+def queries(monkeypatch):
+    """Çalıştırılan SELECT sorgularını kaydeder"""
+    db = get_db_connection()
+    executed = []
+    original = db.execute_query
+
+    def recording(query, params=None):
+        executed.append(query)
+        return original(query, params)
+
+    monkeypatch.setattr(db, 'execute_query', recording)
+    return executed
+
+
+def test_with_loads_each_relation_with_one_in_query(queries):
+    """Her ilişki (iç içe olanlar dahil) tek IN sorgusuyla yüklenir"""
+    orders = Order.with_('user', 'items.product').order_by('id', 'asc').get()
+
+    assert len(orders) == 4
+    assert len(queries) == 4
+    assert 'FROM orders' in queries[0]
+    for table in ('users', 'order_items', 'products'):
+        matching = [query for query in queries if f"FROM {table}" in query]
+        assert len(matching) == 1
+        assert ' IN (' in matching[0]
+
+
+def test_accessors_do_not_query_after_eager_load(queries):
+    """Yüklenen ilişkiler (None ve boş liste dahil) erişimcilerden sorgusuz döner"""
+    orders = Order.with_('user', 'items.product').order_by('id', 'asc').get()
+    loaded = len(queries)
+
+    by_id = {order.id: order for order in orders}
+    assert by_id[1].user().name == 'Ayşe'
+    assert [item.product().name for item in by_id[1].items()] == ['Telefon', 'Kılıf']
+    assert by_id[3].user() is None
+    assert by_id[3].items()[0].product().name == 'Şarj'
+    assert by_id[4].items() == []
+    assert len(queries) == loaded
+
+
+def test_eager_load_stitches_missing_belongs_to(queries):
+    """NULL ya da eşleşmeyen yabancı anahtarlı ilişki None olarak işaretlenir"""
+    products = [Product.find(product_id) for product_id in (1, 2, 3)]
+    del queries[:]
+
+    Product.eager_load(products, 'category')
+    assert len(queries) == 1
+    assert [product.category() and product.category().name for product in products] == ['Elektronik', None, None]
+    assert len(queries) == 1
+
+
+def test_load_relation_caches_single_model(queries):
+    """load_relation tek model için ilişkiyi bir kez yükler"""
+    order = Order.find(3)
+    del queries[:]
+
+    assert order.load_relation('user') is None
+    assert order.load_relation('user') is None
+    assert order.user() is None
+    assert len(queries) == 1
+
+
+def test_unknown_relation_raises():
+    """Tanımsız ilişki adı hata verir"""
+    with pytest.raises(ValueError):
+        Order.eager_load([Order(id=1)], 'payments')
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Fan-Out Testleri
+FanOutExecutor süre sınırlarını, anahtarlı sonuçları ve N11 SKU özetini test eder.
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future, wait
+
+import pytest
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Services.fan_out import FanOutExecutor, summarize
+
+
+def make_executor(**config) -> FanOutExecutor:
+    settings = {'default_concurrency': 2, 'default_deadline': 5}
+    settings.update(config)
+    return FanOutExecutor(settings)
+
+
+def test_platforms_run_in_parallel():
+    """Toplam süre platformların toplamına değil en yavaşına yakındır"""
+    executor = make_executor()
+    started = time.monotonic()
+    results = executor.run({
+        platform: (lambda platform=platform: time.sleep(0.3) or {'success': True, 'platform': platform})
+        for platform in ('trendyol', 'n11', 'hepsiburada')
+    })
+    assert time.monotonic() - started < 0.8
+    assert {platform: result['platform'] for platform, result in results.items()} == {
+        'trendyol': 'trendyol', 'n11': 'n11', 'hepsiburada': 'hepsiburada'
+    }
+    executor.shutdown()
+
+
+def test_deadline_marks_started_call_unknown_and_queued_call_not_started():
+    """Başlamış çağrı 'unknown', sırada bekleyen çağrı 'not_started' olur; diğer platform beklenmez"""
+    executor = make_executor(concurrency={'n11': 1})
+    release = threading.Event()
+    started = time.monotonic()
+    results = executor.execute([
+        ('n11', 'A', lambda: release.wait(5) and {'success': True}),
+        ('n11', 'B', lambda: {'success': True}),
+        ('trendyol', None, lambda: {'success': True}),
+    ], deadlines={'n11': 0.2})
+    release.set()
+
+    assert time.monotonic() - started < 2
+    assert results['trendyol'] == {'success': True}
+    assert results['n11']['A']['timed_out'] and results['n11']['A']['outcome'] == 'unknown'
+    assert results['n11']['B']['timed_out'] and results['n11']['B']['outcome'] == 'not_started'
+    assert list(results['n11']) == ['A', 'B']
+    executor.shutdown()
+
+
+def test_call_finishing_during_cancel_keeps_its_result(monkeypatch):
+    """done() kontrolünden sonra, cancel() öncesinde biten çağrının sonucu kaybolmaz"""
+    release = threading.Event()
+    original_cancel = Future.cancel
+
+    def late_cancel(future):
+        # Çağrı tam süre dolduğunda bitiyor
+        release.set()
+        wait([future])
+        return original_cancel(future)
+
+    monkeypatch.setattr(Future, 'cancel', late_cancel)
+    executor = make_executor()
+    results = executor.execute([('n11', None, lambda: release.wait(5) and {'success': True})],
+                               deadlines={'n11': 0.1})
+    assert results['n11'] == {'success': True}
+    executor.shutdown()
+
+
+def test_errors_become_results():
+    """Hata fırlatan çağrı diğerlerini etkilemez"""
+    executor = make_executor()
+
+    def fail():
+        raise ConnectionError('bağlantı reddedildi')
+
+    results = executor.run({'trendyol': fail, 'n11': lambda: {'success': True}})
+    assert results['trendyol'] == {'success': False, 'error': 'bağlantı reddedildi'}
+    assert results['n11'] == {'success': True}
+    executor.shutdown()
+
+
+def test_mixed_or_duplicate_keys_are_rejected():
+    """Anahtarlı/anahtarsız karışık ya da tekrarlanan anahtarlı çağrılar reddedilir"""
+    executor = make_executor()
+    with pytest.raises(ValueError):
+        executor.execute([('n11', 'A', dict), ('n11', None, dict)])
+    with pytest.raises(ValueError):
+        executor.execute([('n11', 'A', dict), ('n11', 'A', dict)])
+
+
+def test_summarize_counts_platform_level_failures():
+    """HTTP başarılı ama platform düzeyinde başarısız SKU'lar da failed sayılır"""
+    summary = summarize({
+        'A': {'result': {'status': 'success'}},
+        'B': {'result': {'status': 'failure'}},
+        'C': {'success': False, 'error': 'timeout'},
+    })
+    assert summary['success'] is False
+    assert summary['total'] == 3
+    assert summary['failed'] == ['B', 'C']
+
+
+class Client:
+    """Çağrıları kaydeden sahte marketplace client'ı"""
+
+    def __init__(self, failing: set = None):
+        self.failing = failing or set()
+        self.calls = []
+
+    def update_stock_price(self, updates):
+        self.calls.append(('bulk', len(updates)))
+        return {'success': True, 'batchRequestId': 'b-1'}
+
+    def update_stock_by_stock_code(self, stock_code, quantity):
+        self.calls.append((stock_code, quantity))
+        status = 'failure' if stock_code in self.failing else 'success'
+        return {'result': {'status': status}}
+
+
+def make_manager(n11: Client, trendyol: Client):
+    """Bağlı sahte client'larla entegrasyon yöneticisi"""
+    module = pytest.importorskip('core.Services.real_integration_manager', exc_type=ImportError)
+    manager = module.RealIntegrationManager.__new__(module.RealIntegrationManager)
+    manager.trendyol, manager.n11, manager.hepsiburada, manager.iyzico = trendyol, n11, None, None
+    manager.integration_status = {
+        platform: {'connected': platform in ('trendyol', 'n11'), 'last_check': None, 'error': None}
+        for platform in ('trendyol', 'n11', 'hepsiburada', 'iyzico')
+    }
+    manager.fan_out = make_executor()
+    return manager
+
+
+def test_n11_stock_sync_is_summarized_per_sku():
+    """N11 SKU başına gönderilir, son güncelleme kazanır, SKU'suz satırların sırası 'invalid' olur"""
+    n11, trendyol = Client(failing={'SKU-2'}), Client()
+    manager = make_manager(n11, trendyol)
+
+    results = manager.sync_stock_to_all_platforms([
+        {'stockCode': 'SKU-1', 'quantity': 1},
+        {'quantity': 9},
+        {'sku': 'SKU-2', 'quantity': 2},
+        {'stockCode': 'SKU-1', 'quantity': 5},
+    ])
+
+    assert trendyol.calls == [('bulk', 4)]
+    assert results['trendyol']['success'] is True
+    assert sorted(n11.calls) == [('SKU-1', 5), ('SKU-2', 2)]
+    assert results['n11']['total'] == 2
+    assert results['n11']['failed'] == ['SKU-2']
+    assert results['n11']['invalid'] == [1]
+    assert results['n11']['success'] is False
+    assert set(results['n11']['results']) == {'SKU-1', 'SKU-2'}
+    manager.fan_out.shutdown()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Dosya Hash Önbelleği Testleri
+FileHashCache önbellek isabetini, stat değişince geçersizleşmeyi, taşınan
+dosyaların özetinin yeniden kullanılmasını ve prune() temizliğini test eder.
+"""
+
+import hashlib
+import os
+import sys
+
+import pytest
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Services import file_hash_cache
+from core.Services.file_hash_cache import FileHashCache
+
+ALGORITHM = 'blake2b'
+
+
+def blake2b(content: bytes) -> str:
+    return hashlib.blake2b(content, digest_size=32).hexdigest()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return FileHashCache({'path': str(tmp_path / 'hashes.db'), 'workers': 2})
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """hash_path çağrılarını sayar"""
+    calls = []
+    hash_path = file_hash_cache.hash_path
+
+    def counting_hash_path(path, algorithm='md5', buffer_size=1024 * 1024):
+        calls.append(path)
+        return hash_path(path, algorithm, buffer_size)
+
+    monkeypatch.setattr(file_hash_cache, 'hash_path', counting_hash_path)
+    return calls
+
+
+def write(path, content: bytes, mtime_ns: int = None) -> str:
+    path.write_bytes(content)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return str(path)
+
+
+def test_cache_hit_does_not_read_file(cache, reads, tmp_path):
+    """Değişmeyen dosyanın hash'i dosya okunmadan döner"""
+    path = write(tmp_path / 'a.bin', b'icerik' * 1000)
+
+    assert cache.hash_file(path, ALGORITHM) == blake2b(b'icerik' * 1000)
+    assert cache.hash_file(path, ALGORITHM) == blake2b(b'icerik' * 1000)
+    assert cache.hash_files([path, path], ALGORITHM) == {path: blake2b(b'icerik' * 1000)}
+    assert reads == [path]
+
+
+def test_size_or_mtime_change_invalidates(cache, reads, tmp_path):
+    """Boyut ya da mtime değişince dosya yeniden hash'lenir"""
+    path = write(tmp_path / 'a.bin', b'aaaa', mtime_ns=1_000_000_000)
+    assert cache.hash_file(path, ALGORITHM) == blake2b(b'aaaa')
+
+    # Aynı boyut, farklı mtime
+    write(tmp_path / 'a.bin', b'bbbb', mtime_ns=2_000_000_000)
+    assert cache.hash_file(path, ALGORITHM) == blake2b(b'bbbb')
+
+    # Aynı mtime, farklı boyut
+    write(tmp_path / 'a.bin', b'ccccc', mtime_ns=2_000_000_000)
+    assert cache.hash_file(path, ALGORITHM) == blake2b(b'ccccc')
+    assert reads == [path] * 3
+
+
+def test_moved_file_reuses_digest(cache, reads, tmp_path):
+    """Taşınan dosya (aynı inode ve mtime) okunmadan önceki özeti alır ve yeni yolla kaydedilir"""
+    source = write(tmp_path / 'a.bin', b'tasinan')
+    digest = cache.hash_file(source, ALGORITHM)
+
+    target = str(tmp_path / 'b.bin')
+    os.rename(source, target)
+
+    assert cache.hash_file(target, ALGORITHM) == digest
+    assert reads == [source]
+    assert cache._cached([target], ALGORITHM)[target][1] == digest
+    assert sorted(cache.find(digest, ALGORITHM)) == sorted([source, target])
+
+
+def test_file_changed_while_hashing_is_not_stored(cache, monkeypatch, tmp_path):
+    """Okuma sırasında değişen dosyanın özeti döner ama kaydedilmez"""
+    path = write(tmp_path / 'a.bin', b'ilk')
+    hash_path = file_hash_cache.hash_path
+
+    def hash_then_modify(file_path, algorithm='md5', buffer_size=1024 * 1024):
+        digest = hash_path(file_path, algorithm, buffer_size)
+        with open(file_path, 'ab') as handle:
+            handle.write(b' ek')
+        return digest
+
+    monkeypatch.setattr(file_hash_cache, 'hash_path', hash_then_modify)
+    assert cache.hash_file(path, ALGORITHM) == blake2b(b'ilk')
+    assert cache._cached([path], ALGORITHM) == {}
+
+    monkeypatch.setattr(file_hash_cache, 'hash_path', hash_path)
+    assert cache.hash_file(path, ALGORITHM) == blake2b(b'ilk ek')
+
+
+def test_unreadable_files_are_none(cache, tmp_path):
+    """Var olmayan dosya None döner, diğer sonuçları etkilemez"""
+    path = write(tmp_path / 'a.bin', b'var')
+    missing = str(tmp_path / 'yok.bin')
+    assert cache.hash_files([missing, path], ALGORITHM) == {missing: None, path: blake2b(b'var')}
+
+
+def test_prune_removes_deleted_files(cache, tmp_path):
+    """prune() yalnızca artık var olmayan dosyaların kayıtlarını siler"""
+    kept = write(tmp_path / 'a.bin', b'kalan')
+    deleted = write(tmp_path / 'b.bin', b'silinen')
+    cache.hash_files([kept, deleted], ALGORITHM)
+    cache.hash_file(deleted, 'md5')
+
+    os.remove(deleted)
+    assert cache.prune() == 1
+    assert cache.find(blake2b(b'silinen'), ALGORITHM) == []
+    assert cache.find(blake2b(b'kalan'), ALGORITHM) == [kept]
+    assert cache.prune() == 0
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Full-Text Arama Testleri
+SQLite FTS5 indeksinin tetikleyicilerle senkronunu, BM25 sıralamasını,
+güvenli özetleri ve indeks yokken LIKE aramasına dönüşü test eder.
+"""
+
+import os
+import sys
+import tempfile
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Config.config import get_config
+
+# Veritabanı modülü import edilmeden önce geçici veritabanına yönlendir
+DB_PATH = os.path.join(tempfile.mkdtemp(), 'fulltext.db')
+get_config().set('database.driver', 'sqlite')
+get_config().set('database.database_path', DB_PATH)
+
+from core.Database.connection import get_db_connection
+from core.Database.fulltext import SQLiteFTS5Index, get_fulltext_index
+from core.Database.search import search
+
+FIELDS = ['title', 'body']
+
+
+def setup_module(module=None):
+    """Makale tablosunu oluşturur ve FTS5 indeksini kurar"""
+    db = get_db_connection()
+    if db._config.get('database') != DB_PATH:
+        db._load_config()
+        db._create_connection()
+    with db.get_connection() as conn:
+        conn.execute("DROP TABLE IF EXISTS fts_articles")
+        conn.execute("CREATE TABLE fts_articles (id INTEGER PRIMARY KEY, title TEXT, body TEXT)")
+        conn.executemany("INSERT INTO fts_articles (title, body) VALUES (?, ?)", [
+            ('Kahve rehberi', 'kahve kahve kahve demleme yöntemleri'),
+            ('Çay kültürü', 'çay ve biraz kahve'),
+            ('Bahçe', 'domates ve biber yetiştirme'),
+            ('Güvenlik', 'kahve <script>alert(1)</script> & çerezler'),
+        ])
+        conn.commit()
+    assert get_fulltext_index('fts_articles', FIELDS).ensure()
+
+
+def ids(rows) -> list:
+    return [row['id'] for row in rows]
+
+
+def test_sqlite_driver_uses_fts5_index():
+    """Var olan tablo için FTS5 indeksi oluşturulur ve hazır işaretlenir"""
+    index = get_fulltext_index('fts_articles', FIELDS)
+    assert isinstance(index, SQLiteFTS5Index)
+    assert index.is_ready()
+    assert index.name == 'fts_articles_title_body_fts'
+
+
+def test_triggers_sync_insert_update_delete():
+    """Tablodaki insert/update/delete indekse yansır"""
+    db = get_db_connection()
+    index = get_fulltext_index('fts_articles', FIELDS)
+
+    db.execute_many("INSERT INTO fts_articles (id, title, body) VALUES (?, ?, ?)", [(50, 'Zeytinyağı', 'soğuk sıkım')])
+    assert ids(index.search('zeytinyağı')) == [50]
+
+    db.execute_many("UPDATE fts_articles SET title = ? WHERE id = ?", [('Fındık', 50)])
+    assert index.search('zeytinyağı') == []
+    assert ids(index.search('fındık')) == [50]
+
+    db.execute_many("DELETE FROM fts_articles WHERE id = ?", [(50,)])
+    assert index.search('fındık') == []
+    assert index.search('soğuk') == []
+
+
+def test_prefix_and_turkish_variants_match():
+    """Son kelime önek olarak aranır, büyük I/İ ve ı/i varyantları eşleşir"""
+    index = get_fulltext_index('fts_articles', FIELDS)
+    assert ids(index.search('demle')) == [1]
+    assert ids(index.search('ÇAY KÜLTÜRÜ')) == [2]
+    assert ids(index.search('yetistirme')) == [3]
+
+
+def test_sort_by_relevance_uses_bm25_order():
+    """sort_by_relevance BM25 sırasını kullanır (en ilgili ilk)"""
+    rows = search('fts_articles', 'kahve', FIELDS).sort_by_relevance().get()
+    assert ids(rows)[0] == 1
+    assert sorted(ids(rows)) == [1, 2, 4]
+    relevance = [row['relevance'] for row in rows]
+    assert relevance == sorted(relevance)
+
+
+def test_highlight_snippets_are_escaped():
+    """Özetlerde içerik HTML-escape edilir, yalnızca eşleşmeler <mark> olur"""
+    rows = search('fts_articles', 'çerezler', FIELDS).highlight().get()
+    assert ids(rows) == [4]
+    snippet = rows[0]['snippet']
+    assert '<script>' not in snippet
+    assert '&lt;script&gt;' in snippet and '&amp;' in snippet
+    assert '<mark>çerezler</mark>' in snippet
+
+
+def test_falls_back_to_like_without_index():
+    """İndeksi olmayan alan kümesinde LIKE araması kullanılır"""
+    assert not get_fulltext_index('fts_articles', ['body']).is_ready()
+
+    engine = search('fts_articles', 'biber', ['body']).sort_by_relevance()
+    rows = engine.get()
+    assert ids(rows) == [3]
+    assert 'LIKE' in engine.query_builder.to_sql()
+    assert 'MATCH' not in engine.query_builder.to_sql()
+    assert engine.search_engine._fulltext_index is None
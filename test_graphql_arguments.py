@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+GraphQL Argüman Testleri
+Alan argümanlarının (değişken, literal, enum, liste, input nesnesi)
+ayrıştırılmasını, değişkenlerin bağlanmasını ve sorgu cache anahtarını test eder.
+"""
+
+import os
+import sys
+import uuid
+
+import pytest
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Services.cache_stores import LRUCacheStore, SQLiteCacheStore
+from core.Services.graphql_service import GraphQLService, Variable
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = GraphQLService()
+    service.cache.prefix = f"t{uuid.uuid4().hex[:8]}_"
+    service.cache.driver = 'sqlite'
+    service.cache.l1 = LRUCacheStore()
+    service.cache.l2 = SQLiteCacheStore(str(tmp_path / 'cache.db'))
+    return service
+
+
+def test_arguments_are_parsed(service):
+    """Argümanlar alanın 'arguments' sözlüğüne yazılır; iç içe alanlar kendi argümanlarını taşır"""
+    fields = service._parse_query('''
+        query Posts($tags: [String]) {
+            posts(limit: 5, published: true, order: DESC, # yorum (parantez)
+                  filter: {tags: $tags, title: "a\\"b)"}, ids: [1, 2.5, -3e2], after: null) {
+                comments(first: 2) { body }
+            }
+            me
+        }
+    ''')['fields']
+
+    assert fields[0]['arguments'] == {
+        'limit': 5, 'published': True, 'order': 'DESC',
+        'filter': {'tags': Variable('tags'), 'title': 'a"b)'},
+        'ids': [1, 2.5, -300.0], 'after': None,
+    }
+    assert fields[0]['sub_fields'][0]['arguments'] == {'first': 2}
+    assert [field['name'] for field in fields] == ['posts', 'me']
+    assert fields[1]['arguments'] == {}
+
+
+@pytest.mark.parametrize('query', ['{ a(b 1) }', '{ a(b: ) }', '{ a(b: [1 }', '{ a(b: 1'])
+def test_malformed_arguments_raise(service, query):
+    with pytest.raises(ValueError):
+        service._parse_query(query)
+
+
+def test_resolvers_receive_bound_arguments(service):
+    """Değişkenler çalıştırma anında bağlanır; farklı argümanlar ayrı cache kaydıdır"""
+    seen = []
+
+    def resolve_post(field, variables, context):
+        seen.append(field['arguments'])
+        return {'id': field['arguments']['id']}
+
+    service.add_resolver('Query', 'post', resolve_post)
+
+    assert service.execute_query('query P($id: ID!) { post(id: $id) { id } }', {'id': 7})['data'] == {'post': {'id': 7}}
+    assert service.execute_query('{ post(id: 8) { id } }')['data'] == {'post': {'id': 8}}
+    assert service.execute_query('{ post(id: 9) { id } }')['data'] == {'post': {'id': 9}}
+    assert seen == [{'id': 7}, {'id': 8}, {'id': 9}]
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Hamming İndeksi Testleri
+HammingIndex sorgu, çift ve grup sonuçlarını kaba kuvvet karşılaştırmasıyla test eder.
+"""
+
+import os
+import random
+import sys
+import tempfile
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.AI.hash_index import HammingIndex, hamming_distance
+
+
+def make_index(count: int = 3000, seed: int = 1, chunks: int = 4) -> HammingIndex:
+    """Kümelenmiş (yakın kopyalar içeren) rastgele hash'lerle indeks oluşturur"""
+    rng = random.Random(seed)
+    bases = [rng.getrandbits(64) for _ in range(count // 10)]
+    index = HammingIndex(chunks)
+    for n in range(count):
+        value = rng.choice(bases)
+        for _ in range(rng.randint(0, 5)):
+            value ^= 1 << rng.randrange(64)
+        index.add(f"k{n}", value)
+    return index
+
+
+def brute_query(index: HammingIndex, value: int, max_distance: int) -> list:
+    matches = [(key, hamming_distance(index.get(key), value)) for key in index.keys()]
+    return sorted((match for match in matches if match[1] <= max_distance), key=lambda match: (match[1], match[0]))
+
+
+def brute_pairs(index: HammingIndex, max_distance: int) -> list:
+    keys = index.keys()
+    pairs = []
+    for position, first in enumerate(keys):
+        for second in keys[position + 1:]:
+            distance = hamming_distance(index.get(first), index.get(second))
+            if distance <= max_distance:
+                pairs.append((first, second, distance))
+    return normalize(pairs)
+
+
+def normalize(pairs) -> list:
+    return sorted((min(first, second), max(first, second), distance) for first, second, distance in pairs)
+
+
+def test_query_matches_brute_force():
+    """Kova araması ve tam tarama kaba kuvvetle aynı sonucu verir"""
+    index = make_index()
+    rng = random.Random(2)
+    for _ in range(20):
+        value = int(index.get(rng.choice(index.keys())), 16) ^ (1 << rng.randrange(64))
+        # 3: kova araması, 9: tam taramaya düşer
+        for max_distance in (0, 3, 9):
+            expected = brute_query(index, value, max_distance)
+            got = index.query(value, max_distance)
+            assert sorted(got, key=lambda match: (match[1], match[0])) == expected
+            assert [distance for _, distance in got] == sorted(distance for _, distance in got)
+
+
+def test_query_limit_returns_nearest():
+    """limit en yakın kayıtları döndürür"""
+    index = HammingIndex()
+    index.add('uzak', 0b1111)
+    index.add('yakın', 0b1)
+    index.add('aynı', 0)
+    assert index.query(0, 4, limit=2) == [('aynı', 0), ('yakın', 1)]
+    assert index.query('0000000000000000', 0) == [('aynı', 0)]
+
+
+def test_pairs_match_brute_force():
+    """pairs() kaba kuvvetle bulunan çiftlerin tamamını bulur"""
+    index = make_index(600)
+    for max_distance in (0, 3, 12):
+        assert normalize(index.pairs(max_distance)) == brute_pairs(index, max_distance)
+
+
+def test_pairs_with_identical_hashes():
+    """Birebir kopyalar 0 mesafeli çift olarak döner"""
+    index = HammingIndex()
+    for name in ('a', 'b', 'c'):
+        index.add(name, 0xABCDEF)
+    index.add('d', 0xABCDEE)
+    assert normalize(index.pairs(0)) == [('a', 'b', 0), ('a', 'c', 0), ('b', 'c', 0)]
+    assert len(index.pairs(1)) == 6
+
+
+def test_groups_close_to_representative():
+    """Grup üyeleri temsilciye yakındır ve her kayıt en fazla bir gruptadır"""
+    index = make_index(2000)
+    groups = index.groups(3)
+    assert groups
+    seen = set()
+    for group in groups:
+        assert len(group) > 1
+        assert all(hamming_distance(index.get(group[0]), index.get(key)) <= 3 for key in group)
+        assert not seen & set(group)
+        seen.update(group)
+
+
+def test_update_and_remove():
+    """Güncellenen ve silinen kayıtlar sorgulardan düşer"""
+    index = HammingIndex()
+    index.add('a', 0)
+    index.add('a', 0xFFFF)
+    assert index.query(0, 3) == []
+    assert index.query(0xFFFF, 0) == [('a', 0)]
+    assert index.remove('a')
+    assert index.query(0xFFFF, 0) == [] and len(index) == 0
+
+
+def test_save_and_load_roundtrip():
+    """Kaydedilen indeks aynı sorgu sonuçlarıyla yüklenir"""
+    index = make_index(500)
+    path = index.save(os.path.join(tempfile.mkdtemp(), 'hashes.npz'))
+    loaded = HammingIndex.load(path)
+    assert sorted(loaded.keys()) == sorted(index.keys())
+    assert normalize(loaded.pairs(3)) == normalize(index.pairs(3))
+
+
+def main():
+    """Tüm testleri çalıştırır"""
+    tests = [value for name, value in globals().items() if name.startswith('test_') and callable(value)]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e!r}")
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} test başarılı")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
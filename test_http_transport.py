@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+HTTP Transport Testleri
+Yerel bir HTTP sunucusuna karşı TransportSession senkron facade'ını,
+header/Basic auth birleştirmeyi, params normalizasyonunu, hata sınıflarını
+ve backend seçimini test eder.
+"""
+
+import asyncio
+import base64
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+import requests
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Services import http_transport
+from core.Services.http_transport import HTTPStatusError, HttpTransport, TransportConnectionError
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """İsteği JSON olarak geri döndürür; /status/<kod> o kodla yanıt verir"""
+
+    def _respond(self):
+        parts = urlsplit(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode('utf-8') if length else ''
+        payload = json.dumps({
+            'method': self.command,
+            'path': parts.path,
+            'query': parse_qsl(parts.query, keep_blank_values=True),
+            'headers': {key.lower(): value for key, value in self.headers.items()},
+            'body': body,
+        }).encode('utf-8')
+
+        status = int(parts.path.rsplit('/', 1)[-1]) if parts.path.startswith('/status/') else 200
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('Set-Cookie', 'session=abc; Path=/')
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def server_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), EchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+BACKENDS = ['requests']
+if http_transport.AIOHTTP_AVAILABLE:
+    BACKENDS.append('aiohttp')
+if http_transport.HTTPX_HTTP2_AVAILABLE:
+    BACKENDS.append('httpx')
+
+
+@pytest.fixture(params=BACKENDS)
+def transport(request):
+    transport = HttpTransport({'backend': request.param, 'timeout': 5, 'user_agent': 'test-agent'})
+    yield transport
+    transport.close()
+
+
+def test_backend_selection():
+    """Backend config'ten alınır; verilmezse kurulu en yetenekli istemci seçilir"""
+    assert HttpTransport({'backend': 'requests'}).backend == 'requests'
+
+    expected = 'httpx' if http_transport.HTTPX_HTTP2_AVAILABLE else (
+        'aiohttp' if http_transport.AIOHTTP_AVAILABLE else 'requests')
+    assert HttpTransport({}).backend == expected
+
+    without_http2 = HttpTransport({'http2': False}).backend
+    assert without_http2 == ('aiohttp' if http_transport.AIOHTTP_AVAILABLE else 'requests')
+
+
+def test_headers_and_basic_auth_are_merged(transport, server_url):
+    """Oturum header'ı, istek header'ı (harf duyarsız) ve Basic auth birleşir"""
+    session = transport.session('test', headers={'X-Api-Key': 'oturum', 'Accept': 'text/plain'},
+                                auth=('kullanici', 'sifre'), base_url=server_url, retries=0)
+
+    echo = session.get('/echo', headers={'accept': 'application/json', 'X-Request': '1'}).json()
+    headers = echo['headers']
+
+    assert echo['method'] == 'GET' and echo['path'] == '/echo'
+    assert headers['user-agent'] == 'test-agent'
+    assert headers['x-api-key'] == 'oturum'
+    assert headers['accept'] == 'application/json'
+    assert headers['x-request'] == '1'
+    assert headers['authorization'] == 'Basic ' + base64.b64encode(b'kullanici:sifre').decode('ascii')
+
+    session.auth = None
+    assert 'authorization' not in session.get('/echo').json()['headers']
+
+
+def test_params_are_normalized(transport, server_url):
+    """None atlanır, listeler tekrarlı anahtara açılır, bool true/false olur"""
+    session = transport.session('test', base_url=server_url, retries=0)
+    echo = session.get('/echo', params={'page': 2, 'skip': None, 'status': ['Created', 'Shipped'],
+                                        'archived': False}).json()
+    assert echo['query'] == [['page', '2'], ['status', 'Created'], ['status', 'Shipped'], ['archived', 'false']]
+
+
+def test_json_body_and_no_cookies(transport, server_url):
+    """JSON gövde gönderilir; paylaşılan istemci yanıt çerezlerini saklamaz"""
+    session = transport.session('test', base_url=server_url, retries=0)
+    echo = session.post('/items', json={'sku': 'A-1', 'adet': 3}).json()
+    assert echo['method'] == 'POST'
+    assert json.loads(echo['body']) == {'sku': 'A-1', 'adet': 3}
+    assert 'cookie' not in session.get('/echo').json()['headers']
+
+
+def test_raise_for_status_is_caught_by_requests_handlers(transport, server_url):
+    """HTTPStatusError mevcut `except requests.exceptions.*` bloklarına düşer"""
+    session = transport.session('test', base_url=server_url, retries=0)
+    response = session.get('/status/404')
+    assert response.status_code == 404 and not response.ok
+
+    with pytest.raises(requests.exceptions.HTTPError) as error:
+        response.raise_for_status()
+    assert isinstance(error.value, HTTPStatusError)
+    assert error.value.response is response
+
+    try:
+        session.get('/status/500').raise_for_status()
+    except requests.exceptions.RequestException as e:
+        caught = e
+    assert isinstance(caught, HTTPStatusError)
+
+
+def test_connection_error_is_requests_connection_error(transport):
+    """Bağlanılamayan sunucu requests.exceptions.ConnectionError olarak yakalanır"""
+    session = transport.session('test', retries=0)
+    with pytest.raises(requests.exceptions.ConnectionError) as error:
+        session.get('http://127.0.0.1:9/kapali')
+    assert isinstance(error.value, TransportConnectionError)
+
+
+def test_sync_request_inside_transport_loop_raises(transport, server_url):
+    """Transport loop'unda senkron istek kilitlenmek yerine hata verir; async istek çalışır"""
+    session = transport.session('test', base_url=server_url, retries=0)
+
+    async def inside():
+        with pytest.raises(RuntimeError):
+            session.request('GET', '/echo')
+        with pytest.raises(RuntimeError):
+            transport.request_sync('GET', f"{server_url}/echo")
+        return (await session.aget('/echo')).status_code
+
+    loop = transport._ensure_loop()
+    assert asyncio.run_coroutine_threadsafe(inside(), loop).result(timeout=10) == 200
+
+
+def test_async_request_from_another_loop(transport, server_url):
+    """Başka bir event loop'tan yapılan istek transport loop'una devredilir"""
+    session = transport.session('test', base_url=server_url, retries=0)
+
+    async def run():
+        responses = await asyncio.gather(*(session.aget('/echo', params={'n': n}) for n in range(5)))
+        return [response.json()['query'] for response in responses]
+
+    assert asyncio.run(run()) == [[['n', str(n)]] for n in range(5)]
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Görsel Analiz Havuzu Testleri
+Süresi dolan analizörün {'error': 'timeout'} olduğunu ve süreç havuzunun
+emekliye ayrıldığını test eder.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from PIL import Image
+
+# Havuz işçileri bu modülü slow_shared_analyzer için içe aktarır; servis
+# (ve AI Core modelleri) yalnızca test fonksiyonlarında yüklenir
+from core.AI import image_analyzers
+from core.AI.image_context import ImageContext
+
+SLOW_ANALYZER = 'composition'
+
+
+def slow_shared_analyzer(name, block_name, index, options=None):
+    """SLOW_ANALYZER başladıktan sonra takılır; diğerleri normal çalışır"""
+    result = image_analyzers.run_shared_analyzer(name, block_name, index, options)
+    if name == SLOW_ANALYZER:
+        time.sleep(120)
+    return result
+
+
+@pytest.fixture
+def image(tmp_path):
+    path = tmp_path / 'sample.png'
+    Image.new('RGB', (320, 240), (200, 40, 40)).save(path)
+    return ImageContext(str(path), (1024, 1024))
+
+
+def test_slow_analyzer_times_out_and_pool_is_retired(monkeypatch, image):
+    """Süresi dolan analizör beklenmez, havuzu yeni analizlere verilmez ve kapatılır"""
+    from core.AI import image_recognition
+
+    monkeypatch.setattr(image_recognition, 'run_shared_analyzer', slow_shared_analyzer)
+    service = image_recognition.ImageRecognitionService()
+    service.analysis_executor = 'process'
+    service.analysis_workers = len(image_analyzers.ANALYZERS)
+    service.analysis_timeouts = {SLOW_ANALYZER: 2}
+
+    executor = image_recognition.acquire_analysis_executor('process', service.analysis_workers)
+    image_recognition.release_analysis_executor(executor)
+
+    started = time.time()
+    results = asyncio.run(service._run_analyzers(image))
+
+    assert time.time() - started < 60
+    assert results[SLOW_ANALYZER] == {'error': 'timeout'}
+    assert all('error' not in result for name, result in results.items() if name != SLOW_ANALYZER)
+
+    # Emekli havuz kapatıldı, sonraki analizler yeni havuz alır
+    assert executor not in image_recognition._analysis_executor_users
+    with pytest.raises(RuntimeError):
+        executor.submit(time.time)
+    replacement = image_recognition.acquire_analysis_executor('process', service.analysis_workers)
+    try:
+        assert replacement is not executor
+    finally:
+        image_recognition.release_analysis_executor(replacement)
+
+
+def test_thread_pool_timeout_is_not_awaited(monkeypatch, image):
+    """İş parçacığı havuzunda süresi dolan analizör yalnızca beklenmez; havuz korunur"""
+    from core.AI import image_recognition
+
+    def slow_analyzer(name, context, options=None, started=None, index=0):
+        result = image_analyzers.run_analyzer(name, context, options, started, index)
+        if name == SLOW_ANALYZER:
+            time.sleep(5)
+        return result
+
+    monkeypatch.setattr(image_recognition, 'run_analyzer', slow_analyzer)
+    service = image_recognition.ImageRecognitionService()
+    service.analysis_executor = 'thread'
+    service.analysis_workers = len(image_analyzers.ANALYZERS)
+    service.analysis_timeouts = {SLOW_ANALYZER: 0.5}
+
+    executor = image_recognition.acquire_analysis_executor('thread', service.analysis_workers)
+    image_recognition.release_analysis_executor(executor)
+
+    started = time.time()
+    results = asyncio.run(service._run_analyzers(image))
+
+    assert time.time() - started < 5
+    assert results[SLOW_ANALYZER] == {'error': 'timeout'}
+    assert image_recognition.acquire_analysis_executor('thread', service.analysis_workers) is executor
+    image_recognition.release_analysis_executor(executor)
+
+
+def test_total_deadline_times_out_queued_analyzers(monkeypatch, image):
+    """Takılan analizör kuyruktakileri bekletse de analiz toplam sürede biter; havuz emekliye ayrılır"""
+    from core.AI import image_recognition
+
+    def slow_analyzer(name, context, options=None, started=None, index=0):
+        result = image_analyzers.run_analyzer(name, context, options, started, index)
+        if name == SLOW_ANALYZER:
+            time.sleep(4)
+        return result
+
+    monkeypatch.setattr(image_recognition, 'run_analyzer', slow_analyzer)
+    service = image_recognition.ImageRecognitionService()
+    service.analysis_executor = 'thread'
+    service.analysis_workers = 1
+    service.analysis_timeout = 0.5
+    service.analysis_timeouts = {}
+    service.analysis_total_timeout = 1.5
+
+    executor = image_recognition.acquire_analysis_executor('thread', 1)
+    image_recognition.release_analysis_executor(executor)
+
+    started = time.time()
+    results = asyncio.run(service._run_analyzers(image))
+
+    assert time.time() - started < 3
+    names = list(image_analyzers.ANALYZERS)
+    queued = names[names.index(SLOW_ANALYZER):]
+    assert all(results[name] == {'error': 'timeout'} for name in queued)
+    replacement = image_recognition.acquire_analysis_executor('thread', 1)
+    try:
+        assert replacement is not executor
+    finally:
+        image_recognition.release_analysis_executor(replacement)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Görsel Bağlamı Testleri
+ImageContext'in dosyayı bir kez okuduğunu, MD5'i, JPEG draft çözmeyi,
+gri görünümü ve pickle sırasında görünümlerin taşınmadığını test eder.
+"""
+
+import builtins
+import hashlib
+import os
+import pickle
+import sys
+
+import numpy as np
+import pytest
+from PIL import Image
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.AI import image_context
+from core.AI.image_context import ImageContext
+
+
+@pytest.fixture
+def noise_png(tmp_path):
+    path = tmp_path / 'noise.png'
+    pixels = np.random.default_rng(1).integers(0, 256, (240, 320, 3), dtype=np.uint8)
+    Image.fromarray(pixels).save(path)
+    return str(path)
+
+
+def test_file_is_read_once(monkeypatch, noise_png):
+    """Dosya bir kez açılır; görünümler yeniden okuma yapmaz"""
+    opened = []
+
+    def counting_open(file, *args, **kwargs):
+        opened.append(file)
+        return builtins.open(file, *args, **kwargs)
+
+    monkeypatch.setattr(image_context, 'open', counting_open, raising=False)
+    image = ImageContext(noise_png)
+    image.array, image.bgr, image.gray, image.resized_array((64, 64))
+    assert opened == [noise_png]
+
+
+def test_md5_matches_file(noise_png):
+    with open(noise_png, 'rb') as handle:
+        content = handle.read()
+    image = ImageContext(noise_png)
+    assert image.md5 == hashlib.md5(content).hexdigest()
+    assert image.file_size == len(content) == image.stat.st_size
+
+
+def test_jpeg_draft_decode_stays_within_max_size(tmp_path):
+    """Büyük JPEG küçültülerek çözülür; orijinal boyut ve ölçek korunur"""
+    path = tmp_path / 'large.jpg'
+    Image.new('RGB', (4000, 3000), (30, 120, 200)).save(path, quality=90)
+
+    image = ImageContext(str(path), (1024, 1024))
+    assert image.size == (4000, 3000)
+    assert image.format == 'JPEG'
+    assert image.image.mode == 'RGB'
+    assert image.image.width <= 1024 and image.image.height <= 1024
+    assert image.image.width == 1024 or image.image.height == 1024
+    assert image.scale == pytest.approx(4000 / image.image.width)
+
+
+def test_gray_matches_opencv(noise_png):
+    """Gri görünüm cv2 BGR2GRAY sonucundan en fazla 1 farklıdır"""
+    cv2 = pytest.importorskip('cv2')
+    image = ImageContext(noise_png)
+    expected = cv2.cvtColor(image.bgr, cv2.COLOR_BGR2GRAY)
+    assert image.gray.shape == expected.shape
+    assert np.abs(image.gray.astype(int) - expected.astype(int)).max() <= 1
+
+
+def test_pickle_drops_cached_views(noise_png):
+    """Süreç havuzuna gönderilen kopya görünümleri taşımaz; kaynak önbelleği korunur"""
+    image = ImageContext(noise_png)
+    image.gray, image.resized((32, 32))
+    assert image._views
+
+    restored = pickle.loads(pickle.dumps(image))
+    assert restored._views == {}
+    assert image._views
+    assert restored.md5 == image.md5
+    assert np.array_equal(restored.array, image.array)
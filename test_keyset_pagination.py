@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Keyset (Cursor) Sayfalama Testleri
+Cursor'larla gezilen sayfaların OFFSET sonuçlarıyla aynı olduğunu test eder.
+"""
+
+import os
+import sys
+import tempfile
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Config.config import get_config
+
+# Veritabanı modülü import edilmeden önce geçici veritabanına yönlendir
+DB_PATH = os.path.join(tempfile.mkdtemp(), 'keyset.db')
+get_config().set('database.driver', 'sqlite')
+get_config().set('database.database_path', DB_PATH)
+
+from core.Database.connection import get_db_connection
+from core.Database.pagination import KeysetPaginator, approximate_total
+from core.Database.query_builder import QueryBuilder
+
+
+def setup_module(module=None):
+    """Tekrarlı sıralama değerleri olan tabloyu oluşturur"""
+    db = get_db_connection()
+    if db._config.get('database') != DB_PATH:
+        db._load_config()
+        db._create_connection()
+    with db.get_connection() as conn:
+        conn.execute("DROP TABLE IF EXISTS keyset_items")
+        conn.execute("CREATE TABLE keyset_items (id INTEGER PRIMARY KEY, name TEXT, price INTEGER)")
+        conn.executemany(
+            "INSERT INTO keyset_items (name, price) VALUES (?, ?)",
+            [(f"item {i}", i % 7) for i in range(103)]
+        )
+        conn.commit()
+
+
+def walk(builder: QueryBuilder, per_page: int) -> list:
+    """Tüm sayfaları next cursor ile gez"""
+    paginator = KeysetPaginator(builder, per_page)
+    pages, cursor = [], None
+    while True:
+        page = paginator.paginate(cursor)
+        pages.append([row['id'] for row in page.items])
+        if not page.has_next:
+            return pages
+        cursor = page.next_cursor
+
+
+def test_pages_match_offset_order():
+    """Tekrarlı sütuna göre sıralamada kayıt atlanmaz ya da tekrarlanmaz"""
+    expected = [row['id'] for row in QueryBuilder('keyset_items').order_by('price', 'DESC').order_by('id').get()]
+    pages = walk(QueryBuilder('keyset_items').order_by('price', 'DESC'), 10)
+    assert [item for page in pages for item in page] == expected
+    assert [len(page) for page in pages] == [10] * 10 + [3]
+
+
+def test_previous_cursor_returns_previous_page():
+    """prev cursor bir önceki sayfayı aynı sırayla getirir"""
+    paginator = KeysetPaginator(QueryBuilder('keyset_items').order_by('price'), 10)
+    first = paginator.paginate()
+    second = paginator.paginate(first.next_cursor)
+    assert second.has_previous
+    back = paginator.paginate(second.prev_cursor)
+    assert [row['id'] for row in back.items] == [row['id'] for row in first.items]
+    assert not back.has_previous
+
+
+def test_unselected_order_column():
+    """SELECT'te olmayan sıralama sütunu cursor'a eklenir, sonuçtan çıkarılır"""
+    builder = QueryBuilder('keyset_items').select('id', 'name').order_by('price', 'DESC')
+    pages = walk(builder, 25)
+    assert sum(len(page) for page in pages) == 103
+    page = KeysetPaginator(QueryBuilder('keyset_items').select('id', 'name').order_by('price'), 5).paginate()
+    assert set(page.items[0]) == {'id', 'name'}
+
+
+def test_invalid_cursor_rejected():
+    """Bozuk cursor ValueError verir"""
+    paginator = KeysetPaginator(QueryBuilder('keyset_items'), 10)
+    try:
+        paginator.paginate('bozuk-cursor')
+    except ValueError:
+        return
+    raise AssertionError("Geçersiz cursor kabul edildi")
+
+
+def test_chunk_keeps_order_by():
+    """chunk() keyset ile ilerler ve mevcut sıralamayı korur"""
+    expected = [row['id'] for row in QueryBuilder('keyset_items').order_by('price').order_by('id').get()]
+    chunks = list(QueryBuilder('keyset_items').order_by('price').chunk(20))
+    assert [row['id'] for chunk in chunks for row in chunk] == expected
+    assert [len(chunk) for chunk in chunks] == [20] * 5 + [3]
+
+
+def main():
+    """Tüm testleri çalıştırır"""
+    setup_module()
+    tests = [value for name, value in globals().items() if name.startswith('test_') and callable(value)]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e!r}")
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} test başarılı")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
+
+
+def test_approximate_total_uses_rowid_range():
+    """Filtresiz sorguda rowid aralığı tablo taranmadan okunur; filtreli sorguda kesin sayılır"""
+    db = get_db_connection()
+    executed = []
+    execute_query = db.execute_query
+    db.execute_query = lambda query, params=None: executed.append(query) or execute_query(query, params)
+    try:
+        assert approximate_total(QueryBuilder('keyset_items')) == 103
+    finally:
+        del db.execute_query
+    plan = [row['detail'] for row in db.execute_query(f"EXPLAIN QUERY PLAN {executed[0]}")]
+    assert not any(detail.startswith('SCAN keyset_items') for detail in plan)
+
+    assert approximate_total(QueryBuilder('keyset_items').where('price', '=', 0)) == 15
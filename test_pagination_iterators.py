@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Sayfalayan Iterator Testleri
+paginate() sayfa sonu tespitini, önden istenen sayfanın iptalini ve
+merge_iterators() hata yalıtımını test eder.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Services.pagination import PaginationError, has_next_page, merge_iterators, paginate
+
+
+class PageSource:
+    """Sayfa isteklerini kaydeden sahte liste API'si"""
+
+    def __init__(self, total: int, page_size: int, delay: float = 0.0, fail_page: int = None,
+                 report_total: bool = True):
+        self.total = total
+        self.page_size = page_size
+        self.delay = delay
+        self.fail_page = fail_page
+        self.report_total = report_total
+        self.requested = []
+        self.cancelled = []
+
+    async def fetch(self, page: int) -> dict:
+        self.requested.append(page)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(page)
+            raise
+        if page == self.fail_page:
+            return {'success': False, 'error': 'HTTP 500'}
+        start = page * self.page_size
+        content = list(range(start, min(start + self.page_size, self.total)))
+        response = {'success': True, 'content': content}
+        if self.report_total:
+            response['totalElements'] = self.total
+        return response
+
+    def parse(self, response: dict, page: int):
+        items = response['content']
+        return items, has_next_page(page, self.page_size, len(items), total_count=response.get('totalElements'))
+
+
+async def collect(iterator) -> list:
+    return [item async for item in iterator]
+
+
+def test_has_next_page():
+    """Toplam sayfa/kayıt bilgisi önceliklidir, yoksa sayfanın dolu olması belirler"""
+    assert has_next_page(0, 10, 10, total_pages=2)
+    assert not has_next_page(1, 10, 10, total_pages=2)
+    assert has_next_page(1, 10, 10, total_count=21)
+    assert not has_next_page(1, 10, 10, total_count=20)
+    assert has_next_page(0, 10, 10)
+    assert not has_next_page(0, 10, 9)
+    assert not has_next_page(0, 0, 0)
+    assert has_next_page(0, 10, 10, total_pages='bilinmiyor')
+
+
+def test_paginate_stops_on_last_page():
+    """Toplam kayıt sayısına göre son sayfadan sonra istek atılmaz"""
+    source = PageSource(total=25, page_size=10)
+    items = asyncio.run(collect(paginate('trendyol', source.fetch, source.parse)))
+    assert items == list(range(25))
+    assert source.requested == [0, 1, 2]
+
+
+def test_paginate_stops_on_exact_multiple_without_total():
+    """Toplam bilgisi yoksa boş sayfa gelince durur"""
+    source = PageSource(total=20, page_size=10, report_total=False)
+    items = asyncio.run(collect(paginate('n11', source.fetch, source.parse, normalize=lambda item: item * 2)))
+    assert items == [item * 2 for item in range(20)]
+    assert source.requested == [0, 1, 2]
+
+
+def test_paginate_respects_max_pages():
+    source = PageSource(total=100, page_size=10)
+    items = asyncio.run(collect(paginate('trendyol', source.fetch, source.parse, start_page=2, max_pages=2)))
+    assert items == list(range(20, 40))
+    assert source.requested == [2, 3]
+
+
+def test_paginate_raises_after_partial_results():
+    """Hata veren sayfa PaginationError fırlatır; önceki kayıtlar yield edilmiştir"""
+    source = PageSource(total=50, page_size=10, fail_page=2)
+    seen = []
+
+    async def run():
+        async for item in paginate('hepsiburada', source.fetch, source.parse):
+            seen.append(item)
+
+    with pytest.raises(PaginationError) as error:
+        asyncio.run(run())
+    assert error.value.page == 2 and error.value.platform == 'hepsiburada'
+    assert seen == list(range(20))
+
+
+def test_early_aclose_cancels_prefetched_page():
+    """Tüketici erken çıkınca önden istenen sayfa iptal edilir"""
+    source = PageSource(total=100, page_size=10, delay=0.05)
+
+    async def run():
+        iterator = paginate('trendyol', source.fetch, source.parse)
+        first = await iterator.__anext__()
+        await asyncio.sleep(0)
+        await iterator.aclose()
+        await asyncio.sleep(0.1)
+        return first
+
+    assert asyncio.run(run()) == 0
+    assert source.requested == [0, 1]
+    assert source.cancelled == [1]
+
+
+def test_merge_isolates_failing_iterator():
+    """Hata veren iterator diğerlerini durdurmaz; hatası (ad, istisna) olarak gelir"""
+    good = PageSource(total=30, page_size=10, delay=0.01)
+    bad = PageSource(total=30, page_size=10, fail_page=1)
+
+    async def run():
+        merged = merge_iterators({
+            'trendyol': paginate('trendyol', good.fetch, good.parse),
+            'n11': paginate('n11', bad.fetch, bad.parse),
+        })
+        return await collect(merged)
+
+    results = asyncio.run(run())
+    assert sorted(item for name, item in results if name == 'trendyol') == list(range(30))
+    n11 = [item for name, item in results if name == 'n11']
+    assert n11[:10] == list(range(10))
+    assert len(n11) == 11 and isinstance(n11[-1], PaginationError)
+
+
+def test_merge_aclose_closes_sources():
+    """Birleştirme erken kapatılınca kaynak iterator'lar kapatılır"""
+    closed = []
+
+    async def endless(name):
+        try:
+            n = 0
+            while True:
+                await asyncio.sleep(0)
+                yield n
+                n += 1
+        finally:
+            closed.append(name)
+
+    async def run():
+        merged = merge_iterators({'a': endless('a'), 'b': endless('b')}, buffer_size=2)
+        taken = [await merged.__anext__() for _ in range(5)]
+        await merged.aclose()
+        return taken
+
+    assert len(asyncio.run(run())) == 5
+    assert sorted(closed) == ['a', 'b']
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+SQLite Queue Batch Testleri
+Toplu ekleme, batch ilerlemesi, sonuç akışı ve tek seferlik tamamlanma bildirimini test eder.
+"""
+
+import os
+import sys
+import tempfile
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Services.queue_service import Job, JobStatus, SQLiteQueueDriver
+from core.Services.queue_worker import QueueWorker
+
+
+def make_driver() -> SQLiteQueueDriver:
+    """Geçici dizinde boş kuyruk oluşturur"""
+    return SQLiteQueueDriver({'path': tempfile.mkdtemp(), 'visibility_timeout': 30})
+
+
+def handle(data):
+    """Tek sayıları başarısız sayan test handler'ı"""
+    if data['n'] % 2:
+        raise ValueError(f"tek sayı: {data['n']}")
+    return data['n'] * 10
+
+
+def make_jobs(count: int) -> list:
+    jobs = [Job('calc', {'n': n}) for n in range(count)]
+    for job in jobs:
+        job.max_attempts = 1
+    return jobs
+
+
+def test_push_many_creates_batch():
+    """push_many tüm job'ları ekler ve batch kaydını oluşturur"""
+    driver = make_driver()
+    assert driver.push_many(make_jobs(5), batch_id='b1', name='hesap', meta={'kaynak': 'test'}) == 5
+    assert driver.size() == 5
+    batch = driver.get_batch('b1')
+    assert (batch['name'], batch['total'], batch['meta']) == ('hesap', 5, {'kaynak': 'test'})
+    assert (batch['done'], batch['pending'], batch['progress'], batch['finished']) == (0, 5, 0.0, False)
+    assert driver.get_batch('yok') is None
+
+
+def test_push_many_is_atomic():
+    """Aynı batch id ile ikinci ekleme hiçbir job eklemez"""
+    driver = make_driver()
+    driver.push_many(make_jobs(2), batch_id='b1')
+    assert driver.push_many(make_jobs(3), batch_id='b1') == 0
+    assert driver.size() == 2
+
+
+def test_batch_progress_and_results_order():
+    """Sayaçlar job bitince artar, sonuçlar bitiş sırasıyla akar"""
+    driver = make_driver()
+    driver.push_many(make_jobs(4), batch_id='b1')
+    worker = QueueWorker(driver, {'calc': handle})
+
+    finished = []
+    for _ in range(2):
+        job = driver.pop()
+        worker.execute(job)
+        finished.append(job.id)
+    batch = driver.get_batch('b1')
+    assert (batch['completed'], batch['failed'], batch['pending'], batch['progress']) == (1, 1, 2, 50.0)
+    assert not batch['finished']
+
+    first_page = driver.batch_results('b1')
+    assert [job.id for job in first_page] == finished
+    assert first_page[0].status == JobStatus.COMPLETED and first_page[0].result == 0
+    assert first_page[1].status == JobStatus.FAILED
+
+    for _ in range(2):
+        worker.execute(driver.pop())
+    rest = driver.batch_results('b1', after=first_page[-1].done_seq)
+    assert len(rest) == 2
+    assert driver.get_batch('b1')['finished']
+    assert len(driver.batch_results('b1', limit=3)) == 3
+
+
+def test_batch_completion_claimed_once():
+    """Tamamlanma bildirimi yalnızca batch bitince ve bir kez alınır"""
+    driver = make_driver()
+    driver.push_many(make_jobs(2), batch_id='b1')
+    assert not driver.claim_batch_completion('b1')
+
+    worker = QueueWorker(driver, {'calc': handle})
+    worker.execute(driver.pop())
+    assert not driver.claim_batch_completion('b1')
+    worker.execute(driver.pop())
+    # Worker bildirimi zaten aldı
+    assert not driver.claim_batch_completion('b1')
+    assert driver.get_batch('b1')['finished']
+
+
+def test_retried_job_not_counted_until_final():
+    """Tekrar denenecek job batch sayacını artırmaz"""
+    driver = make_driver()
+    jobs = make_jobs(1)
+    jobs[0].data['n'] = 1
+    jobs[0].max_attempts = 2
+    driver.push_many(jobs, batch_id='b1')
+
+    QueueWorker(driver, {'calc': handle}).execute(driver.pop())
+    batch = driver.get_batch('b1')
+    assert (batch['done'], batch['finished']) == (0, False)
+    assert driver.batch_results('b1') == []
+
+
+def main():
+    """Tüm testleri çalıştırır"""
+    tests = [value for name, value in globals().items() if name.startswith('test_') and callable(value)]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e!r}")
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} test başarılı")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+SQLite Queue Lease Testleri
+Job alma (claim), lease süresi, deneme hakkı ve lease sahipliğini test eder.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Services.queue_service import Job, JobPriority, JobStatus, SQLiteQueueDriver
+from core.Services.queue_worker import QueueWorker
+
+
+def make_driver() -> SQLiteQueueDriver:
+    """Geçici dizinde boş kuyruk oluşturur"""
+    return SQLiteQueueDriver({'path': tempfile.mkdtemp(), 'visibility_timeout': 30})
+
+
+def test_pop_orders_by_priority_then_insertion():
+    """Yüksek öncelikli job önce, aynı öncelikte ilk eklenen önce alınır"""
+    driver = make_driver()
+    low = Job('t', {'n': 1}, JobPriority.LOW)
+    first = Job('t', {'n': 2})
+    second = Job('t', {'n': 3})
+    urgent = Job('t', {'n': 4}, JobPriority.URGENT)
+    for job in (low, first, second, urgent):
+        driver.push(job)
+    assert [driver.pop().id for _ in range(4)] == [urgent.id, first.id, second.id, low.id]
+    assert driver.pop() is None
+
+
+def test_claimed_job_invisible_until_lease_expires():
+    """Lease süresince job başka işçiye verilmez, süre dolunca yeniden alınır"""
+    driver = make_driver()
+    job = Job('t', {})
+    driver.push(job)
+    claimed = driver.pop(visibility_timeout=0.05)
+    assert claimed.status == JobStatus.PROCESSING
+    assert driver.pop() is None
+    time.sleep(0.1)
+    again = driver.pop()
+    assert again.id == job.id
+    assert again.lease_token != claimed.lease_token
+
+
+def test_extend_lease_keeps_job_claimed():
+    """Uzatılan lease dolmaz; token'ı eski olan uzatamaz"""
+    driver = make_driver()
+    driver.push(Job('t', {}))
+    claimed = driver.pop(visibility_timeout=0.05)
+    assert driver.extend_lease(claimed, 30)
+    time.sleep(0.1)
+    assert driver.pop() is None
+
+    claimed.lease_token = 'eski'
+    assert not driver.extend_lease(claimed, 30)
+
+
+def test_stale_owner_cannot_overwrite_result():
+    """Lease'i başka işçiye geçen job'un eski sahibinin sonucu kaydedilmez"""
+    driver = make_driver()
+    job = Job('t', {})
+    driver.push(job)
+    worker = QueueWorker(driver, {'t': lambda data: 'ok'})
+
+    stale = driver.pop(visibility_timeout=0.05)
+    worker._begin(stale)
+    time.sleep(0.1)
+    current = driver.pop(visibility_timeout=30)
+
+    worker._finish(stale, 'eski sonuç')
+    assert worker.processed == 0
+    assert driver.get(job.id).status == JobStatus.PROCESSING
+
+    QueueWorker(driver, {'t': lambda data: 'yeni sonuç'}).execute(current)
+    assert driver.get(job.id).result == 'yeni sonuç'
+
+
+def test_expired_lease_without_attempts_left_fails():
+    """Deneme hakkı biten job'un lease'i dolunca job başarısız olur"""
+    driver = make_driver()
+    job = Job('t', {})
+    job.max_attempts = 2
+    driver.push(job)
+    worker = QueueWorker(driver, {'t': lambda data: 'ok'})
+
+    # İşçi job'u alıp bitiremeden ölür
+    for _ in range(job.max_attempts):
+        worker._begin(driver.pop(visibility_timeout=0.05))
+        time.sleep(0.1)
+
+    assert driver.pop() is None
+    stored = driver.get(job.id)
+    assert stored.status == JobStatus.FAILED
+    assert stored.error_message
+
+
+def test_type_limits():
+    """Tip başına eşzamanlılık sınırı tüm işçiler için uygulanır"""
+    driver = make_driver()
+    for _ in range(3):
+        driver.push(Job('mail', {}))
+    driver.push(Job('report', {}))
+    assert driver.pop(limits={'mail': 1}).type == 'mail'
+    assert driver.pop(limits={'mail': 1}).type == 'report'
+    assert driver.pop(limits={'mail': 1}) is None
+
+
+def test_compact_keeps_recent_and_pending():
+    """compact() yalnızca eski bitmiş job'ları siler"""
+    driver = make_driver()
+    worker = QueueWorker(driver, {'t': lambda data: 'ok'})
+    for _ in range(5):
+        driver.push(Job('t', {}))
+    for _ in range(4):
+        worker.execute(driver.pop())
+    assert driver.compact(keep_completed=1, older_than=0) == 3
+    assert driver.counts() == {'completed': 1, 'pending': 1}
+
+
+def main():
+    """Tüm testleri çalıştırır"""
+    tests = [value for name, value in globals().items() if name.startswith('test_') and callable(value)]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e!r}")
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} test başarılı")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Retry Motoru Testleri
+Retry-After başlıklarına uyulmasını, senkron sınırları ve retry bütçesini test eder.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from email.utils import formatdate
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Services.retry_policy import RetryBudget, RetryEngine, RetryPolicy, RetryStats, parse_retry_after
+
+
+class Response:
+    """status_code ve headers taşıyan sahte yanıt"""
+
+    def __init__(self, status_code: int, headers: dict = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def make_sender(*responses):
+    """Sırayla yanıt (ya da hata) döndüren send fabrikası"""
+    queue = list(responses)
+    calls = []
+
+    async def send():
+        calls.append(time.monotonic())
+        item = queue.pop(0) if len(queue) > 1 else queue[0]
+        if isinstance(item, BaseException):
+            raise item
+        return item
+
+    send.calls = calls
+    return send
+
+
+def make_engine(budget: RetryBudget = None, **policy) -> RetryEngine:
+    settings = {'base_delay': 0.01, 'max_delay': 0.02}
+    settings.update(policy)
+    return RetryEngine('test', RetryPolicy(**settings), budget or RetryBudget(), RetryStats())
+
+
+def test_parse_retry_after_formats():
+    """Saniye, HTTP tarihi ve rate limit reset başlıkları okunur"""
+    now = 1_700_000_000.0
+    assert parse_retry_after({'Retry-After': '7'}, now) == 7.0
+    assert abs(parse_retry_after({'Retry-After': formatdate(now + 30, usegmt=True)}, now) - 30) < 1
+    assert parse_retry_after({'X-RateLimit-Reset': str(now + 12)}, now) == 12.0
+    assert parse_retry_after({'X-RateLimit-Reset': str((now + 5) * 1000)}, now) == 5.0
+    assert parse_retry_after({'RateLimit-Reset': '3'}, now) == 3.0
+    assert parse_retry_after({'Retry-After': 'yarın'}, now) is None
+    assert parse_retry_after({}, now) is None
+
+
+def test_retry_after_honored():
+    """Sunucunun bildirdiği süre beklenir ve sonraki denemede başarı sayılır"""
+    engine = make_engine()
+    send = make_sender(Response(429, {'Retry-After': '0.2'}), Response(200))
+    response = asyncio.run(engine.execute('POST', send))
+    assert response.status_code == 200
+    assert send.calls[1] - send.calls[0] >= 0.19
+    stats = engine.stats.snapshot()
+    assert (stats['retry_after_honored'], stats['recovered'], stats['retries']) == (1, 1, 1)
+
+
+def test_long_retry_after_returns_immediately():
+    """Sınırı aşan Retry-After beklenmez, son yanıt hemen döner"""
+    engine = make_engine(max_retry_after=1)
+    send = make_sender(Response(503, {'Retry-After': '60'}), Response(200))
+    started = time.monotonic()
+    response = asyncio.run(engine.execute('GET', send))
+    assert response.status_code == 503
+    assert time.monotonic() - started < 0.5
+    assert len(send.calls) == 1
+    assert engine.stats.snapshot()['retry_after_too_long'] == 1
+
+
+def test_blocking_uses_sync_limits():
+    """Senkron çağrıda daha kısa sync_max_retry_after uygulanır"""
+    send_async = make_sender(Response(429, {'Retry-After': '0.1'}), Response(200))
+    engine = make_engine(max_retry_after=1, sync_max_retry_after=0.05)
+    assert asyncio.run(engine.execute('GET', send_async)).status_code == 200
+
+    send_blocking = make_sender(Response(429, {'Retry-After': '0.1'}), Response(200))
+    assert asyncio.run(engine.execute('GET', send_blocking, blocking=True)).status_code == 429
+    assert len(send_blocking.calls) == 1
+
+
+def test_deadline_stops_retries():
+    """Bekleme toplam süreyi aşacaksa tekrar denenmez"""
+    engine = make_engine(deadline=0.1)
+    send = make_sender(Response(503, {'Retry-After': '0.5'}))
+    assert asyncio.run(engine.execute('GET', send)).status_code == 503
+    assert len(send.calls) == 1
+    assert engine.stats.snapshot()['deadline_exceeded'] == 1
+
+
+def test_non_idempotent_not_retried_without_retry_after():
+    """POST 5xx'te Retry-After yoksa tekrarlanmaz, bağlantı hatası fırlatılır"""
+    engine = make_engine()
+    send = make_sender(Response(502), Response(200))
+    assert asyncio.run(engine.execute('POST', send)).status_code == 502
+    assert len(send.calls) == 1
+
+    failing = make_sender(ConnectionError('koptu'), Response(200))
+    try:
+        asyncio.run(engine.execute('POST', failing, retry_exceptions=(ConnectionError,)))
+    except ConnectionError:
+        pass
+    else:
+        raise AssertionError("POST bağlantı hatasında tekrarlandı")
+    assert len(failing.calls) == 1
+
+    recovering = make_sender(ConnectionError('koptu'), Response(200))
+    assert asyncio.run(engine.execute('GET', recovering, retry_exceptions=(ConnectionError,))).status_code == 200
+
+
+def test_retries_exhausted():
+    """max_retries dolunca son yanıt döner"""
+    engine = make_engine(max_retries=2)
+    send = make_sender(Response(500))
+    assert asyncio.run(engine.execute('GET', send)).status_code == 500
+    assert len(send.calls) == 3
+    assert engine.stats.snapshot()['exhausted'] == 1
+
+
+def test_budget_limits_retry_storm():
+    """Arızalı serviste retry sayısı bütçeyle sınırlanır"""
+    budget = RetryBudget(ratio=0.1, min_per_second=0.2, window=10)
+    engine = make_engine(budget=budget, max_retries=3)
+    send = make_sender(Response(503))
+
+    async def storm():
+        return await asyncio.gather(*(engine.execute('GET', send) for _ in range(20)))
+
+    responses = asyncio.run(storm())
+    assert all(response.status_code == 503 for response in responses)
+    stats = engine.stats.snapshot()
+    # 0.2/s * 10s + 0.1 * 20 istek = 4 retry
+    assert stats['retries'] == 4
+    assert len(send.calls) == 24
+    assert stats['budget_exhausted'] == 20 - stats['exhausted']
+    assert budget.remaining() == 0
+
+
+def main():
+    """Tüm testleri çalıştırır"""
+    tests = [value for name, value in globals().items() if name.startswith('test_') and callable(value)]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e!r}")
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} test başarılı")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Salt Okunur Row Testleri
+Row eşleme erişimini, salt okunurluğu, to_model() dönüşümünü ve Row
+üreten okuma yollarını (get_rows, stream, readonly chunk) test eder.
+"""
+
+import os
+import pickle
+import sys
+import tempfile
+from collections.abc import Mapping
+
+import pytest
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Config.config import get_config
+
+# Veritabanı modülü import edilmeden önce geçici veritabanına yönlendir
+DB_PATH = os.path.join(tempfile.mkdtemp(), 'rows.db')
+get_config().set('database.driver', 'sqlite')
+get_config().set('database.database_path', DB_PATH)
+
+from core.Database.base_model import BaseModel
+from core.Database.connection import get_db_connection
+from core.Database.query_builder import QueryBuilder
+from core.Database.row import Row, make_rows
+
+
+class RowAccount(BaseModel):
+    """Test modeli"""
+
+    __table__ = 'row_accounts'
+    __fillable__ = ['name', 'balance', 'password']
+    __hidden__ = ['password']
+
+
+def setup_module(module=None):
+    """Hesap tablosunu oluşturur"""
+    db = get_db_connection()
+    if db._config.get('database') != DB_PATH:
+        db._load_config()
+        db._create_connection()
+    with db.get_connection() as conn:
+        conn.execute("DROP TABLE IF EXISTS row_accounts")
+        conn.execute("CREATE TABLE row_accounts (id INTEGER PRIMARY KEY, name TEXT, balance INTEGER, password TEXT)")
+        conn.executemany(
+            "INSERT INTO row_accounts (name, balance, password) VALUES (?, ?, ?)",
+            [(f"hesap {i}", i * 10 % 70, f"gizli {i}") for i in range(1, 26)]
+        )
+        conn.commit()
+
+
+def sample_row() -> Row:
+    return make_rows(['id', 'name', 'balance', 'password'], [(7, 'hesap 7', 70, 'x')], RowAccount)[0]
+
+
+def test_mapping_access():
+    """Sütun adı, sıra numarası ve özellik ile erişim dict gibi çalışır"""
+    row = sample_row()
+    assert isinstance(row, Mapping)
+    assert row['name'] == row.name == row[1] == 'hesap 7'
+    assert row.get('missing', 'yok') == 'yok'
+    assert list(row) == ['id', 'name', 'balance', 'password']
+    assert 'balance' in row and 'missing' not in row
+    assert len(row) == 4
+    assert dict(row) == {'id': 7, 'name': 'hesap 7', 'balance': 70, 'password': 'x'}
+    assert row == dict(row)
+    assert row.to_dict() == {'id': 7, 'name': 'hesap 7', 'balance': 70}
+    with pytest.raises(KeyError):
+        row['missing']
+    with pytest.raises(AttributeError):
+        row.missing
+
+
+def test_rows_are_read_only():
+    """Atama ve silme reddedilir"""
+    row = sample_row()
+    with pytest.raises(AttributeError):
+        row.name = 'değişti'
+    with pytest.raises(AttributeError):
+        del row.name
+    with pytest.raises(TypeError):
+        row['name'] = 'değişti'
+    assert row.name == 'hesap 7'
+
+
+def test_to_model_and_pickle():
+    """to_model() tam model oluşturur; pickle sonrası şema korunur"""
+    model = sample_row().to_model()
+    assert isinstance(model, RowAccount)
+    assert model.name == 'hesap 7'
+    model.balance = 5
+    assert model.is_dirty()
+
+    restored = pickle.loads(pickle.dumps(sample_row()))
+    assert restored == sample_row()
+    assert isinstance(restored.to_model(), RowAccount)
+
+    with pytest.raises(TypeError):
+        make_rows(['id'], [(1,)])[0].to_model()
+
+
+def test_query_paths_return_rows():
+    """readonly(), get_rows() ve stream() aynı satırları Row olarak döndürür"""
+    expected = QueryBuilder('row_accounts').order_by('id', 'ASC').get()
+
+    readonly = RowAccount.query().order_by('id', 'asc').readonly().get()
+    streamed = list(QueryBuilder('row_accounts').order_by('id', 'ASC').stream(batch_size=4, model_class=RowAccount))
+
+    for rows in (readonly, streamed):
+        assert all(isinstance(row, Row) for row in rows)
+        assert [dict(row) for row in rows] == expected
+    assert streamed[3].to_model().id == 4
+    assert get_db_connection().get_pool_stats()['active_connections'] == 0
+
+
+def test_readonly_chunk_strips_seek_columns():
+    """Row parçalarında seek için eklenen sütunlar sonuçta yer almaz"""
+    builder = QueryBuilder('row_accounts').select('id', 'name').order_by('balance', 'DESC')
+    expected = [dict(row) for rows in builder.chunk(6) for row in rows]
+    chunks = list(builder.chunk(6, readonly=True))
+
+    assert [len(rows) for rows in chunks] == [6, 6, 6, 6, 1]
+    assert all(isinstance(row, Row) and list(row) == ['id', 'name'] for rows in chunks for row in rows)
+    assert [dict(row) for rows in chunks for row in rows] == expected
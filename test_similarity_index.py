@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benzerlik İndeksi Testleri
+similarity_index'in kullanıcı/global indeks ayrımını, exclude ve limit
+birlikteliğini, kategori korunmasını ve eşik-mesafe dönüşümünü test eder.
+"""
+
+import os
+import sys
+import tempfile
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Config.config import get_config
+
+# İndeksler geçici klasörde tutulur
+get_config().set('ai.similarity_index.path', tempfile.mkdtemp())
+
+from core.AI import similarity_index
+from core.AI.similarity_index import add_image, find_similar, remove_image, threshold_to_distance
+
+BASE = 0x8f3c_52a1_0e77_d4b9
+
+
+def near(bits: int) -> str:
+    """BASE'ten `bits` bit farklı hash"""
+    return format(BASE ^ ((1 << bits) - 1), '016x')
+
+
+def paths(results) -> list:
+    return [result['image_path'] for result in results]
+
+
+def test_user_and_global_indexes_are_isolated():
+    """Kullanıcı araması yalnızca kendi görsellerini, global arama herkesinkini döndürür"""
+    add_image('/u101/a.jpg', near(0), 101)
+    add_image('/u102/b.jpg', near(1), 102)
+
+    assert paths(find_similar(near(0), 101, max_distance=4)) == ['/u101/a.jpg']
+    assert paths(find_similar(near(0), 102, max_distance=4)) == ['/u102/b.jpg']
+    assert paths(find_similar(near(0), None, max_distance=4)) == ['/u101/a.jpg', '/u102/b.jpg']
+
+    result = find_similar(near(0), 102, max_distance=4)[0]
+    assert result['user_id'] == 102
+    assert result['distance'] == 1 and result['similarity'] == 1 - 1 / 64
+
+    remove_image('/u102/b.jpg', 102)
+    assert find_similar(near(0), 102, max_distance=4) == []
+    assert paths(find_similar(near(0), None, max_distance=4)) == ['/u101/a.jpg']
+
+
+def test_exclude_with_limit_returns_full_page():
+    """Aranan görsel hariç tutulunca limit yine dolar; sonuçlar mesafeye göre sıralıdır"""
+    for bits in range(5):
+        add_image(f"/u201/{bits}.jpg", near(bits), 201)
+
+    results = find_similar(near(0), 201, max_distance=8, limit=2, exclude='/u201/0.jpg')
+    assert paths(results) == ['/u201/1.jpg', '/u201/2.jpg']
+    assert [result['distance'] for result in results] == [1, 2]
+
+    assert paths(find_similar(near(0), 201, max_distance=8, limit=2)) == ['/u201/0.jpg', '/u201/1.jpg']
+    assert find_similar('', 201) == []
+
+
+def test_categories_kept_when_not_given():
+    """categories=None mevcut kategorileri korur, hash güncellenir"""
+    add_image('/u301/a.jpg', near(0), 301, ['elbise', 'kırmızı'])
+    add_image('/u301/a.jpg', near(3), 301)
+
+    result = find_similar(near(3), 301, max_distance=0)[0]
+    assert result['categories'] == ['elbise', 'kırmızı']
+    assert result['similarity_hash'] == near(3)
+
+    add_image('/u301/a.jpg', near(3), 301, [])
+    assert find_similar(near(3), 301, max_distance=0)[0]['categories'] == []
+
+
+def test_signature_kept_when_not_given():
+    """Dosya imzası yalnızca verildiğinde değişir"""
+    add_image('/u401/a.jpg', near(0), 401, signature='10:1')
+    add_image('/u401/a.jpg', near(0), 401, ['ayakkabı'])
+    index = similarity_index.get_similarity_index(401)
+    assert similarity_index.stored_signature(index, '/u401/a.jpg') == '10:1'
+
+
+def test_threshold_to_distance_bounds():
+    """Eşik 64 bitlik hamming mesafesine aşağı yuvarlanır, kayan nokta hatası bit kaybettirmez"""
+    assert threshold_to_distance(1.0) == 0
+    assert threshold_to_distance(0.0) == 64
+    assert threshold_to_distance(0.9) == 6
+    assert threshold_to_distance(0.875) == 8
+    assert threshold_to_distance(0.8) == 12
+    assert all(threshold_to_distance(1 - bits / 64) == bits for bits in range(65))
+    assert threshold_to_distance(1.5) == 0
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Derlenmiş SQL Önbelleği Testleri
+BaseModel sorgu şekillerinin önbellekten geldiğini, LIMIT/OFFSET'in SQL'e
+gömülmeden parametre olarak bağlandığını ve LRU tahliyesini test eder.
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Config.config import get_config
+
+# Veritabanı modülü import edilmeden önce geçici veritabanına yönlendir
+DB_PATH = os.path.join(tempfile.mkdtemp(), 'statements.db')
+get_config().set('database.driver', 'sqlite')
+get_config().set('database.database_path', DB_PATH)
+
+from core.Database import statement_cache
+from core.Database.base_model import BaseModel
+from core.Database.connection import get_db_connection
+from core.Database.query_builder import QueryBuilder
+from core.Database.statement_cache import StatementCache
+
+
+class CachedNote(BaseModel):
+    """Test modeli"""
+
+    __table__ = 'cached_notes'
+    __fillable__ = ['title', 'pinned']
+    __timestamps__ = False
+
+
+def setup_module(module=None):
+    """Not tablosunu oluşturur"""
+    db = get_db_connection()
+    if db._config.get('database') != DB_PATH:
+        db._load_config()
+        db._create_connection()
+    with db.get_connection() as conn:
+        conn.execute("DROP TABLE IF EXISTS cached_notes")
+        conn.execute("CREATE TABLE cached_notes (id INTEGER PRIMARY KEY, title TEXT, pinned INTEGER)")
+        conn.executemany("INSERT INTO cached_notes (title, pinned) VALUES (?, ?)",
+                         [(f"not {i}", i % 2) for i in range(1, 21)])
+        conn.commit()
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Her test için boş global önbellek"""
+    fresh = StatementCache()
+    monkeypatch.setattr(statement_cache, '_statement_cache', fresh)
+    return fresh
+
+
+def test_same_shape_is_a_cache_hit(cache):
+    """Aynı sütunlarla tekrarlanan sorgu SQL'i yeniden derlemez; farklı şekil ayrı kayıttır"""
+    assert CachedNote.find(1).title == 'not 1'
+    assert CachedNote.find(2).title == 'not 2'
+    assert len(CachedNote.where({'pinned': 1})) == 10
+    assert len(CachedNote.where({'pinned': 0})) == 10
+    assert cache.get_stats()['misses'] == 2
+    assert cache.get_stats()['hits'] == 2
+
+    # Sütun sırası şeklin parçasıdır
+    CachedNote.where({'pinned': 1, 'title': 'not 1'})
+    CachedNote.where({'title': 'not 1', 'pinned': 1})
+    assert cache.get_stats()['size'] == 4
+
+    note = CachedNote.find(3)
+    note.title = 'güncel'
+    assert note.save()
+    note.title = 'yine güncel'
+    assert note.save()
+    assert cache.get_stats()['size'] == 5
+    assert CachedNote.find(3).title == 'yine güncel'
+
+
+def test_limit_and_offset_are_bound_parameters():
+    """LIMIT/OFFSET değerleri SQL metninde yer almaz; farklı sayfalar aynı SQL'i kullanır"""
+    first_sql, first_values = QueryBuilder('cached_notes').order_by('id').limit(5).offset(0)._build_select_query()
+    second_sql, second_values = QueryBuilder('cached_notes').order_by('id').limit(7).offset(10)._build_select_query()
+
+    assert first_sql == second_sql
+    assert first_sql.endswith('LIMIT ? OFFSET ?')
+    assert first_values == [5, 0] and second_values == [7, 10]
+
+    rows = CachedNote.query().order_by('id', 'asc').limit(3).offset(4).get()
+    assert [note.id for note in rows] == [5, 6, 7]
+
+
+def test_lru_eviction_at_capacity(monkeypatch):
+    """Kapasite aşılınca en uzun süre kullanılmayan şekil çıkarılır"""
+    cache = StatementCache(max_size=2)
+    built = []
+
+    def build(name):
+        return lambda: built.append(name) or f"SQL {name}"
+
+    assert cache.get_or_build('a', build('a')) == 'SQL a'
+    cache.get_or_build('b', build('b'))
+    cache.get_or_build('a', build('a'))
+    cache.get_or_build('c', build('c'))
+
+    assert cache.get_stats()['evictions'] == 1
+    cache.get_or_build('a', build('a'))
+    cache.get_or_build('b', build('b'))
+    assert built == ['a', 'b', 'c', 'b']
+
+    # BaseModel sorguları da aynı kapasite sınırına tabidir
+    monkeypatch.setattr(statement_cache, '_statement_cache', StatementCache(max_size=2))
+    CachedNote.find(1)
+    CachedNote.all()
+    CachedNote.count({'pinned': 1})
+    stats = statement_cache.get_statement_cache().get_stats()
+    assert stats['size'] == 2 and stats['evictions'] == 1
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Akışlı Okuma Testleri
+DatabaseConnection.iter_query / QueryBuilder.stream Row akışını ve rapor export'unu test eder.
+"""
+
+import csv
+import io
+import json
+import os
+import sys
+import tempfile
+
+# Proje root'unu sys.path'e ekle
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.Config.config import get_config
+
+# Veritabanı modülü import edilmeden önce geçici veritabanına yönlendir
+DB_PATH = os.path.join(tempfile.mkdtemp(), 'stream.db')
+get_config().set('database.driver', 'sqlite')
+get_config().set('database.database_path', DB_PATH)
+
+from core.Database.connection import get_db_connection
+from core.Database.query_builder import QueryBuilder
+from core.Database.row import Row
+from core.Services.advanced_reporting_service import AdvancedReportingService, ReportConfig, ReportType
+from core.Services.queue_service import JobHandlers
+
+
+def setup_module(module=None):
+    """Sipariş ve kullanıcı tablolarını oluşturur"""
+    db = get_db_connection()
+    if db._config.get('database') != DB_PATH:
+        db._load_config()
+        db._create_connection()
+    with db.get_connection() as conn:
+        conn.execute("DROP TABLE IF EXISTS orders")
+        conn.execute("DROP TABLE IF EXISTS users")
+        conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT)")
+        conn.execute(
+            "CREATE TABLE orders (id INTEGER PRIMARY KEY, order_number TEXT, user_id INTEGER, status TEXT, "
+            "payment_status TEXT, payment_method TEXT, total_amount REAL, created_at TEXT)"
+        )
+        conn.executemany("INSERT INTO users (id, name, email) VALUES (?, ?, ?)",
+                         [(i, f"Müşteri {i}", f"m{i}@example.com") for i in range(1, 4)])
+        conn.executemany(
+            "INSERT INTO orders (order_number, user_id, status, payment_status, payment_method, "
+            "total_amount, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(f"ORD-{i:04d}", i % 3 + 1, 'completed' if i % 2 else 'pending', 'paid', 'card',
+              float(i), f"2026-01-{i % 28 + 1:02d}") for i in range(1, 251)]
+        )
+        conn.commit()
+
+
+def order_report(**overrides) -> dict:
+    config = ReportConfig(name='Siparişler', type=ReportType.ORDER_HISTORY, filters=[], groupby=[], orderby=[])
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    return AdvancedReportingService().generate_order_history_report(config)
+
+
+def test_iter_query_yields_rows_and_batches():
+    """Satırlar fetchmany partileriyle gelir, bağlantı akış sonunda havuza döner"""
+    db = get_db_connection()
+    rows = list(db.iter_query("SELECT id FROM orders ORDER BY id", batch_size=100))
+    assert [row['id'] for row in rows] == list(range(1, 251))
+    assert all(isinstance(row, Row) for row in rows)
+
+    batches = list(db.iter_query("SELECT id FROM orders ORDER BY id", batch_size=100, batches=True))
+    assert [len(batch) for batch in batches] == [100, 100, 50]
+    assert db.get_pool_stats()['active_connections'] == 0
+
+
+def test_stream_respects_filters_and_limit():
+    """QueryBuilder.stream() tek sorguda get() ile aynı sonucu verir"""
+    builder = QueryBuilder('orders').where('status', '=', 'completed').order_by('id', 'DESC').limit(7)
+    assert list(builder.stream(batch_size=3)) == builder.get()
+
+
+def test_stream_close_releases_connection():
+    """Erken kapatılan akış bağlantıyı havuza bırakır"""
+    stream = QueryBuilder('orders').stream(batch_size=10)
+    next(stream)
+    assert get_db_connection().get_pool_stats()['active_connections'] == 1
+    stream.close()
+    assert get_db_connection().get_pool_stats()['active_connections'] == 0
+
+
+def test_export_report_streams_csv_and_json():
+    """export_report QueryBuilder raporunu tüm satırlarıyla dışa aktarır"""
+    service = AdvancedReportingService()
+
+    rows = list(csv.DictReader(io.StringIO(service.export_report(order_report(), 'csv', batch_size=40))))
+    assert len(rows) == 250
+    assert rows[0]['order_number'] == 'ORD-0001'
+    assert rows[0]['customer_name'] == 'Müşteri 2'
+
+    exported = json.loads(service.export_report(order_report(limit=5), 'json', batch_size=2))
+    assert exported['type'] == 'order_history'
+    assert [row['id'] for row in exported['data']] == [1, 2, 3, 4, 5]
+
+
+def test_export_report_writes_to_output():
+    """output verildiğinde parçalar dosyaya yazılır"""
+    path = os.path.join(tempfile.mkdtemp(), 'orders.csv')
+    service = AdvancedReportingService()
+    assert service.export_report(order_report(), 'csv', output=path, batch_size=64) == path
+    with open(path, encoding='utf-8') as handle:
+        assert len(list(csv.DictReader(handle))) == 250
+
+
+def test_stream_report_matches_export():
+    """HTTP akışı export ile aynı metni üretir"""
+    service = AdvancedReportingService()
+    report = order_report(orderby=[{'field': 'total_amount', 'direction': 'DESC'}])
+    assert ''.join(service.stream_report(report, 'csv', batch_size=30)) == service.export_report(report, 'csv')
+
+
+def test_report_job_returns_file_info_only():
+    """Rapor işi sonucu metni değil dosya yolunu taşır; output verilmezse storage/reports altına yazılır"""
+    path = os.path.join(tempfile.mkdtemp(), 'orders.json')
+    result = JobHandlers.generate_report({'type': 'order_history', 'format': 'json', 'output': path})
+    assert result == {'output': path, 'format': 'json', 'size': os.path.getsize(path)}
+    with open(path, encoding='utf-8') as handle:
+        assert len(json.load(handle)['data']) == 250
+
+    storage_root = get_config('storage.root')
+    get_config().set('storage.root', tempfile.mkdtemp())
+    try:
+        result = JobHandlers.generate_report({'type': 'order_history', 'format': 'csv'})
+        assert os.path.dirname(result['output']) == os.path.join(get_config('storage.root'), 'reports')
+        assert result['output'].endswith('.csv') and result['format'] == 'csv'
+        with open(result['output'], encoding='utf-8') as handle:
+            assert len(list(csv.DictReader(handle))) == 250
+        assert result['size'] == os.path.getsize(result['output'])
+    finally:
+        get_config().set('storage.root', storage_root)